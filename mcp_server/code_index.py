@@ -0,0 +1,264 @@
+"""
+In-memory code search index for the MCP server.
+
+Keeps the text of project files in memory together with a trigram inverted index,
+so ``search_code`` only reads candidate files from memory instead of walking and
+reading the whole tree per query. The index is refreshed incrementally: a refresh
+walks the tree, stats each file and re-reads only files whose (mtime, size) changed.
+Refreshes are throttled (``GENESIS_MCP_INDEX_REFRESH_SECONDS``, default 2s).
+
+All methods are blocking and thread-safe; async callers should use
+``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "__pycache__",
+        "archive",
+        "cache",
+        "data",
+        "logs",
+        "reports",
+        "results",
+    }
+)
+MAX_INDEXED_FILE_BYTES = 2 * 1024 * 1024
+
+
+def _refresh_interval() -> float:
+    try:
+        return max(0.0, float(os.environ.get("GENESIS_MCP_INDEX_REFRESH_SECONDS", "2")))
+    except ValueError:
+        return 2.0
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass(slots=True)
+class _IndexedFile:
+    mtime_ns: int
+    size: int
+    lines: list[str] | None
+    trigrams: set[str] = field(default_factory=set)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchHit:
+    file: str
+    line: int
+    content: str
+
+
+class CodeSearchIndex:
+    """Trigram index over text files under ``root`` (see module docstring)."""
+
+    def __init__(self, root: Path, *, excluded_dirs: frozenset[str] = EXCLUDED_DIRS) -> None:
+        self.root = root
+        self.excluded_dirs = excluded_dirs
+        self._lock = threading.RLock()
+        self._files: dict[str, _IndexedFile] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._sorted_paths: list[str] = []
+        self._last_refresh = 0.0
+        # Bumped whenever a file is added, changed or removed.
+        self.generation = 0
+
+    def _walk(self) -> Iterator[tuple[str, os.stat_result]]:
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in self.excluded_dirs]
+            for name in filenames:
+                full = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(full)
+                except OSError:
+                    # Some files (e.g. within broken/locked environments) can raise on stat.
+                    continue
+                rel = os.path.relpath(full, self.root).replace("\\", "/")
+                yield rel, stat
+
+    def _load(self, rel: str, stat: os.stat_result) -> _IndexedFile:
+        lines: list[str] | None = None
+        if stat.st_size <= MAX_INDEXED_FILE_BYTES:
+            try:
+                with open(self.root / rel, encoding="utf-8") as handle:
+                    lines = handle.readlines()
+            except (UnicodeDecodeError, PermissionError, OSError, ValueError):
+                lines = None
+        grams = _trigrams("".join(lines).lower()) if lines else set()
+        return _IndexedFile(stat.st_mtime_ns, stat.st_size, lines, grams)
+
+    def _unindex(self, rel: str) -> None:
+        entry = self._files.pop(rel, None)
+        if entry is None:
+            return
+        for gram in entry.trigrams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(rel)
+                if not posting:
+                    del self._postings[gram]
+
+    def _index_file(self, rel: str, stat: os.stat_result) -> None:
+        self._unindex(rel)
+        entry = self._load(rel, stat)
+        self._files[rel] = entry
+        for gram in entry.trigrams:
+            self._postings.setdefault(gram, set()).add(rel)
+
+    def update_path(self, path: Path) -> None:
+        """Re-index a single file right away (e.g. after the server wrote it)."""
+        try:
+            rel_path = Path(path).resolve().relative_to(self.root.resolve())
+        except ValueError:
+            return
+        if self.excluded_dirs.intersection(rel_path.parts[:-1]):
+            return
+        rel = rel_path.as_posix()
+        with self._lock:
+            if not self._files:
+                # Not built yet; the first refresh will pick the file up.
+                return
+            try:
+                stat = os.stat(self.root / rel)
+            except OSError:
+                if rel in self._files:
+                    self._unindex(rel)
+                    self._sorted_paths = sorted(self._files)
+                    self.generation += 1
+                return
+            is_new = rel not in self._files
+            self._index_file(rel, stat)
+            if is_new:
+                self._sorted_paths = sorted(self._files)
+            self.generation += 1
+
+    def refresh(self, *, force: bool = False) -> int:
+        """Re-index changed files; returns the number of files added/changed/removed."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._files and now - self._last_refresh < _refresh_interval():
+                return 0
+            seen: set[str] = set()
+            changed = 0
+            for rel, stat in self._walk():
+                seen.add(rel)
+                current = self._files.get(rel)
+                if (
+                    current is not None
+                    and current.mtime_ns == stat.st_mtime_ns
+                    and current.size == stat.st_size
+                ):
+                    continue
+                self._index_file(rel, stat)
+                changed += 1
+            for rel in [rel for rel in self._files if rel not in seen]:
+                self._unindex(rel)
+                changed += 1
+            if changed:
+                self._sorted_paths = sorted(self._files)
+                self.generation += 1
+            self._last_refresh = time.monotonic()
+            return changed
+
+    def _content_candidates(self, query_lower: str) -> set[str] | None:
+        """Files that may contain ``query_lower``; ``None`` means every file."""
+        if len(query_lower) < 3:
+            return None
+        grams = sorted(_trigrams(query_lower), key=lambda g: len(self._postings.get(g, ())))
+        candidates: set[str] | None = None
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                return candidates
+        return candidates
+
+    def search(
+        self,
+        query: str,
+        *,
+        file_pattern: str = "*.py",
+        max_matches: int = 200,
+        is_allowed: Callable[[str], bool] | None = None,
+    ) -> tuple[list[SearchHit], bool]:
+        """Case-insensitive substring search over paths and lines.
+
+        Files are visited in path order; each yields an optional path hit (line 0)
+        followed by its matching lines. Returns ``(hits, truncated)``.
+        """
+        self.refresh()
+        query_lower = query.lower()
+        hits: list[SearchHit] = []
+        with self._lock:
+            candidates = self._content_candidates(query_lower)
+            for rel in self._sorted_paths:
+                if not fnmatch.fnmatch(rel.rsplit("/", 1)[-1], file_pattern):
+                    continue
+                path_hit = bool(query_lower) and query_lower in rel.lower()
+                content_possible = candidates is None or rel in candidates
+                if not path_hit and not content_possible:
+                    continue
+                if is_allowed is not None and not is_allowed(rel):
+                    continue
+                if path_hit:
+                    hits.append(SearchHit(rel, 0, "[path match]"))
+                    if len(hits) >= max_matches:
+                        return hits, True
+                lines = self._files[rel].lines
+                if not content_possible or not lines:
+                    continue
+                for line_num, line in enumerate(lines, 1):
+                    if query_lower in line.lower():
+                        hits.append(SearchHit(rel, line_num, line.strip()))
+                        if len(hits) >= max_matches:
+                            return hits, True
+        return hits, False
+
+
+_INDEXES: dict[Path, CodeSearchIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_code_index(root: Path) -> CodeSearchIndex:
+    """Shared index per project root (built on first use)."""
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(root)
+        if index is None:
+            index = CodeSearchIndex(root)
+            _INDEXES[root] = index
+        return index
+
+
+def warm_code_index(root: Path) -> threading.Thread:
+    """Build the index for ``root`` in a daemon thread (server startup)."""
+
+    def _build() -> None:
+        started = time.perf_counter()
+        index = get_code_index(root)
+        count = index.refresh(force=True)
+        logger.info(
+            "Code search index ready: %d files in %.2fs", count, time.perf_counter() - started
+        )
+
+    thread = threading.Thread(target=_build, name="mcp-code-index", daemon=True)
+    thread.start()
+    return thread
@@ -19,6 +19,7 @@ if TYPE_CHECKING:
     )
 
 
+from .code_index import warm_code_index
 from .config import get_project_root, load_config
 from .tools import (
     GIT_WORKFLOW_MUTATING_OPERATIONS,
@@ -1473,6 +1474,9 @@ if __name__ == "__main__":
     # Build best available transport app (FastMCP streamable HTTP or SSE fallback).
     app = _build_asgi_app()
 
+    # Build the search_code index in the background so the first query is fast.
+    warm_code_index(get_project_root())
+
     # Print routes for debugging (set GENESIS_MCP_DEBUG_ROUTES=1)
     if os.environ.get("GENESIS_MCP_DEBUG_ROUTES") == "1":
         print("Routes:")
@@ -80,7 +80,8 @@ except Exception:  # pragma: no cover - fallback for environments without mcp in
         yield (None, None)
 
 
-from mcp_server.config import load_config
+from mcp_server.code_index import warm_code_index
+from mcp_server.config import get_project_root, load_config
 from mcp_server.resources import (
     get_config_resource,
     get_documentation,
@@ -369,6 +370,9 @@ async def main():
     logger.info(f"  - Git Integration: {config.features.git_integration}")
     logger.info("=" * 60)
 
+    # Build the search_code index in the background so the first query is fast.
+    warm_code_index(get_project_root())
+
     # Start the server
     async with stdio_server() as (read_stream, write_stream):
         logger.info("MCP Server started and ready for connections")
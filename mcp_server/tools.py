@@ -14,10 +14,12 @@ import re
 import shutil
 import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Any
 from urllib.parse import quote, urlsplit, urlunsplit
 
+from .code_index import get_code_index
 from .config import MCPConfig, get_project_root
 from .utils import is_safe_path, sanitize_code
 
@@ -136,6 +138,8 @@ async def write_file(file_path: str, content: str, config: MCPConfig) -> dict[st
 
         # Write file content (no external deps; avoid aiofiles requirement)
         await asyncio.to_thread(path_obj.write_text, content, encoding="utf-8")
+        # Make the write visible to search_code without waiting for the next refresh.
+        await asyncio.to_thread(get_code_index(get_project_root()).update_path, path_obj)
 
         logger.info(f"Successfully wrote file: {file_path}")
         return {
@@ -285,6 +289,115 @@ async def execute_python(code: str, config: MCPConfig) -> dict[str, Any]:
         return {"success": False, "error": f"Error executing code: {str(e)}"}
 
 
+_STRUCTURE_CACHE: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+
+
+def _structure_cache_ttl() -> float:
+    try:
+        return max(0.0, float(os.environ.get("GENESIS_MCP_STRUCTURE_CACHE_SECONDS", "30")))
+    except ValueError:
+        return 30.0
+
+
+def _build_project_structure(
+    config: MCPConfig, *, max_lines_per_root: int, max_total_lines: int
+) -> dict[str, Any]:
+    from .utils import format_tree_structure
+
+    project_root = get_project_root()
+    tree_lines = [str(project_root.name)]
+
+    allowed_paths = config.security.allowed_paths or []
+    if not allowed_paths:
+        full_tree = format_tree_structure(project_root, "", max_depth=5)
+        if len(full_tree) > max_total_lines:
+            omitted = len(full_tree) - max_total_lines
+            full_tree = full_tree[:max_total_lines]
+            full_tree.append(f"... [truncated {omitted} lines]")
+        tree_lines.extend(full_tree)
+    else:
+        allowed_roots: list[Path] = []
+        for allowed in allowed_paths:
+            try:
+                allowed_root = (project_root / allowed).resolve()
+                allowed_root.relative_to(project_root)
+                if allowed_root.exists():
+                    allowed_roots.append(allowed_root)
+            except Exception:
+                continue
+
+        if not allowed_roots:
+            structure = "\n".join(tree_lines)
+            return {"success": True, "structure": structure, "root": str(project_root)}
+
+        allowed_roots = sorted(set(allowed_roots))
+        allowed_dir_roots = [p for p in allowed_roots if p.is_dir()]
+        allowed_file_roots = [p for p in allowed_roots if p.is_file()]
+
+        minimal_dir_roots: list[Path] = []
+        for candidate in allowed_dir_roots:
+            candidate_has_parent = False
+            for parent in allowed_dir_roots:
+                if candidate == parent:
+                    continue
+                try:
+                    candidate.relative_to(parent)
+                    candidate_has_parent = True
+                    break
+                except Exception:
+                    continue
+            if candidate_has_parent:
+                continue
+            minimal_dir_roots.append(candidate)
+
+        # Keep only allowed files not already covered by an allowed directory root.
+        minimal_file_roots: list[Path] = []
+        for f in allowed_file_roots:
+            file_is_covered = False
+            for d in minimal_dir_roots:
+                try:
+                    f.relative_to(d)
+                    file_is_covered = True
+                    break
+                except Exception:
+                    continue
+            if file_is_covered:
+                continue
+            minimal_file_roots.append(f)
+
+        display_roots: list[Path] = sorted(minimal_dir_roots + minimal_file_roots)
+
+        for i, allowed_root in enumerate(display_roots):
+            is_last = i == len(display_roots) - 1
+            current_prefix = "└── " if is_last else "├── "
+            rel = allowed_root.relative_to(project_root).as_posix()
+            tree_lines.append(f"{current_prefix}{rel}")
+
+            if allowed_root.is_dir():
+                extension = "    " if is_last else "│   "
+                # Reserve one level for the allowed root itself.
+                children = format_tree_structure(
+                    allowed_root,
+                    prefix=extension,
+                    max_depth=4,
+                    current_depth=0,
+                )
+                if len(children) > max_lines_per_root:
+                    omitted = len(children) - max_lines_per_root
+                    children = children[:max_lines_per_root]
+                    children.append(f"{extension}... [truncated {omitted} lines]")
+                tree_lines.extend(children)
+
+    if len(tree_lines) > max_total_lines:
+        omitted = len(tree_lines) - max_total_lines
+        tree_lines = tree_lines[:max_total_lines]
+        tree_lines.append(f"... [truncated {omitted} lines]")
+
+    structure = "\n".join(tree_lines)
+
+    return {"success": True, "structure": structure, "root": str(project_root)}
+
+
 async def get_project_structure(config: MCPConfig) -> dict[str, Any]:
     """
     Get the project structure as a tree.
@@ -296,8 +409,6 @@ async def get_project_structure(config: MCPConfig) -> dict[str, Any]:
         Dictionary with project structure or error information
     """
     try:
-        from .utils import format_tree_structure
-
         try:
             max_lines_per_root = int(
                 os.environ.get("GENESIS_MCP_STRUCTURE_MAX_LINES_PER_ROOT", "60")
@@ -312,105 +423,69 @@ async def get_project_structure(config: MCPConfig) -> dict[str, Any]:
             max_total_lines = 800
         max_total_lines = max(100, min(4000, max_total_lines))
 
-        project_root = get_project_root()
-        tree_lines = [str(project_root.name)]
-
-        allowed_paths = config.security.allowed_paths or []
-        if not allowed_paths:
-            full_tree = format_tree_structure(project_root, "", max_depth=5)
-            if len(full_tree) > max_total_lines:
-                omitted = len(full_tree) - max_total_lines
-                full_tree = full_tree[:max_total_lines]
-                full_tree.append(f"... [truncated {omitted} lines]")
-            tree_lines.extend(full_tree)
-        else:
-            allowed_roots: list[Path] = []
-            for allowed in allowed_paths:
-                try:
-                    allowed_root = (project_root / allowed).resolve()
-                    allowed_root.relative_to(project_root)
-                    if allowed_root.exists():
-                        allowed_roots.append(allowed_root)
-                except Exception:
-                    continue
-
-            if not allowed_roots:
-                structure = "\n".join(tree_lines)
-                return {"success": True, "structure": structure, "root": str(project_root)}
-
-            allowed_roots = sorted(set(allowed_roots))
-            allowed_dir_roots = [p for p in allowed_roots if p.is_dir()]
-            allowed_file_roots = [p for p in allowed_roots if p.is_file()]
-
-            minimal_dir_roots: list[Path] = []
-            for candidate in allowed_dir_roots:
-                candidate_has_parent = False
-                for parent in allowed_dir_roots:
-                    if candidate == parent:
-                        continue
-                    try:
-                        candidate.relative_to(parent)
-                        candidate_has_parent = True
-                        break
-                    except Exception:
-                        continue
-                if candidate_has_parent:
-                    continue
-                minimal_dir_roots.append(candidate)
-
-            # Keep only allowed files not already covered by an allowed directory root.
-            minimal_file_roots: list[Path] = []
-            for f in allowed_file_roots:
-                file_is_covered = False
-                for d in minimal_dir_roots:
-                    try:
-                        f.relative_to(d)
-                        file_is_covered = True
-                        break
-                    except Exception:
-                        continue
-                if file_is_covered:
-                    continue
-                minimal_file_roots.append(f)
-
-            display_roots: list[Path] = sorted(minimal_dir_roots + minimal_file_roots)
-
-            for i, allowed_root in enumerate(display_roots):
-                is_last = i == len(display_roots) - 1
-                current_prefix = "└── " if is_last else "├── "
-                rel = allowed_root.relative_to(project_root).as_posix()
-                tree_lines.append(f"{current_prefix}{rel}")
-
-                if allowed_root.is_dir():
-                    extension = "    " if is_last else "│   "
-                    # Reserve one level for the allowed root itself.
-                    children = format_tree_structure(
-                        allowed_root,
-                        prefix=extension,
-                        max_depth=4,
-                        current_depth=0,
-                    )
-                    if len(children) > max_lines_per_root:
-                        omitted = len(children) - max_lines_per_root
-                        children = children[:max_lines_per_root]
-                        children.append(f"{extension}... [truncated {omitted} lines]")
-                    tree_lines.extend(children)
-
-        if len(tree_lines) > max_total_lines:
-            omitted = len(tree_lines) - max_total_lines
-            tree_lines = tree_lines[:max_total_lines]
-            tree_lines.append(f"... [truncated {omitted} lines]")
-
-        structure = "\n".join(tree_lines)
+        cache_key = (
+            str(get_project_root()),
+            tuple(config.security.allowed_paths or ()),
+            max_lines_per_root,
+            max_total_lines,
+        )
+        cached = _STRUCTURE_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _structure_cache_ttl():
+            return dict(cached[1])
+
+        # Walking the tree is blocking I/O; keep it off the event loop.
+        result = await asyncio.to_thread(
+            _build_project_structure,
+            config,
+            max_lines_per_root=max_lines_per_root,
+            max_total_lines=max_total_lines,
+        )
+        _STRUCTURE_CACHE[cache_key] = (time.monotonic(), result)
 
         logger.info("Successfully generated project structure")
-        return {"success": True, "structure": structure, "root": str(project_root)}
+        return dict(result)
 
     except Exception as e:
         logger.error(f"Error generating project structure: {e}")
         return {"success": False, "error": f"Error generating structure: {str(e)}"}
 
 
+_SAFE_PATH_CACHE: dict[tuple[Any, ...], tuple[int, dict[str, bool]]] = {}
+
+
+def _search_code_blocking(
+    query: str, file_pattern: str, config: MCPConfig, max_matches: int
+) -> tuple[list[dict[str, Any]], bool]:
+    project_root = get_project_root()
+    index = get_code_index(project_root)
+    index.refresh()
+
+    # is_safe_path depends only on the path and the security config; memoize it per
+    # index generation so repeated queries don't re-resolve every candidate file.
+    cache_key = (
+        str(project_root),
+        tuple(config.security.allowed_paths or ()),
+        tuple(config.security.blocked_patterns),
+    )
+    generation, safe_paths = _SAFE_PATH_CACHE.get(cache_key, (-1, {}))
+    if generation != index.generation:
+        safe_paths = {}
+        _SAFE_PATH_CACHE[cache_key] = (index.generation, safe_paths)
+
+    def _is_allowed(relative_file: str) -> bool:
+        allowed = safe_paths.get(relative_file)
+        if allowed is None:
+            allowed, _ = is_safe_path(project_root / relative_file, config)
+            safe_paths[relative_file] = allowed
+        return allowed
+
+    hits, truncated = index.search(
+        query, file_pattern=file_pattern, max_matches=max_matches, is_allowed=_is_allowed
+    )
+    matches = [{"file": hit.file, "line": hit.line, "content": hit.content} for hit in hits]
+    return matches, truncated
+
+
 async def search_code(query: str, file_pattern: str | None, config: MCPConfig) -> dict[str, Any]:
     """
     Search for code in the project.
@@ -424,94 +499,16 @@ async def search_code(query: str, file_pattern: str | None, config: MCPConfig) -
         Dictionary with search results or error information
     """
     try:
-        project_root = get_project_root()
-        matches = []
-        truncated = False
-        query_lower = query.lower()
-
         try:
             max_matches = int(os.environ.get("GENESIS_MCP_SEARCH_MAX_MATCHES", "200"))
         except ValueError:
             max_matches = 200
         max_matches = max(20, min(2000, max_matches))
 
-        excluded_dirs = {
-            ".git",
-            ".venv",
-            "__pycache__",
-            "archive",
-            "cache",
-            "data",
-            "logs",
-            "reports",
-            "results",
-        }
-
-        # Determine which files to search
-        import fnmatch
-
-        files: list[Path] = []
-        pattern = file_pattern or "*.py"
-        for f in project_root.rglob(pattern):
-            try:
-                if excluded_dirs.intersection(f.parts):
-                    continue
-                if not f.is_file():
-                    continue
-                if file_pattern and not fnmatch.fnmatch(f.name, file_pattern):
-                    continue
-                files.append(f)
-            except OSError:
-                # Some files (e.g. within broken/locked environments) can raise on stat.
-                continue
-
-        # Search in files
-        for file_path in files:
-            if len(matches) >= max_matches:
-                truncated = True
-                break
-
-            # Skip files in blocked patterns
-            is_safe, _ = is_safe_path(file_path, config)
-            if not is_safe:
-                continue
-
-            relative_file = str(file_path.relative_to(project_root)).replace("\\", "/")
-            if query_lower and query_lower in relative_file.lower():
-                matches.append(
-                    {
-                        "file": relative_file,
-                        "line": 0,
-                        "content": "[path match]",
-                    }
-                )
-                if len(matches) >= max_matches:
-                    truncated = True
-                    break
-
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    lines = f.readlines()
-
-                for line_num, line in enumerate(lines, 1):
-                    if query_lower in line.lower():
-                        matches.append(
-                            {
-                                "file": relative_file,
-                                "line": line_num,
-                                "content": line.strip(),
-                            }
-                        )
-                        if len(matches) >= max_matches:
-                            truncated = True
-                            break
-
-                if truncated:
-                    break
-
-            except (UnicodeDecodeError, PermissionError, OSError, ValueError):
-                # Skip files that can't be read
-                continue
+        # Index refresh (stat walk, re-reading changed files) and matching are blocking.
+        matches, truncated = await asyncio.to_thread(
+            _search_code_blocking, query, file_pattern or "*.py", config, max_matches
+        )
 
         logger.info(
             "Search for '%s' found %d matches%s",
@@ -0,0 +1,184 @@
+"""Audit cold-start import cost of Genesis-Core entry points.
+
+Why this exists
+--------------
+The FastAPI server, the pipeline bootstrap and optimizer workers are started
+often (reloads, CLI invocations, one process per Optuna worker). Heavy
+dependencies (optuna, sklearn, numba, yaml, pandas) are deferred until the code
+path that needs them runs; see core.utils.lazy_import. This script measures
+each entry point with ``python -X importtime`` in a fresh interpreter and fails
+when a forbidden module is loaded at import time or a time budget is exceeded.
+
+Usage
+-----
+python scripts/audit/import_time_audit.py
+python scripts/audit/import_time_audit.py --entry core.server --top 25
+python scripts/audit/import_time_audit.py --enforce-time
+
+Exit codes
+----------
+0: All entry points within budget
+2: Budget violations found
+3: An entry point failed to import
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class ImportBudget:
+    entry: str
+    forbidden: tuple[str, ...]
+    max_seconds: float
+
+
+# Time limits are generous on purpose (CI machines vary); forbidden modules are
+# the real contract. Tighten limits locally with --enforce-time.
+BUDGETS: tuple[ImportBudget, ...] = (
+    ImportBudget(
+        "core.pipeline",
+        forbidden=("optuna", "sklearn", "numba", "yaml", "pandas", "tqdm"),
+        max_seconds=0.25,
+    ),
+    ImportBudget(
+        "core.server",
+        forbidden=("optuna", "sklearn", "numba", "yaml", "pandas"),
+        max_seconds=1.5,
+    ),
+    ImportBudget(
+        "core.optimizer.runner",
+        forbidden=("optuna", "sklearn", "numba", "yaml"),
+        max_seconds=1.5,
+    ),
+    ImportBudget(
+        "core.api.strategy",
+        forbidden=("optuna", "sklearn", "numba", "yaml", "pandas"),
+        max_seconds=1.5,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass(frozen=True)
+class AuditResult:
+    entry: str
+    total_seconds: float
+    records: tuple[ImportRecord, ...]
+    violations: tuple[str, ...]
+
+
+def _find_repo_root() -> Path:
+    here = Path(__file__).resolve()
+    for parent in [here.parent, *here.parents]:
+        if (parent / "pyproject.toml").is_file() and (parent / "src").is_dir():
+            return parent
+    return here.parents[1]
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    """Parse ``-X importtime`` output into records (header and noise skipped)."""
+    records: list[ImportRecord] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # header row
+        records.append(ImportRecord(parts[2].strip(), self_us, cumulative_us))
+    return records
+
+
+def measure_entry(entry: str, *, repo_root: Path) -> list[ImportRecord]:
+    env = dict(os.environ)
+    src = str(repo_root / "src")
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH")) if p)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {entry}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=str(repo_root),
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {entry} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def check_budget(
+    budget: ImportBudget, records: list[ImportRecord], *, enforce_time: bool
+) -> AuditResult:
+    loaded = {r.module for r in records}
+    violations = [
+        f"{budget.entry} loads forbidden module '{name}'"
+        for name in budget.forbidden
+        if name in loaded
+    ]
+    entry_record = next((r for r in records if r.module == budget.entry), None)
+    total = (entry_record.cumulative_us if entry_record else 0) / 1e6
+    if enforce_time and total > budget.max_seconds:
+        violations.append(f"{budget.entry} took {total:.3f}s (budget {budget.max_seconds:.3f}s)")
+    return AuditResult(budget.entry, total, tuple(records), tuple(violations))
+
+
+def _print_result(result: AuditResult, *, top: int) -> None:
+    print(f"== {result.entry}: {result.total_seconds:.3f}s")
+    heaviest = sorted(result.records, key=lambda r: r.cumulative_us, reverse=True)[:top]
+    for record in heaviest:
+        print(f"   {record.cumulative_us / 1e3:9.1f} ms  {record.module}")
+    for violation in result.violations:
+        print(f"   VIOLATION: {violation}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entry", action="append", help="Only audit these entry modules")
+    parser.add_argument("--top", type=int, default=15, help="Heaviest modules to list")
+    parser.add_argument(
+        "--enforce-time", action="store_true", help="Also fail on time budget overruns"
+    )
+    args = parser.parse_args()
+
+    repo_root = _find_repo_root()
+    budgets = [b for b in BUDGETS if not args.entry or b.entry in args.entry]
+    if args.entry:
+        known = {b.entry for b in budgets}
+        budgets += [ImportBudget(e, (), float("inf")) for e in args.entry if e not in known]
+
+    violations = 0
+    for budget in budgets:
+        try:
+            records = measure_entry(budget.entry, repo_root=repo_root)
+        except RuntimeError as exc:
+            print(str(exc), file=sys.stderr)
+            return 3
+        result = check_budget(budget, records, enforce_time=args.enforce_time)
+        _print_result(result, top=args.top)
+        violations += len(result.violations)
+
+    if violations:
+        print(f"{violations} import budget violation(s)")
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -772,9 +772,12 @@ def submit_paper_order(
             "type": "MARKET",
         }
 
+        started = time.perf_counter()
         resp = client.post(url, json=payload, timeout=10.0)
         resp.raise_for_status()
         data = resp.json()
+        # Client-side submit-to-ack latency; the server logs its exchange round trip.
+        logger.info("paper_submit ack in %.1f ms", (time.perf_counter() - started) * 1000.0)
         if not isinstance(data, dict) or not data.get("ok"):
             logger.error(f"paper_submit returned ok=false: {data}")
             return None
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Run the offline benchmark suite and optionally compare against a baseline.
+
+Usage:
+    python scripts/run/run_benchmarks.py --output results/benchmarks/latest.json
+    python scripts/run/run_benchmarks.py --scenarios engine_run precompute --bars 1000
+    python scripts/run/run_benchmarks.py --baseline results/benchmarks/baseline.json
+    python scripts/run/run_benchmarks.py --save-baseline results/benchmarks/baseline.json
+
+Exit code is 1 when any directional metric regresses beyond the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def _repo_root() -> Path:
+    here = Path(__file__).resolve()
+    for candidate in [here, *here.parents]:
+        if (candidate / "pyproject.toml").exists() and (candidate / "src").exists():
+            return candidate
+    raise RuntimeError("Could not locate repository root from script path")
+
+
+def _ensure_import_path() -> None:
+    root = _repo_root()
+    for p in (root, root / "src"):
+        sp = str(p)
+        if sp not in sys.path:
+            sys.path.insert(0, sp)
+
+
+_ensure_import_path()
+
+from core.benchmark import (  # noqa: E402
+    DATASET_KINDS,
+    DEFAULT_TOLERANCE,
+    SCENARIOS,
+    SyntheticDatasetSpec,
+    compare_reports,
+    load_report,
+    run_benchmarks,
+    write_report,
+)
+
+
+def _parse_metric_tolerances(items: list[str]) -> dict[str, float]:
+    tolerances: dict[str, float] = {}
+    for item in items:
+        name, _, value = item.partition("=")
+        if not name or not value:
+            raise SystemExit(f"--metric-tolerance expects NAME=FLOAT, got {item!r}")
+        tolerances[name] = float(value)
+    return tolerances
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Genesis-Core benchmark suite")
+    parser.add_argument(
+        "--scenarios", nargs="+", default=list(SCENARIOS), choices=sorted(SCENARIOS)
+    )
+    parser.add_argument("--kind", default="regime_switch", choices=DATASET_KINDS)
+    parser.add_argument("--bars", type=int, default=2000)
+    parser.add_argument("--timeframe", default="3h")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--config", type=Path, default=None, help="Strategy config JSON")
+    parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run scenarios in this process (faster, but peak RSS is process-wide)",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write the report here")
+    parser.add_argument("--baseline", type=Path, default=None, help="Compare against report")
+    parser.add_argument("--save-baseline", type=Path, default=None)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--metric-tolerance", action="append", default=[], metavar="NAME=FLOAT")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        args.scenarios,
+        dataset=SyntheticDatasetSpec(
+            kind=args.kind, bars=args.bars, timeframe=args.timeframe, seed=args.seed
+        ),
+        repeats=args.repeats,
+        trials=args.trials,
+        config_path=args.config,
+        isolate=not args.no_isolate,
+    )
+    if args.output:
+        write_report(report, args.output)
+    if args.save_baseline:
+        write_report(report, args.save_baseline)
+    if not args.output and not args.save_baseline:
+        print(json.dumps(report, indent=2, sort_keys=True))
+
+    if args.baseline is None:
+        return 0
+
+    comparisons = compare_reports(
+        report,
+        load_report(args.baseline),
+        tolerance=args.tolerance,
+        metric_tolerances=_parse_metric_tolerances(args.metric_tolerance),
+    )
+    regressions = [item for item in comparisons if item.regressed]
+    for item in comparisons:
+        marker = "REGRESSION" if item.regressed else "ok"
+        print(
+            f"[{marker}] {item.scenario}.{item.metric}: "
+            f"{item.baseline:.4g} -> {item.current:.4g} ({item.relative_change:+.1%})"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -3,11 +3,13 @@ from __future__ import annotations
 import asyncio
 import time
 import uuid
+from typing import Any
 
 from fastapi import APIRouter
 
 from core.io.bitfinex import read_helpers as bfx_read
 from core.utils.logging_redaction import get_logger
+from core.utils.single_flight import StaleWhileRevalidateCache
 
 _LOGGER = get_logger("core.server")
 
@@ -30,91 +32,133 @@ async def auth_check() -> dict:
     return {"ok": True, "wallets": w_count, "positions": p_count}
 
 
-@router.get("/account/wallets")
-async def account_wallets() -> dict:
-    now = time.time()
-    if now - _ACCOUNT_CACHE["wallets"]["ts"] < _ACCOUNT_TTL:
-        return _ACCOUNT_CACHE["wallets"]["data"]
+_ACCOUNT_STALE_TTL = 30.0
+
+# Shared by the per-resource routes and /account/snapshot: concurrent misses issue one
+# signed request per resource, and entries past the TTL are served while refreshing.
+_ACCOUNT_SWR = StaleWhileRevalidateCache(
+    ttl=_ACCOUNT_TTL,
+    stale_ttl=_ACCOUNT_STALE_TTL,
+    name="account_cache",
+    store=_ACCOUNT_CACHE,
+)
+
+
+def _normalize_wallets(data: Any) -> dict:
+    items = []
+    if isinstance(data, list):
+        for w in data:
+            if isinstance(w, list) and len(w) >= 5 and str(w[0]).lower() == "exchange":
+                items.append(
+                    {
+                        "type": w[0],
+                        "currency": str(w[1]).upper(),
+                        "balance": float(w[2]),
+                        "available": float(w[4]) if w[4] is not None else None,
+                    }
+                )
+    return {"items": items}
+
+
+def _normalize_positions(data: Any) -> dict:
+    items = []
+    if isinstance(data, list):
+        for p in data:
+            if isinstance(p, list) and len(p) >= 4:
+                sym = str(p[0])
+                if not (sym.startswith("tTEST") or ":TEST" in sym):
+                    continue
+                items.append(
+                    {
+                        "symbol": sym,
+                        "status": p[1],
+                        "amount": float(p[2]),
+                        "base_price": float(p[3]) if p[3] is not None else None,
+                    }
+                )
+    return {"items": items}
+
+
+def _normalize_orders(data: Any) -> dict:
+    items = []
+    if isinstance(data, list):
+        for o in data:
+            if isinstance(o, list) and len(o) >= 8:
+                sym = str(o[3])
+                if not (sym.startswith("tTEST") or ":TEST" in sym):
+                    continue
+                items.append(
+                    {
+                        "symbol": sym,
+                        "amount": float(o[6]) if o[6] is not None else None,
+                        "type": o[8] if len(o) > 8 else None,
+                        "status": o[13] if len(o) > 13 else None,
+                    }
+                )
+    return {"items": items}
+
+
+def _resource_loader(name: str):
+    # Resolve helpers at call time so monkeypatched read_helpers are honoured.
+    fetchers = {
+        "wallets": (lambda: bfx_read.get_wallets(), _normalize_wallets),
+        "positions": (lambda: bfx_read.get_positions(), _normalize_positions),
+        "orders": (lambda: bfx_read.get_orders(), _normalize_orders),
+    }
+    fetch, normalize = fetchers[name]
+
+    async def _load() -> dict:
+        return normalize(await fetch())
+
+    return _load
+
+
+async def _cached_resource(name: str) -> dict:
     try:
-        data = await bfx_read.get_wallets()
-        items = []
-        if isinstance(data, list):
-            for w in data:
-                if isinstance(w, list) and len(w) >= 5 and str(w[0]).lower() == "exchange":
-                    items.append(
-                        {
-                            "type": w[0],
-                            "currency": str(w[1]).upper(),
-                            "balance": float(w[2]),
-                            "available": float(w[4]) if w[4] is not None else None,
-                        }
-                    )
-        out = {"items": items}
-        _ACCOUNT_CACHE["wallets"] = {"ts": now, "data": out}
-        return out
+        return await _ACCOUNT_SWR.get(name, _resource_loader(name))
     except Exception:
         error_id = uuid.uuid4().hex[:12]
-        _LOGGER.exception("/account/wallets failed (error_id=%s)", error_id)
+        _LOGGER.exception("/account/%s failed (error_id=%s)", name, error_id)
         return {"items": [], "error": "internal_error", "error_id": error_id}
 
 
+@router.get("/account/wallets")
+async def account_wallets() -> dict:
+    return await _cached_resource("wallets")
+
+
 @router.get("/account/positions")
 async def account_positions() -> dict:
-    now = time.time()
-    if now - _ACCOUNT_CACHE["positions"]["ts"] < _ACCOUNT_TTL:
-        return _ACCOUNT_CACHE["positions"]["data"]
-    try:
-        data = await bfx_read.get_positions()
-        items = []
-        if isinstance(data, list):
-            for p in data:
-                if isinstance(p, list) and len(p) >= 4:
-                    sym = str(p[0])
-                    if not (sym.startswith("tTEST") or ":TEST" in sym):
-                        continue
-                    items.append(
-                        {
-                            "symbol": sym,
-                            "status": p[1],
-                            "amount": float(p[2]),
-                            "base_price": float(p[3]) if p[3] is not None else None,
-                        }
-                    )
-        out = {"items": items}
-        _ACCOUNT_CACHE["positions"] = {"ts": now, "data": out}
-        return out
-    except Exception:
-        error_id = uuid.uuid4().hex[:12]
-        _LOGGER.exception("/account/positions failed (error_id=%s)", error_id)
-        return {"items": [], "error": "internal_error", "error_id": error_id}
+    return await _cached_resource("positions")
 
 
 @router.get("/account/orders")
 async def account_orders() -> dict:
+    return await _cached_resource("orders")
+
+
+@router.get("/account/snapshot")
+async def account_snapshot() -> dict:
+    """Wallets + positions + orders in one response.
+
+    The three signed reads run concurrently; each goes through the shared
+    single-flight/stale-while-revalidate cache, so N concurrent snapshot callers
+    cause at most one exchange request per resource. A failing resource is
+    reported in place without failing the others.
+    """
+    started = time.perf_counter()
+    names = ("wallets", "positions", "orders")
+    parts = await asyncio.gather(*(_cached_resource(name) for name in names))
+    out: dict[str, Any] = dict(zip(names, parts, strict=True))
+    ages = []
     now = time.time()
-    if now - _ACCOUNT_CACHE["orders"]["ts"] < _ACCOUNT_TTL:
-        return _ACCOUNT_CACHE["orders"]["data"]
-    try:
-        data = await bfx_read.get_orders()
-        items = []
-        if isinstance(data, list):
-            for o in data:
-                if isinstance(o, list) and len(o) >= 8:
-                    sym = str(o[3])
-                    if not (sym.startswith("tTEST") or ":TEST" in sym):
-                        continue
-                    items.append(
-                        {
-                            "symbol": sym,
-                            "amount": float(o[6]) if o[6] is not None else None,
-                            "type": o[8] if len(o) > 8 else None,
-                            "status": o[13] if len(o) > 13 else None,
-                        }
-                    )
-        out = {"items": items}
-        _ACCOUNT_CACHE["orders"] = {"ts": now, "data": out}
-        return out
-    except Exception:
-        error_id = uuid.uuid4().hex[:12]
-        _LOGGER.exception("/account/orders failed (error_id=%s)", error_id)
-        return {"items": [], "error": "internal_error", "error_id": error_id}
+    for name in names:
+        entry = _ACCOUNT_SWR.peek(name)
+        ages.append(now - float(entry["ts"]) if entry else None)
+    out["meta"] = {
+        "max_age_s": max((a for a in ages if a is not None), default=None),
+        "stale": any(a is not None and a >= _ACCOUNT_TTL for a in ages),
+        "latency_ms": round((time.perf_counter() - started) * 1000.0, 3),
+        "cache": _ACCOUNT_SWR.snapshot_stats(),
+    }
+    return out
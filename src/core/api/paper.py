@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
 
 import httpx
@@ -8,6 +9,7 @@ from fastapi import APIRouter, Body
 from core.config.settings import get_settings as fallback_get_settings
 from core.io.bitfinex import read_helpers as fallback_bfx_read
 from core.io.bitfinex.exchange_client import get_exchange_client as fallback_get_exchange_client
+from core.io.bitfinex.order_pipeline import OrderQueueFull, get_order_pipeline
 from core.utils.logging_redaction import get_logger
 
 from .info import TEST_SPOT_WHITELIST as fallback_test_spot_whitelist
@@ -92,6 +94,21 @@ def _resolve_logger():
     return _FALLBACK_LOGGER
 
 
+async def _fetch_last_price(real_sym: str) -> float | None:
+    try:
+        resp = await _resolve_get_exchange_client()().public_request(
+            method="GET",
+            endpoint=f"ticker/{real_sym}",
+            timeout=5,
+        )
+        arr = resp.json()
+        if isinstance(arr, list) and len(arr) >= 7:
+            return float(arr[6])
+    except Exception:
+        return None
+    return None
+
+
 @router.get("/paper/estimate")
 async def paper_estimate(symbol: str) -> dict:
     """Beräkna minsta storlek (med marginal) och ungefärlig max-storlek utifrån USD-saldo.
@@ -211,7 +228,20 @@ async def paper_submit(payload: dict = Body(...)) -> dict:
             and settings.BITFINEX_API_KEY
             and settings.BITFINEX_API_SECRET
         ):
-            wallets = await _resolve_bfx_read().get_wallets()
+            real_sym = _resolve_real_from_test()(symbol)
+            base_ccy = _resolve_base_ccy_from_test()(symbol)
+            px = None
+            if side == "LONG":
+                # Wallets och ticker är oberoende: hämta parallellt (kortare signal-to-ack).
+                wallets, px = await asyncio.gather(
+                    _resolve_bfx_read().get_wallets(),
+                    _fetch_last_price(real_sym),
+                    return_exceptions=True,
+                )
+                if isinstance(wallets, BaseException):
+                    raise wallets
+            else:
+                wallets = await _resolve_bfx_read().get_wallets()
             avail_by_ccy: dict[str, float] = {}
             if isinstance(wallets, list):
                 for wallet in wallets:
@@ -233,21 +263,9 @@ async def paper_submit(payload: dict = Body(...)) -> dict:
                                 0.0, available
                             )
 
-            real_sym = _resolve_real_from_test()(symbol)
-            base_ccy = _resolve_base_ccy_from_test()(symbol)
             if side == "LONG":
                 usd_avail = avail_by_ccy.get("USD", 0.0) or avail_by_ccy.get("TESTUSD", 0.0) or 0.0
-                px = None
-                try:
-                    resp = await _resolve_get_exchange_client()().public_request(
-                        method="GET",
-                        endpoint=f"ticker/{real_sym}",
-                        timeout=5,
-                    )
-                    arr = resp.json()
-                    if isinstance(arr, list) and len(arr) >= 7:
-                        px = float(arr[6])
-                except Exception:
+                if isinstance(px, BaseException):
                     px = None
                 if px and px > 0 and usd_avail > 0:
                     max_affordable = usd_avail / px
@@ -278,7 +296,14 @@ async def paper_submit(payload: dict = Body(...)) -> dict:
 
     ec = _resolve_get_exchange_client()()
     try:
-        resp = await ec.signed_request(method="POST", endpoint="auth/w/order/submit", body=body)
+        result = await get_order_pipeline().submit(ec, body)
+        resp = result.response
+        _resolve_logger().info(
+            "paper_submit ack total_ms=%.1f exchange_ms=%.1f queued_ms=%.1f",
+            result.latency.total_ms,
+            result.latency.exchange_ms,
+            result.latency.queued_ms,
+        )
         data = resp.json() if hasattr(resp, "json") else {"status": resp.status_code}
         return {
             "ok": True,
@@ -294,6 +319,9 @@ async def paper_submit(payload: dict = Body(...)) -> dict:
                 "min_with_margin": min_with_margin,
             },
         }
+    except OrderQueueFull as exc:
+        _resolve_logger().warning("paper_submit rejected: %s", exc)
+        return {"ok": False, "error": "order_queue_full"}
     except httpx.HTTPStatusError as exc:
         error_id = uuid.uuid4().hex[:12]
         status = getattr(exc.response, "status_code", None)
@@ -1,13 +1,55 @@
 from __future__ import annotations
 
-import time
+from collections import OrderedDict
+from typing import Any
 
 from fastapi import APIRouter
 
+from core.utils.single_flight import StaleWhileRevalidateCache
+
 router = APIRouter()
 
-_CANDLES_CACHE = {}  # key -> {ts: float, data: dict}
 _CANDLES_TTL = 10.0  # 10s cache for candles
+_CANDLES_STALE_TTL = 60.0  # serve stale candles while refreshing for up to 60s
+_CANDLES_RING_DEPTH = 240  # minimum candles fetched per (symbol, timeframe)
+_CANDLES_MAX_LIMIT = 1000  # Bitfinex hist limit
+_CANDLES_MAX_KEYS = 64
+
+
+class _BoundedCache(OrderedDict):
+    """LRU-bounded dict: reads and writes refresh a key; inserting beyond ``maxsize``
+    evicts the least recently used one."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = int(maxsize)
+
+    def __getitem__(self, key: Any) -> Any:
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        # OrderedDict.get bypasses __getitem__; route hits through it to refresh recency.
+        return self[key] if key in self else default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        if key in self:
+            self.move_to_end(key)
+        super().__setitem__(key, value)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# "symbol:timeframe" -> {ts: float, data: {"depth": int, "candles": {...}}}
+# One ring per (symbol, timeframe) serves every limit <= its depth.
+_CANDLES_CACHE: _BoundedCache = _BoundedCache(_CANDLES_MAX_KEYS)
+_CANDLES_SWR = StaleWhileRevalidateCache(
+    ttl=_CANDLES_TTL,
+    stale_ttl=_CANDLES_STALE_TTL,
+    name="public_candles_cache",
+    store=_CANDLES_CACHE,
+)
 
 
 def _resolve_get_exchange_client():
@@ -21,24 +63,7 @@ def _resolve_get_exchange_client():
         return get_exchange_client
 
 
-@router.get("/public/candles")
-async def public_candles(symbol: str = "tBTCUSD", timeframe: str = "1m", limit: int = 120) -> dict:
-    """Proxy till Bitfinex public candles och normaliserar till {open,high,low,close,volume}."""
-    cache_key = f"{symbol}:{timeframe}:{limit}"
-    now = time.time()
-    if cache_key in _CANDLES_CACHE:
-        entry = _CANDLES_CACHE[cache_key]
-        if now - entry["ts"] < _CANDLES_TTL:
-            return entry["data"]
-
-    safe_limit = max(1, min(int(limit), 1000))
-    endpoint = f"candles/trade:{timeframe}:{symbol}/hist"
-    params = {"limit": safe_limit, "sort": 1}
-
-    ec = _resolve_get_exchange_client()()
-    response = await ec.public_request(method="GET", endpoint=endpoint, params=params, timeout=10)
-    data = response.json()
-
+def _normalize_candles(data: Any) -> dict[str, list[float]]:
     opens: list[float] = []
     highs: list[float] = []
     lows: list[float] = []
@@ -54,7 +79,7 @@ async def public_candles(symbol: str = "tBTCUSD", timeframe: str = "1m", limit:
                 lows.append(float(row[4]))
                 volumes.append(float(row[5]))
 
-    result = {
+    return {
         "open": opens,
         "high": highs,
         "low": lows,
@@ -62,5 +87,52 @@ async def public_candles(symbol: str = "tBTCUSD", timeframe: str = "1m", limit:
         "volume": volumes,
     }
 
-    _CANDLES_CACHE[cache_key] = {"ts": now, "data": result}
-    return result
+
+async def _fetch_ring(symbol: str, timeframe: str, depth: int) -> dict[str, Any]:
+    endpoint = f"candles/trade:{timeframe}:{symbol}/hist"
+    params = {"limit": depth, "sort": 1}
+
+    ec = _resolve_get_exchange_client()()
+    response = await ec.public_request(method="GET", endpoint=endpoint, params=params, timeout=10)
+    return {"depth": depth, "candles": _normalize_candles(response.json())}
+
+
+def _tail(ring: dict[str, Any], limit: int) -> dict[str, list[float]]:
+    return {name: values[-limit:] for name, values in ring["candles"].items()}
+
+
+def candles_cache_stats() -> dict[str, Any]:
+    """Hit/miss counters and occupancy of the /public/candles ring cache."""
+    return {**_CANDLES_SWR.snapshot_stats(), "max_keys": _CANDLES_CACHE.maxsize}
+
+
+@router.get("/public/candles")
+async def public_candles(symbol: str = "tBTCUSD", timeframe: str = "1m", limit: int = 120) -> dict:
+    """Proxy till Bitfinex public candles och normaliserar till {open,high,low,close,volume}.
+
+    Candles are cached as one ring (the latest ``depth`` candles) per (symbol, timeframe):
+    any ``limit`` up to the ring depth is served from a single upstream fetch, concurrent
+    misses share one request, and expired rings are refreshed in the background.
+    """
+    safe_limit = max(1, min(int(limit), _CANDLES_MAX_LIMIT))
+    cache_key = f"{symbol}:{timeframe}"
+
+    def _deep_enough(ring: Any) -> bool:
+        return isinstance(ring, dict) and int(ring.get("depth", 0)) >= safe_limit
+
+    def _loader():
+        current = _CANDLES_SWR.peek(cache_key)
+        current_depth = int(current["data"].get("depth", 0)) if current else 0
+        depth = min(max(_CANDLES_RING_DEPTH, safe_limit, current_depth), _CANDLES_MAX_LIMIT)
+        return _fetch_ring(symbol, timeframe, depth)
+
+    ring = await _CANDLES_SWR.get(cache_key, _loader, accept=_deep_enough)
+    if not _deep_enough(ring):
+        # Coalesced onto a shallower in-flight fetch; deepen the ring once.
+        ring = await _CANDLES_SWR.get(cache_key, _loader, accept=_deep_enough)
+    return _tail(ring, safe_limit)
+
+
+@router.get("/public/candles/stats")
+async def public_candles_stats() -> dict:
+    return candles_cache_stats()
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import APIRouter, Body
 
-from core.strategy.evaluate import evaluate_pipeline
+from core.utils.lazy_import import resolve_lazy_attribute
 
 router = APIRouter()
 
+# evaluate_pipeline pulls in pandas and the whole strategy stack; resolve it on the
+# first request so importing core.server stays fast.
+_LAZY_EXPORTS = {"evaluate_pipeline": "core.strategy.evaluate"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        return resolve_lazy_attribute(globals(), name, _LAZY_EXPORTS)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 @router.post("/strategy/evaluate")
 def strategy_evaluate(payload: dict = Body({})) -> dict:
@@ -38,5 +50,6 @@ def strategy_evaluate(payload: dict = Body({})) -> dict:
     policy = payload.get("policy") or {"symbol": "tBTCUSD", "timeframe": "1m"}
     configs = payload.get("configs") or {}
     state = payload.get("state") or {}
+    evaluate_pipeline = resolve_lazy_attribute(globals(), "evaluate_pipeline", _LAZY_EXPORTS)
     result, meta = evaluate_pipeline(candles, policy=policy, configs=configs, state=state)
     return {"result": result, "meta": meta}
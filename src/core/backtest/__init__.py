@@ -2,16 +2,23 @@
 Backtest module for Genesis-Core.
 
 Provides tools for backtesting trading strategies on historical data.
+
+Exports are resolved on first access so that importing a light submodule
+(e.g. ``core.backtest.metrics``) does not load the engine and pandas.
 """
 
-from core.backtest.engine import BacktestEngine
-from core.backtest.metrics import (
-    calculate_backtest_metrics,
-    calculate_metrics,  # Backward compatibility
-    print_metrics_report,  # Backward compatibility
-)
-from core.backtest.position_tracker import PositionTracker
-from core.backtest.trade_logger import TradeLogger
+from typing import Any
+
+from core.utils.lazy_import import resolve_lazy_attribute
+
+_LAZY_EXPORTS = {
+    "BacktestEngine": "core.backtest.engine",
+    "PositionTracker": "core.backtest.position_tracker",
+    "calculate_backtest_metrics": "core.backtest.metrics",
+    "calculate_metrics": "core.backtest.metrics",  # Backward compatibility
+    "print_metrics_report": "core.backtest.metrics",  # Backward compatibility
+    "TradeLogger": "core.backtest.trade_logger",
+}
 
 __all__ = [
     "BacktestEngine",
@@ -21,3 +28,13 @@ __all__ = [
     "print_metrics_report",
     "TradeLogger",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        return resolve_lazy_attribute(globals(), name, _LAZY_EXPORTS)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
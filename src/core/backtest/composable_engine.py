@@ -48,6 +48,9 @@ class ComposableBacktestEngine:
         """
         self.strategy = strategy
         self.attribution_tracker = AttributionTracker()
+        # Approved bars evaluate every component; share one immutable name tuple instead of
+        # rebuilding a list per bar.
+        approved_components = tuple(component.name() for component in strategy.components)
 
         # Create evaluation hook that applies component filtering
         def component_evaluation_hook(result: dict, meta: dict, candles: dict):
@@ -89,7 +92,7 @@ class ComposableBacktestEngine:
                 # Components allowed - keep original action
                 meta["component_approved"] = {
                     "confidence": decision.confidence,
-                    "components": list((decision.component_results or {}).keys()),
+                    "components": approved_components,
                 }
 
             return result, meta
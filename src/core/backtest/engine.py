@@ -17,6 +17,7 @@ import pandas as pd
 from tqdm import tqdm
 
 from core.backtest.engine_precompute import (
+    ensure_atr_period_features,
     get_persisted_precompute_spec,
     prepare_precomputed_features,
 )
@@ -24,9 +25,17 @@ from core.backtest.engine_results import _build_backtest_results_payload
 from core.backtest.htf_exit_engine import ExitAction
 from core.backtest.htf_exit_engine import HTFFibonacciExitEngine as LegacyExitEngine
 from core.config.merge_policy import resolve_champion_merge_for_engine
+from core.indicators.htf_resample import (
+    can_derive_timeframe,
+    derived_source_label,
+    get_resampled_candles,
+    timeframe_to_minutes,
+)
 from core.utils.dict_merge import deep_merge_dicts
 from core.utils.env_flags import env_flag_enabled
+from core.utils.feature_store import FeatureKey, default_feature_store
 from core.utils.logging_redaction import get_logger
+from core.utils.provenance import fingerprint_dataframe
 
 try:
     from core.strategy.htf_exit_engine import HTFFibonacciExitEngine as NewExitEngine
@@ -37,10 +46,12 @@ from core.backtest.position_tracker import PositionTracker
 from core.indicators.exit_fibonacci import calculate_exit_fibonacci_levels
 from core.strategy.champion_loader import ChampionLoader
 from core.strategy.evaluate import evaluate_pipeline
+from core.strategy.features_asof_parts.result_cache_utils import feature_config_fingerprint
 
 _LOGGER = get_logger(__name__)
 _PER_BAR_ERROR_POLICY = "continue_collect_raise_after_loop"
 _VALID_PER_BAR_ERROR_POLICIES = (_PER_BAR_ERROR_POLICY, "fail_fast")
+_VALID_HTF_DERIVE_MODES = ("off", "missing", "stale", "always")
 
 
 # B1: On-disk precompute cache versioning.
@@ -253,6 +264,39 @@ def _resolve_htf_exit_engine_selection(
     return isinstance(htf_exit_config, dict) and bool(htf_exit_config)
 
 
+def _resolve_htf_derive_mode(raw: str | None) -> str:
+    """Return the HTF derivation mode from ``GENESIS_HTF_DERIVE``.
+
+    - ``missing`` (default): resample from base candles only when no HTF file exists.
+    - ``stale``: additionally resample when the HTF file ends before the base data.
+    - ``always``: ignore HTF files and always resample.
+    - ``off`` (or any falsy flag token): never resample (legacy behaviour).
+    """
+
+    value = str(raw or "").strip().lower()
+    if not value:
+        return "missing"
+    if not env_flag_enabled(value, default=True):
+        return "off"
+    if value in _VALID_HTF_DERIVE_MODES:
+        return value
+    _LOGGER.warning("GENESIS_HTF_DERIVE=%r not recognised; using 'missing'", raw)
+    return "missing"
+
+
+def _htf_candles_are_stale(htf_df: pd.DataFrame, base_df: pd.DataFrame, htf_timeframe: str) -> bool:
+    """Return True when the last HTF bar closes more than one HTF period before the base data."""
+
+    minutes = timeframe_to_minutes(htf_timeframe)
+    if minutes is None or len(htf_df) == 0 or len(base_df) == 0:
+        return False
+    htf_last = pd.to_datetime(htf_df["timestamp"], utc=True, errors="coerce").max()
+    base_last = pd.to_datetime(base_df["timestamp"], utc=True, errors="coerce").max()
+    if pd.isna(htf_last) or pd.isna(base_last):
+        return False
+    return bool(htf_last + 2 * pd.Timedelta(minutes=minutes) <= base_last)
+
+
 class CandleCache:
     def __init__(self, max_size: int = 4):
         self._max_size = max_size
@@ -409,7 +453,8 @@ class BacktestEngine:
         """Return a stable fingerprint of the effective config used by the backtest.
 
         Notes:
-        - Excludes volatile/large keys (e.g. precomputed feature arrays and _global_index).
+        - Excludes volatile/large keys (e.g. precomputed feature arrays, _global_index and
+          _dataset_fingerprint/_feature_config_fingerprint).
         - Scrubs non-deterministic meta fields like champion_loaded_at timestamps.
         """
 
@@ -419,6 +464,8 @@ class BacktestEngine:
         scrubbed: dict[str, Any] = scrubbed_any if isinstance(scrubbed_any, dict) else {}
         scrubbed.pop("precomputed_features", None)
         scrubbed.pop("_global_index", None)
+        scrubbed.pop("_dataset_fingerprint", None)
+        scrubbed.pop("_feature_config_fingerprint", None)
 
         payload = json.dumps(scrubbed, sort_keys=True, separators=(",", ":"), default=str)
         return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -558,37 +605,11 @@ class BacktestEngine:
                 base_df["timestamp"] = pd.to_datetime(ts, utc=True, errors="coerce")
 
         # Load HTF (1D) candles for HTF-related features/exits.
-        # NOTE: HTF context (and therefore HTF-exit tuning) is effectively inert if 1D data is missing.
+        # NOTE: HTF context (and therefore HTF-exit tuning) is effectively inert without 1D
+        # candles, so a missing (or, per GENESIS_HTF_DERIVE, stale) file is replaced by 1D
+        # bars resampled from the base candles.
         if getattr(self, "_use_new_exit_engine", False):
-            htf_timeframe = "1D"
-            htf_candidates = self._build_data_candidates(base_dir, htf_timeframe)
-            htf_file = next((p for p in htf_candidates if p.exists()), None)
-            if htf_file is not None:
-                try:
-                    self.htf_candles_df = pd.read_parquet(
-                        htf_file,
-                        columns=["timestamp", "open", "high", "low", "close"],
-                        engine="pyarrow",
-                    )
-                    if "timestamp" in self.htf_candles_df.columns:
-                        self.htf_candles_df["timestamp"] = pd.to_datetime(
-                            self.htf_candles_df["timestamp"], utc=True, errors="coerce"
-                        )
-                    self.htf_candles_source = str(htf_file)
-                    _LOGGER.debug(
-                        "Loaded %s HTF candles from %s",
-                        f"{len(self.htf_candles_df):,}",
-                        htf_file.name,
-                    )
-                except Exception as e:
-                    _LOGGER.warning("Failed to load HTF candles from %s: %s", htf_file, e)
-            else:
-                _LOGGER.warning(
-                    "HTF candles missing for %s %s. Tried: %s",
-                    self.symbol,
-                    htf_timeframe,
-                    ", ".join(str(p) for p in htf_candidates),
-                )
+            self._load_htf_candles(base_dir, base_df, htf_timeframe="1D")
 
         # Work off cached DataFrame (avoid eager copy); filters below create sliced views/frames
         self.candles_df = base_df
@@ -606,6 +627,36 @@ class BacktestEngine:
 
         _LOGGER.debug("Filtered to %s candles", f"{len(self.candles_df):,}")
 
+        return self._prepare_loaded_candles()
+
+    def load_candles_dataframe(
+        self,
+        candles_df: pd.DataFrame,
+        *,
+        htf_candles_df: pd.DataFrame | None = None,
+        source: str = "in_memory",
+    ) -> bool:
+        """
+        Load candles from an in-memory DataFrame instead of the data directory.
+
+        Runs the same post-load preparation as ``load_data()`` (fast-window
+        columns, precompute, NumPy arrays); used by benchmarks and tooling that
+        generate their own datasets. Date filters are not applied.
+
+        Returns:
+            True if data loaded successfully, False otherwise
+        """
+        df = candles_df
+        if "timestamp" in df.columns and not isinstance(df["timestamp"].dtype, pd.DatetimeTZDtype):
+            df = df.assign(timestamp=pd.to_datetime(df["timestamp"], utc=True, errors="coerce"))
+        self.candles_df = df
+        self.candles_source = source
+        self.htf_candles_df = htf_candles_df
+        self.htf_candles_source = source if htf_candles_df is not None else None
+        return self._prepare_loaded_candles()
+
+    def _prepare_loaded_candles(self) -> bool:
+        """Validate ``self.candles_df`` and build the per-run arrays/precompute for it."""
         # If filtering yields an empty dataset, treat it as “no data loaded” so callers
         # can skip gracefully (and so run() doesn't later return {'error': 'no_data'}
         # after load_data() claimed success).
@@ -670,6 +721,15 @@ class BacktestEngine:
                         candle_count=candle_count,
                     ),
                     load_cache_payload=_load_precompute_cache_payload,
+                    feature_store=default_feature_store(),
+                    # The cache key already covers spec material, data fingerprint and
+                    # sources; the path keeps differently rooted caches apart.
+                    feature_key=FeatureKey(
+                        symbol=self.symbol,
+                        timeframe=self.timeframe,
+                        spec_hash=_precompute_cache_key_material(),
+                        data_id=str(cache_path),
+                    ),
                 )
             except Exception as e:
                 # Non-fatal: skip precompute if indicators unavailable
@@ -695,6 +755,82 @@ class BacktestEngine:
 
         return True
 
+    def _load_htf_candles(
+        self, base_dir: Path, base_df: pd.DataFrame, *, htf_timeframe: str
+    ) -> None:
+        """Populate ``htf_candles_df`` from the HTF file or by resampling ``base_df``."""
+
+        derive_mode = _resolve_htf_derive_mode(os.getenv("GENESIS_HTF_DERIVE"))
+        htf_candidates = self._build_data_candidates(base_dir, htf_timeframe)
+        htf_file = None
+        if derive_mode != "always":
+            htf_file = next((p for p in htf_candidates if p.exists()), None)
+        if htf_file is not None:
+            try:
+                self.htf_candles_df = pd.read_parquet(
+                    htf_file,
+                    columns=["timestamp", "open", "high", "low", "close"],
+                    engine="pyarrow",
+                )
+                if "timestamp" in self.htf_candles_df.columns:
+                    self.htf_candles_df["timestamp"] = pd.to_datetime(
+                        self.htf_candles_df["timestamp"], utc=True, errors="coerce"
+                    )
+                self.htf_candles_source = str(htf_file)
+                _LOGGER.debug(
+                    "Loaded %s HTF candles from %s",
+                    f"{len(self.htf_candles_df):,}",
+                    htf_file.name,
+                )
+            except Exception as e:
+                _LOGGER.warning("Failed to load HTF candles from %s: %s", htf_file, e)
+                self.htf_candles_df = None
+
+        if self.htf_candles_df is not None and derive_mode == "stale":
+            if _htf_candles_are_stale(self.htf_candles_df, base_df, htf_timeframe):
+                _LOGGER.warning(
+                    "HTF candles in %s end before the base data; deriving %s from %s",
+                    self.htf_candles_source,
+                    htf_timeframe,
+                    self.timeframe,
+                )
+                self.htf_candles_df = None
+                self.htf_candles_source = None
+
+        if self.htf_candles_df is not None:
+            return
+
+        if derive_mode != "off" and can_derive_timeframe(self.timeframe, htf_timeframe):
+            try:
+                self.htf_candles_df = get_resampled_candles(
+                    base_df,
+                    symbol=self.symbol,
+                    source_timeframe=self.timeframe,
+                    target_timeframe=htf_timeframe,
+                    cache_dir=base_dir.parent / "cache" / "htf_resampled",
+                )
+                self.htf_candles_source = derived_source_label(
+                    self.candles_source, self.timeframe, htf_timeframe
+                )
+                _LOGGER.debug(
+                    "Derived %s HTF candles (%s) from %s base candles",
+                    f"{len(self.htf_candles_df):,}",
+                    htf_timeframe,
+                    self.timeframe,
+                )
+                return
+            except Exception as e:
+                _LOGGER.warning("Failed to derive HTF candles from base data: %s", e)
+                self.htf_candles_df = None
+
+        if htf_file is None:
+            _LOGGER.warning(
+                "HTF candles missing for %s %s. Tried: %s",
+                self.symbol,
+                htf_timeframe,
+                ", ".join(str(p) for p in htf_candidates),
+            )
+
     def _precompute_cache_key(self, df: pd.DataFrame) -> str:
         """Build a stable on-disk cache key for precomputed features.
 
@@ -732,11 +868,40 @@ class BacktestEngine:
             source_digest = hashlib.sha256(candles_source.encode("utf-8")).hexdigest()[:12]
             source_segment = f"_src{source_digest}"
 
+        # Derived (resampled) HTF candles feed the persisted HTF mapping, so isolate them
+        # from artifacts built with a file-backed (or absent) HTF source.
+        htf_segment = ""
+        htf_source = str(getattr(self, "htf_candles_source", "") or "").strip()
+        if htf_source.startswith("derived:"):
+            htf_digest = hashlib.sha256(htf_source.encode("utf-8")).hexdigest()[:12]
+            htf_segment = f"_htf{htf_digest}"
+
+        # Content identity: same range/length but revised candles must not share a cache.
+        data_segment = f"_d{self._candles_fingerprint(df)[:16]}"
+
         return (
             f"{self.symbol}_{self.timeframe}_{material}"
-            f"{cfg_segment}{source_segment}_{len(df)}_{start_ns}_{end_ns}"
+            f"{cfg_segment}{source_segment}{htf_segment}_{len(df)}_{start_ns}_{end_ns}"
+            f"{data_segment}"
         )
 
+    def _candles_fingerprint(self, df: pd.DataFrame) -> str:
+        """Columnar SHA-256 over the timestamp/OHLCV buffers of ``df`` (content identity)."""
+
+        columns = [c for c in ("timestamp", "open", "high", "low", "close", "volume") if c in df]
+        return fingerprint_dataframe(df, columns=columns, sort=False)
+
+    def _dataset_fingerprint(self) -> int:
+        """Return a 63-bit identity of the loaded candles for keyed feature caching.
+
+        Computed once per run so features_asof can key its result cache on
+        ``(fingerprint, _global_index)`` instead of hashing every candle window.
+        """
+
+        material = f"{self.symbol}|{self.timeframe}|{self._candles_fingerprint(self.candles_df)}"
+        digest = hashlib.blake2b(material.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") >> 1
+
     def _prepare_numpy_arrays(self) -> None:
         """Prepare numpy arrays from candles_df for fast window extraction."""
         if self.candles_df is not None:
@@ -902,8 +1067,26 @@ class BacktestEngine:
         if getattr(self, "precompute_features", False) and getattr(
             self, "_precomputed_features", None
         ):
+            # Precompute runs before configs are known; add the configured ATR period's
+            # columns once so features_asof reads them by index instead of per bar.
+            sig_adapt = (configs.get("thresholds") or {}).get("signal_adaptation") or {}
+            try:
+                ensure_atr_period_features(
+                    self._precomputed_features,
+                    candles_df=self.candles_df,
+                    atr_period=int(sig_adapt.get("atr_period", 14)),
+                )
+            except Exception as e:
+                _LOGGER.warning("Precompute: ATR period features unavailable: %s", e)
             configs["precomputed_features"] = dict(self._precomputed_features)
 
+        # Keyed feature-cache mode: features_asof addresses cached results by
+        # (dataset fingerprint, _global_index) instead of hashing candle windows.
+        configs["_dataset_fingerprint"] = self._dataset_fingerprint()
+        # Feature-affecting config (ATR period, fib/HTF settings) is part of the key so
+        # runs with different feature configs on the same data never share results.
+        configs["_feature_config_fingerprint"] = feature_config_fingerprint(configs)
+
         # Record a stable fingerprint of the effective config used.
         # Stored on the engine and emitted via backtest_info for debugging/tracing.
         self._effective_config_fingerprint = self._config_fingerprint(configs)
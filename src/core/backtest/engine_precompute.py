@@ -2,12 +2,29 @@ from __future__ import annotations
 
 import json
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
 import pandas as pd
 
+from core.utils.feature_store import FeatureKey, FeatureStore
+
+# Columns of the persisted `.npz` payload (dense indicators and LTF swing pairs).
+PRECOMPUTE_BASE_COLUMNS: tuple[str, ...] = (
+    "atr_14",
+    "atr_50",
+    "ema_20",
+    "ema_50",
+    "rsi_14",
+    "bb_position_20_2",
+    "adx_14",
+    "fib_high_idx",
+    "fib_low_idx",
+    "fib_high_px",
+    "fib_low_px",
+)
+
 
 def get_persisted_precompute_spec() -> dict[str, Any]:
     """Return the producer-owned spec for the persisted `.npz` precompute payload."""
@@ -74,6 +91,183 @@ def _build_precompute_fibonacci_configs(*, candle_count: int) -> tuple[Any, Any]
     return fib_cfg, fib_precompute_cfg
 
 
+def _load_or_compute_base_payload(
+    *,
+    closes_all: list[float],
+    highs_all: list[float],
+    lows_all: list[float],
+    cache_path: Path,
+    cache_write_enabled: bool,
+    logger: Any,
+    build_cache_metadata: Callable[[int], dict[str, Any]],
+    validate_cache: Callable[[Any, int], tuple[bool, str | None]],
+    load_cache_payload: Callable[[Any], dict[str, list[float]]],
+    fib_precompute_cfg: Any,
+) -> dict[str, list[float]]:
+    """Return the persisted indicator/swing columns from the `.npz` cache or compute them."""
+
+    import numpy as _np
+
+    from core.indicators.adx import calculate_adx as _calc_adx
+    from core.indicators.atr import calculate_atr as _calc_atr
+    from core.indicators.bollinger import bollinger_bands as _bb
+    from core.indicators.ema import calculate_ema as _calc_ema
+    from core.indicators.fibonacci import detect_swing_points as _detect_swings
+    from core.indicators.rsi import calculate_rsi as _calc_rsi
+
+    persisted_spec = get_persisted_precompute_spec()
+    indicator_spec = persisted_spec["indicators"]
+    atr_periods = [int(period) for period in indicator_spec["atr_periods"]]
+    ema_periods = [int(period) for period in indicator_spec["ema_periods"]]
+    bb_spec = indicator_spec["bb"]
+
+    loaded = False
+    pre: dict[str, list[float]] = {}
+    if cache_path.exists():
+        try:
+            with _np.load(cache_path, allow_pickle=False) as npz:
+                cache_valid, invalid_reason = validate_cache(npz, len(closes_all))
+                if cache_valid:
+                    pre = load_cache_payload(npz)
+                    loaded = True
+                    logger.debug(
+                        "Loaded precomputed features from cache: %s",
+                        cache_path.name,
+                    )
+                else:
+                    logger.warning(
+                        "Ignoring precompute cache %s: %s",
+                        cache_path.name,
+                        invalid_reason,
+                    )
+        except Exception:
+            loaded = False
+
+    if not loaded:
+        logger.info("Precompute: computing indicators")
+        start_time = time.perf_counter()
+        atr_14 = _calc_atr(highs_all, lows_all, closes_all, period=atr_periods[0])
+        atr_50 = _calc_atr(highs_all, lows_all, closes_all, period=atr_periods[1])
+        # Precompute two common EMA periods used by features
+        ema_20 = _calc_ema(closes_all, period=ema_periods[0])
+        ema_50 = _calc_ema(closes_all, period=ema_periods[1])
+        rsi_14 = _calc_rsi(closes_all, period=int(indicator_spec["rsi_period"]))
+        bb_all = _bb(
+            closes_all,
+            period=int(bb_spec["period"]),
+            std_dev=float(bb_spec["std_dev"]),
+        )
+        bb_pos = list(bb_all.get("position") or [])
+        adx_14 = _calc_adx(
+            highs_all,
+            lows_all,
+            closes_all,
+            period=int(indicator_spec["adx_period"]),
+        )
+
+        # Precompute Fibonacci swings (LTF) for reuse in feature calculation.
+        # Use pandas only for Series conversion inside detect function to keep parity.
+        import pandas as _pd
+
+        sh_idx, sl_idx, sh_px, sl_px = _detect_swings(
+            _pd.Series(highs_all),
+            _pd.Series(lows_all),
+            _pd.Series(closes_all),
+            fib_precompute_cfg,
+        )
+
+        elapsed = time.perf_counter() - start_time
+        logger.info("Precompute: computed indicators in %.2fs", elapsed)
+
+        if cache_write_enabled:
+            try:
+                _np.savez_compressed(
+                    cache_path,
+                    cache_meta_json=json.dumps(
+                        build_cache_metadata(len(closes_all)),
+                        sort_keys=True,
+                        separators=(",", ":"),
+                        ensure_ascii=False,
+                    ),
+                    atr_14=_np.asarray(atr_14, dtype=float),
+                    atr_50=_np.asarray(atr_50, dtype=float),
+                    ema_20=_np.asarray(ema_20, dtype=float),
+                    ema_50=_np.asarray(ema_50, dtype=float),
+                    rsi_14=_np.asarray(rsi_14, dtype=float),
+                    bb_position_20_2=_np.asarray(bb_pos, dtype=float),
+                    adx_14=_np.asarray(adx_14, dtype=float),
+                    fib_high_idx=_np.asarray(sh_idx, dtype=int),
+                    fib_low_idx=_np.asarray(sl_idx, dtype=int),
+                    fib_high_px=_np.asarray(sh_px, dtype=float),
+                    fib_low_px=_np.asarray(sl_px, dtype=float),
+                )
+                logger.debug("Cached precomputed features: %s", cache_path.name)
+            except Exception as cache_err:  # nosec B110
+                logger.warning(
+                    "Failed to write precompute cache %s: %s",
+                    cache_path,
+                    cache_err,
+                )
+        else:
+            logger.debug(
+                "Precompute cache writes disabled via GENESIS_PRECOMPUTE_CACHE_WRITE; "
+                "using in-memory precomputed features only for this run"
+            )
+
+        pre = {
+            "atr_14": atr_14,
+            "atr_50": atr_50,
+            "ema_20": ema_20,
+            "ema_50": ema_50,
+            "rsi_14": rsi_14,
+            "bb_position_20_2": bb_pos,
+            "adx_14": adx_14,
+            "fib_high_idx": list(sh_idx),
+            "fib_low_idx": list(sl_idx),
+            "fib_high_px": list(sh_px),
+            "fib_low_px": list(sl_px),
+        }
+
+    return pre
+
+
+def ensure_atr_period_features(
+    pre: dict[str, list[float]],
+    *,
+    candles_df: pd.DataFrame,
+    atr_period: int,
+) -> None:
+    """Add ``atr_{p}`` and ``volatility_shift_{p}`` (ATR(p)/ATR50) to ``pre`` in place.
+
+    features_asof reads both by bar index for the configured ``atr_period``; ATR14 is
+    covered by the base ``atr_14``/``volatility_shift`` columns and needs nothing here.
+    """
+
+    period = int(atr_period)
+    atr_key = f"atr_{period}"
+    shift_key = f"volatility_shift_{period}"
+    if period == 14 or period <= 0 or (atr_key in pre and shift_key in pre):
+        return
+    if "atr_50" not in pre:
+        return
+
+    from core.indicators.atr import calculate_atr as _calc_atr
+    from core.indicators.derived_features import volatility_shift_array
+
+    atr_vals = pre.get(atr_key)
+    if atr_vals is None:
+        atr_vals = list(
+            _calc_atr(
+                candles_df["high"].tolist(),
+                candles_df["low"].tolist(),
+                candles_df["close"].tolist(),
+                period=period,
+            )
+        )
+        pre[atr_key] = atr_vals
+    pre[shift_key] = volatility_shift_array(atr_vals, pre["atr_50"]).tolist()
+
+
 def prepare_precomputed_features(
     *,
     candles_df: pd.DataFrame,
@@ -84,11 +278,23 @@ def prepare_precomputed_features(
     build_cache_metadata: Callable[[int], dict[str, Any]],
     validate_cache: Callable[[Any, int], tuple[bool, str | None]],
     load_cache_payload: Callable[[Any], dict[str, list[float]]],
+    feature_store: FeatureStore | None = None,
+    feature_key: FeatureKey | None = None,
+    atr_periods: Iterable[int] = (),
 ) -> dict[str, list[float]] | None:
     """Load or build the precomputed feature payload used by BacktestEngine.
 
     This keeps the behavior owned by ``engine.py`` while moving the large
     precompute/cache orchestration block into a dedicated helper module.
+
+    With ``feature_store``/``feature_key`` the indicator and swing columns are
+    shared through the in-process feature store: engines built on the same data
+    and spec (optimizer trials, benchmark repeats) skip the ``.npz`` decode and
+    the recompute. The ``.npz`` cache stays the persisted artifact.
+
+    ``atr_periods`` lists configured ATR periods whose ``atr_{p}`` and
+    ``volatility_shift_{p}`` columns are added up front (see
+    ``ensure_atr_period_features``).
     """
 
     try:
@@ -96,133 +302,51 @@ def prepare_precomputed_features(
         highs_all = candles_df["high"].tolist()
         lows_all = candles_df["low"].tolist()
 
-        import numpy as _np
-
-        from core.indicators.adx import calculate_adx as _calc_adx
-        from core.indicators.atr import calculate_atr as _calc_atr
-        from core.indicators.bollinger import bollinger_bands as _bb
-        from core.indicators.ema import calculate_ema as _calc_ema
-        from core.indicators.fibonacci import detect_swing_points as _detect_swings
-        from core.indicators.rsi import calculate_rsi as _calc_rsi
-
-        persisted_spec = get_persisted_precompute_spec()
-        indicator_spec = persisted_spec["indicators"]
-        atr_periods = [int(period) for period in indicator_spec["atr_periods"]]
-        ema_periods = [int(period) for period in indicator_spec["ema_periods"]]
-        bb_spec = indicator_spec["bb"]
-
         # Fib config is used both for LTF swing precompute and HTF mapping.
         # It must exist even when we load indicators from the on-disk cache.
         fib_cfg, fib_precompute_cfg = _build_precompute_fibonacci_configs(
             candle_count=len(closes_all)
         )
 
-        loaded = False
-        pre: dict[str, list[float]] = {}
-        if cache_path.exists():
-            try:
-                with _np.load(cache_path, allow_pickle=False) as npz:
-                    cache_valid, invalid_reason = validate_cache(npz, len(closes_all))
-                    if cache_valid:
-                        pre = load_cache_payload(npz)
-                        loaded = True
-                        logger.debug(
-                            "Loaded precomputed features from cache: %s",
-                            cache_path.name,
-                        )
-                    else:
-                        logger.warning(
-                            "Ignoring precompute cache %s: %s",
-                            cache_path.name,
-                            invalid_reason,
-                        )
-            except Exception:
-                loaded = False
-
-        if not loaded:
-            logger.info("Precompute: computing indicators")
-            start_time = time.perf_counter()
-            atr_14 = _calc_atr(highs_all, lows_all, closes_all, period=atr_periods[0])
-            atr_50 = _calc_atr(highs_all, lows_all, closes_all, period=atr_periods[1])
-            # Precompute two common EMA periods used by features
-            ema_20 = _calc_ema(closes_all, period=ema_periods[0])
-            ema_50 = _calc_ema(closes_all, period=ema_periods[1])
-            rsi_14 = _calc_rsi(closes_all, period=int(indicator_spec["rsi_period"]))
-            bb_all = _bb(
-                closes_all,
-                period=int(bb_spec["period"]),
-                std_dev=float(bb_spec["std_dev"]),
+        def _load_or_compute_base(_missing: tuple[str, ...] = ()) -> dict[str, list[float]]:
+            return _load_or_compute_base_payload(
+                closes_all=closes_all,
+                highs_all=highs_all,
+                lows_all=lows_all,
+                cache_path=cache_path,
+                cache_write_enabled=cache_write_enabled,
+                logger=logger,
+                build_cache_metadata=build_cache_metadata,
+                validate_cache=validate_cache,
+                load_cache_payload=load_cache_payload,
+                fib_precompute_cfg=fib_precompute_cfg,
             )
-            bb_pos = list(bb_all.get("position") or [])
-            adx_14 = _calc_adx(
-                highs_all,
-                lows_all,
-                closes_all,
-                period=int(indicator_spec["adx_period"]),
+
+        if feature_store is not None and feature_key is not None:
+            shared = feature_store.get(
+                feature_key,
+                PRECOMPUTE_BASE_COLUMNS,
+                compute=_load_or_compute_base,
+                persist=False,
             )
+            pre = {name: values.tolist() for name, values in shared.items()}
+        else:
+            pre = _load_or_compute_base()
 
-            # Precompute Fibonacci swings (LTF) for reuse in feature calculation.
-            # Use pandas only for Series conversion inside detect function to keep parity.
-            import pandas as _pd
+        # volatility_shift is the only derived feature features_asof reads per bar; it is
+        # a whole-series transform of the base ATRs, so it is rebuilt for loaded and
+        # freshly computed payloads alike instead of being persisted.
+        from core.indicators.derived_features import volatility_shift_array
 
-            sh_idx, sl_idx, sh_px, sl_px = _detect_swings(
-                _pd.Series(highs_all),
-                _pd.Series(lows_all),
-                _pd.Series(closes_all),
-                fib_precompute_cfg,
-            )
+        pre["volatility_shift"] = volatility_shift_array(pre["atr_14"], pre["atr_50"]).tolist()
+        for period in atr_periods:
+            ensure_atr_period_features(pre, candles_df=candles_df, atr_period=period)
 
-            elapsed = time.perf_counter() - start_time
-            logger.info("Precompute: computed indicators in %.2fs", elapsed)
-
-            if cache_write_enabled:
-                try:
-                    _np.savez_compressed(
-                        cache_path,
-                        cache_meta_json=json.dumps(
-                            build_cache_metadata(len(closes_all)),
-                            sort_keys=True,
-                            separators=(",", ":"),
-                            ensure_ascii=False,
-                        ),
-                        atr_14=_np.asarray(atr_14, dtype=float),
-                        atr_50=_np.asarray(atr_50, dtype=float),
-                        ema_20=_np.asarray(ema_20, dtype=float),
-                        ema_50=_np.asarray(ema_50, dtype=float),
-                        rsi_14=_np.asarray(rsi_14, dtype=float),
-                        bb_position_20_2=_np.asarray(bb_pos, dtype=float),
-                        adx_14=_np.asarray(adx_14, dtype=float),
-                        fib_high_idx=_np.asarray(sh_idx, dtype=int),
-                        fib_low_idx=_np.asarray(sl_idx, dtype=int),
-                        fib_high_px=_np.asarray(sh_px, dtype=float),
-                        fib_low_px=_np.asarray(sl_px, dtype=float),
-                    )
-                    logger.debug("Cached precomputed features: %s", cache_path.name)
-                except Exception as cache_err:  # nosec B110
-                    logger.warning(
-                        "Failed to write precompute cache %s: %s",
-                        cache_path,
-                        cache_err,
-                    )
-            else:
-                logger.debug(
-                    "Precompute cache writes disabled via GENESIS_PRECOMPUTE_CACHE_WRITE; "
-                    "using in-memory precomputed features only for this run"
-                )
+        if "volume" in candles_df.columns:
+            from core.indicators.volume import volume_score as _volume_score
 
-            pre = {
-                "atr_14": atr_14,
-                "atr_50": atr_50,
-                "ema_20": ema_20,
-                "ema_50": ema_50,
-                "rsi_14": rsi_14,
-                "bb_position_20_2": bb_pos,
-                "adx_14": adx_14,
-                "fib_high_idx": list(sh_idx),
-                "fib_low_idx": list(sl_idx),
-                "fib_high_px": list(sh_px),
-                "fib_low_px": list(sl_px),
-            }
+            # Per-bar evaluate_pipeline volume score with the default window/cap.
+            pre["volume_score"] = _volume_score(candles_df["volume"].to_numpy(dtype=float)).tolist()
 
         if htf_candles_df is not None:
             from core.indicators.htf_fibonacci import compute_htf_fibonacci_mapping
@@ -8,6 +8,8 @@ import subprocess
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from core.strategy.decision_attribution import build_shadow_attribution_report
+
 if TYPE_CHECKING:
     from core.backtest.engine import BacktestEngine
 
@@ -27,7 +29,7 @@ def _build_backtest_results_payload(engine: BacktestEngine) -> dict:
     except (OSError, subprocess.SubprocessError):
         git_hash = "unknown"
 
-    return {
+    payload = {
         "backtest_info": {
             "symbol": engine.symbol,
             "timeframe": engine.timeframe,
@@ -97,3 +99,8 @@ def _build_backtest_results_payload(engine: BacktestEngine) -> dict:
         ],
         "equity_curve": engine.position_tracker.equity_curve,
     }
+
+    feature_attribution = build_shadow_attribution_report(engine.state)
+    if feature_attribution is not None:
+        payload["feature_attribution"] = feature_attribution
+    return payload
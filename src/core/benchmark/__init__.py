@@ -0,0 +1,41 @@
+"""
+Benchmark suite for Genesis-Core.
+
+Deterministic synthetic datasets plus timed scenarios (engine run, precompute,
+feature cache, Optuna trials, results building) that emit JSON reports and
+compare them against a stored baseline. Runs fully offline.
+"""
+
+from core.benchmark.datasets import (
+    DATASET_KINDS,
+    SyntheticDatasetSpec,
+    dataset_digest,
+    generate_ohlcv,
+)
+from core.benchmark.harness import (
+    DEFAULT_TOLERANCE,
+    BenchmarkContext,
+    Metric,
+    MetricComparison,
+    compare_reports,
+    load_report,
+    run_benchmarks,
+    write_report,
+)
+from core.benchmark.scenarios import SCENARIOS
+
+__all__ = [
+    "DATASET_KINDS",
+    "DEFAULT_TOLERANCE",
+    "SCENARIOS",
+    "BenchmarkContext",
+    "Metric",
+    "MetricComparison",
+    "SyntheticDatasetSpec",
+    "compare_reports",
+    "dataset_digest",
+    "generate_ohlcv",
+    "load_report",
+    "run_benchmarks",
+    "write_report",
+]
@@ -0,0 +1,118 @@
+"""Deterministic synthetic OHLCV datasets for benchmarks.
+
+Datasets are pinned by ``SyntheticDatasetSpec`` (kind, bars, timeframe, seed): the same spec
+always yields byte-identical candles, and ``dataset_digest`` fingerprints them so benchmark
+reports can only be compared against baselines recorded on the same data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from core.strategy.htf_selector import TIMEFRAME_TO_MINUTES
+
+DATASET_KINDS = ("trend", "chop", "regime_switch")
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticDatasetSpec:
+    kind: str = "regime_switch"
+    bars: int = 2000
+    timeframe: str = "3h"
+    seed: int = 42
+    start: str = "2024-01-01"
+    start_price: float = 30_000.0
+
+    def __post_init__(self) -> None:
+        if self.kind not in DATASET_KINDS:
+            raise ValueError(f"Unknown dataset kind {self.kind!r}; expected one of {DATASET_KINDS}")
+        if self.timeframe not in TIMEFRAME_TO_MINUTES:
+            raise ValueError(f"Unsupported timeframe: {self.timeframe}")
+        if self.bars <= 0:
+            raise ValueError("bars must be > 0")
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _trend_returns(rng: np.random.Generator, bars: int, vol: float) -> np.ndarray:
+    drift = 0.25 * vol
+    return rng.normal(drift, vol, bars)
+
+
+def _chop_returns(rng: np.random.Generator, bars: int, vol: float) -> np.ndarray:
+    # Ornstein-Uhlenbeck in log-price around the start level.
+    log_price = np.empty(bars)
+    level = 0.0
+    for i, shock in enumerate(rng.normal(0.0, vol, bars)):
+        level += -0.05 * level + shock
+        log_price[i] = level
+    return np.diff(log_price, prepend=0.0)
+
+
+def _regime_switch_returns(rng: np.random.Generator, bars: int, vol: float) -> np.ndarray:
+    returns = np.empty(bars)
+    filled = 0
+    regime = 0
+    while filled < bars:
+        length = min(bars - filled, int(rng.integers(max(bars // 12, 20), max(bars // 6, 40))))
+        if regime % 3 == 1:
+            segment = _chop_returns(rng, length, vol * 0.8)
+        else:
+            # Alternate up-trend, chop, down-trend.
+            sign = 1.0 if regime % 3 == 0 else -1.0
+            segment = sign * _trend_returns(rng, length, vol * 1.2)
+        returns[filled : filled + length] = segment
+        filled += length
+        regime += 1
+    return returns
+
+
+def generate_ohlcv(spec: SyntheticDatasetSpec) -> pd.DataFrame:
+    """Return candles (timestamp/open/high/low/close/volume) for ``spec``."""
+    rng = np.random.default_rng(spec.seed)
+    minutes = TIMEFRAME_TO_MINUTES[spec.timeframe]
+    # Per-bar volatility scaled from ~1% per hour.
+    vol = 0.01 * float(np.sqrt(minutes / 60.0))
+
+    if spec.kind == "trend":
+        returns = _trend_returns(rng, spec.bars, vol)
+    elif spec.kind == "chop":
+        returns = _chop_returns(rng, spec.bars, vol)
+    else:
+        returns = _regime_switch_returns(rng, spec.bars, vol)
+
+    close = spec.start_price * np.exp(np.cumsum(returns))
+    open_ = np.concatenate([[spec.start_price], close[:-1]])
+    wick = np.abs(rng.normal(0.0, vol * 0.5, (2, spec.bars)))
+    high = np.maximum(open_, close) * (1.0 + wick[0])
+    low = np.minimum(open_, close) * (1.0 - wick[1])
+    # Volume rises with the size of the move, plus lognormal noise.
+    volume = rng.lognormal(3.0, 0.4, spec.bars) * (1.0 + 50.0 * np.abs(returns))
+
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range(
+                spec.start, periods=spec.bars, freq=f"{minutes}min", tz="UTC"
+            ),
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+        }
+    )
+
+
+def dataset_digest(candles: pd.DataFrame) -> str:
+    """Short sha256 over the OHLCV values (pins the exact dataset in reports)."""
+    hasher = hashlib.sha256()
+    for column in ("open", "high", "low", "close", "volume"):
+        hasher.update(np.ascontiguousarray(candles[column].to_numpy(dtype=float)).tobytes())
+    hasher.update(candles["timestamp"].astype("int64").to_numpy().tobytes())
+    return hasher.hexdigest()[:16]
@@ -0,0 +1,265 @@
+"""Benchmark runner, JSON reports and baseline comparison.
+
+A report is a JSON object::
+
+    {
+      "schema_version": 1,
+      "generated_at": "...",
+      "environment": {"python": ..., "platform": ..., "numpy": ..., "pandas": ...},
+      "dataset": {"spec": {...}, "digest": "..."},
+      "scenarios": {
+        "<name>": {
+          "params": {...},
+          "metrics": {"<metric>": {"value": 12.3, "unit": "bars/s", "higher_is_better": true}}
+        }
+      }
+    }
+
+``compare_reports`` checks every directional metric of the current report against the
+baseline with a relative tolerance. Metrics with ``higher_is_better=None`` are informational.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from core.benchmark.datasets import SyntheticDatasetSpec, dataset_digest, generate_ohlcv
+
+REPORT_SCHEMA_VERSION = 1
+DEFAULT_TOLERANCE = 0.25
+
+# Benchmarks measure the optimizer execution mode (precompute + fast window) and must not
+# touch the shared on-disk caches or print progress bars.
+_BENCHMARK_ENV = {
+    "GENESIS_PRECOMPUTE_FEATURES": "1",
+    "GENESIS_PRECOMPUTE_CACHE_WRITE": "0",
+    "GENESIS_DISABLE_METRICS": "1",
+    "TQDM_DISABLE": "1",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Metric:
+    value: float | None
+    unit: str
+    higher_is_better: bool | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"value": self.value, "unit": self.unit, "higher_is_better": self.higher_is_better}
+
+
+@dataclass(slots=True)
+class BenchmarkContext:
+    """Inputs shared by all scenarios of one benchmark run."""
+
+    dataset: SyntheticDatasetSpec
+    workdir: Path
+    repeats: int = 3
+    trials: int = 5
+    config_path: Path | None = None
+    _candles: pd.DataFrame | None = field(default=None, repr=False)
+
+    @property
+    def candles(self) -> pd.DataFrame:
+        if self._candles is None:
+            self._candles = generate_ohlcv(self.dataset)
+        return self._candles
+
+
+@dataclass(frozen=True, slots=True)
+class MetricComparison:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    relative_change: float
+    higher_is_better: bool
+    regressed: bool
+
+
+Scenario = Callable[[BenchmarkContext], dict[str, Metric]]
+
+
+def best_of(fn: Callable[[], Any], repeats: int) -> tuple[float, Any]:
+    """Run ``fn`` ``repeats`` times; return the fastest wall time and the last result."""
+    best = float("inf")
+    result: Any = None
+    for _ in range(max(1, int(repeats))):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MiB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    peak = float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    # Linux reports KiB, macOS bytes.
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+@contextmanager
+def benchmark_environment() -> Iterator[None]:
+    previous = {key: os.environ.get(key) for key in _BENCHMARK_ENV}
+    os.environ.update(_BENCHMARK_ENV)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _run_scenario(name: str, context: BenchmarkContext) -> dict[str, Any]:
+    from core.benchmark.scenarios import SCENARIOS
+
+    with benchmark_environment():
+        metrics = SCENARIOS[name](context)
+    metrics.setdefault("peak_rss_mb", Metric(peak_rss_mb(), "MiB", higher_is_better=False))
+    return {
+        "params": {"repeats": context.repeats, "trials": context.trials},
+        "metrics": {key: metric.to_dict() for key, metric in sorted(metrics.items())},
+    }
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def run_benchmarks(
+    scenarios: Sequence[str],
+    *,
+    dataset: SyntheticDatasetSpec | None = None,
+    repeats: int = 3,
+    trials: int = 5,
+    config_path: Path | None = None,
+    isolate: bool = True,
+) -> dict[str, Any]:
+    """Run ``scenarios`` and return a report (see module docstring).
+
+    With ``isolate=True`` every scenario runs in a fresh spawned process, so caches start
+    cold and ``peak_rss_mb`` is per scenario; otherwise scenarios share this process and
+    ``peak_rss_mb`` is the process-wide peak so far.
+    """
+    from core.benchmark.scenarios import SCENARIOS
+
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark scenarios: {unknown}; available: {sorted(SCENARIOS)}")
+    dataset = dataset or SyntheticDatasetSpec()
+
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="genesis_bench_") as tmp:
+        context = BenchmarkContext(
+            dataset=dataset,
+            workdir=Path(tmp),
+            repeats=repeats,
+            trials=trials,
+            config_path=config_path,
+        )
+        for name in scenarios:
+            if isolate:
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                    results[name] = pool.submit(_run_scenario, name, context).result()
+            else:
+                results[name] = _run_scenario(name, context)
+        digest = dataset_digest(context.candles)
+
+    return {
+        "schema_version": REPORT_SCHEMA_VERSION,
+        "generated_at": datetime.now(UTC).isoformat(),
+        "environment": _environment(),
+        "dataset": {"spec": dataset.to_dict(), "digest": digest},
+        "scenarios": results,
+    }
+
+
+def write_report(report: Mapping[str, Any], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or data.get("schema_version") != REPORT_SCHEMA_VERSION:
+        raise ValueError(f"Not a benchmark report (schema {REPORT_SCHEMA_VERSION}): {path}")
+    return data
+
+
+def compare_reports(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+    metric_tolerances: Mapping[str, float] | None = None,
+) -> list[MetricComparison]:
+    """Compare directional metrics present in both reports.
+
+    ``metric_tolerances`` overrides ``tolerance`` per metric name (e.g. a looser bound for
+    ``peak_rss_mb``). Raises ``ValueError`` when the reports were produced on different
+    datasets, since their numbers are not comparable.
+    """
+    current_digest = (current.get("dataset") or {}).get("digest")
+    baseline_digest = (baseline.get("dataset") or {}).get("digest")
+    if current_digest != baseline_digest:
+        raise ValueError(
+            f"Baseline dataset {baseline_digest} differs from current dataset {current_digest}"
+        )
+
+    overrides = dict(metric_tolerances or {})
+    comparisons: list[MetricComparison] = []
+    baseline_scenarios = baseline.get("scenarios") or {}
+    for scenario, payload in sorted((current.get("scenarios") or {}).items()):
+        baseline_metrics = (baseline_scenarios.get(scenario) or {}).get("metrics") or {}
+        for name, metric in sorted((payload.get("metrics") or {}).items()):
+            direction = metric.get("higher_is_better")
+            reference = (baseline_metrics.get(name) or {}).get("value")
+            value = metric.get("value")
+            if direction is None or reference is None or value is None or reference == 0:
+                continue
+            change = (float(value) - float(reference)) / abs(float(reference))
+            limit = float(overrides.get(name, tolerance))
+            regressed = change < -limit if direction else change > limit
+            comparisons.append(
+                MetricComparison(
+                    scenario=scenario,
+                    metric=name,
+                    baseline=float(reference),
+                    current=float(value),
+                    relative_change=change,
+                    higher_is_better=bool(direction),
+                    regressed=regressed,
+                )
+            )
+    return comparisons
@@ -0,0 +1,207 @@
+"""Benchmark scenarios.
+
+Each scenario takes a ``BenchmarkContext`` and returns named ``Metric`` values. Scenarios
+run against the synthetic dataset of the context and a pinned strategy config
+(``DEFAULT_CONFIG_PATH`` unless the context overrides it), with precompute and fast-window
+enabled as in optimizer runs.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from core.benchmark.harness import BenchmarkContext, Metric, Scenario, best_of
+
+_LOG = logging.getLogger(__name__)
+
+DEFAULT_CONFIG_PATH = (
+    Path(__file__).resolve().parents[3] / "config" / "strategy" / "champions" / "tBTCUSD_3h.json"
+)
+_SYMBOL = "tBTCUSD"
+
+
+def _load_config(context: BenchmarkContext) -> dict[str, Any]:
+    path = context.config_path or DEFAULT_CONFIG_PATH
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    cfg = data.get("cfg") if isinstance(data.get("cfg"), dict) else data
+    cfg = copy.deepcopy(cfg)
+    # Explicit backtest config: never merge whichever champion is active on disk.
+    cfg.setdefault("meta", {})["skip_champion_merge"] = True
+    return cfg
+
+
+def _policy(context: BenchmarkContext) -> dict[str, str]:
+    return {"symbol": _SYMBOL, "timeframe": context.dataset.timeframe}
+
+
+def _clear_feature_caches() -> None:
+    import core.strategy.features_asof as features_asof
+
+    features_asof._feature_cache.clear()
+    features_asof._indexed_feature_cache.clear()
+    features_asof._indicator_cache.clear()
+
+
+def _loaded_engine(context: BenchmarkContext):
+    from core.backtest.engine import BacktestEngine
+
+    engine = BacktestEngine(
+        symbol=_SYMBOL,
+        timeframe=context.dataset.timeframe,
+        warmup_bars=min(120, max(0, context.dataset.bars // 4)),
+        fast_window=True,
+    )
+    engine.precompute_features = True
+    if not engine.load_candles_dataframe(context.candles, source="synthetic"):
+        raise RuntimeError("Benchmark dataset could not be loaded into BacktestEngine")
+    return engine
+
+
+def _run_engine(engine, context: BenchmarkContext, cfg: dict[str, Any]) -> dict[str, Any]:
+    results = engine.run(policy=_policy(context), configs=copy.deepcopy(cfg), verbose=False)
+    if results.get("error"):
+        raise RuntimeError(f"Benchmark backtest failed: {results['error']}")
+    return results
+
+
+def precompute(context: BenchmarkContext) -> dict[str, Metric]:
+    """Indicator precompute from scratch vs loading the persisted ``.npz`` payload."""
+    from core.backtest import engine as engine_module
+    from core.backtest.engine_precompute import prepare_precomputed_features
+
+    cache_path = context.workdir / "precompute.npz"
+
+    def _prepare(*, write: bool):
+        return prepare_precomputed_features(
+            candles_df=context.candles,
+            htf_candles_df=None,
+            cache_path=cache_path,
+            cache_write_enabled=write,
+            logger=_LOG,
+            build_cache_metadata=lambda count: engine_module._build_precompute_cache_metadata(
+                candle_count=count
+            ),
+            validate_cache=lambda npz, count: (
+                engine_module._validate_metadata_bearing_precompute_cache(npz, candle_count=count)
+            ),
+            load_cache_payload=engine_module._load_precompute_cache_payload,
+        )
+
+    cache_path.unlink(missing_ok=True)
+    compute_seconds, _ = best_of(lambda: _prepare(write=False), context.repeats)
+    _prepare(write=True)
+    load_seconds, _ = best_of(lambda: _prepare(write=False), context.repeats)
+    cache_path.unlink(missing_ok=True)
+
+    bars = len(context.candles)
+    return {
+        "compute_seconds": Metric(compute_seconds, "s", higher_is_better=False),
+        "compute_bars_per_sec": Metric(bars / compute_seconds, "bars/s", higher_is_better=True),
+        "cache_load_seconds": Metric(load_seconds, "s", higher_is_better=False),
+    }
+
+
+def engine_run(context: BenchmarkContext) -> dict[str, Metric]:
+    """Full ``BacktestEngine.run`` with cold feature caches."""
+    cfg = _load_config(context)
+    engine = _loaded_engine(context)
+
+    def _cold_run() -> dict[str, Any]:
+        _clear_feature_caches()
+        return _run_engine(engine, context, cfg)
+
+    seconds, results = best_of(_cold_run, context.repeats)
+    bars = len(context.candles)
+    return {
+        "seconds": Metric(seconds, "s", higher_is_better=False),
+        "bars_per_sec": Metric(bars / seconds, "bars/s", higher_is_better=True),
+        "trades": Metric(float(len(results.get("trades") or [])), "trades"),
+    }
+
+
+def feature_cache(context: BenchmarkContext) -> dict[str, Metric]:
+    """The same backtest twice: cold feature caches, then warm."""
+    cfg = _load_config(context)
+    engine = _loaded_engine(context)
+
+    _clear_feature_caches()
+    cold_seconds, _ = best_of(lambda: _run_engine(engine, context, cfg), 1)
+    warm_seconds, _ = best_of(lambda: _run_engine(engine, context, cfg), context.repeats)
+    return {
+        "cold_seconds": Metric(cold_seconds, "s", higher_is_better=False),
+        "warm_seconds": Metric(warm_seconds, "s", higher_is_better=False),
+        "warm_speedup": Metric(cold_seconds / warm_seconds, "x", higher_is_better=True),
+    }
+
+
+def optuna_trials(context: BenchmarkContext) -> dict[str, Metric]:
+    """Optuna trial throughput: TPE sampling + backtest + scoring per trial."""
+    import optuna
+
+    from core.optimizer.scoring import score_backtest
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    cfg = _load_config(context)
+    engine = _loaded_engine(context)
+
+    def _objective(trial: optuna.Trial) -> float:
+        trial_cfg = copy.deepcopy(cfg)
+        thresholds = trial_cfg.setdefault("thresholds", {})
+        thresholds["entry_conf_overall"] = trial.suggest_float("entry_conf_overall", 0.2, 0.6)
+        gates = trial_cfg.setdefault("gates", {})
+        gates["cooldown_bars"] = trial.suggest_int("cooldown_bars", 0, 6)
+        results = _run_engine(engine, context, trial_cfg)
+        return float(score_backtest(results)["score"])
+
+    study = optuna.create_study(
+        direction="maximize",
+        sampler=optuna.samplers.TPESampler(seed=context.dataset.seed),
+    )
+    trials = max(1, int(context.trials))
+    seconds, _ = best_of(lambda: study.optimize(_objective, n_trials=trials), 1)
+    return {
+        "seconds_per_trial": Metric(seconds / trials, "s", higher_is_better=False),
+        "trials_per_hour": Metric(3600.0 * trials / seconds, "trials/h", higher_is_better=True),
+    }
+
+
+def results_build(context: BenchmarkContext) -> dict[str, Metric]:
+    """Results payload + scoring after a run with many synthetic trades."""
+    from core.backtest.position_tracker import PositionTracker
+    from core.optimizer.scoring import score_backtest
+
+    candles = context.candles
+    engine = _loaded_engine(context)
+
+    tracker = PositionTracker(initial_capital=10_000.0)
+    timestamps = candles["timestamp"].tolist()
+    closes = candles["close"].tolist()
+    size = 1_000.0 / float(closes[0])
+    # Flip between LONG and SHORT every 12 bars to produce a realistic trade list.
+    for i, (timestamp, price) in enumerate(zip(timestamps, closes, strict=True)):
+        if i % 12 == 0:
+            action = "LONG" if (i // 12) % 2 == 0 else "SHORT"
+            tracker.execute_action(action, size, price, timestamp, symbol=_SYMBOL)
+        tracker.update_equity(price, timestamp)
+    tracker.close_all_positions(closes[-1], timestamps[-1])
+    engine.position_tracker = tracker
+    engine.bar_count = len(candles)
+
+    seconds, results = best_of(lambda: score_backtest(engine._build_results()), context.repeats)
+    return {
+        "seconds": Metric(seconds, "s", higher_is_better=False),
+        "trades": Metric(float(len(tracker.trades)), "trades"),
+    }
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "precompute": precompute,
+    "engine_run": engine_run,
+    "feature_cache": feature_cache,
+    "optuna_trials": optuna_trials,
+    "results_build": results_build,
+}
@@ -3,7 +3,9 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import threading
 import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -125,6 +127,47 @@ def _load_latest_audit_signature(audit_path: Path) -> tuple[int, str] | None:
     return None
 
 
+SnapshotListener = Callable[[RuntimeSnapshot], None]
+_FileSignature = tuple[Any, ...]
+
+
+class _SnapshotSlot:
+    """Process-wide cached snapshot + listeners for one runtime config path.
+
+    Shared by every ConfigAuthority pointing at the same file, so a write through one
+    instance (e.g. the config API) is pushed to listeners registered on another
+    (e.g. status/server).
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.signature: _FileSignature | None = None
+        self.snapshot: RuntimeSnapshot | None = None
+        self.listeners: list[SnapshotListener] = []
+
+
+_SNAPSHOT_SLOTS: dict[str, _SnapshotSlot] = {}
+_SNAPSHOT_SLOTS_LOCK = threading.Lock()
+
+
+def _snapshot_slot(path: Path) -> _SnapshotSlot:
+    key = os.path.abspath(path)
+    with _SNAPSHOT_SLOTS_LOCK:
+        slot = _SNAPSHOT_SLOTS.get(key)
+        if slot is None:
+            slot = _SnapshotSlot()
+            _SNAPSHOT_SLOTS[key] = slot
+        return slot
+
+
+def _stat_signature(path: Path) -> tuple[int, int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_ino, st.st_dev, st.st_size)
+
+
 class ConfigAuthority:
     def __init__(self, path: Path | None = None) -> None:
         self.path = path or RUNTIME_PATH
@@ -207,7 +250,68 @@ class ConfigAuthority:
         canon = _json_dumps_canonical(cfg)
         return hashlib.sha256(canon.encode("utf-8")).hexdigest()
 
+    def _file_signature(self) -> _FileSignature:
+        runtime_sig = _stat_signature(self.path)
+        if runtime_sig is not None:
+            return ("runtime", runtime_sig)
+        # No runtime file yet: _read() falls back to the seed file (or defaults).
+        return ("seed", str(SEED_PATH), _stat_signature(SEED_PATH))
+
+    def _publish(self, slot: _SnapshotSlot, sig: _FileSignature, snap: RuntimeSnapshot) -> None:
+        """Store ``snap`` as the cached snapshot and notify listeners on change.
+
+        Caller must hold ``slot.lock``.
+        """
+        previous = slot.snapshot
+        slot.signature = sig
+        slot.snapshot = snap
+        if previous is not None and (previous.version, previous.hash) == (snap.version, snap.hash):
+            return
+        for listener in list(slot.listeners):
+            try:
+                listener(snap)
+            except Exception as e:
+                _LOGGER.warning("config_snapshot_listener_error: %s", e)
+
     def load(self) -> RuntimeSnapshot:
+        """Return the current runtime snapshot.
+
+        The validated snapshot is cached per file and only re-read/re-validated when
+        the file's mtime/inode/size changes. Treat the returned ``cfg`` as read-only.
+        """
+        slot = _snapshot_slot(self.path)
+        with slot.lock:
+            sig = self._file_signature()
+            if slot.snapshot is not None and slot.signature == sig:
+                return slot.snapshot
+            snap = self._load_uncached()
+            self._publish(slot, sig, snap)
+            return snap
+
+    def version_info(self) -> tuple[int, str]:
+        """Cheap ``(version, hash)`` accessor served from the cached snapshot."""
+        snap = self.load()
+        return snap.version, snap.hash
+
+    def subscribe(self, listener: SnapshotListener) -> Callable[[], None]:
+        """Register ``listener`` for snapshot changes; returns an unsubscribe callable.
+
+        Listeners are called with the new RuntimeSnapshot whenever this process
+        observes a new (version, hash): immediately after ``propose_update`` and on
+        the first read after the file changed on disk.
+        """
+        slot = _snapshot_slot(self.path)
+        with slot.lock:
+            slot.listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with slot.lock:
+                if listener in slot.listeners:
+                    slot.listeners.remove(listener)
+
+        return _unsubscribe
+
+    def _load_uncached(self) -> RuntimeSnapshot:
         version, cfg_raw = self._read()
         try:
             cfg_raw = _normalize_loaded_runtime_cfg(cfg_raw)
@@ -237,6 +341,27 @@ class ConfigAuthority:
         actor: str = "system",
         changed_paths: list[str] | None = None,
         hash_before: str | None = None,
+    ) -> RuntimeSnapshot:
+        slot = _snapshot_slot(self.path)
+        with slot.lock:
+            snap = self._persist_atomic_unlocked(
+                new_cfg,
+                expected_version,
+                actor=actor,
+                changed_paths=changed_paths,
+                hash_before=hash_before,
+            )
+            self._publish(slot, self._file_signature(), snap)
+            return snap
+
+    def _persist_atomic_unlocked(
+        self,
+        new_cfg: RuntimeConfig,
+        expected_version: int,
+        *,
+        actor: str = "system",
+        changed_paths: list[str] | None = None,
+        hash_before: str | None = None,
     ) -> RuntimeSnapshot:
         # optimistic lock
         cur_version, _ = self._read()
@@ -11,8 +11,14 @@ without the non-stationary visual pattern recognition:
 5. volume_anomaly_z: Orderflow confirmation
 6. regime_persistence: Trend stability
 7. price_reversion_potential: Inverted stretch signal
+
+The ``calculate_*`` functions take the as-of window and return one value per bar.
+``compute_derived_feature_arrays`` computes the whole suite for a full series in one
+vectorized pass; every value at bar i depends only on bars <= i and equals the last
+value of the corresponding ``calculate_*`` call on the prefix ending at i.
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -270,3 +276,109 @@ def calculate_price_reversion_potential(
         Reversion potential (higher value = stronger mean reversion setup)
     """
     return [-abs(x) for x in price_stretch_z]
+
+
+DERIVED_FEATURE_KEYS = (
+    "momentum_displacement_z",
+    "price_stretch_z",
+    "trend_confluence",
+    "volatility_shift",
+    "volume_anomaly_z",
+    "regime_persistence",
+    "price_reversion_potential",
+)
+
+
+def _trend_confluence_array(ema_fast: np.ndarray, ema_slow: np.ndarray, window: int) -> np.ndarray:
+    n = len(ema_fast)
+    result = np.zeros(n, dtype=float)
+    if len(ema_slow) != n or n < window + 1:
+        return result
+    fast_start, fast_end = ema_fast[:-window], ema_fast[window:]
+    slow_start, slow_end = ema_slow[:-window], ema_slow[window:]
+    valid = (fast_start != 0) & (slow_start != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fast_slope = np.where(valid, (fast_end - fast_start) / fast_start, 0.0)
+        slow_slope = np.where(valid, (slow_end - slow_start) / slow_start, 0.0)
+    magnitude = np.minimum(np.abs(fast_slope), np.abs(slow_slope))
+    confluence = np.where(
+        (fast_slope > 0) & (slow_slope > 0),
+        magnitude,
+        np.where((fast_slope < 0) & (slow_slope < 0), -magnitude, 0.0),
+    )
+    result[window:] = np.clip(confluence * 10, -1.0, 1.0)
+    return result
+
+
+def volatility_shift_array(atr_short, atr_long) -> np.ndarray:
+    """Whole-series ``calculate_volatility_shift`` (ATR(short) / ATR(long), 1.0 if long <= 0)."""
+    atr_short_arr = np.asarray(atr_short, dtype=float)
+    atr_long_arr = np.asarray(atr_long, dtype=float)
+    ratio = np.ones(len(atr_short_arr), dtype=float)
+    np.divide(atr_short_arr, atr_long_arr, out=ratio, where=atr_long_arr > 0)
+    return ratio
+
+
+def compute_derived_feature_arrays(
+    *,
+    closes,
+    volumes,
+    atr_short,
+    atr_long,
+    ema_fast,
+    ema_slow,
+    momentum_period: int = 3,
+    zscore_window: int = 240,
+    confluence_window: int = 20,
+    persistence_window: int = 24,
+) -> dict[str, np.ndarray]:
+    """
+    Whole-series derived features (one array per feature, aligned with ``closes``).
+
+    Inputs follow the precompute payload: ``atr_short``/``atr_long`` are ATR14/ATR50,
+    ``ema_fast``/``ema_slow`` are EMA20/EMA50. Momentum and stretch use ``atr_short``;
+    stretch and regime persistence use ``ema_slow``.
+
+    Returns:
+        Dict keyed by ``DERIVED_FEATURE_KEYS`` with float arrays of ``len(closes)``.
+    """
+    close_arr = np.asarray(closes, dtype=float)
+    atr_short_arr = np.asarray(atr_short, dtype=float)
+    atr_long_arr = np.asarray(atr_long, dtype=float)
+    ema_fast_arr = np.asarray(ema_fast, dtype=float)
+    ema_slow_arr = np.asarray(ema_slow, dtype=float)
+    n = len(close_arr)
+
+    # The rolling z-scores are causal, so the series versions already give the
+    # per-bar as-of values; only the per-bar loops need a numpy counterpart.
+    momentum = np.asarray(
+        calculate_momentum_displacement_z(
+            close_arr.tolist(), atr_short_arr.tolist(), period=momentum_period, window=zscore_window
+        ),
+        dtype=float,
+    )
+    stretch = np.asarray(
+        calculate_price_stretch_z(
+            close_arr.tolist(), ema_slow_arr.tolist(), atr_short_arr.tolist(), window=zscore_window
+        ),
+        dtype=float,
+    )
+    volume_z = np.asarray(
+        calculate_volume_anomaly_z(list(volumes), window=zscore_window), dtype=float
+    )
+    persistence = np.asarray(
+        calculate_regime_persistence(ema_slow_arr.tolist(), window=persistence_window),
+        dtype=float,
+    )
+    # As-of windows shorter than window + 1 bars report 0.0 (see calculate_regime_persistence).
+    persistence[: min(n, persistence_window)] = 0.0
+
+    return {
+        "momentum_displacement_z": momentum,
+        "price_stretch_z": stretch,
+        "trend_confluence": _trend_confluence_array(ema_fast_arr, ema_slow_arr, confluence_window),
+        "volatility_shift": volatility_shift_array(atr_short_arr, atr_long_arr),
+        "volume_anomaly_z": volume_z,
+        "regime_persistence": persistence,
+        "price_reversion_potential": -np.abs(stretch),
+    }
@@ -5,6 +5,11 @@ from typing import Any
 
 import pandas as pd
 
+from core.indicators.htf_resample import (
+    derivation_sources,
+    derived_source_label,
+    get_resampled_candles,
+)
 from core.utils import is_case_sensitive_directory, timeframe_filename_suffix
 
 # Cache: {"{symbol}_{htf_timeframe}_{config_hash}": {"fib_df": pd.DataFrame}}
@@ -26,11 +31,68 @@ def normalize_data_source_policy(policy: str | None) -> str:
     return normalized
 
 
+def _candidate_paths(data_dir: Path, symbol: str, tf: str, policy: str) -> list[Path]:
+    curated = data_dir / "curated" / "v1" / "candles" / f"{symbol}_{tf}.parquet"
+    if policy == "curated_only":
+        return [curated]
+    return [
+        data_dir / "raw" / f"{symbol}_{tf}_frozen.parquet",
+        curated,
+        data_dir / "candles" / f"{symbol}_{tf}.parquet",
+    ]
+
+
+def _read_candles(path: Path, cache_key: tuple[str, str, str, str]) -> pd.DataFrame:
+    cached = _candles_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    df = pd.read_parquet(path, engine="pyarrow")
+    if "timestamp" in df.columns:
+        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, errors="coerce")
+    _candles_cache[cache_key] = df
+    return df
+
+
+def _derive_candles_data(
+    symbol: str, timeframe: str, data_dir: Path, policy: str
+) -> pd.DataFrame | None:
+    """Resample ``timeframe`` candles from the coarsest available base file, if any."""
+
+    for source_tf in derivation_sources(timeframe):
+        source_path = next(
+            (p for p in _candidate_paths(data_dir, symbol, source_tf, policy) if p.exists()),
+            None,
+        )
+        if source_path is None:
+            continue
+        cache_key = (
+            symbol,
+            timeframe,
+            policy,
+            derived_source_label(str(source_path), source_tf, timeframe),
+        )
+        cached = _candles_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        base = _read_candles(source_path, (symbol, source_tf, policy, str(source_path)))
+        df = get_resampled_candles(
+            base,
+            symbol=symbol,
+            source_timeframe=source_tf,
+            target_timeframe=timeframe,
+        )
+        _candles_cache[cache_key] = df
+        return df
+    return None
+
+
 def load_candles_data(
     symbol: str,
     timeframe: str,
     *,
     data_source_policy: str = "frozen_first",
+    allow_derive: bool = True,
 ) -> pd.DataFrame:
     """Load candles from frozen/curated/legacy parquet with deterministic priority.
 
@@ -38,6 +100,8 @@ def load_candles_data(
       1) data/raw/{symbol}_{tf}_frozen.parquet
       2) data/curated/v1/candles/{symbol}_{tf}.parquet
       3) data/candles/{symbol}_{tf}.parquet
+      4) (allow_derive) resampled from the coarsest base timeframe that has a file,
+         see ``core.indicators.htf_resample``
     """
 
     tf_in = str(timeframe)
@@ -57,44 +121,20 @@ def load_candles_data(
 
     path: Path | None = None
     for tf in suffixes:
-        curated = data_dir / "curated" / "v1" / "candles" / f"{symbol}_{tf}.parquet"
-        if policy == "curated_only":
-            candidates = [curated]
-        else:
-            candidates = [
-                data_dir / "raw" / f"{symbol}_{tf}_frozen.parquet",
-                curated,
-                data_dir / "candles" / f"{symbol}_{tf}.parquet",
-            ]
-        path = next((p for p in candidates if p.exists()), None)
+        path = next((p for p in _candidate_paths(data_dir, symbol, tf, policy) if p.exists()), None)
         if path is not None:
             break
     if path is None:
+        if allow_derive:
+            derived = _derive_candles_data(symbol, tf_in, data_dir, policy)
+            if derived is not None:
+                return derived
         tried = []
         for tf in suffixes:
-            curated = data_dir / "curated" / "v1" / "candles" / f"{symbol}_{tf}.parquet"
-            if policy == "curated_only":
-                tried.append(curated)
-            else:
-                tried.extend(
-                    [
-                        data_dir / "raw" / f"{symbol}_{tf}_frozen.parquet",
-                        curated,
-                        data_dir / "candles" / f"{symbol}_{tf}.parquet",
-                    ]
-                )
+            tried.extend(_candidate_paths(data_dir, symbol, tf, policy))
         raise FileNotFoundError(
             "No candle parquet found for "
             f"{symbol} {tf_cache}. Tried: {', '.join(str(p) for p in tried)}"
         )
 
-    cache_key = (symbol, tf_cache, policy, str(path))
-    cached = _candles_cache.get(cache_key)
-    if cached is not None:
-        return cached
-
-    df = pd.read_parquet(path, engine="pyarrow")
-    if "timestamp" in df.columns:
-        df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True, errors="coerce")
-    _candles_cache[cache_key] = df
-    return df
+    return _read_candles(path, (symbol, tf_cache, policy, str(path)))
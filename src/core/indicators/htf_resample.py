@@ -0,0 +1,244 @@
+"""Derive higher-timeframe candles from base (LTF) candles.
+
+HTF features and exits historically required a separate candle file per HTF
+(e.g. ``tBTCUSD_1D.parquet``). When that file was missing or stale the HTF
+context silently degraded. This module derives any HTF whose period is an exact
+multiple of the base timeframe directly from the base candles.
+
+Bar semantics match the exchange candles used elsewhere in the repo:
+
+- ``timestamp`` is the bar *open* time (UTC); the bar is valid from
+  ``timestamp + period`` (see ``htf_fibonacci_mapping``).
+- Buckets are aligned to the UTC epoch (``4h`` -> 00/04/08..., ``1D`` -> 00:00);
+  weekly buckets are anchored on Monday 00:00 UTC.
+- Only *closed* buckets are emitted: a leading bucket that starts before the
+  first base bar and a trailing bucket that has not yet closed are dropped, so
+  consumers can never observe a partially formed HTF bar.
+
+Derived frames are cached on disk keyed by a checksum of the source candles, so
+repeated runs over the same base data never re-aggregate.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from core.utils.logging_redaction import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# Bump when the meaning or layout of persisted resampled frames changes.
+RESAMPLE_SCHEMA_VERSION = 1
+
+_UNIT_MINUTES = {"m": 1, "h": 60, "D": 1440, "W": 10080}
+_TIMEFRAME_RE = re.compile(r"^\s*(\d+)\s*(m|h|D|d|W|w)\s*$")
+_NS_PER_MINUTE = 60 * 1_000_000_000
+# 1970-01-05 is the first Monday after the epoch.
+_WEEK_ORIGIN_NS = 4 * 1440 * _NS_PER_MINUTE
+_OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Base timeframes probed (coarsest first) when deriving an HTF without its own file.
+DERIVATION_SOURCE_TIMEFRAMES = ("1D", "12h", "6h", "4h", "3h", "1h", "30m", "15m", "5m", "1m")
+
+# In-memory layer in front of the disk cache: {(symbol, src, tgt, checksum): df}
+_resampled_cache: dict[tuple[str, str, str, str], pd.DataFrame] = {}
+
+
+def timeframe_to_minutes(timeframe: str | None) -> int | None:
+    """Parse a timeframe label (``15m``, ``4h``, ``1D``, ``1W``) into minutes.
+
+    Monthly timeframes (``1M``/``1mo``) are not fixed-length and return None.
+    """
+
+    if timeframe is None:
+        return None
+    raw = str(timeframe)
+    if raw.strip() in {"1M", "1mo"}:
+        return None
+    match = _TIMEFRAME_RE.match(raw)
+    if match is None:
+        return None
+    count = int(match.group(1))
+    unit = match.group(2)
+    unit = unit.upper() if unit in {"d", "w"} else unit
+    if count <= 0:
+        return None
+    return count * _UNIT_MINUTES[unit]
+
+
+def minutes_to_timeframe(minutes: int) -> str:
+    """Return the canonical (Bitfinex-style) label for a period in minutes."""
+
+    minutes = int(minutes)
+    if minutes <= 0:
+        raise ValueError(f"minutes must be positive; got {minutes}")
+    if minutes % _UNIT_MINUTES["W"] == 0:
+        return f"{minutes // _UNIT_MINUTES['W']}W"
+    if minutes % _UNIT_MINUTES["D"] == 0:
+        return f"{minutes // _UNIT_MINUTES['D']}D"
+    if minutes % _UNIT_MINUTES["h"] == 0:
+        return f"{minutes // _UNIT_MINUTES['h']}h"
+    return f"{minutes}m"
+
+
+def can_derive_timeframe(source_timeframe: str, target_timeframe: str) -> bool:
+    """Return True if ``target_timeframe`` is an exact multiple of ``source_timeframe``."""
+
+    src = timeframe_to_minutes(source_timeframe)
+    tgt = timeframe_to_minutes(target_timeframe)
+    if src is None or tgt is None:
+        return False
+    return tgt > src and tgt % src == 0
+
+
+def derivation_sources(target_timeframe: str) -> list[str]:
+    """Return base timeframes that ``target_timeframe`` can be derived from, coarsest first."""
+
+    return [tf for tf in DERIVATION_SOURCE_TIMEFRAMES if can_derive_timeframe(tf, target_timeframe)]
+
+
+def candles_checksum(df: pd.DataFrame) -> str:
+    """Return a SHA-256 checksum of the timestamp and OHLCV columns of ``df``."""
+
+    hasher = hashlib.sha256()
+    hasher.update(f"rows={len(df)}".encode())
+    ts = pd.to_datetime(df["timestamp"], utc=True, errors="coerce")
+    hasher.update(b"timestamp")
+    hasher.update(np.ascontiguousarray(ts.to_numpy(dtype="datetime64[ns]").view("int64")).data)
+    for col in _OHLCV_COLUMNS:
+        if col not in df.columns:
+            continue
+        hasher.update(col.encode())
+        hasher.update(np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)).data)
+    return hasher.hexdigest()
+
+
+def resample_candles(
+    df: pd.DataFrame,
+    source_timeframe: str,
+    target_timeframe: str,
+) -> pd.DataFrame:
+    """Aggregate ``df`` (``source_timeframe`` bars) into closed ``target_timeframe`` bars.
+
+    Raises:
+        ValueError: if the target is not an exact multiple of the source timeframe.
+    """
+
+    if not can_derive_timeframe(source_timeframe, target_timeframe):
+        raise ValueError(
+            f"Cannot derive {target_timeframe!r} candles from {source_timeframe!r} candles"
+        )
+    src_minutes = int(timeframe_to_minutes(source_timeframe) or 0)
+    tgt_minutes = int(timeframe_to_minutes(target_timeframe) or 0)
+
+    columns = ["timestamp", *[c for c in _OHLCV_COLUMNS if c in df.columns]]
+    if len(df) == 0:
+        return pd.DataFrame({c: [] for c in columns}).astype({"timestamp": "datetime64[ns, UTC]"})
+
+    ts = pd.to_datetime(df["timestamp"], utc=True, errors="coerce")
+    valid = ts.notna().to_numpy()
+    ts_ns = ts.to_numpy(dtype="datetime64[ns]").view("int64")[valid]
+    order = np.argsort(ts_ns, kind="stable")
+    ts_ns = ts_ns[order]
+
+    period_ns = tgt_minutes * _NS_PER_MINUTE
+    origin_ns = _WEEK_ORIGIN_NS if tgt_minutes % _UNIT_MINUTES["W"] == 0 else 0
+    buckets = (ts_ns - origin_ns) // period_ns * period_ns + origin_ns
+
+    frame = pd.DataFrame({"bucket": buckets})
+    for col in columns[1:]:
+        frame[col] = df[col].to_numpy(dtype=np.float64)[valid][order]
+
+    agg: dict[str, Any] = {"open": "first", "high": "max", "low": "min", "close": "last"}
+    if "volume" in frame.columns:
+        agg["volume"] = "sum"
+    grouped = frame.groupby("bucket", sort=True).agg(
+        {k: v for k, v in agg.items() if k in frame.columns}
+    )
+
+    bucket_starts = grouped.index.to_numpy(dtype=np.int64)
+    keep = np.ones(len(bucket_starts), dtype=bool)
+    # Leading bucket is partial when the base data starts after the bucket open.
+    if len(bucket_starts) and int(ts_ns[0]) != int(bucket_starts[0]):
+        keep[0] = False
+    # Trailing bucket is closed only once its final base bar has closed at the bucket end.
+    src_ns = src_minutes * _NS_PER_MINUTE
+    if len(bucket_starts) and int(ts_ns[-1]) + src_ns < int(bucket_starts[-1]) + period_ns:
+        keep[-1] = False
+
+    out = grouped.loc[keep].reset_index()
+    out["timestamp"] = pd.to_datetime(out.pop("bucket"), utc=True)
+    return out[columns].reset_index(drop=True)
+
+
+def _default_cache_dir() -> Path:
+    return Path(__file__).resolve().parents[3] / "cache" / "htf_resampled"
+
+
+def _cache_file(
+    cache_dir: Path, symbol: str, source_timeframe: str, target_timeframe: str, checksum: str
+) -> Path:
+    return cache_dir / (
+        f"{symbol}_{source_timeframe}_to_{target_timeframe}"
+        f"_v{RESAMPLE_SCHEMA_VERSION}_{checksum[:16]}.parquet"
+    )
+
+
+def get_resampled_candles(
+    df: pd.DataFrame,
+    *,
+    symbol: str,
+    source_timeframe: str,
+    target_timeframe: str,
+    cache_dir: Path | None = None,
+    cache_write_enabled: bool = True,
+) -> pd.DataFrame:
+    """Return ``target_timeframe`` candles derived from ``df``, using the checksum cache.
+
+    Lookup order: in-process memo -> on-disk parquet -> resample (then persist).
+    Cache I/O failures are non-fatal; the resample result is always returned.
+    """
+
+    checksum = candles_checksum(df)
+    memo_key = (symbol, source_timeframe, target_timeframe, checksum)
+    cached = _resampled_cache.get(memo_key)
+    if cached is not None:
+        return cached
+
+    directory = cache_dir if cache_dir is not None else _default_cache_dir()
+    path = _cache_file(directory, symbol, source_timeframe, target_timeframe, checksum)
+    result: pd.DataFrame | None = None
+    if path.exists():
+        try:
+            result = pd.read_parquet(path, engine="pyarrow")
+            result["timestamp"] = pd.to_datetime(result["timestamp"], utc=True, errors="coerce")
+        except Exception as exc:
+            _LOGGER.warning("Ignoring unreadable resample cache %s: %s", path, exc)
+            result = None
+
+    if result is None:
+        result = resample_candles(df, source_timeframe, target_timeframe)
+        if cache_write_enabled:
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                result.to_parquet(tmp_path, index=False, engine="pyarrow")
+                os.replace(tmp_path, path)
+            except Exception as exc:
+                _LOGGER.warning("Failed to persist resample cache %s: %s", path, exc)
+
+    _resampled_cache[memo_key] = result
+    return result
+
+
+def derived_source_label(source: str | None, source_timeframe: str, target_timeframe: str) -> str:
+    """Describe a derived HTF frame for provenance fields (``*_candles_source``)."""
+
+    return f"derived:{source_timeframe}->{target_timeframe}:{source or 'memory'}"
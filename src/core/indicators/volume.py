@@ -6,13 +6,22 @@ Volume metrics help confirm price movements and identify institutional interest:
 - Volume spike: Abnormally high volume (potential breakout)
 - Volume trend: Short-term vs long-term volume momentum
 - Volume-price divergence: Volume not confirming price action
+- Volume score: Current volume vs rolling median (market-quality input)
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
+from collections import deque
+
 import numpy as np
 import pandas as pd
 
+# Defaults of quality.pipeline.volume_window / volume_cap_ratio in evaluate_pipeline.
+# The precomputed `volume_score` array is built with these parameters.
+VOLUME_SCORE_WINDOW = 50
+VOLUME_SCORE_CAP_RATIO = 3.0
+
 
 def calculate_volume_sma(volume: list[float], period: int) -> list[float]:
     """
@@ -287,3 +296,117 @@ def obv(close: list[float], volume: list[float]) -> list[float]:
     obv_series = pd.Series(signed_arr, index=close_series.index).cumsum()
 
     return obv_series.tolist()
+
+
+class RollingMedian:
+    """
+    Streaming upper median over the last ``window`` values.
+
+    Only positive values take part in the median (matching the volume score);
+    other values still occupy a slot in the window. Values are kept in a
+    sorted list, so each ``push`` is an O(log w) search plus one insert/remove.
+
+    Example:
+        >>> rm = RollingMedian(3)
+        >>> [rm.push(v) for v in (5.0, 1.0, 3.0, 9.0)]
+        [5.0, 5.0, 3.0, 9.0]
+    """
+
+    def __init__(self, window: int) -> None:
+        if window <= 0:
+            raise ValueError("window must be > 0")
+        self.window = int(window)
+        self._values: deque[float | None] = deque()
+        self._sorted: list[float] = []
+
+    def push(self, value: float) -> float | None:
+        """Add ``value`` (evicting the oldest if full) and return the median."""
+        if len(self._values) == self.window:
+            old = self._values.popleft()
+            if old is not None:
+                del self._sorted[bisect_left(self._sorted, old)]
+        item = float(value) if value is not None and value > 0 else None
+        self._values.append(item)
+        if item is not None:
+            insort(self._sorted, item)
+        return self.median()
+
+    def median(self) -> float | None:
+        """Upper median of the positive values in the window (None if there are none)."""
+        if not self._sorted:
+            return None
+        return self._sorted[len(self._sorted) // 2]
+
+
+def rolling_upper_median(
+    volume: list[float] | np.ndarray,
+    window: int = VOLUME_SCORE_WINDOW,
+    *,
+    chunk_size: int = 8192,
+) -> np.ndarray:
+    """
+    Upper median of the positive values among the last ``window`` bars, per bar.
+
+    Vectorized equivalent of feeding the series through ``RollingMedian``; bars
+    whose window has no positive value are NaN. Windows are sorted in chunks to
+    bound memory.
+
+    Args:
+        volume: Volume values
+        window: Rolling window length
+        chunk_size: Bars sorted per chunk
+
+    Returns:
+        Array of medians aligned with ``volume``
+    """
+    if window <= 0:
+        raise ValueError("window must be > 0")
+    vol = np.asarray(volume, dtype=float)
+    n = len(vol)
+    result = np.full(n, np.nan)
+    if n == 0:
+        return result
+
+    # NaN sorts last, so the k valid values of each window occupy the first k slots.
+    masked = np.where(vol > 0, vol, np.nan)
+    padded = np.concatenate([np.full(window - 1, np.nan), masked])
+    for start in range(0, n, chunk_size):
+        stop = min(n, start + chunk_size)
+        windows = np.lib.stride_tricks.sliding_window_view(
+            padded[start : stop + window - 1], window
+        )
+        counts = np.count_nonzero(~np.isnan(windows), axis=1)
+        ordered = np.sort(windows, axis=1)
+        medians = ordered[np.arange(len(ordered)), np.minimum(counts // 2, window - 1)]
+        result[start:stop] = np.where(counts > 0, medians, np.nan)
+    return result
+
+
+def volume_score(
+    volume: list[float] | np.ndarray,
+    window: int = VOLUME_SCORE_WINDOW,
+    cap_ratio: float = VOLUME_SCORE_CAP_RATIO,
+) -> np.ndarray:
+    """
+    Volume quality score in [0, 1] per bar: min(v_now / rolling median, cap), clamped.
+
+    Per-bar equivalent of the live ``_volume_score_from_candles`` computed on the
+    bars up to and including each index. Non-positive current volume or a window
+    without positive volume scores 0.0; undefined ratios are NaN (``None`` live).
+
+    Args:
+        volume: Volume values
+        window: Rolling window for the median
+        cap_ratio: Outlier cap for the ratio (values below 1 are raised to 1)
+
+    Returns:
+        Array of scores aligned with ``volume``
+    """
+    vol = np.asarray(volume, dtype=float)
+    median = rolling_upper_median(vol, window)
+    cap = max(1.0, float(cap_ratio))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.minimum(vol / median, cap)
+    score = np.clip(ratio, 0.0, 1.0)
+    score[(vol <= 0) | np.isnan(median)] = 0.0
+    return score
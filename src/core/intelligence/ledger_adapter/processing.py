@@ -120,30 +120,41 @@ class DeterministicIntelligenceLedgerAdapter(IntelligenceLedgerAdapter):
                     raise ValueError("strategy_family_context_required") from exc
                 raise
 
-        persisted_event_ids: list[str] = []
-        ledger_entity_ids: list[str] = []
-
-        for validated_event in request.events:
-            entity_id = self.service.allocate_id(
-                LedgerEntityType.ARTIFACT,
-                year=_timestamp_year(validated_event.event.timestamp),
-            )
-            record = map_validated_event_to_artifact_record(
-                validated_event,
-                entity_id=entity_id,
-                strategy_family=resolved_strategy_family,
-                strategy_family_source=self.strategy_family_source,
+        events = list(request.events)
+        if not events:
+            return LedgerPersistenceResult(persisted_event_ids=(), ledger_entity_ids=())
+
+        # Reserve one contiguous ID range per year (one directory scan each) and hand the
+        # IDs out in event order, matching what sequential allocate_id calls produced.
+        years = [_timestamp_year(validated_event.event.timestamp) for validated_event in events]
+        reserved: dict[int, list[str]] = {}
+        for year in dict.fromkeys(years):
+            reserved[year] = self.service.allocate_ids(
+                LedgerEntityType.ARTIFACT, year=year, count=years.count(year)
             )
-            persisted = self.service.append_record_with_strategy_family(
-                record,
-                config=self.strategy_config,
-                strategy_family=resolved_strategy_family,
-                strategy_family_source=self.strategy_family_source,
+        cursors = dict.fromkeys(reserved, 0)
+
+        records: list[ArtifactRecord] = []
+        for validated_event, year in zip(events, years, strict=True):
+            entity_id = reserved[year][cursors[year]]
+            cursors[year] += 1
+            records.append(
+                map_validated_event_to_artifact_record(
+                    validated_event,
+                    entity_id=entity_id,
+                    strategy_family=resolved_strategy_family,
+                    strategy_family_source=self.strategy_family_source,
+                )
             )
-            persisted_event_ids.append(validated_event.event.event_id)
-            ledger_entity_ids.append(persisted.entity_id)
+
+        persisted = self.service.append_records_with_strategy_family(
+            records,
+            config=self.strategy_config,
+            strategy_family=resolved_strategy_family,
+            strategy_family_source=self.strategy_family_source,
+        )
 
         return LedgerPersistenceResult(
-            persisted_event_ids=tuple(persisted_event_ids),
-            ledger_entity_ids=tuple(ledger_entity_ids),
+            persisted_event_ids=tuple(validated_event.event.event_id for validated_event in events),
+            ledger_entity_ids=tuple(record.entity_id for record in persisted),
         )
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import re
+import weakref
 from typing import Any
 
 import httpx
@@ -11,6 +13,7 @@ from core.observability.metrics import metrics
 from core.symbols.symbols import SymbolMapper, SymbolMode
 from core.utils.backoff import exponential_backoff_delay
 from core.utils.crypto import build_hmac_signature
+from core.utils.lazy_import import module_available
 from core.utils.logging_redaction import get_logger
 from core.utils.nonce_manager import bump_nonce, get_nonce
 
@@ -20,6 +23,23 @@ _LOGGER = get_logger(__name__)
 _MAX_SIGNED_REQUEST_ATTEMPTS = 3
 _NONCE_ERROR_CODE = 10114
 _RETRYABLE_STATUS_CODES = {429}
+# HTTP/2 multiplexes concurrent order submits over one warm TLS connection; httpx
+# only negotiates it when the optional ``h2`` package is installed.
+_HTTP2_AVAILABLE = module_available("h2")
+# Per event loop and API key: held from nonce allocation until the request body is
+# written, so concurrent submits reach the wire in nonce order (asyncio locks are
+# loop-bound, hence keyed by loop).
+_DISPATCH_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Lock]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _dispatch_lock(api_key: str) -> asyncio.Lock:
+    locks = _DISPATCH_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    lock = locks.get(api_key)
+    if lock is None:
+        lock = locks[api_key] = asyncio.Lock()
+    return lock
 
 
 def _collect_error_markers(payload: Any, *, codes: set[int], texts: list[str]) -> None:
@@ -83,7 +103,10 @@ def _get_http_client() -> httpx.AsyncClient:
     if _HTTP_CLIENT is None:
         _HTTP_CLIENT = httpx.AsyncClient(
             timeout=httpx.Timeout(10.0, connect=5.0, pool=5.0),
-            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0
+            ),
+            http2=_HTTP2_AVAILABLE,
         )
     return _HTTP_CLIENT
 
@@ -92,11 +115,22 @@ class ExchangeClient:
     """Minimal central REST-klient för Bitfinex v2.
 
     - Bygger signerade headers med NonceManager
+    - Serialiserar nonce-allokering → skrivning per API-nyckel (samtidiga submits)
     - Skickar requests (GET/POST)
     - Begränsad retry med jitter-backoff för 10114/429/5xx och transienta request-fel
+
+    ``base_url``/``http_client`` pekar om klienten (t.ex. mot en lokal mock-börs i
+    tester); standard är Bitfinex och den delade poolade klienten.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        base_url: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._base_url = base_url
+        self._http_client = http_client
         self._settings = get_settings()
         try:
             self._symbol_mapper = SymbolMapper(self._settings.symbol_mode)
@@ -117,6 +151,12 @@ class ExchangeClient:
             "Content-Type": "application/json",
         }
 
+    def _client(self) -> httpx.AsyncClient:
+        return self._http_client if self._http_client is not None else _get_http_client()
+
+    def _url(self, endpoint: str) -> str:
+        return f"{self._base_url or _BASE_URL}/v2/{endpoint}"
+
     @staticmethod
     def _is_retryable_status(status_code: int | None) -> bool:
         return status_code is not None and (
@@ -150,23 +190,46 @@ class ExchangeClient:
             _LOGGER.info("REST %s %s", method.upper(), endpoint)
         except Exception as log_err:
             _LOGGER.debug("log_error: %s", log_err)
-        client = _get_http_client()
-        url = f"{_BASE_URL}/v2/{endpoint}"
+        client = self._client()
+        url = self._url(endpoint)
         api_key = (self._settings.BITFINEX_API_KEY or "").strip()
 
-        async def _do(request_headers: dict[str, str]) -> httpx.Response:
-            # Viktigt: använd exakt samma JSON‑serialisering för innehållet som vid signering
-            body_str = json.dumps(body, separators=(",", ":"))
-            req = getattr(client, method.lower())
-            kwargs: dict[str, Any] = {"headers": request_headers, "content": body_str}
-            if timeout is not None:
-                kwargs["timeout"] = timeout
-            return await req(url, **kwargs)
+        async def _do() -> httpx.Response:
+            # Nonce-allokering → skrivning serialiseras per API-nyckel: låset hålls tills
+            # httpcore rapporterar att request-bodyn är skriven (trace-extension), så en
+            # senare nonce kan inte nå börsen före en tidigare medan pool/anslutning väntas
+            # in. Klienter utan trace släpper låset först när svaret kommit.
+            lock = _dispatch_lock(api_key)
+            await lock.acquire()
+            released = False
+
+            def _release() -> None:
+                nonlocal released
+                if not released:
+                    released = True
+                    lock.release()
+
+            async def _trace(event_name: str, _info: dict[str, Any]) -> None:
+                if event_name.endswith("send_request_body.complete"):
+                    _release()
+
+            try:
+                request_headers = self._build_headers(endpoint, body)
+                # Viktigt: använd exakt samma JSON‑serialisering för innehållet som vid signering
+                body_str = json.dumps(body, separators=(",", ":"))
+                req = getattr(client, method.lower())
+                kwargs: dict[str, Any] = {"headers": request_headers, "content": body_str}
+                if timeout is not None:
+                    kwargs["timeout"] = timeout
+                if isinstance(client, httpx.AsyncClient):
+                    kwargs["extensions"] = {"trace": _trace}
+                return await req(url, **kwargs)
+            finally:
+                _release()
 
         for attempt in range(_MAX_SIGNED_REQUEST_ATTEMPTS):
-            headers = self._build_headers(endpoint, body)
             try:
-                resp = await _do(headers)
+                resp = await _do()
                 resp.raise_for_status()
                 metrics.inc("rest_auth_success")
                 try:
@@ -268,8 +331,6 @@ class ExchangeClient:
 
     async def _sleep_jitter(self, attempt: int = 1) -> None:
         # Enhetlig backoff/jitter via util (en mild fördröjning)
-        import asyncio
-
         delay = exponential_backoff_delay(
             attempt,
             base_delay=0.05,
@@ -288,8 +349,8 @@ class ExchangeClient:
         timeout: float | None = None,
     ) -> httpx.Response:
         """Utför en publik (osignerad) request via den delade klienten."""
-        client = _get_http_client()
-        url = f"{_BASE_URL}/v2/{endpoint}"
+        client = self._client()
+        url = self._url(endpoint)
 
         try:
             req = getattr(client, method.lower())
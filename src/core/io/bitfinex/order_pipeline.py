@@ -0,0 +1,184 @@
+"""Bounded, concurrent order-submission path with latency metrics.
+
+Independent paper orders are submitted concurrently (up to ``max_in_flight``)
+over the pooled exchange client instead of queueing behind each other's
+sign → post → parse round trip. Callers beyond ``max_in_flight`` wait in a FIFO
+queue bounded by ``max_pending``; when it is full, ``submit`` raises
+OrderQueueFull immediately instead of piling up stale orders.
+
+Nonces reach the exchange in increasing order per API key: ExchangeClient holds
+a per-key lock from nonce allocation until the request body is written, so
+concurrent submits never overtake each other while waiting for a pooled or new
+connection. 10114 rejections are still retried with a bumped nonce as a backstop.
+
+Each submission records queue wait, exchange round trip and total latency, both
+in ``core.observability.metrics`` and in a rolling window (``latency_summary``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from core.observability.metrics import metrics
+from core.utils.logging_redaction import get_logger
+
+ORDER_SUBMIT_ENDPOINT = "auth/w/order/submit"
+
+_LOGGER = get_logger(__name__)
+
+
+class SignedRequestClient(Protocol):
+    async def signed_request(self, **kwargs: Any) -> Any: ...
+
+
+class OrderQueueFull(RuntimeError):
+    """Raised when more than ``max_pending`` submissions are already waiting."""
+
+
+@dataclass(frozen=True)
+class OrderLatency:
+    queued_ms: float
+    exchange_ms: float
+    total_ms: float
+
+
+@dataclass(frozen=True)
+class OrderSubmitResult:
+    response: Any
+    latency: OrderLatency
+
+
+class _LoopState:
+    """Per event loop admission state (asyncio primitives are loop-bound)."""
+
+    def __init__(self, max_in_flight: int) -> None:
+        self.slots = asyncio.Semaphore(max_in_flight)
+        self.waiting = 0
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(q * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class OrderSubmitPipeline:
+    def __init__(
+        self,
+        *,
+        max_in_flight: int = 4,
+        max_pending: int = 32,
+        endpoint: str = ORDER_SUBMIT_ENDPOINT,
+        latency_window: int = 256,
+    ) -> None:
+        if max_in_flight < 1 or max_pending < 0:
+            raise ValueError("max_in_flight must be >= 1 and max_pending >= 0")
+        self.max_in_flight = int(max_in_flight)
+        self.max_pending = int(max_pending)
+        self.endpoint = endpoint
+        self._states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._latencies: deque[OrderLatency] = deque(maxlen=max(1, int(latency_window)))
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = _LoopState(self.max_in_flight)
+            self._states[loop] = state
+        return state
+
+    async def submit(
+        self,
+        client: SignedRequestClient,
+        body: dict[str, Any],
+        *,
+        signal_ts: float | None = None,
+    ) -> OrderSubmitResult:
+        """Submit one order via ``client.signed_request`` and time it.
+
+        ``signal_ts`` (``time.perf_counter()`` when the signal was produced) makes
+        ``total_ms`` a signal-to-ack latency; otherwise it starts at this call.
+        Exchange errors propagate unchanged after being counted.
+        """
+        state = self._state()
+        start = time.perf_counter() if signal_ts is None else float(signal_ts)
+        if state.slots.locked():
+            if state.waiting >= self.max_pending:
+                metrics.inc("order_submit_rejected_queue_full")
+                raise OrderQueueFull(
+                    f"order submit queue full ({self.max_pending} waiting, "
+                    f"{self.max_in_flight} in flight)"
+                )
+            state.waiting += 1
+            try:
+                await state.slots.acquire()
+            finally:
+                state.waiting -= 1
+        else:
+            await state.slots.acquire()
+
+        dispatched = time.perf_counter()
+        try:
+            response = await client.signed_request(method="POST", endpoint=self.endpoint, body=body)
+        except Exception:
+            metrics.inc("order_submit_error")
+            raise
+        finally:
+            state.slots.release()
+
+        acked = time.perf_counter()
+        latency = OrderLatency(
+            queued_ms=(dispatched - start) * 1000.0,
+            exchange_ms=(acked - dispatched) * 1000.0,
+            total_ms=(acked - start) * 1000.0,
+        )
+        self._record(latency)
+        return OrderSubmitResult(response=response, latency=latency)
+
+    def _record(self, latency: OrderLatency) -> None:
+        self._latencies.append(latency)
+        metrics.inc("order_submit_ok")
+        metrics.set_gauge("order_submit_last_total_ms", latency.total_ms)
+        try:
+            metrics.event(
+                "order_submit_latency",
+                {
+                    "endpoint": self.endpoint,
+                    "queued_ms": round(latency.queued_ms, 3),
+                    "exchange_ms": round(latency.exchange_ms, 3),
+                    "total_ms": round(latency.total_ms, 3),
+                },
+            )
+        except Exception as m_err:
+            _LOGGER.debug("metrics_error: %s", m_err)
+
+    def latency_summary(self) -> dict[str, Any]:
+        """Percentiles (ms) over the rolling latency window."""
+        samples = list(self._latencies)
+        summary: dict[str, Any] = {"count": len(samples)}
+        if not samples:
+            return summary
+        for field in ("queued_ms", "exchange_ms", "total_ms"):
+            values = sorted(getattr(sample, field) for sample in samples)
+            summary[field] = {
+                "p50": _percentile(values, 0.50),
+                "p95": _percentile(values, 0.95),
+                "max": values[-1],
+            }
+        return summary
+
+
+_ORDER_PIPELINE: OrderSubmitPipeline | None = None
+
+
+def get_order_pipeline() -> OrderSubmitPipeline:
+    global _ORDER_PIPELINE
+    if _ORDER_PIPELINE is None:
+        _ORDER_PIPELINE = OrderSubmitPipeline()
+    return _ORDER_PIPELINE
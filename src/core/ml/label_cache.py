@@ -2,13 +2,37 @@
 Label caching utilities to avoid recomputing expensive triple-barrier labels.
 
 Performance impact: ~5 minutes saved per configuration (27 configs = 135 min saved!)
+
+All labels live in a single indexed store (``cache/labels/label_store.npz``): one
+int8 array per cache key (-1 = None) plus a JSON index member describing every
+entry. Lookups only read the members they need; legacy one-parquet-per-key files
+are still readable and counted by ``get_cache_info``.
+
+Writes rewrite the store under an exclusive lock (``label_store.npz.lock``), so
+concurrent labeling processes never drop each other's entries. Prefer
+``save_label_batch``/``get_or_compute_label_grid`` to pay the rewrite once per batch.
 """
 
+import fnmatch
+import json
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+try:  # POSIX only; elsewhere writes fall back to unlocked read-modify-write
+    import fcntl
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None  # type: ignore[assignment]
+
+_CACHE_DIR = Path("cache/labels")
+_STORE_FILENAME = "label_store.npz"
+_INDEX_MEMBER = "__index__"
+
 
 def get_label_cache_key(
     symbol: str,
@@ -38,12 +62,123 @@ def get_label_cache_key(
 
 
 def get_label_cache_path(cache_key: str) -> Path:
-    """Get full path to label cache file."""
-    cache_dir = Path("cache/labels")
+    """Get full path to a legacy (one file per key) label cache file."""
+    cache_dir = _CACHE_DIR
     cache_dir.mkdir(parents=True, exist_ok=True)
     return cache_dir / f"{cache_key}.parquet"
 
 
+def get_label_store_path() -> Path:
+    """Get path to the single indexed label store."""
+    return _CACHE_DIR / _STORE_FILENAME
+
+
+def _read_store_index(store_path: Path) -> dict[str, dict[str, Any]]:
+    if not store_path.exists():
+        return {}
+    with np.load(store_path, allow_pickle=False) as npz:
+        if _INDEX_MEMBER not in npz.files:
+            return {}
+        raw = npz[_INDEX_MEMBER].tolist()
+    parsed = json.loads(raw)
+    return parsed if isinstance(parsed, dict) else {}
+
+
+@contextmanager
+def _store_lock(store_path: Path) -> Iterator[None]:
+    """Hold an exclusive inter-process lock for a read-modify-write of the store."""
+    if fcntl is None:
+        yield
+        return
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(store_path.with_name(f"{store_path.name}.lock"), "a+b") as handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _legacy_files() -> list[Path]:
+    if not _CACHE_DIR.exists():
+        return []
+    return sorted(_CACHE_DIR.glob("*.parquet"))
+
+
+def _labels_from_array(arr: np.ndarray) -> list[int | None]:
+    return [None if int(label) < 0 else int(label) for label in arr]
+
+
+def _labels_to_array(labels: list[int | None]) -> np.ndarray:
+    return np.array([-1 if label is None else int(label) for label in labels], dtype=np.int8)
+
+
+def _write_store(
+    store_path: Path, arrays: dict[str, np.ndarray], index: dict[str, dict[str, Any]]
+) -> None:
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = store_path.with_name(f"{store_path.stem}.{os.getpid()}.tmp.npz")
+    payload = dict(arrays)
+    payload[_INDEX_MEMBER] = np.array(json.dumps(index, sort_keys=True))
+    np.savez(tmp_path, **payload)
+    os.replace(tmp_path, store_path)
+
+
+def load_label_batch(cache_keys: list[str]) -> dict[str, list[int | None]]:
+    """
+    Load several label arrays from the store in one open.
+
+    Returns:
+        Mapping of cache key -> labels for keys present in the store (misses omitted)
+    """
+    store_path = get_label_store_path()
+    if not store_path.exists():
+        return {}
+
+    try:
+        with np.load(store_path, allow_pickle=False) as npz:
+            members = set(npz.files)
+            return {key: _labels_from_array(npz[key]) for key in cache_keys if key in members}
+    except Exception as e:
+        print(f"[CACHE] Warning: Failed to read label store {store_path}: {e}")
+        return {}
+
+
+def save_label_batch(
+    entries: dict[str, list[int | None]],
+    metadata: dict[str, dict[str, Any]] | None = None,
+) -> None:
+    """
+    Save many label arrays with a single rewrite of the indexed store.
+
+    Args:
+        entries: Mapping of cache key -> labels
+        metadata: Optional per-key metadata merged into the index
+    """
+    if not entries:
+        return
+
+    store_path = get_label_store_path()
+    try:
+        with _store_lock(store_path):
+            arrays: dict[str, np.ndarray] = {}
+            index: dict[str, dict[str, Any]] = {}
+            if store_path.exists():
+                with np.load(store_path, allow_pickle=False) as npz:
+                    arrays = {name: npz[name] for name in npz.files if name != _INDEX_MEMBER}
+                index = _read_store_index(store_path)
+
+            for key, labels in entries.items():
+                arr = _labels_to_array(labels)
+                arrays[key] = arr
+                index[key] = {**(metadata or {}).get(key, {}), "n_labels": int(arr.size)}
+
+            _write_store(store_path, arrays, index)
+        print(f"[CACHE] Saved {len(entries)} label set(s) to {store_path.name}")
+    except Exception as e:
+        print(f"[CACHE] Warning: Failed to save label store {store_path}: {e}")
+
+
 def load_cached_labels(
     symbol: str,
     timeframe: str,
@@ -62,8 +197,12 @@ def load_cached_labels(
     cache_key = get_label_cache_key(
         symbol, timeframe, k_profit, k_stop, max_holding, atr_period, version
     )
-    cache_path = get_label_cache_path(cache_key)
+    stored = load_label_batch([cache_key])
+    if cache_key in stored:
+        return stored[cache_key]
 
+    # Legacy layout: one parquet file per cache key.
+    cache_path = _CACHE_DIR / f"{cache_key}.parquet"
     if not cache_path.exists():
         return None
 
@@ -106,16 +245,91 @@ def save_labels_to_cache(
     cache_key = get_label_cache_key(
         symbol, timeframe, k_profit, k_stop, max_holding, atr_period, version
     )
-    cache_path = get_label_cache_path(cache_key)
+    save_label_batch(
+        {cache_key: labels},
+        {
+            cache_key: _entry_metadata(
+                symbol, timeframe, k_profit, k_stop, max_holding, atr_period, version
+            )
+        },
+    )
 
-    try:
-        # Convert to DataFrame (None → NaN for Parquet compatibility)
-        df = pd.DataFrame({"label": labels})
-        df.to_parquet(cache_path, index=False, compression="snappy", engine="pyarrow")
 
-        print(f"[CACHE] Saved labels to {cache_key}")
-    except Exception as e:
-        print(f"[CACHE] Warning: Failed to save cache {cache_key}: {e}")
+def _entry_metadata(
+    symbol: str,
+    timeframe: str,
+    k_profit: float,
+    k_stop: float,
+    max_holding: int,
+    atr_period: int,
+    version: str,
+) -> dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "k_profit": float(k_profit),
+        "k_stop": float(k_stop),
+        "max_holding": int(max_holding),
+        "atr_period": int(atr_period),
+        "version": version,
+    }
+
+
+def get_or_compute_label_grid(
+    closes: list[float],
+    highs: list[float],
+    lows: list[float],
+    symbol: str,
+    timeframe: str,
+    configs: list[tuple[float, float, int]],
+    atr_period: int = 14,
+    version: str = "v2",
+) -> dict[tuple[float, float, int], list[int | None]]:
+    """
+    Return labels for a grid of barrier configs, computing only the cache misses.
+
+    Misses are labelled together with the batched Numba kernel (ATR computed once,
+    one forward scan per bar) and persisted with a single store rewrite.
+
+    Args:
+        closes: List of close prices
+        highs: List of high prices
+        lows: List of low prices
+        symbol: Trading symbol
+        timeframe: Timeframe
+        configs: ``(k_profit, k_stop, max_holding)`` tuples
+        atr_period: ATR calculation period
+        version: Cache version
+
+    Returns:
+        Mapping from config tuple to labels
+    """
+    keyed = {
+        (float(p), float(s), int(h)): get_label_cache_key(
+            symbol, timeframe, p, s, h, atr_period, version
+        )
+        for p, s, h in configs
+    }
+    cached = load_label_batch(list(keyed.values()))
+    results = {cfg: cached[key] for cfg, key in keyed.items() if key in cached}
+    misses = [cfg for cfg in keyed if cfg not in results]
+    if not misses:
+        return results
+
+    from core.ml.labeling_fast import generate_adaptive_triple_barrier_label_grid
+
+    computed = generate_adaptive_triple_barrier_label_grid(
+        closes, highs, lows, misses, atr_period=atr_period
+    )
+    save_label_batch(
+        {keyed[cfg]: labels for cfg, labels in computed.items()},
+        {
+            keyed[cfg]: _entry_metadata(symbol, timeframe, *cfg, atr_period, version)
+            for cfg in computed
+        },
+    )
+    results.update(computed)
+    return results
 
 
 def clear_label_cache(
@@ -123,16 +337,16 @@ def clear_label_cache(
     timeframe: str | None = None,
 ) -> int:
     """
-    Clear label cache files.
+    Clear cached labels (store entries and legacy parquet files).
 
     Args:
         symbol: If provided, only clear this symbol (e.g., "tBTCUSD")
         timeframe: If provided, only clear this timeframe (e.g., "1h")
 
     Returns:
-        Number of files deleted
+        Number of cache entries deleted
     """
-    cache_dir = Path("cache/labels")
+    cache_dir = _CACHE_DIR
 
     if not cache_dir.exists():
         return 0
@@ -147,37 +361,73 @@ def clear_label_cache(
         else:
             pattern = f"*_{timeframe}_*"
 
-    pattern += ".parquet"
-
-    # Delete matching files
     deleted = 0
-    for file in cache_dir.glob(pattern):
+    store_path = get_label_store_path()
+    if store_path.exists():
+        try:
+            with _store_lock(store_path):
+                with np.load(store_path, allow_pickle=False) as npz:
+                    arrays = {name: npz[name] for name in npz.files if name != _INDEX_MEMBER}
+                index = _read_store_index(store_path)
+                doomed = [key for key in arrays if fnmatch.fnmatchcase(key, pattern)]
+                if doomed:
+                    for key in doomed:
+                        arrays.pop(key, None)
+                        index.pop(key, None)
+                    if arrays:
+                        _write_store(store_path, arrays, index)
+                    else:
+                        store_path.unlink()
+                    deleted += len(doomed)
+        except Exception as e:
+            print(f"[CACHE] Warning: Failed to clear label store {store_path}: {e}")
+
+    # Legacy one-file-per-key layout
+    for file in cache_dir.glob(f"{pattern}.parquet"):
         file.unlink()
         deleted += 1
 
     if deleted > 0:
-        print(f"[CACHE] Cleared {deleted} label cache file(s)")
+        print(f"[CACHE] Cleared {deleted} label cache entr{'y' if deleted == 1 else 'ies'}")
 
     return deleted
 
 
 def get_cache_info() -> dict[str, Any]:
-    """Get information about label cache."""
-    cache_dir = Path("cache/labels")
+    """Get information about label cache (store index plus legacy parquet files)."""
+    store_path = get_label_store_path()
+    legacy = _legacy_files()
 
-    if not cache_dir.exists():
+    if not store_path.exists() and not legacy:
         return {
             "exists": False,
             "total_files": 0,
+            "total_entries": 0,
             "total_size_mb": 0.0,
         }
 
-    files = list(cache_dir.glob("*.parquet"))
-    total_size = sum(f.stat().st_size for f in files)
-
+    index: dict[str, dict[str, Any]] = {}
+    size_bytes = 0
+    if store_path.exists():
+        try:
+            index = _read_store_index(store_path)
+        except Exception as e:
+            print(f"[CACHE] Warning: Failed to read label store index {store_path}: {e}")
+        size_bytes += store_path.stat().st_size
+
+    # Legacy keys shadowed by the store are only counted once.
+    legacy_only = [path for path in legacy if path.stem not in index]
+    size_bytes += sum(path.stat().st_size for path in legacy)
+    symbols = {str(meta.get("symbol")) for meta in index.values() if meta.get("symbol")}
+    symbols.update(path.stem.split("_", 1)[0] for path in legacy_only)
     return {
         "exists": True,
-        "total_files": len(files),
-        "total_size_mb": total_size / (1024 * 1024),
-        "cache_dir": str(cache_dir.absolute()),
+        "total_files": int(store_path.exists()) + len(legacy),
+        "total_entries": len(index) + len(legacy_only),
+        "legacy_entries": len(legacy_only),
+        "total_labels": int(sum(int(meta.get("n_labels", 0)) for meta in index.values())),
+        "symbols": sorted(symbols),
+        "total_size_mb": size_bytes / (1024 * 1024),
+        "cache_dir": str(store_path.parent.absolute()),
+        "store_path": str(store_path.absolute()),
     }
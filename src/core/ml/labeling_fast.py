@@ -204,3 +204,146 @@ def generate_adaptive_triple_barrier_labels_fast(
     labels = [None if label == -1 else int(label) for label in labels_np]
 
     return labels
+
+
+@jit(nopython=True)
+def generate_adaptive_triple_barrier_label_grid_numba(
+    closes: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    profit_multipliers: np.ndarray,
+    stop_multipliers: np.ndarray,
+    max_holdings: np.ndarray,
+    atr_period: int,
+) -> np.ndarray:
+    """
+    Numba-compiled triple-barrier labeling for a batch of barrier configs.
+
+    ATR is computed once and every bar's forward window is scanned once for all
+    configs (up to the longest holding period), instead of once per config.
+    Config ``c`` is ``(profit_multipliers[c], stop_multipliers[c], max_holdings[c])``.
+
+    Returns:
+        Array of shape (n_configs, n) with labels identical to running
+        ``generate_adaptive_triple_barrier_labels_numba`` per config.
+    """
+    n = len(closes)
+    n_cfg = len(profit_multipliers)
+    labels = np.full((n_cfg, n), -1, dtype=np.int32)
+    if n_cfg == 0:
+        return labels
+
+    atr = calculate_atr_pointwise(highs, lows, closes, atr_period)
+    max_h = 0
+    for c in range(n_cfg):
+        if max_holdings[c] > max_h:
+            max_h = max_holdings[c]
+
+    profit_targets = np.empty(n_cfg)
+    stop_losses = np.empty(n_cfg)
+    active = np.zeros(n_cfg, dtype=np.bool_)
+
+    for i in range(n):
+        if closes[i] <= 0 or np.isnan(atr[i]) or atr[i] <= 0:
+            continue
+
+        entry_price = closes[i]
+        current_atr = atr[i]
+
+        pending = 0
+        for c in range(n_cfg):
+            # Same "enough future bars" rule as the single-config kernel.
+            if i + max_holdings[c] >= n:
+                active[c] = False
+                continue
+            profit_targets[c] = entry_price + (profit_multipliers[c] * current_atr)
+            stop_losses[c] = entry_price - (stop_multipliers[c] * current_atr)
+            active[c] = True
+            pending += 1
+        if pending == 0:
+            continue
+
+        # Single forward scan shared by all configs still waiting for a barrier hit.
+        last_j = min(i + max_h + 1, n)
+        for j in range(i + 1, last_j):
+            high_price = highs[j]
+            low_price = lows[j]
+            if high_price <= 0 or low_price <= 0:
+                continue
+            for c in range(n_cfg):
+                if not active[c] or j > i + max_holdings[c]:
+                    continue
+                if high_price >= profit_targets[c]:
+                    labels[c, i] = 1
+                    active[c] = False
+                    pending -= 1
+                elif low_price <= stop_losses[c]:
+                    labels[c, i] = 0
+                    active[c] = False
+                    pending -= 1
+            if pending == 0:
+                break
+
+        # Time exit for configs whose barriers were not hit.
+        for c in range(n_cfg):
+            if not active[c]:
+                continue
+            exit_price = closes[min(i + max_holdings[c], n - 1)]
+            if exit_price <= 0:
+                continue
+            price_change_pct = ((exit_price - entry_price) / entry_price) * 100
+            min_threshold_pct = min(
+                profit_multipliers[c] * current_atr / entry_price * 100,
+                stop_multipliers[c] * current_atr / entry_price * 100,
+            )
+            if abs(price_change_pct) < min_threshold_pct / 2:
+                labels[c, i] = -1
+            elif price_change_pct > 0:
+                labels[c, i] = 1
+            else:
+                labels[c, i] = 0
+
+    return labels
+
+
+def generate_adaptive_triple_barrier_label_grid(
+    closes: list[float],
+    highs: list[float],
+    lows: list[float],
+    configs: list[tuple[float, float, int]],
+    atr_period: int = 14,
+) -> dict[tuple[float, float, int], list[int | None]]:
+    """
+    Label a grid of barrier configs in one pass (shared ATR + forward scans).
+
+    Args:
+        closes: List of close prices
+        highs: List of high prices
+        lows: List of low prices
+        configs: ``(profit_multiplier, stop_multiplier, max_holding_bars)`` tuples
+        atr_period: ATR calculation period
+
+    Returns:
+        Mapping from each (deduplicated) config tuple to its labels
+        (1=profit, 0=loss, None=filtered), in input order.
+    """
+    unique: list[tuple[float, float, int]] = []
+    for profit, stop, holding in configs:
+        key = (float(profit), float(stop), int(holding))
+        if key not in unique:
+            unique.append(key)
+
+    labels_np = generate_adaptive_triple_barrier_label_grid_numba(
+        np.array(closes, dtype=np.float64),
+        np.array(highs, dtype=np.float64),
+        np.array(lows, dtype=np.float64),
+        np.array([c[0] for c in unique], dtype=np.float64),
+        np.array([c[1] for c in unique], dtype=np.float64),
+        np.array([c[2] for c in unique], dtype=np.int64),
+        int(atr_period),
+    )
+
+    return {
+        cfg: [None if label == -1 else int(label) for label in labels_np[row]]
+        for row, cfg in enumerate(unique)
+    }
@@ -6,18 +6,26 @@ import logging
 import os
 import subprocess
 import sys
+import tempfile
 import threading
 import time
-from collections.abc import Iterable
-from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from core.optimizer import runner_config as runner_config_lib
 from core.optimizer.champion import ChampionManager
 from core.optimizer.constraints import enforce_constraints
+from core.optimizer.runner_fidelity import (
+    FidelityLevel,
+    fidelity_dir,
+    fidelity_window,
+    parse_fidelity_schedule,
+)
 from core.optimizer.runner_optuna_orchestration import (
     collect_comparability_warnings_impl,
     compute_optuna_resume_signature_impl,
@@ -42,7 +50,8 @@ from core.utils.diffing import summarize_metrics_diff
 from core.utils.diffing.optuna_guard import estimate_zero_trade
 from core.utils.diffing.results_diff import diff_backtest_results
 from core.utils.diffing.trial_cache import TrialResultCache
-from core.utils.optuna_helpers import param_signature, set_global_seeds
+from core.utils.lazy_import import lazy_import, module_available, resolve_lazy_attribute
+from core.utils.optuna_helpers import NoDupeGuard, param_signature, set_global_seeds
 
 
 def _json_default(obj: Any) -> Any:
@@ -72,20 +81,37 @@ except Exception:  # pragma: no cover
     _HAS_ORJSON = False
 
 
-try:
-    import optuna
+# optuna is only needed by the Optuna strategy itself; grid runs and trial
+# worker processes import this module without paying for it. The sampler,
+# pruner and storage classes stay module attributes (resolved on first use).
+OPTUNA_AVAILABLE = module_available("optuna")
+optuna = lazy_import("optuna") if OPTUNA_AVAILABLE else None
+_OPTUNA_EXPORTS = {
+    "Trial": "optuna",
+    "TrialState": "optuna.trial",
+    "TPESampler": "optuna.samplers",
+    "RandomSampler": "optuna.samplers",
+    "CmaEsSampler": "optuna.samplers",
+    "MedianPruner": "optuna.pruners",
+    "SuccessiveHalvingPruner": "optuna.pruners",
+    "HyperbandPruner": "optuna.pruners",
+    "NopPruner": "optuna.pruners",
+    "RDBStorage": "optuna.storages",
+}
+if TYPE_CHECKING:
     from optuna import Trial
-    from optuna.pruners import HyperbandPruner, MedianPruner, NopPruner, SuccessiveHalvingPruner
-    from optuna.samplers import CmaEsSampler, RandomSampler, TPESampler
-    from optuna.storages import RDBStorage
-    from optuna.trial import TrialState
 
-    OPTUNA_AVAILABLE = True
-except ModuleNotFoundError:  # pragma: no cover - handled at runtime
-    optuna = None
-    Trial = Any
-    TrialState = Any
-    OPTUNA_AVAILABLE = False
+
+def _optuna_symbol(name: str) -> Any:
+    if not OPTUNA_AVAILABLE:
+        return Any if name in ("Trial", "TrialState") else None
+    return resolve_lazy_attribute(globals(), name, _OPTUNA_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _OPTUNA_EXPORTS:
+        return _optuna_symbol(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
@@ -313,7 +339,7 @@ def _expand_dict(spec: dict[str, Any]) -> Iterable[dict[str, Any]]:
 
 
 def expand_parameters(spec: dict[str, Any]) -> Iterable[dict[str, Any]]:
-    yield from runner_config_lib.expand_parameters(spec)
+    return runner_config_lib.expand_parameters(spec)
 
 
 def _estimate_optuna_search_space(spec: dict[str, Any]) -> dict[str, Any]:
@@ -431,6 +457,32 @@ _DATA_CACHE: dict[str, Any] = {}
 _DATA_LOCK = threading.Lock()
 
 
+def _claim_param_key(
+    key: str,
+    seen_param_keys: set[str] | NoDupeGuard | None,
+    seen_param_lock: threading.Lock | None,
+) -> bool:
+    """Record ``key`` as seen; return False if it was already claimed in this run.
+
+    ``seen_param_keys`` is either an in-process set (guarded by ``seen_param_lock``) or a
+    ``NoDupeGuard`` shared by all worker processes of a grid run.
+    """
+    if seen_param_keys is None:
+        return True
+    if isinstance(seen_param_keys, NoDupeGuard):
+        return seen_param_keys.add(key)
+    if seen_param_lock:
+        with seen_param_lock:
+            if key in seen_param_keys:
+                return False
+            seen_param_keys.add(key)
+            return True
+    if key in seen_param_keys:
+        return False
+    seen_param_keys.add(key)
+    return True
+
+
 def run_trial(
     trial: TrialConfig,
     *,
@@ -442,7 +494,7 @@ def run_trial(
     max_attempts: int = 2,
     constraints_cfg: dict[str, Any | None] | None = None,
     cache_enabled: bool = False,
-    seen_param_keys: set[str] | None = None,
+    seen_param_keys: set[str] | NoDupeGuard | None = None,
     seen_param_lock: threading.Lock | None = None,
     baseline_results: dict[str, Any] | None = None,
     baseline_label: str | None = None,
@@ -463,12 +515,7 @@ def run_trial(
     fingerprint_digest = identity.fingerprint_digest
 
     if allow_resume and key in existing_trials:
-        if seen_param_keys is not None:
-            if seen_param_lock:
-                with seen_param_lock:
-                    seen_param_keys.add(key)
-            else:
-                seen_param_keys.add(key)
+        _claim_param_key(key, seen_param_keys, seen_param_lock)
         existing = existing_trials[key]
         return {
             "trial_id": existing.get("trial_id"),
@@ -478,19 +525,7 @@ def run_trial(
             "results_path": existing.get("results_path"),
         }
 
-    duplicate_detected = False
-    if seen_param_keys is not None:
-        if seen_param_lock:
-            with seen_param_lock:
-                if key in seen_param_keys:
-                    duplicate_detected = True
-                else:
-                    seen_param_keys.add(key)
-        else:
-            if key in seen_param_keys:
-                duplicate_detected = True
-            else:
-                seen_param_keys.add(key)
+    duplicate_detected = not _claim_param_key(key, seen_param_keys, seen_param_lock)
 
     trial_id = identity.trial_id
     if duplicate_detected:
@@ -939,9 +974,9 @@ def _select_optuna_sampler(
         kwargs,
         concurrency=concurrency,
         optuna_available=OPTUNA_AVAILABLE,
-        tpe_sampler_cls=TPESampler,
-        random_sampler_cls=RandomSampler,
-        cmaes_sampler_cls=CmaEsSampler,
+        tpe_sampler_cls=_optuna_symbol("TPESampler"),
+        random_sampler_cls=_optuna_symbol("RandomSampler"),
+        cmaes_sampler_cls=_optuna_symbol("CmaEsSampler"),
     )
 
 
@@ -953,10 +988,10 @@ def _select_optuna_pruner(
         name,
         kwargs,
         optuna_available=OPTUNA_AVAILABLE,
-        median_pruner_cls=MedianPruner,
-        successive_halving_pruner_cls=SuccessiveHalvingPruner,
-        hyperband_pruner_cls=HyperbandPruner,
-        nop_pruner_cls=NopPruner,
+        median_pruner_cls=_optuna_symbol("MedianPruner"),
+        successive_halving_pruner_cls=_optuna_symbol("SuccessiveHalvingPruner"),
+        hyperband_pruner_cls=_optuna_symbol("HyperbandPruner"),
+        nop_pruner_cls=_optuna_symbol("NopPruner"),
     )
 
 
@@ -987,7 +1022,7 @@ def _create_optuna_study(
         optuna_available=OPTUNA_AVAILABLE,
         select_optuna_sampler=_select_optuna_sampler,
         select_optuna_pruner=_select_optuna_pruner,
-        rdb_storage_cls=RDBStorage,
+        rdb_storage_cls=_optuna_symbol("RDBStorage"),
         create_study=getattr(optuna, "create_study", None),
         optuna_lock=_OPTUNA_LOCK,
     )
@@ -1150,18 +1185,35 @@ def _create_run_id(proposed: str | None = None) -> str:
 
 def _submit_trials(
     executor: ProcessPoolExecutor,
-    params_list: list[dict[str, Any]],
+    trials: Iterable[tuple[int, dict[str, Any]]],
     trial_cfg_builder,
-) -> list[Future]:
-    futures: list[Future] = []
-    for idx, params in enumerate(params_list, start=1):
-        futures.append(executor.submit(trial_cfg_builder, idx, params))
-    return futures
+    *,
+    max_pending: int,
+) -> Iterator[dict[str, Any]]:
+    """Run ``(idx, params)`` trials on the pool and yield results as they complete.
+
+    At most ``max_pending`` trials are queued at once, so a lazy grid is pulled
+    from as workers free up instead of being submitted (and held) up front.
+    """
+    pending: set[Future] = set()
+    for idx, params in trials:
+        pending.add(executor.submit(trial_cfg_builder, idx, params))
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    for future in as_completed(pending):
+        yield future.result()
 
 
 @dataclass
 class TrialContext:
-    """Context for executing a trial in a worker process."""
+    """Read-only trial settings shared by the worker processes of a grid run.
+
+    Sent once per worker via the pool initializer. Bulky state is referenced by path:
+    each worker loads the resume index and baseline results itself, and deduplicates
+    through the shared ``seen_keys_path`` database.
+    """
 
     snapshot_id: str
     symbol: str
@@ -1172,20 +1224,52 @@ class TrialContext:
     run_id: str
     run_dir: Path
     allow_resume: bool
-    existing_trials: dict[str, dict[str, Any]]
     max_attempts: int
     constraints_cfg: dict[str, Any] | None
-    baseline_results: dict[str, Any] | None
+    baseline_results_path: Path | None
     baseline_label: str | None
     optuna_context: dict[str, Any] | None
-
-
-def _execute_trial_task(
-    idx: int,
-    params: dict[str, Any],
-    ctx: TrialContext,
-) -> dict[str, Any]:
-    """Execute a single trial task in a worker process."""
+    resume_index_path: Path | None = None
+    seen_keys_path: Path | None = None
+
+
+# Per-process worker state, populated once by _init_trial_worker.
+_WORKER_CTX: TrialContext | None = None
+_WORKER_EXISTING_TRIALS: dict[str, dict[str, Any]] = {}
+_WORKER_BASELINE_RESULTS: dict[str, Any] | None = None
+_WORKER_SEEN_KEYS: NoDupeGuard | None = None
+
+
+def _write_resume_index(path: Path, existing_trials: dict[str, dict[str, Any]]) -> None:
+    """Write the subset of ``existing_trials`` that resume skips need (key -> ids/paths)."""
+    index = {
+        key: {"trial_id": trial.get("trial_id"), "results_path": trial.get("results_path")}
+        for key, trial in existing_trials.items()
+    }
+    _atomic_write_text(path, _json_dumps(index))
+
+
+def _init_trial_worker(ctx: TrialContext) -> None:
+    """ProcessPoolExecutor initializer: load the shared read-only trial context once."""
+    global _WORKER_CTX, _WORKER_EXISTING_TRIALS, _WORKER_BASELINE_RESULTS, _WORKER_SEEN_KEYS
+
+    _WORKER_CTX = ctx
+    _WORKER_EXISTING_TRIALS = {}
+    if ctx.allow_resume and ctx.resume_index_path is not None:
+        _WORKER_EXISTING_TRIALS = _json_loads(ctx.resume_index_path.read_text(encoding="utf-8"))
+    _WORKER_BASELINE_RESULTS = None
+    if ctx.baseline_results_path is not None:
+        _WORKER_BASELINE_RESULTS = _read_json_cached(ctx.baseline_results_path)
+    _WORKER_SEEN_KEYS = None
+    if ctx.seen_keys_path is not None:
+        _WORKER_SEEN_KEYS = NoDupeGuard(sqlite_path=str(ctx.seen_keys_path))
+
+
+def _execute_trial_task(idx: int, params: dict[str, Any]) -> dict[str, Any]:
+    """Execute a single trial task in a worker set up by ``_init_trial_worker``."""
+    ctx = _WORKER_CTX
+    if ctx is None:
+        raise RuntimeError("Trial worker not initialised (missing _init_trial_worker)")
     trial_cfg = TrialConfig(
         snapshot_id=ctx.snapshot_id,
         symbol=ctx.symbol,
@@ -1196,22 +1280,19 @@ def _execute_trial_task(
         end_date=ctx.end_date,
     )
 
-    # Note: seen_param_keys/lock are not shared across processes in this simple setup.
-    # We rely on existing_trials (disk cache) for deduplication.
-
     return run_trial(
         trial_cfg,
         run_id=ctx.run_id,
         index=idx,
         run_dir=ctx.run_dir,
         allow_resume=ctx.allow_resume,
-        existing_trials=ctx.existing_trials,
+        existing_trials=_WORKER_EXISTING_TRIALS,
         max_attempts=ctx.max_attempts,
         constraints_cfg=ctx.constraints_cfg,
         cache_enabled=True,
-        seen_param_keys=None,
+        seen_param_keys=_WORKER_SEEN_KEYS,
         seen_param_lock=None,
-        baseline_results=ctx.baseline_results,
+        baseline_results=_WORKER_BASELINE_RESULTS,
         baseline_label=ctx.baseline_label,
         optuna_context=ctx.optuna_context,
     )
@@ -1331,6 +1412,7 @@ def run_optimizer(config_path: Path, *, run_id: str | None = None) -> list[dict[
         "baseline_results_path"
     )
     baseline_results_data: dict[str, Any] | None = None
+    baseline_results_path: Path | None = None
     baseline_label: str | None = None
     if baseline_results_path_cfg:
         candidate_path = Path(baseline_results_path_cfg)
@@ -1340,18 +1422,62 @@ def run_optimizer(config_path: Path, *, run_id: str | None = None) -> list[dict[
             try:
                 baseline_results_data = _read_json_cached(candidate_path)
                 baseline_label = candidate_path.name
+                baseline_results_path = candidate_path
                 print(f"[Baseline] Loaded comparison results from {candidate_path}")
             except json.JSONDecodeError as exc:
                 print(f"[WARN] baseline_results_path ogiltig JSON ({candidate_path}): {exc}")
         else:
             print(f"[WARN] baseline_results_path hittades inte: {candidate_path}")
 
+    fidelity_schedule = parse_fidelity_schedule((runs_cfg.get("optuna") or {}).get("fidelity"))
+
+    def run_fidelity_trial(
+        idx: int, params: dict[str, Any], fidelity: FidelityLevel
+    ) -> dict[str, Any]:
+        # Screening run on a sub-range; own directory (and result cache) per fidelity level.
+        # No resume/dedup bookkeeping here: that belongs to the full-range run.
+        full_start, full_end = sample_start, sample_end
+        if full_start is None or full_end is None:
+            full_start, full_end = (
+                _normalize_date(value, "snapshot_id")
+                for value in _derive_dates(meta.get("snapshot_id", ""))
+            )
+        anchor = fidelity_schedule.anchor if fidelity_schedule is not None else "end"
+        window_start, window_end = fidelity_window(
+            full_start, full_end, fidelity.fraction, anchor=anchor
+        )
+        trial_cfg = TrialConfig(
+            snapshot_id=meta.get("snapshot_id", ""),
+            symbol=symbol,
+            timeframe=timeframe,
+            warmup_bars=int(meta.get("warmup_bars", 150)),
+            parameters=params,
+            start_date=window_start,
+            end_date=window_end,
+        )
+        payload = run_trial(
+            trial_cfg,
+            run_id=run_id_resolved,
+            index=idx,
+            run_dir=fidelity_dir(run_dir, fidelity),
+            allow_resume=False,
+            existing_trials={},
+            max_attempts=max_attempts,
+            constraints_cfg=config.get("constraints"),
+            cache_enabled=True,
+        )
+        payload["fidelity_window"] = {"start_date": window_start, "end_date": window_end}
+        return payload
+
     def make_trial(
         idx: int,
         params: dict[str, Any],
         advance_only: bool = False,
         optuna_context: dict[str, Any] | None = None,
+        fidelity: FidelityLevel | None = None,
     ) -> dict[str, Any]:
+        if fidelity is not None:
+            return run_fidelity_trial(idx, params, fidelity)
         if advance_only:
             # Cheap advancement without running backtest
             return {
@@ -1389,9 +1515,21 @@ def run_optimizer(config_path: Path, *, run_id: str | None = None) -> list[dict[
     results: list[dict[str, Any]] = []
 
     if strategy == OptimizerStrategy.GRID:
-        params_list = list(expand_parameters(parameters))
+        # Lazy grid: shard/dedup selection streams (global_idx, params) so the space is
+        # never materialised. max_trials caps the points run by this shard.
+        shard_index, shard_count = runner_config_lib.parse_grid_shard(
+            os.environ.get("GENESIS_GRID_SHARD") or runs_cfg.get("grid_shard")
+        )
+        grid_trials: Iterable[tuple[int, dict[str, Any]]] = runner_config_lib.iter_grid_trials(
+            expand_parameters(parameters),
+            shard_index=shard_index,
+            shard_count=shard_count,
+            dedup=_as_bool(runs_cfg.get("grid_dedup")),
+        )
         if max_trials is not None:
-            params_list = params_list[:max_trials]
+            grid_trials = islice(grid_trials, max_trials)
+        if shard_count > 1:
+            print(f"[Grid] Shard {shard_index}/{shard_count}")
 
         # Use ProcessPoolExecutor for Grid Search to avoid GIL issues
         # GENESIS_IN_PROCESS=1 forces concurrency=1 (Debug Mode)
@@ -1403,36 +1541,52 @@ def run_optimizer(config_path: Path, *, run_id: str | None = None) -> list[dict[
 
         # If debug mode or single worker, run in main process (simpler for tests/patching)
         if debug_mode or concurrency == 1:
-            for idx, params in enumerate(params_list, start=1):
-                results.append(make_trial(idx, params))
+            for grid_idx, params in grid_trials:
+                results.append(make_trial(grid_idx + 1, params))
         else:
-            # Use ProcessPoolExecutor for true parallelism with RAM caching per worker
-            # We must use a picklable task function (_execute_trial_task) and context
-            ctx = TrialContext(
-                snapshot_id=meta.get("snapshot_id", ""),
-                symbol=symbol,
-                timeframe=timeframe,
-                warmup_bars=int(meta.get("warmup_bars", 150)),
-                start_date=sample_start,
-                end_date=sample_end,
-                run_id=run_id_resolved,
-                run_dir=run_dir,
-                allow_resume=allow_resume,
-                existing_trials=existing_trials,
-                max_attempts=max_attempts,
-                constraints_cfg=config.get("constraints"),
-                baseline_results=baseline_results_data,
-                baseline_label=baseline_label,
-                optuna_context=None,
-            )
-
-            with ProcessPoolExecutor(max_workers=concurrency) as executor:
-                futures = []
-                for idx, params in enumerate(params_list, start=1):
-                    futures.append(executor.submit(_execute_trial_task, idx, params, ctx))
+            # Use ProcessPoolExecutor for true parallelism with RAM caching per worker.
+            # Workers receive the context once through the initializer; tasks carry only
+            # (idx, params). Resume index and seen-keys live in a per-invocation temp dir.
+            with tempfile.TemporaryDirectory(prefix="genesis_grid_") as worker_dir:
+                worker_path = Path(worker_dir)
+                resume_index_path: Path | None = None
+                if existing_trials:
+                    resume_index_path = worker_path / "resume_index.json"
+                    _write_resume_index(resume_index_path, existing_trials)
+                seen_keys_path = worker_path / "seen_param_keys.db"
+                NoDupeGuard(sqlite_path=str(seen_keys_path))  # create schema before workers
+                ctx = TrialContext(
+                    snapshot_id=meta.get("snapshot_id", ""),
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    warmup_bars=int(meta.get("warmup_bars", 150)),
+                    start_date=sample_start,
+                    end_date=sample_end,
+                    run_id=run_id_resolved,
+                    run_dir=run_dir,
+                    allow_resume=allow_resume,
+                    max_attempts=max_attempts,
+                    constraints_cfg=config.get("constraints"),
+                    baseline_results_path=baseline_results_path,
+                    baseline_label=baseline_label,
+                    optuna_context=None,
+                    resume_index_path=resume_index_path,
+                    seen_keys_path=seen_keys_path,
+                )
 
-                for future in as_completed(futures):
-                    results.append(future.result())
+                with ProcessPoolExecutor(
+                    max_workers=concurrency,
+                    initializer=_init_trial_worker,
+                    initargs=(ctx,),
+                ) as executor:
+                    results.extend(
+                        _submit_trials(
+                            executor,
+                            ((grid_idx + 1, params) for grid_idx, params in grid_trials),
+                            _execute_trial_task,
+                            max_pending=concurrency * 4,
+                        )
+                    )
     elif strategy == OptimizerStrategy.OPTUNA:
         runtime_version = _get_default_runtime_version()
         resume_signature = _compute_optuna_resume_signature(
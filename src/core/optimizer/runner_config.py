@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import hashlib
+import itertools
 import json
 import logging
 import os
@@ -11,14 +12,12 @@ import tempfile
 import threading
 import time
 from collections import OrderedDict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 try:  # Optional heavy deps used for JSON serialization helpers
     import numpy as np  # type: ignore
 except Exception:  # pragma: no cover - numpy not strictly required
@@ -32,8 +31,11 @@ except Exception:  # pragma: no cover - pandas not strictly required
 from core.optimizer.param_transforms import transform_parameters
 from core.utils.dict_merge import deep_merge_dicts
 from core.utils.diffing.canonical import canonicalize_config
+from core.utils.lazy_import import lazy_import
 from core.utils.optuna_helpers import param_signature
 
+yaml = lazy_import("yaml")
+
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 logger = logging.getLogger(__name__)
 
@@ -570,19 +572,20 @@ def _deep_merge(base: dict, override: dict) -> dict:
     return deep_merge_dicts(base, override)
 
 
-def _expand_value(node: Any) -> list[Any]:
-    def _clone_value(value: Any) -> Any:
-        value_type = type(value)
-        if value_type in (int, float, str, bool, type(None), bytes):
-            return value
-        if value_type is tuple:
-            return tuple(_clone_value(x) for x in value)
-        if value_type is list:
-            return [_clone_value(x) for x in value]
-        if value_type is dict:
-            return {k: _clone_value(val) for k, val in value.items()}
-        return copy.deepcopy(value)
+def _clone_value(value: Any) -> Any:
+    value_type = type(value)
+    if value_type in (int, float, str, bool, type(None), bytes):
+        return value
+    if value_type is tuple:
+        return tuple(_clone_value(x) for x in value)
+    if value_type is list:
+        return [_clone_value(x) for x in value]
+    if value_type is dict:
+        return {k: _clone_value(val) for k, val in value.items()}
+    return copy.deepcopy(value)
+
 
+def _expand_value(node: Any) -> list[Any]:
     if isinstance(node, dict):
         node_type = node.get("type")
         if node_type == "grid":
@@ -596,27 +599,137 @@ def _expand_value(node: Any) -> list[Any]:
     return [_clone_value(node)]
 
 
-def _expand_dict(spec: dict[str, Any]) -> Iterable[dict[str, Any]]:
-    items = [(key, _expand_value(value)) for key, value in spec.items()]
-
-    def _recurse(idx: int, current: dict[str, Any]) -> Iterable[dict[str, Any]]:
-        if idx >= len(items):
-            yield current
+def _flatten_grid_dimensions(
+    spec: dict[str, Any], prefix: tuple[str, ...] = ()
+) -> list[tuple[tuple[str, ...], list[Any]]]:
+    dims: list[tuple[tuple[str, ...], list[Any]]] = []
+    for key, node in spec.items():
+        path = (*prefix, key)
+        if isinstance(node, dict) and node and node.get("type") not in ("grid", "fixed"):
+            dims.extend(_flatten_grid_dimensions(node, path))
+        else:
+            dims.append((path, _expand_value(node)))
+    return dims
+
+
+class GridSpace:
+    """Lazy Cartesian product of a grid parameter spec.
+
+    Combinations are never materialised: ``len()`` is the product of the value
+    counts and ``nth(i)`` decodes ``i`` as a mixed-radix number over the leaf
+    dimensions (last key varies fastest), so ``nth(i) == list(space)[i]`` and
+    iteration order matches the historical recursive expansion.
+    """
+
+    def __init__(self, spec: dict[str, Any]) -> None:
+        self._dims = _flatten_grid_dimensions(spec or {})
+        size = 1
+        for _path, values in self._dims:
+            size *= len(values)
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _build(self, values: Iterable[Any]) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        for (path, _choices), value in zip(self._dims, values, strict=True):
+            node = params
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+            node[path[-1]] = _clone_value(value)
+        return params
+
+    def nth(self, index: int) -> dict[str, Any]:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(f"grid index {index} utanför [0, {self._size})")
+        picked: list[Any] = []
+        for _path, values in reversed(self._dims):
+            index, digit = divmod(index, len(values))
+            picked.append(values[digit])
+        picked.reverse()
+        return self._build(picked)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for values in itertools.product(*(choices for _path, choices in self._dims)):
+            yield self._build(values)
+
+
+def grid_param_key(params: dict[str, Any]) -> str:
+    """Canonical identity of a grid point after ``transform_parameters``.
+
+    Points that normalise to the same runtime parameters share a key.
+    """
+    transformed, _derived = transform_parameters(params)
+    return param_signature(transformed)
+
+
+def parse_grid_shard(value: Any) -> tuple[int, int]:
+    """Parse ``"i/n"`` (or ``[i, n]`` / ``{"index": i, "count": n}``) into ``(i, n)``."""
+    if value is None or value == "":
+        return 0, 1
+    if isinstance(value, dict):
+        index, count = value.get("index", 0), value.get("count", 1)
+    elif isinstance(value, list | tuple) and len(value) == 2:
+        index, count = value
+    elif isinstance(value, str) and "/" in value:
+        index, count = value.split("/", 1)
+    else:
+        raise ValueError(f"Ogiltig grid-shard: {value!r} (förväntade 'index/count')")
+    index, count = int(index), int(count)
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Ogiltig grid-shard: {index}/{count}")
+    return index, count
+
+
+def iter_grid_trials(
+    space: Iterable[dict[str, Any]],
+    *,
+    shard_index: int = 0,
+    shard_count: int = 1,
+    dedup: bool = False,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield ``(global_index, params)`` for the grid points owned by one shard.
+
+    Without ``dedup`` shards are strided over the global index (point ``i`` goes
+    to shard ``i % shard_count``) and a ``GridSpace`` is addressed via ``nth`` so
+    each node only decodes its own points. With ``dedup`` points are assigned by
+    their canonical key instead, so duplicates always land on the same shard and
+    only the first occurrence runs; the seen set holds this shard's keys only.
+    Global indices are stable across shards, keeping trial ids unique when shard
+    results are merged.
+    """
+    if shard_count < 1 or not 0 <= shard_index < shard_count:
+        raise ValueError(f"Ogiltig grid-shard: {shard_index}/{shard_count}")
+    if not dedup:
+        if isinstance(space, GridSpace):
+            for index in range(shard_index, len(space), shard_count):
+                yield index, space.nth(index)
             return
-        key, values = items[idx]
-        for value in values:
-            next_config = dict(current)
-            next_config[key] = value
-            yield from _recurse(idx + 1, next_config)
+        stride = itertools.islice(enumerate(space), shard_index, None, shard_count)
+        yield from stride
+        return
+
+    seen: set[str] = set()
+    for index, params in enumerate(space):
+        key = grid_param_key(params)
+        if shard_count > 1 and int(key[:12], 16) % shard_count != shard_index:
+            continue
+        if key in seen:
+            continue
+        seen.add(key)
+        yield index, params
+
 
-    yield from _recurse(0, {})
+def _expand_dict(spec: dict[str, Any]) -> Iterable[dict[str, Any]]:
+    yield from GridSpace(spec)
 
 
-def expand_parameters(spec: dict[str, Any]) -> Iterable[dict[str, Any]]:
-    if not spec:
-        yield {}
-        return
-    yield from _expand_dict(spec)
+def expand_parameters(spec: dict[str, Any]) -> GridSpace:
+    """Lazy, index-addressable expansion of a grid spec (``{}`` yields one empty point)."""
+    return GridSpace(spec)
 
 
 def _estimate_optuna_search_space(spec: dict[str, Any]) -> dict[str, Any]:
@@ -0,0 +1,216 @@
+"""Multi-fidelity screening for Optuna trials (asynchronous successive halving).
+
+Configured under ``runs.optuna.fidelity`` in the search YAML::
+
+    fidelity:
+      enabled: true
+      levels: [0.25, 0.5]   # screening windows as fractions of the sample range
+      keep_fraction: 0.34   # promote the top third of scores seen at each level
+      min_trials: 5         # promote everything until a level has this many scores
+      anchor: end           # sub-windows end at sample_end ("start" to begin there)
+
+Each trial first runs on the shortest window. It is promoted to the next level only if
+its score ranks in the top ``keep_fraction`` of all scores recorded at that level so far;
+trials that survive every level run the full configured range as usual. Screening runs
+live in ``<run_dir>/fidelity/<level>/`` with their own trial result cache, so results are
+cached per (fidelity, fingerprint).
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+_ANCHORS = ("end", "start")
+
+
+@dataclass(frozen=True, slots=True)
+class FidelityLevel:
+    rung: int
+    fraction: float
+
+    @property
+    def name(self) -> str:
+        return f"r{self.rung}_{round(self.fraction * 100):03d}pct"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"rung": self.rung, "fraction": self.fraction, "name": self.name}
+
+
+@dataclass(frozen=True, slots=True)
+class FidelitySchedule:
+    levels: tuple[FidelityLevel, ...]
+    keep_fraction: float = 1.0 / 3.0
+    min_trials: int = 5
+    anchor: str = "end"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "levels": [level.to_dict() for level in self.levels],
+            "keep_fraction": self.keep_fraction,
+            "min_trials": self.min_trials,
+            "anchor": self.anchor,
+        }
+
+
+def parse_fidelity_schedule(fidelity_cfg: Any) -> FidelitySchedule | None:
+    """Return the screening schedule, or None when fidelity screening is disabled."""
+    if not isinstance(fidelity_cfg, dict) or not fidelity_cfg.get("enabled", True):
+        return None
+    raw_levels = fidelity_cfg.get("levels") or []
+    if not isinstance(raw_levels, list) or not raw_levels:
+        raise ValueError("optuna.fidelity.levels måste vara en icke-tom lista av andelar")
+    fractions = [float(value) for value in raw_levels]
+    if any(not 0.0 < value < 1.0 for value in fractions):
+        raise ValueError("optuna.fidelity.levels måste ligga i intervallet (0, 1)")
+    if fractions != sorted(set(fractions)):
+        raise ValueError("optuna.fidelity.levels måste vara strikt stigande")
+
+    keep_fraction = float(fidelity_cfg.get("keep_fraction", 1.0 / 3.0))
+    if not 0.0 < keep_fraction <= 1.0:
+        raise ValueError("optuna.fidelity.keep_fraction måste ligga i intervallet (0, 1]")
+    min_trials = max(1, int(fidelity_cfg.get("min_trials", 5)))
+    anchor = str(fidelity_cfg.get("anchor", "end")).lower()
+    if anchor not in _ANCHORS:
+        raise ValueError(f"optuna.fidelity.anchor måste vara en av {_ANCHORS}")
+
+    return FidelitySchedule(
+        levels=tuple(
+            FidelityLevel(rung=rung, fraction=fraction) for rung, fraction in enumerate(fractions)
+        ),
+        keep_fraction=keep_fraction,
+        min_trials=min_trials,
+        anchor=anchor,
+    )
+
+
+def fidelity_window(
+    start: str, end: str, fraction: float, *, anchor: str = "end"
+) -> tuple[str, str]:
+    """Sub-range covering ``fraction`` of [start, end] (ISO dates, at least one day)."""
+    start_day = date.fromisoformat(start)
+    end_day = date.fromisoformat(end)
+    total_days = (end_day - start_day).days
+    length = max(1, round(total_days * fraction))
+    if length >= total_days:
+        return start, end
+    if anchor == "start":
+        return start, (start_day + timedelta(days=length)).isoformat()
+    return (end_day - timedelta(days=length)).isoformat(), end
+
+
+def fidelity_dir(run_dir: Path, level: FidelityLevel) -> Path:
+    return run_dir / "fidelity" / level.name
+
+
+def _payload_score(payload: dict[str, Any]) -> float | None:
+    score_block = payload.get("score")
+    if not isinstance(score_block, dict):
+        return None
+    try:
+        value = float(score_block.get("score"))
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _load_level_scores(level_dir: Path) -> list[float]:
+    scores: list[float] = []
+    for trial_path in sorted(level_dir.glob("trial_*.json")):
+        try:
+            payload = json.loads(trial_path.read_text(encoding="utf-8"))
+        except (ValueError, OSError):
+            continue
+        if isinstance(payload, dict) and not payload.get("error") and not payload.get("skipped"):
+            score = _payload_score(payload)
+            if score is not None:
+                scores.append(score)
+    return scores
+
+
+@dataclass(slots=True)
+class ScreeningOutcome:
+    """Fidelity history of one trial; ``payload`` is set when it stopped before full range."""
+
+    history: list[dict[str, Any]]
+    payload: dict[str, Any] | None = None
+
+
+@dataclass
+class FidelityLadder:
+    """Thread-safe promotion bookkeeping for one study (Optuna n_jobs uses threads)."""
+
+    schedule: FidelitySchedule
+    scores: dict[int, list[float]] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_run_dir(cls, schedule: FidelitySchedule, run_dir: Path) -> FidelityLadder:
+        """Seed per-level score history from screening artifacts of a resumed run."""
+        scores = {
+            level.rung: _load_level_scores(fidelity_dir(run_dir, level))
+            for level in schedule.levels
+        }
+        return cls(schedule=schedule, scores=scores)
+
+    def record(self, rung: int, score: float) -> bool:
+        """Record ``score`` at ``rung`` and return True if the trial is promoted."""
+        with self._lock:
+            level_scores = self.scores.setdefault(rung, [])
+            level_scores.append(score)
+            count = len(level_scores)
+            if count < self.schedule.min_trials:
+                return True
+            better = sum(1 for other in level_scores if other > score)
+            return better < math.ceil(self.schedule.keep_fraction * count)
+
+    def screen(
+        self,
+        trial_number: int,
+        parameters: dict[str, Any],
+        make_trial: Callable[..., dict[str, Any]],
+    ) -> ScreeningOutcome:
+        """Run ``parameters`` up the screening levels until rejected or promoted to full range.
+
+        ``make_trial`` is called with ``fidelity=<FidelityLevel>``. Failed or skipped screening
+        runs are returned as the outcome payload unchanged so the objective handles them like
+        full-range failures; screened-out trials get ``fidelity_pruned=True`` and are marked
+        skipped, so their short-window score never competes with full-range results.
+        """
+        history: list[dict[str, Any]] = []
+        for level in self.schedule.levels:
+            payload = make_trial(trial_number, parameters, fidelity=level)
+            payload = dict(payload or {})
+            entry = {**level.to_dict(), **(payload.get("fidelity_window") or {})}
+            score = _payload_score(payload)
+            if payload.get("error") or (payload.get("skipped") and not payload.get("from_cache")):
+                entry["status"] = "failed" if payload.get("error") else "skipped"
+                history.append(entry)
+                payload["fidelity"] = history
+                return ScreeningOutcome(history=history, payload=payload)
+            if score is None:
+                entry["status"] = "unscored"
+                history.append(entry)
+                break
+            promoted = self.record(level.rung, score)
+            entry.update(
+                {
+                    "score": score,
+                    "from_cache": bool(payload.get("from_cache")),
+                    "status": "promoted" if promoted else "screened_out",
+                }
+            )
+            history.append(entry)
+            if not promoted:
+                payload["fidelity"] = history
+                payload["fidelity_pruned"] = True
+                payload["skipped"] = True
+                payload["reason"] = "fidelity_pruned"
+                return ScreeningOutcome(history=history, payload=payload)
+        return ScreeningOutcome(history=history)
@@ -8,6 +8,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from core.optimizer.runner_fidelity import FidelityLadder, parse_fidelity_schedule
 from core.utils.diffing.canonical import canonicalize_config
 from core.utils.optuna_helpers import NoDupeGuard, param_signature
 
@@ -607,8 +608,16 @@ def run_optuna_impl(
     total_trials_attempted = 0
     duplicate_count = 0
     zero_trade_count = 0
+    fidelity_pruned_count = 0
     score_memory: dict[str, float] = {}
 
+    fidelity_schedule = parse_fidelity_schedule(study_config.get("fidelity"))
+    fidelity_ladder = (
+        FidelityLadder.from_run_dir(fidelity_schedule, run_dir)
+        if fidelity_schedule is not None
+        else None
+    )
+
     dedup_guard_enabled = bool(study_config.get("dedup_guard_enabled", True))
     guard: NoDupeGuard | None = (
         NoDupeGuard(sqlite_path=str(run_dir / "_dedup.db")) if dedup_guard_enabled else None
@@ -616,6 +625,7 @@ def run_optuna_impl(
 
     def objective(trial):
         nonlocal duplicate_streak, total_trials_attempted, duplicate_count, zero_trade_count
+        nonlocal fidelity_pruned_count
         total_trials_attempted += 1
         try:
             trial.set_user_attr("score_version", score_version)
@@ -702,9 +712,29 @@ def run_optuna_impl(
             "study_name": study_name,
             "pruner": pruner_cfg,
         }
-        payload = make_trial(trial_number, parameters, optuna_context=optuna_ctx)
+        payload: dict[str, Any] | None = None
+        fidelity_history: list[dict[str, Any]] | None = None
+        if fidelity_ladder is not None:
+            screening = fidelity_ladder.screen(trial_number, parameters, make_trial)
+            fidelity_history = screening.history
+            trial.set_user_attr("fidelity", fidelity_history)
+            payload = screening.payload
+        if payload is None:
+            payload = make_trial(trial_number, parameters, optuna_context=optuna_ctx)
+            if fidelity_history is not None and isinstance(payload, dict):
+                payload["fidelity"] = [
+                    *fidelity_history,
+                    {"name": "full", "fraction": 1.0, "status": "full_range"},
+                ]
         results.append(payload)
 
+        if payload.get("fidelity_pruned"):
+            # Screened out on a short window: the full-range backtest is never run.
+            trial.set_user_attr("fidelity_pruned", True)
+            fidelity_pruned_count += 1
+            duplicate_streak = 0
+            raise optuna_module.TrialPruned()
+
         if payload.get("from_cache"):
             score_block = payload.get("score") or {}
             cached_score = float(score_block.get("score", 0.0) or 0.0)
@@ -970,7 +1000,8 @@ def run_optuna_impl(
     if total_trials_attempted > 0:
         duplicate_ratio = duplicate_count / total_trials_attempted
         zero_trade_ratio = zero_trade_count / total_trials_attempted
-        pruned_ratio = pruned_count / total_trials_attempted
+        # Fidelity screen-outs are expected by design; only warn about pruner-driven pruning.
+        pruned_ratio = max(0, pruned_count - fidelity_pruned_count) / total_trials_attempted
 
         if duplicate_ratio > 0.5:
             print(
@@ -1045,6 +1076,7 @@ def run_optuna_impl(
                     "total_trials_attempted": total_trials_attempted,
                     "duplicate_count": duplicate_count,
                     "pruned_count": pruned_count,
+                    "fidelity_pruned_count": fidelity_pruned_count,
                     "zero_trade_count": zero_trade_count,
                     "duplicate_ratio": duplicate_count / max(1, total_trials_attempted),
                     "pruned_ratio": pruned_count / max(1, total_trials_attempted),
@@ -1064,6 +1096,7 @@ def run_optuna_impl(
                     "total_trials_attempted": total_trials_attempted,
                     "duplicate_count": duplicate_count,
                     "pruned_count": pruned_count,
+                    "fidelity_pruned_count": fidelity_pruned_count,
                     "zero_trade_count": zero_trade_count,
                     "duplicate_ratio": duplicate_count / max(1, total_trials_attempted),
                     "pruned_ratio": pruned_count / max(1, total_trials_attempted),
@@ -1082,6 +1115,7 @@ def run_optuna_impl(
                 "total_trials_attempted": total_trials_attempted,
                 "duplicate_count": duplicate_count,
                 "pruned_count": pruned_count,
+                "fidelity_pruned_count": fidelity_pruned_count,
                 "zero_trade_count": zero_trade_count,
                 "duplicate_ratio": duplicate_count / max(1, total_trials_attempted),
                 "pruned_ratio": pruned_count / max(1, total_trials_attempted),
@@ -1089,6 +1123,9 @@ def run_optuna_impl(
             },
         }
 
+    if fidelity_schedule is not None:
+        optuna_meta["fidelity"] = fidelity_schedule.to_dict()
+
     run_meta_path = run_dir / "run_meta.json"
     try:
         run_meta = json.loads(run_meta_path.read_text(encoding="utf-8"))
@@ -33,7 +33,7 @@ def _extract_results_path_from_log(log_content: str) -> Path | None:
 
 
 def _candidate_from_result(result: dict[str, Any]) -> ChampionCandidate | None:
-    if result.get("error") or result.get("skipped"):
+    if result.get("error") or result.get("skipped") or result.get("fidelity_pruned"):
         return None
     score_block = result.get("score") or {}
     constraints_block = result.get("constraints") or {}
@@ -23,7 +23,7 @@ def _select_validation_candidates(
 ) -> list[dict[str, Any]]:
     ranked: list[tuple[float, dict[str, Any]]] = []
     for result in results:
-        if result.get("error") or result.get("skipped"):
+        if result.get("error") or result.get("skipped") or result.get("fidelity_pruned"):
             continue
         score_block = result.get("score") or {}
         try:
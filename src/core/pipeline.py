@@ -1,17 +1,20 @@
+from __future__ import annotations
+
 import logging
 import os
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import TYPE_CHECKING, Any
 
 try:
     from dotenv import load_dotenv
 except ImportError:  # pragma: no cover
     load_dotenv = None
 
-from core.backtest.engine import BacktestEngine
-from core.utils.optuna_helpers import set_global_seeds
+# BacktestEngine (pandas, tqdm, exit engines, strategy stack), yaml and the
+# optuna helpers are imported where they are used so that importing this module
+# stays cheap for optimizer workers and short CLI commands.
+if TYPE_CHECKING:
+    from core.backtest.engine import BacktestEngine
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +44,8 @@ class GenesisPipeline:
         default_path = self.config_dir / "backtest_defaults.yaml"
         if default_path.exists():
             try:
+                import yaml
+
                 with open(default_path) as f:
                     return yaml.safe_load(f) or {}
             except Exception as e:
@@ -55,6 +60,8 @@ class GenesisPipeline:
             except ValueError:
                 seed = 42
 
+        from core.utils.optuna_helpers import set_global_seeds
+
         os.environ["GENESIS_RANDOM_SEED"] = str(seed)
         set_global_seeds(seed)
 
@@ -112,6 +119,8 @@ class GenesisPipeline:
         slippage = slippage if slippage is not None else self.defaults.get("slippage", 0.0005)
         warmup_bars = warmup_bars if warmup_bars is not None else self.defaults.get("warmup", 120)
 
+        from core.backtest.engine import BacktestEngine
+
         use_fast_window = os.environ.get("GENESIS_FAST_WINDOW") == "1"
 
         engine = BacktestEngine(
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import bisect
+
 from core.research_ledger.enums import LedgerEntityType
 from core.research_ledger.models import (
+    ArtifactRecord,
     ChampionRecord,
     ExperimentRecord,
+    GovernanceDecisionRecord,
     HypothesisRecord,
     JsonObject,
+    ProposalRecord,
 )
 
 
@@ -106,3 +111,178 @@ def build_champion_index(champions: list[ChampionRecord]) -> JsonObject:
         "entity_type": "champion",
         "items": items,
     }
+
+
+# --- Incremental maintenance -------------------------------------------------
+#
+# The catalog index holds a body-free summary of every record (status, date,
+# strategy family and the link fields used for lineage) plus secondary indexes.
+# Appends are delta-applied to the in-memory payloads below; a full rebuild via
+# the ``build_*`` functions above is only needed for compaction/recovery.
+
+_CATALOG_LINK_FIELDS = (
+    "hypothesis_id",
+    "proposal_id",
+    "experiment_id",
+    "subject_type",
+    "subject_id",
+    "subject_experiment_id",
+    "governance_decision_id",
+    "promotion_record_id",
+    "symbol",
+    "timeframe",
+)
+
+
+def catalog_entry(record) -> JsonObject:
+    entry: JsonObject = {"created_at": record.created_at}
+    status = getattr(record, "status", None)
+    if status is not None:
+        entry["status"] = str(status)
+    strategy_family = (record.metadata or {}).get("strategy_family")
+    if strategy_family is not None:
+        entry["strategy_family"] = str(strategy_family)
+    for field_name in _CATALOG_LINK_FIELDS:
+        value = getattr(record, field_name, None)
+        if value is not None:
+            entry[field_name] = str(value)
+    return entry
+
+
+def _insort_unique(values: list[str], value: str) -> None:
+    position = bisect.bisect_left(values, value)
+    if position == len(values) or values[position] != value:
+        values.insert(position, value)
+
+
+def _add_to_catalog(catalog: JsonObject, record) -> None:
+    entity_type = str(record.entity_type)
+    entry = catalog_entry(record)
+    catalog["items"].setdefault(entity_type, {})[record.entity_id] = entry
+    catalog["record_counts"][entity_type] = len(catalog["items"][entity_type])
+    if "strategy_family" in entry:
+        family_ids = catalog["by_strategy_family"].setdefault(entry["strategy_family"], [])
+        _insort_unique(family_ids, record.entity_id)
+    if "status" in entry:
+        by_status = catalog["by_status"].setdefault(entity_type, {})
+        _insort_unique(by_status.setdefault(entry["status"], []), record.entity_id)
+    _insort_unique(catalog["by_date"].setdefault(entry["created_at"][:10], []), record.entity_id)
+
+
+def build_catalog_index(records: list) -> JsonObject:
+    catalog: JsonObject = {
+        "schema_version": "research_ledger.v1",
+        "entity_type": "catalog",
+        "record_counts": {str(entity_type): 0 for entity_type in LedgerEntityType},
+        "items": {},
+        "by_strategy_family": {},
+        "by_status": {},
+        "by_date": {},
+    }
+    for record in sorted(records, key=lambda item: item.entity_id):
+        _add_to_catalog(catalog, record)
+    return catalog
+
+
+def _find_item(items: list[JsonObject], entity_id: str) -> JsonObject | None:
+    position = bisect.bisect_left(items, entity_id, key=lambda item: item["entity_id"])
+    if position < len(items) and items[position]["entity_id"] == entity_id:
+        return items[position]
+    return None
+
+
+def _linked_ids(catalog: JsonObject, entity_type: LedgerEntityType, **match: str) -> list[str]:
+    entries = catalog["items"].get(str(entity_type), {})
+    return sorted(
+        entity_id
+        for entity_id, entry in entries.items()
+        if all(entry.get(field_name) == value for field_name, value in match.items())
+    )
+
+
+def apply_records_to_indexes(indexes: dict[str, JsonObject], records: list) -> set[str]:
+    """Delta-apply appended ``records`` to ``indexes`` in place.
+
+    ``indexes`` maps index names (``hypothesis``, ``experiment``, ``champion``,
+    ``catalog``) to payloads shaped like the ``build_*`` output. Returns the names
+    of the indexes that changed. The result matches a full rebuild over the same
+    records.
+    """
+    catalog = indexes["catalog"]
+    for record in records:
+        _add_to_catalog(catalog, record)
+    touched = {"catalog"}
+
+    for record in records:
+        if isinstance(record, HypothesisRecord):
+            items = indexes["hypothesis"]["items"]
+            item = {
+                "entity_id": record.entity_id,
+                "created_at": record.created_at,
+                "status": str(record.status),
+                "title": record.title,
+                "proposal_ids": _linked_ids(
+                    catalog, LedgerEntityType.PROPOSAL, hypothesis_id=record.entity_id
+                ),
+                "experiment_ids": _linked_ids(
+                    catalog, LedgerEntityType.EXPERIMENT, hypothesis_id=record.entity_id
+                ),
+            }
+            bisect.insort(items, item, key=lambda entry: entry["entity_id"])
+            touched.add("hypothesis")
+        elif isinstance(record, ProposalRecord):
+            parent = _find_item(indexes["hypothesis"]["items"], record.hypothesis_id)
+            if parent is not None:
+                _insort_unique(parent["proposal_ids"], record.entity_id)
+                touched.add("hypothesis")
+        elif isinstance(record, ExperimentRecord):
+            parent = _find_item(indexes["hypothesis"]["items"], record.hypothesis_id)
+            if parent is not None:
+                _insort_unique(parent["experiment_ids"], record.entity_id)
+                touched.add("hypothesis")
+            item = {
+                "entity_id": record.entity_id,
+                "created_at": record.created_at,
+                "status": str(record.status),
+                "hypothesis_id": record.hypothesis_id,
+                "proposal_id": record.proposal_id,
+                "artifact_ids": _linked_ids(
+                    catalog, LedgerEntityType.ARTIFACT, experiment_id=record.entity_id
+                ),
+                "governance_ids": _linked_ids(
+                    catalog,
+                    LedgerEntityType.GOVERNANCE_DECISION,
+                    subject_type=str(LedgerEntityType.EXPERIMENT),
+                    subject_id=record.entity_id,
+                ),
+            }
+            bisect.insort(indexes["experiment"]["items"], item, key=lambda e: e["entity_id"])
+            touched.add("experiment")
+        elif isinstance(record, ArtifactRecord):
+            parent = _find_item(indexes["experiment"]["items"], record.experiment_id or "")
+            if parent is not None:
+                _insort_unique(parent["artifact_ids"], record.entity_id)
+                touched.add("experiment")
+        elif isinstance(record, GovernanceDecisionRecord):
+            if record.subject_type == LedgerEntityType.EXPERIMENT:
+                parent = _find_item(indexes["experiment"]["items"], record.subject_id)
+                if parent is not None:
+                    _insort_unique(parent["governance_ids"], record.entity_id)
+                    touched.add("experiment")
+        elif isinstance(record, ChampionRecord):
+            item = {
+                "entity_id": record.entity_id,
+                "created_at": record.created_at,
+                "symbol": record.symbol,
+                "timeframe": record.timeframe,
+                "status": str(record.status),
+                "promotion_record_id": record.promotion_record_id,
+                "predecessor_champion_id": record.predecessor_champion_id,
+            }
+            bisect.insort(
+                indexes["champion"]["items"],
+                item,
+                key=lambda entry: (entry["symbol"], entry["timeframe"], entry["entity_id"]),
+            )
+            touched.add("champion")
+    return touched
@@ -1,14 +1,111 @@
 from __future__ import annotations
 
 from core.research_ledger.enums import ChampionStatus, ExperimentStatus, LedgerEntityType
+from core.research_ledger.indexes import catalog_entry
 from core.research_ledger.models import ChampionRecord, ExperimentRecord, JsonObject, record_to_dict
 from core.research_ledger.storage import LedgerStorage
 
 
 class LedgerQueries:
+    """Read-side queries over the ledger.
+
+    Queries are answered from the catalog index (see ``indexes.build_catalog_index``)
+    and only the matching record bodies are read. When the catalog is missing or its
+    record counts do not match the stored records, they fall back to a full scan.
+    """
+
     def __init__(self, storage: LedgerStorage) -> None:
         self.storage = storage
 
+    def _catalog(self) -> JsonObject | None:
+        if not self.storage.index_exists("catalog"):
+            return None
+        try:
+            catalog = self.storage.read_index("catalog")
+        except (OSError, ValueError):
+            return None
+        record_counts = catalog.get("record_counts") or {}
+        for entity_type in LedgerEntityType:
+            if int(record_counts.get(str(entity_type), -1)) != self.storage.count_records(
+                entity_type
+            ):
+                return None
+        return catalog
+
+    @staticmethod
+    def _entries(catalog: JsonObject, entity_type: LedgerEntityType) -> dict[str, JsonObject]:
+        return catalog["items"].get(str(entity_type), {})
+
+    def _read_many(self, entity_type: LedgerEntityType, entity_ids) -> list:
+        return [self.storage.read_record(entity_type, entity_id) for entity_id in entity_ids]
+
+    def find_ids(
+        self,
+        entity_type: LedgerEntityType | None = None,
+        *,
+        strategy_family: str | None = None,
+        status: str | None = None,
+        created_from: str | None = None,
+        created_to: str | None = None,
+    ) -> list[str]:
+        """Entity IDs matching the filters, answered from the secondary indexes.
+
+        ``created_from``/``created_to`` are inclusive ``YYYY-MM-DD`` day bounds.
+        Falls back to a full scan when the catalog is unavailable.
+        """
+        catalog = self._catalog()
+        if catalog is None:
+            types = [entity_type] if entity_type is not None else list(LedgerEntityType)
+            matches: list[str] = []
+            for current_type in types:
+                for record in self.storage.list_records(current_type):
+                    entry = catalog_entry(record)
+                    if strategy_family is not None:
+                        if entry.get("strategy_family") != strategy_family:
+                            continue
+                    if status is not None and entry.get("status") != str(status):
+                        continue
+                    day = entry["created_at"][:10]
+                    if created_from is not None and day < created_from:
+                        continue
+                    if created_to is not None and day > created_to:
+                        continue
+                    matches.append(record.entity_id)
+            return sorted(matches)
+
+        candidates: set[str] | None = None
+
+        def _narrow(ids) -> None:
+            nonlocal candidates
+            candidates = set(ids) if candidates is None else candidates & set(ids)
+
+        if entity_type is not None:
+            _narrow(self._entries(catalog, entity_type))
+        if strategy_family is not None:
+            _narrow(catalog["by_strategy_family"].get(strategy_family, []))
+        if status is not None:
+            types = [entity_type] if entity_type is not None else list(LedgerEntityType)
+            _narrow(
+                entity_id
+                for current_type in types
+                for entity_id in catalog["by_status"]
+                .get(str(current_type), {})
+                .get(str(status), [])
+            )
+        if created_from is not None or created_to is not None:
+            _narrow(
+                entity_id
+                for day, ids in catalog["by_date"].items()
+                if (created_from is None or day >= created_from)
+                and (created_to is None or day <= created_to)
+                for entity_id in ids
+            )
+        if candidates is None:
+            candidates = {
+                entity_id for entries in catalog["items"].values() for entity_id in entries
+            }
+        return sorted(candidates)
+
     def list_experiments(
         self,
         *,
@@ -16,6 +113,27 @@ class LedgerQueries:
         proposal_id: str | None = None,
         status: ExperimentStatus | None = None,
     ) -> list[ExperimentRecord]:
+        catalog = self._catalog()
+        if catalog is not None:
+            entries = self._entries(catalog, LedgerEntityType.EXPERIMENT)
+            if status is not None:
+                candidate_ids = (
+                    catalog["by_status"].get(str(LedgerEntityType.EXPERIMENT), {}).get(str(status))
+                    or []
+                )
+            else:
+                candidate_ids = sorted(entries)
+            selected = [
+                entity_id
+                for entity_id in candidate_ids
+                if (
+                    hypothesis_id is None
+                    or entries[entity_id].get("hypothesis_id") == hypothesis_id
+                )
+                and (proposal_id is None or entries[entity_id].get("proposal_id") == proposal_id)
+            ]
+            return self._read_many(LedgerEntityType.EXPERIMENT, selected)
+
         experiments = self.storage.list_records(LedgerEntityType.EXPERIMENT)
         filtered: list[ExperimentRecord] = []
         for experiment in experiments:
@@ -35,6 +153,22 @@ class LedgerQueries:
         timeframe: str | None = None,
         status: ChampionStatus | None = None,
     ) -> list[ChampionRecord]:
+        catalog = self._catalog()
+        if catalog is not None:
+            entries = self._entries(catalog, LedgerEntityType.CHAMPION_RECORD)
+            selected = sorted(
+                (
+                    (entry.get("symbol", ""), entry.get("timeframe", ""), entity_id)
+                    for entity_id, entry in entries.items()
+                    if (symbol is None or entry.get("symbol") == symbol)
+                    and (timeframe is None or entry.get("timeframe") == timeframe)
+                    and (status is None or entry.get("status") == str(status))
+                )
+            )
+            return self._read_many(
+                LedgerEntityType.CHAMPION_RECORD, [entity_id for _, _, entity_id in selected]
+            )
+
         champions = self.storage.list_records(LedgerEntityType.CHAMPION_RECORD)
         filtered: list[ChampionRecord] = []
         for champion in champions:
@@ -47,7 +181,56 @@ class LedgerQueries:
             filtered.append(champion)
         return sorted(filtered, key=lambda item: (item.symbol, item.timeframe, item.entity_id))
 
+    def _lineage_from_catalog(self, catalog: JsonObject, hypothesis_id: str) -> JsonObject:
+        def _select(entity_type: LedgerEntityType, predicate) -> list[str]:
+            entries = self._entries(catalog, entity_type)
+            return sorted(entity_id for entity_id, entry in entries.items() if predicate(entry))
+
+        hypothesis = self.storage.read_record(LedgerEntityType.HYPOTHESIS, hypothesis_id)
+        proposal_ids = _select(
+            LedgerEntityType.PROPOSAL, lambda e: e.get("hypothesis_id") == hypothesis_id
+        )
+        experiment_ids = _select(
+            LedgerEntityType.EXPERIMENT, lambda e: e.get("hypothesis_id") == hypothesis_id
+        )
+        experiment_set = set(experiment_ids)
+        artifact_ids = _select(
+            LedgerEntityType.ARTIFACT, lambda e: e.get("experiment_id") in experiment_set
+        )
+        governance_ids = _select(
+            LedgerEntityType.GOVERNANCE_DECISION,
+            lambda e: e.get("subject_id") in experiment_set or e.get("subject_id") == hypothesis_id,
+        )
+        governance_set = set(governance_ids)
+        promotion_ids = _select(
+            LedgerEntityType.PROMOTION_RECORD,
+            lambda e: e.get("subject_experiment_id") in experiment_set
+            or e.get("governance_decision_id") in governance_set,
+        )
+        promotion_set = set(promotion_ids)
+        champion_ids = _select(
+            LedgerEntityType.CHAMPION_RECORD,
+            lambda e: e.get("promotion_record_id") in promotion_set,
+        )
+
+        def _dicts(entity_type: LedgerEntityType, ids: list[str]) -> list[JsonObject]:
+            return [record_to_dict(record) for record in self._read_many(entity_type, ids)]
+
+        return {
+            "hypothesis": record_to_dict(hypothesis),
+            "proposals": _dicts(LedgerEntityType.PROPOSAL, proposal_ids),
+            "experiments": _dicts(LedgerEntityType.EXPERIMENT, experiment_ids),
+            "artifacts": _dicts(LedgerEntityType.ARTIFACT, artifact_ids),
+            "governance_decisions": _dicts(LedgerEntityType.GOVERNANCE_DECISION, governance_ids),
+            "promotion_records": _dicts(LedgerEntityType.PROMOTION_RECORD, promotion_ids),
+            "champion_records": _dicts(LedgerEntityType.CHAMPION_RECORD, champion_ids),
+        }
+
     def get_hypothesis_lineage(self, hypothesis_id: str) -> JsonObject:
+        catalog = self._catalog()
+        if catalog is not None:
+            return self._lineage_from_catalog(catalog, hypothesis_id)
+
         hypotheses = self.storage.list_records(LedgerEntityType.HYPOTHESIS)
         proposals = self.storage.list_records(LedgerEntityType.PROPOSAL)
         experiments = self.storage.list_records(LedgerEntityType.EXPERIMENT)
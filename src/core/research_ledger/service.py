@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import replace
 
 from core.research_ledger.enums import LedgerEntityType
 from core.research_ledger.indexes import (
+    apply_records_to_indexes,
+    build_catalog_index,
     build_champion_index,
     build_experiment_index,
     build_hypothesis_index,
@@ -14,6 +17,7 @@ from core.research_ledger.models import (
     ExperimentRecord,
     GovernanceDecisionRecord,
     HypothesisRecord,
+    JsonObject,
     LedgerRecordT,
     PromotionRecord,
     ProposalRecord,
@@ -30,26 +34,54 @@ from core.strategy.family_registry import (
     validate_strategy_family_name,
 )
 
+# Appended records are delta-applied to the indexes; every N appends (or whenever the
+# on-disk indexes do not match the stored records) they are rebuilt from scratch.
+INDEX_COMPACTION_INTERVAL = 256
+_INDEX_NAMES = ("hypothesis", "experiment", "champion", "catalog")
+
 
 class ResearchLedgerService:
     def __init__(self, storage: LedgerStorage | None = None) -> None:
         self.storage = storage or LedgerStorage()
         self.queries = LedgerQueries(self.storage)
+        self._indexes: dict[str, JsonObject] | None = None
+        self._indexes_signature: tuple[int, int, int] | None = None
+        self._appends_since_compaction = 0
 
     def allocate_id(self, entity_type: LedgerEntityType, *, year: int) -> str:
         return self.storage.next_entity_id(entity_type, year)
 
-    def _validate_experiment_semantics(self, record: ExperimentRecord) -> None:
-        if not self.storage.exists(LedgerEntityType.HYPOTHESIS, record.hypothesis_id):
+    def allocate_ids(self, entity_type: LedgerEntityType, *, year: int, count: int) -> list[str]:
+        """Reserve ``count`` consecutive IDs with a single directory scan."""
+        return self.storage.reserve_entity_ids(entity_type, year, count)
+
+    def _exists(
+        self,
+        entity_type: LedgerEntityType,
+        entity_id: str,
+        pending: dict[tuple[LedgerEntityType, str], LedgerRecordT] | None = None,
+    ) -> bool:
+        if pending and (entity_type, entity_id) in pending:
+            return True
+        return self.storage.exists(entity_type, entity_id)
+
+    def _validate_experiment_semantics(
+        self,
+        record: ExperimentRecord,
+        pending: dict[tuple[LedgerEntityType, str], LedgerRecordT] | None = None,
+    ) -> None:
+        if not self._exists(LedgerEntityType.HYPOTHESIS, record.hypothesis_id, pending):
             raise LedgerValidationError(
                 f"Experiment {record.entity_id} references missing hypothesis {record.hypothesis_id}"
             )
-        if not self.storage.exists(LedgerEntityType.PROPOSAL, record.proposal_id):
+        if not self._exists(LedgerEntityType.PROPOSAL, record.proposal_id, pending):
             raise LedgerValidationError(
                 f"Experiment {record.entity_id} references missing proposal {record.proposal_id}"
             )
 
-        proposal = self.storage.read_record(LedgerEntityType.PROPOSAL, record.proposal_id)
+        proposal = (pending or {}).get((LedgerEntityType.PROPOSAL, record.proposal_id))
+        if proposal is None:
+            proposal = self.storage.read_record(LedgerEntityType.PROPOSAL, record.proposal_id)
         if not isinstance(proposal, ProposalRecord):
             raise LedgerValidationError(
                 f"Proposal lookup returned unexpected record for {record.proposal_id}"
@@ -62,7 +94,7 @@ class ResearchLedgerService:
         for link in record.artifact_links:
             if link.artifact_id is None:
                 continue
-            if not self.storage.exists(LedgerEntityType.ARTIFACT, link.artifact_id):
+            if not self._exists(LedgerEntityType.ARTIFACT, link.artifact_id, pending):
                 raise LedgerValidationError(
                     f"Experiment {record.entity_id} references missing artifact {link.artifact_id}"
                 )
@@ -74,16 +106,40 @@ class ResearchLedgerService:
         if isinstance(record, ExperimentRecord):
             self._validate_experiment_semantics(record)
         self.storage.write_record(record)
-        self.refresh_indexes()
+        self._update_indexes([record])
         return record
 
-    def append_record_with_strategy_family(
+    def append_records(self, records: list[LedgerRecordT]) -> list[LedgerRecordT]:
+        """Append a batch of records as one unit.
+
+        Every record is validated (including references to other records in the same
+        batch) before anything is written; the batch is then written with a single
+        fsync group and the indexes are updated once.
+        """
+        records = list(records)
+        if not records:
+            return []
+        pending: dict[tuple[LedgerEntityType, str], LedgerRecordT] = {}
+        for record in records:
+            validate_record(record)
+            key = (record.entity_type, record.entity_id)
+            if key in pending or self.storage.exists(record.entity_type, record.entity_id):
+                raise FileExistsError(f"Ledger record already exists: {record.entity_id}")
+            pending[key] = record
+        for record in records:
+            if isinstance(record, ExperimentRecord):
+                self._validate_experiment_semantics(record, pending)
+        self.storage.write_records(records)
+        self._update_indexes(records)
+        return records
+
+    def _tag_strategy_family(
         self,
         record: LedgerRecordT,
         *,
-        config: dict | None = None,
-        strategy_family: str | None = None,
-        strategy_family_source: str = STRATEGY_FAMILY_SOURCE,
+        config: dict | None,
+        strategy_family: str | None,
+        strategy_family_source: str,
     ) -> LedgerRecordT:
         explicit_family = (
             validate_strategy_family_name(strategy_family) if strategy_family is not None else None
@@ -102,8 +158,44 @@ class ResearchLedgerService:
         tagged_metadata = dict(record.metadata)
         tagged_metadata["strategy_family"] = resolved_family
         tagged_metadata["strategy_family_source"] = strategy_family_source
-        tagged_record = replace(record, metadata=tagged_metadata)
-        return self.append_record(tagged_record)
+        return replace(record, metadata=tagged_metadata)
+
+    def append_record_with_strategy_family(
+        self,
+        record: LedgerRecordT,
+        *,
+        config: dict | None = None,
+        strategy_family: str | None = None,
+        strategy_family_source: str = STRATEGY_FAMILY_SOURCE,
+    ) -> LedgerRecordT:
+        return self.append_record(
+            self._tag_strategy_family(
+                record,
+                config=config,
+                strategy_family=strategy_family,
+                strategy_family_source=strategy_family_source,
+            )
+        )
+
+    def append_records_with_strategy_family(
+        self,
+        records: list[LedgerRecordT],
+        *,
+        config: dict | None = None,
+        strategy_family: str | None = None,
+        strategy_family_source: str = STRATEGY_FAMILY_SOURCE,
+    ) -> list[LedgerRecordT]:
+        return self.append_records(
+            [
+                self._tag_strategy_family(
+                    record,
+                    config=config,
+                    strategy_family=strategy_family,
+                    strategy_family_source=strategy_family_source,
+                )
+                for record in records
+            ]
+        )
 
     def append_hypothesis(self, record: HypothesisRecord) -> HypothesisRecord:
         return self.append_record(record)
@@ -128,12 +220,66 @@ class ResearchLedgerService:
     def append_champion_record(self, record: ChampionRecord) -> ChampionRecord:
         return self.append_record(record)
 
+    def _catalog_signature(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.storage.paths.index_path("catalog").stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _remember_indexes(self, indexes: dict[str, JsonObject]) -> None:
+        self._indexes = indexes
+        self._indexes_signature = self._catalog_signature()
+
+    def _load_indexes(self, appended: list[LedgerRecordT]) -> dict[str, JsonObject] | None:
+        """Index payloads as of before ``appended``; ``None`` when a rebuild is needed.
+
+        The in-memory copy is reused while the catalog file is the one this service
+        last wrote. Otherwise the indexes are re-read and checked against the record
+        counts on disk (directory listings only), so writes from another process or
+        a missing/corrupt index fall back to a full rebuild.
+        """
+        signature = self._catalog_signature()
+        if signature is None:
+            return None
+        if self._indexes is not None and signature == self._indexes_signature:
+            return self._indexes
+        try:
+            indexes = {name: self.storage.read_index(name) for name in _INDEX_NAMES}
+        except (OSError, ValueError):
+            return None
+        record_counts = indexes["catalog"].get("record_counts") or {}
+        pending = Counter(str(record.entity_type) for record in appended)
+        for entity_type in LedgerEntityType:
+            expected = int(record_counts.get(str(entity_type), -1)) + pending[str(entity_type)]
+            if self.storage.count_records(entity_type) != expected:
+                return None
+        return indexes
+
+    def _update_indexes(self, records: list[LedgerRecordT]) -> None:
+        self._appends_since_compaction += len(records)
+        indexes = self._load_indexes(records)
+        if indexes is None or self._appends_since_compaction >= INDEX_COMPACTION_INTERVAL:
+            self.refresh_indexes()
+            return
+        try:
+            touched = apply_records_to_indexes(indexes, records)
+            self.storage.write_indexes(
+                {name: indexes[name] for name in _INDEX_NAMES if name in touched}
+            )
+        except BaseException:
+            self._indexes = None
+            raise
+        self._remember_indexes(indexes)
+
     def refresh_indexes(self) -> dict[str, dict]:
+        """Rebuild every index from the stored records (compaction/recovery)."""
         hypotheses = self.storage.list_records(LedgerEntityType.HYPOTHESIS)
         proposals = self.storage.list_records(LedgerEntityType.PROPOSAL)
         experiments = self.storage.list_records(LedgerEntityType.EXPERIMENT)
         artifacts = self.storage.list_records(LedgerEntityType.ARTIFACT)
         governance = self.storage.list_records(LedgerEntityType.GOVERNANCE_DECISION)
+        promotions = self.storage.list_records(LedgerEntityType.PROMOTION_RECORD)
         champions = self.storage.list_records(LedgerEntityType.CHAMPION_RECORD)
 
         hypothesis_index = build_hypothesis_index(
@@ -147,12 +293,30 @@ class ResearchLedgerService:
             governance_records=governance,
         )
         champion_index = build_champion_index(champions)
+        catalog_index = build_catalog_index(
+            [
+                *hypotheses,
+                *proposals,
+                *experiments,
+                *artifacts,
+                *governance,
+                *promotions,
+                *champions,
+            ]
+        )
 
-        self.storage.write_index("hypothesis", hypothesis_index)
-        self.storage.write_index("experiment", experiment_index)
-        self.storage.write_index("champion", champion_index)
+        indexes = {
+            "hypothesis": hypothesis_index,
+            "experiment": experiment_index,
+            "champion": champion_index,
+            "catalog": catalog_index,
+        }
+        self.storage.write_indexes(indexes)
+        self._remember_indexes(indexes)
+        self._appends_since_compaction = 0
         return {
             "hypothesis_index": hypothesis_index,
             "experiment_index": experiment_index,
             "champion_index": champion_index,
+            "catalog_index": catalog_index,
         }
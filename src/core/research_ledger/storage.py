@@ -22,6 +22,7 @@ _INDEX_FILES = {
     "hypothesis": "hypothesis_index.json",
     "experiment": "experiment_index.json",
     "champion": "champion_index.json",
+    "catalog": "catalog_index.json",
 }
 
 
@@ -53,6 +54,38 @@ def atomic_write_text(path: Path, text: str) -> None:
         pass
 
 
+def atomic_write_texts(items: list[tuple[Path, str]]) -> None:
+    """Atomically write several files with a single fsync group.
+
+    All temp files are written and fsync'd before any of them is renamed into place,
+    and each parent directory is fsync'd once at the end. If writing a temp file fails,
+    nothing becomes visible.
+    """
+    staged: list[tuple[Path, Path]] = []
+    try:
+        for path, text in items:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + f".tmp.{os.getpid()}")
+            staged.append((tmp_path, path))
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                handle.write(text)
+                handle.flush()
+                os.fsync(handle.fileno())
+    except BaseException:
+        for tmp_path, _ in staged:
+            tmp_path.unlink(missing_ok=True)
+        raise
+    for tmp_path, path in staged:
+        os.replace(tmp_path, path)
+    for directory in sorted({path.parent for _, path in staged}):
+        try:
+            dir_fd = os.open(directory, os.O_DIRECTORY)
+            os.fsync(dir_fd)
+            os.close(dir_fd)
+        except Exception:  # nosec B110 - best effort on platforms without O_DIRECTORY
+            pass
+
+
 class LedgerPaths:
     def __init__(self, root: Path | None = None) -> None:
         repo_root = _resolve_repo_root()
@@ -89,6 +122,17 @@ class LedgerStorage:
         atomic_write_text(path, json_dumps_stable(payload))
         return path
 
+    def write_records(self, records: list[LedgerRecordT]) -> list[Path]:
+        items = [
+            (
+                self.paths.record_path(record.entity_type, record.entity_id),
+                json_dumps_stable(record_to_dict(record)),
+            )
+            for record in records
+        ]
+        atomic_write_texts(items)
+        return [path for path, _ in items]
+
     def read_record(self, entity_type: LedgerEntityType, entity_id: str) -> LedgerRecordT:
         path = self.paths.record_path(entity_type, entity_id)
         data = json.loads(path.read_text(encoding="utf-8"))
@@ -111,6 +155,17 @@ class LedgerStorage:
         atomic_write_text(path, json_dumps_stable(payload))
         return path
 
+    def write_indexes(self, payloads: dict[str, JsonObject]) -> list[Path]:
+        items = [
+            (self.paths.index_path(index_name), json_dumps_stable(payload))
+            for index_name, payload in payloads.items()
+        ]
+        atomic_write_texts(items)
+        return [path for path, _ in items]
+
+    def index_exists(self, index_name: str) -> bool:
+        return self.paths.index_path(index_name).exists()
+
     def read_index(self, index_name: str) -> JsonObject:
         path = self.paths.index_path(index_name)
         data = json.loads(path.read_text(encoding="utf-8"))
@@ -118,7 +173,17 @@ class LedgerStorage:
             raise ValueError(f"Ledger index must be a JSON object: {path}")
         return data
 
+    def count_records(self, entity_type: LedgerEntityType) -> int:
+        """Number of stored records of ``entity_type`` (directory listing only)."""
+        return sum(1 for _ in self.paths.entity_dir(entity_type).glob("*.json"))
+
     def next_entity_id(self, entity_type: LedgerEntityType, year: int) -> str:
+        return self.reserve_entity_ids(entity_type, year, 1)[0]
+
+    def reserve_entity_ids(self, entity_type: LedgerEntityType, year: int, count: int) -> list[str]:
+        """Return ``count`` consecutive unused IDs after the highest existing one (one scan)."""
+        if count < 0:
+            raise ValueError("count must be >= 0")
         prefix = {
             LedgerEntityType.HYPOTHESIS: "HYP",
             LedgerEntityType.PROPOSAL: "PROP",
@@ -135,4 +200,4 @@ class LedgerStorage:
             if match is None:
                 continue
             max_value = max(max_value, int(match.group(1)))
-        return f"{prefix}-{year}-{max_value + 1:04d}"
+        return [f"{prefix}-{year}-{max_value + offset:04d}" for offset in range(1, count + 1)]
@@ -22,6 +22,7 @@ from core.research_orchestrator.family_decisions import (
     family_status_records_to_dict,
 )
 from core.research_orchestrator.models import (
+    AnalyzedResearchTask,
     ResearchResult,
     ResearchStageOutputs,
     ResearchTask,
@@ -29,10 +30,13 @@ from core.research_orchestrator.models import (
 from core.research_orchestrator.orchestrator import DeterministicResearchOrchestrator
 from core.research_orchestrator.workflow import (
     ResearchOrchestrationError,
+    analyze_research_task,
     orchestrate_research_task,
+    persist_research_task,
 )
 
 __all__ = [
+    "AnalyzedResearchTask",
     "DeterministicResearchOrchestrator",
     "MINIMUM_TRADE_THRESHOLD",
     "PROMOTION_MARGIN_PF",
@@ -52,10 +56,12 @@ __all__ = [
     "ResearchStageOutputs",
     "ResearchTask",
     "analyze_parameter_batches_by_family",
+    "analyze_research_task",
     "build_family_status_records",
     "evaluate_family_promotion",
     "family_status_records_to_dict",
     "orchestrate_research_task",
+    "persist_research_task",
     "require_explicit_cross_family_override",
     "run_family_research_tasks",
 ]
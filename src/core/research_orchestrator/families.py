@@ -73,13 +73,33 @@ class FamilyParameterBatch:
 def run_family_research_tasks(
     orchestrator: DeterministicResearchOrchestrator,
     tasks: tuple[FamilyResearchTask, ...],
+    *,
+    max_workers: int | None = 1,
 ) -> dict[StrategyFamily, tuple[ResearchResult, ...]]:
-    grouped: dict[StrategyFamily, list[ResearchResult]] = {}
+    """Run family tasks (across all families) and group the results per family.
+
+    ``max_workers`` is forwarded to ``DeterministicResearchOrchestrator.run_many``;
+    grouping and ledger writes follow task order, so the output does not depend on it.
+    """
+
+    research_tasks: list[ResearchTask] = []
+    conversion_error: Exception | None = None
     for family_task in tasks:
-        grouped.setdefault(family_task.strategy_family, []).append(
-            orchestrator.run(family_task.to_research_task())
-        )
-    return {family: tuple(results) for family, results in grouped.items()}
+        try:
+            research_tasks.append(family_task.to_research_task())
+        except Exception as exc:
+            # Tasks before an invalid one still run, exactly as in a sequential loop.
+            conversion_error = exc
+            break
+
+    results = orchestrator.run_many(research_tasks, max_workers=max_workers)
+    if conversion_error is not None:
+        raise conversion_error
+
+    grouped: dict[StrategyFamily, list[ResearchResult]] = {}
+    for family_task, result in zip(tasks, results, strict=True):
+        grouped.setdefault(family_task.strategy_family, []).append(result)
+    return {family: tuple(family_results) for family, family_results in grouped.items()}
 
 
 def _sorted_unique_ids(values: tuple[str, ...] | list[str]) -> list[str]:
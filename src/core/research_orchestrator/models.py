@@ -17,6 +17,18 @@ class ResearchTask:
     approved_parameter_sets: tuple[ApprovedParameterSet, ...]
 
 
+@dataclass(frozen=True, slots=True)
+class AnalyzedResearchTask:
+    """Outputs of the side-effect free stages (collect → parameter analysis)."""
+
+    task: ResearchTask
+    collected_events: CollectionResult
+    normalized_events: NormalizationResult
+    feature_sets: FeatureExtractionResult
+    evaluations: EvaluationResult
+    parameter_recommendations: ParameterAnalysisResult
+
+
 @dataclass(frozen=True, slots=True)
 class ResearchStageOutputs:
     collected_events: CollectionResult
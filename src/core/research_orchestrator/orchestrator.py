@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 
 from core.intelligence.collection.interface import IntelligenceCollector
@@ -8,8 +10,34 @@ from core.intelligence.features.interface import IntelligenceFeatureExtractor
 from core.intelligence.ledger_adapter.interface import IntelligenceLedgerAdapter
 from core.intelligence.normalization.interface import IntelligenceNormalizer
 from core.intelligence.parameter.interface import ParameterIntelligenceAnalyzer
-from core.research_orchestrator.models import ResearchResult, ResearchTask
-from core.research_orchestrator.workflow import orchestrate_research_task
+from core.research_orchestrator.models import AnalyzedResearchTask, ResearchResult, ResearchTask
+from core.research_orchestrator.workflow import (
+    analyze_research_task,
+    orchestrate_research_task,
+    persist_research_task,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _AnalysisStages:
+    """Picklable bundle of the side-effect free components shipped to pool workers."""
+
+    collector: IntelligenceCollector
+    normalizer: IntelligenceNormalizer
+    feature_extractor: IntelligenceFeatureExtractor
+    evaluator: IntelligenceEvaluator
+    parameter_analyzer: ParameterIntelligenceAnalyzer
+
+
+def _analyze_in_worker(stages: _AnalysisStages, task: ResearchTask) -> AnalyzedResearchTask:
+    return analyze_research_task(
+        task,
+        collector=stages.collector,
+        normalizer=stages.normalizer,
+        feature_extractor=stages.feature_extractor,
+        evaluator=stages.evaluator,
+        parameter_analyzer=stages.parameter_analyzer,
+    )
 
 
 @dataclass(frozen=True, slots=True)
@@ -31,3 +59,45 @@ class DeterministicResearchOrchestrator:
             parameter_analyzer=self.parameter_analyzer,
             ledger_adapter=self.ledger_adapter,
         )
+
+    def run_many(
+        self,
+        tasks: Iterable[ResearchTask],
+        *,
+        max_workers: int | None = 1,
+    ) -> tuple[ResearchResult, ...]:
+        """Run ``tasks`` and return their results in input order.
+
+        With ``max_workers`` > 1 (or ``None`` for one worker per CPU) the analysis
+        stages run concurrently in a process pool, while ledger persistence stays in
+        this process and is applied strictly in task order. Ledger contents, IDs and
+        results are therefore identical to running ``run`` sequentially; if a task
+        fails, earlier tasks are persisted and its error is raised, as sequentially.
+        """
+
+        tasks = tuple(tasks)
+        if (max_workers is not None and max_workers <= 1) or len(tasks) <= 1:
+            return tuple(self.run(task) for task in tasks)
+
+        stages = _AnalysisStages(
+            collector=self.collector,
+            normalizer=self.normalizer,
+            feature_extractor=self.feature_extractor,
+            evaluator=self.evaluator,
+            parameter_analyzer=self.parameter_analyzer,
+        )
+        workers = min(max_workers, len(tasks)) if max_workers is not None else None
+        results: list[ResearchResult] = []
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures: list[Future[AnalyzedResearchTask]] = [
+                executor.submit(_analyze_in_worker, stages, task) for task in tasks
+            ]
+            # Single writer: merge in submission order, persisting as each result lands.
+            for future in futures:
+                results.append(
+                    persist_research_task(future.result(), ledger_adapter=self.ledger_adapter)
+                )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return tuple(results)
@@ -18,7 +18,12 @@ from core.intelligence.parameter.interface import (
     ParameterAnalysisRequest,
     ParameterIntelligenceAnalyzer,
 )
-from core.research_orchestrator.models import ResearchResult, ResearchStageOutputs, ResearchTask
+from core.research_orchestrator.models import (
+    AnalyzedResearchTask,
+    ResearchResult,
+    ResearchStageOutputs,
+    ResearchTask,
+)
 
 
 class ResearchOrchestrationError(ValueError):
@@ -32,7 +37,7 @@ def _validate_task(task: ResearchTask) -> None:
         raise ResearchOrchestrationError("approved_parameter_sets must not be empty")
 
 
-def orchestrate_research_task(
+def analyze_research_task(
     task: ResearchTask,
     *,
     collector: IntelligenceCollector,
@@ -40,9 +45,8 @@ def orchestrate_research_task(
     feature_extractor: IntelligenceFeatureExtractor,
     evaluator: IntelligenceEvaluator,
     parameter_analyzer: ParameterIntelligenceAnalyzer,
-    ledger_adapter: IntelligenceLedgerAdapter,
-) -> ResearchResult:
-    """Run the deterministic research workflow using injected stable components only."""
+) -> AnalyzedResearchTask:
+    """Run the side-effect free stages; safe to execute concurrently across tasks."""
 
     _validate_task(task)
 
@@ -71,17 +75,39 @@ def orchestrate_research_task(
     if not parameter_recommendations:
         raise ResearchOrchestrationError("parameter analysis produced no recommendations")
 
+    return AnalyzedResearchTask(
+        task=task,
+        collected_events=collected_events,
+        normalized_events=normalized_events,
+        feature_sets=feature_sets,
+        evaluations=evaluations,
+        parameter_recommendations=parameter_recommendations,
+    )
+
+
+def persist_research_task(
+    analyzed: AnalyzedResearchTask,
+    *,
+    ledger_adapter: IntelligenceLedgerAdapter,
+) -> ResearchResult:
+    """Persist an analyzed task to the ledger and assemble its result.
+
+    Ledger IDs are allocated here, so callers running analyses concurrently must
+    persist in task order from a single writer to stay identical to a sequential run.
+    """
+
     persistence_result = ledger_adapter.persist_events(
-        LedgerPersistenceRequest(events=normalized_events)
+        LedgerPersistenceRequest(events=analyzed.normalized_events)
     )
     if not persistence_result.persisted_event_ids:
         raise ResearchOrchestrationError("ledger persistence produced no persisted_event_ids")
 
+    parameter_recommendations = analyzed.parameter_recommendations
     stage_outputs = ResearchStageOutputs(
-        collected_events=collected_events,
-        normalized_events=normalized_events,
-        feature_sets=feature_sets,
-        evaluations=evaluations,
+        collected_events=analyzed.collected_events,
+        normalized_events=analyzed.normalized_events,
+        feature_sets=analyzed.feature_sets,
+        evaluations=analyzed.evaluations,
         parameter_recommendations=parameter_recommendations,
         persistence_result=persistence_result,
     )
@@ -91,7 +117,7 @@ def orchestrate_research_task(
         if recommendation.advisory_disposition == "preferred"
     )
     return ResearchResult(
-        task_id=task.task_id,
+        task_id=analyzed.task.task_id,
         stage_outputs=stage_outputs,
         recommended_parameter_set_ids=tuple(
             recommendation.parameter_set_id for recommendation in parameter_recommendations
@@ -99,3 +125,26 @@ def orchestrate_research_task(
         preferred_parameter_set_ids=preferred_parameter_set_ids,
         top_advisory_parameter_set_id=parameter_recommendations[0].parameter_set_id,
     )
+
+
+def orchestrate_research_task(
+    task: ResearchTask,
+    *,
+    collector: IntelligenceCollector,
+    normalizer: IntelligenceNormalizer,
+    feature_extractor: IntelligenceFeatureExtractor,
+    evaluator: IntelligenceEvaluator,
+    parameter_analyzer: ParameterIntelligenceAnalyzer,
+    ledger_adapter: IntelligenceLedgerAdapter,
+) -> ResearchResult:
+    """Run the deterministic research workflow using injected stable components only."""
+
+    analyzed = analyze_research_task(
+        task,
+        collector=collector,
+        normalizer=normalizer,
+        feature_extractor=feature_extractor,
+        evaluator=evaluator,
+        parameter_analyzer=parameter_analyzer,
+    )
+    return persist_research_task(analyzed, ledger_adapter=ledger_adapter)
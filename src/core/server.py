@@ -37,6 +37,7 @@ auth_check = server_account_api.auth_check
 account_wallets = server_account_api.account_wallets
 account_positions = server_account_api.account_positions
 account_orders = server_account_api.account_orders
+account_snapshot = server_account_api.account_snapshot
 account_router = server_account_api.router
 ui_page = server_ui_api.ui_page
 ui_router = server_ui_api.router
@@ -2,7 +2,10 @@
 ATR Filter Component - Filters trades based on volatility (ATR ratio).
 """
 
+import numpy as np
+
 from .base import ComponentResult, StrategyComponent
+from .batch import Columns, ComponentBatchResult, column_length, numeric_column
 
 
 class ATRFilterComponent(StrategyComponent):
@@ -80,3 +83,23 @@ class ATRFilterComponent(StrategyComponent):
                 "atr_ma": atr_ma,
             },
         )
+
+    def evaluate_batch(self, columns: Columns) -> ComponentBatchResult:
+        """Vectorized evaluate() over 'atr' and 'atr_ma' columns."""
+        size = column_length(columns)
+        atr = numeric_column(columns, "atr", size)
+        atr_ma = numeric_column(columns, "atr_ma", size)
+
+        missing = np.isnan(atr) | np.isnan(atr_ma)
+        invalid = ~missing & (atr_ma <= 0)
+        valid = ~missing & ~invalid
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(valid, atr / np.where(valid, atr_ma, 1.0), 0.0)
+        allowed = valid & (ratio >= self.min_ratio)
+
+        reason = np.full(size, None, dtype=object)
+        reason[missing] = "ATR_DATA_MISSING"
+        reason[invalid] = "ATR_MA_INVALID"
+        reason[valid & ~allowed] = "ATR_TOO_LOW"
+        confidence = np.where(valid, np.minimum(ratio / 2.0, 1.0), 0.0)
+        return ComponentBatchResult(allowed=allowed, confidence=confidence, reason=reason)
@@ -3,23 +3,151 @@ Attribution tracker for composable strategy POC.
 
 Tracks component veto counts and confidence distributions to understand
 which components add value.
+
+All statistics are streaming (O(1) memory per component): Welford running
+mean/variance, P² quantile estimators and per-reason veto histograms, so
+long backtests do not accumulate per-bar confidence lists.
 """
 
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
+
+CONFIDENCE_QUANTILES = (0.1, 0.5, 0.9)
+
+
+class P2Quantile:
+    """
+    Streaming quantile estimate using the P² algorithm (Jain & Chlamtac, 1985).
+
+    Keeps five markers regardless of the number of observations. Exact for the
+    first five observations, an estimate afterwards.
+    """
+
+    __slots__ = ("p", "_heights", "_positions", "_desired", "_increments")
+
+    def __init__(self, p: float):
+        if not 0.0 < p < 1.0:
+            raise ValueError(f"Quantile must be in (0, 1), got {p}")
+        self.p = p
+        self._heights: list[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._desired = [1.0, 1.0 + 2.0 * p, 1.0 + 4.0 * p, 3.0 + 2.0 * p, 5.0]
+        self._increments = [0.0, p / 2.0, p, (1.0 + p) / 2.0, 1.0]
+
+    def add(self, value: float) -> None:
+        q = self._heights
+        if len(q) < 5:
+            q.append(value)
+            q.sort()
+            return
+
+        n = self._positions
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = 0
+            while value >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            n[i] += 1.0
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in range(1, 4):
+            d = self._desired[i] - n[i]
+            if (d >= 1.0 and n[i + 1] - n[i] > 1.0) or (d <= -1.0 and n[i - 1] - n[i] < -1.0):
+                step = 1.0 if d > 0 else -1.0
+                candidate = self._parabolic(i, step)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    j = i + int(step)
+                    candidate = q[i] + step * (q[j] - q[i]) / (n[j] - n[i])
+                q[i] = candidate
+                n[i] += step
+
+    def _parabolic(self, i: int, step: float) -> float:
+        q = self._heights
+        n = self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> float:
+        """Current estimate (0.0 before any observation)."""
+        q = self._heights
+        if not q:
+            return 0.0
+        if self._positions[4] <= 5.0:
+            # Exact quantile (linear interpolation) while the sample is tiny.
+            pos = self.p * (len(q) - 1)
+            lo = math.floor(pos)
+            hi = min(lo + 1, len(q) - 1)
+            return q[lo] + (q[hi] - q[lo]) * (pos - lo)
+        return q[2]
 
 
 @dataclass
 class ComponentStats:
-    """Statistics for a single component."""
+    """Streaming statistics for a single component."""
 
     name: str
     total_evaluations: int = 0
     veto_count: int = 0
-    confidences: list[float] | None = None
+    confidence_mean: float = 0.0
+    confidence_m2: float = 0.0
+    confidence_min: float = 0.0
+    confidence_max: float = 0.0
+    quantiles: dict[float, P2Quantile] = field(default_factory=dict)
+    veto_reasons: dict[str, int] = field(default_factory=dict)
 
     def __post_init__(self):
-        if self.confidences is None:
-            self.confidences = []
+        if not self.quantiles:
+            self.quantiles = {p: P2Quantile(p) for p in CONFIDENCE_QUANTILES}
+
+    def add(self, confidence: float, allowed: bool, reason: str | None) -> None:
+        """Update all statistics with one component evaluation."""
+        self.total_evaluations += 1
+        count = self.total_evaluations
+        if count == 1:
+            self.confidence_min = confidence
+            self.confidence_max = confidence
+        else:
+            self.confidence_min = min(self.confidence_min, confidence)
+            self.confidence_max = max(self.confidence_max, confidence)
+        # Welford's online mean/variance.
+        delta = confidence - self.confidence_mean
+        self.confidence_mean += delta / count
+        self.confidence_m2 += delta * (confidence - self.confidence_mean)
+        for estimator in self.quantiles.values():
+            estimator.add(confidence)
+
+        if not allowed:
+            self.veto_count += 1
+            key = reason or "UNSPECIFIED"
+            self.veto_reasons[key] = self.veto_reasons.get(key, 0) + 1
+
+    @property
+    def confidence_std(self) -> float:
+        """Sample standard deviation of the recorded confidences."""
+        if self.total_evaluations < 2:
+            return 0.0
+        return math.sqrt(self.confidence_m2 / (self.total_evaluations - 1))
+
+    def confidence_summary(self) -> dict:
+        summary = {
+            "avg": self.confidence_mean,
+            "min": self.confidence_min,
+            "max": self.confidence_max,
+            "std": self.confidence_std,
+        }
+        for p, estimator in self.quantiles.items():
+            summary[f"p{round(p * 100)}"] = estimator.value()
+        return summary
 
 
 class AttributionTracker:
@@ -57,12 +185,7 @@ class AttributionTracker:
             if component_name not in self.stats:
                 self.stats[component_name] = ComponentStats(name=component_name)
 
-            stats = self.stats[component_name]
-            stats.total_evaluations += 1
-            stats.confidences.append(result.confidence)
-
-            if not result.allowed:
-                stats.veto_count += 1
+            self.stats[component_name].add(result.confidence, result.allowed, result.reason)
 
     def get_report_dict(self) -> dict:
         """
@@ -73,10 +196,6 @@ class AttributionTracker:
         """
         component_stats = {}
         for component_name, stats in self.stats.items():
-            avg_conf = sum(stats.confidences) / len(stats.confidences) if stats.confidences else 0.0
-            min_conf = min(stats.confidences) if stats.confidences else 0.0
-            max_conf = max(stats.confidences) if stats.confidences else 0.0
-
             component_stats[component_name] = {
                 "evaluations": stats.total_evaluations,
                 "vetoes": stats.veto_count,
@@ -85,11 +204,8 @@ class AttributionTracker:
                     if stats.total_evaluations > 0
                     else 0.0
                 ),
-                "confidence": {
-                    "avg": avg_conf,
-                    "min": min_conf,
-                    "max": max_conf,
-                },
+                "confidence": stats.confidence_summary(),
+                "veto_reasons": dict(stats.veto_reasons),
             }
 
         return {
@@ -136,13 +252,14 @@ class AttributionTracker:
             veto_pct = self._pct(stats.veto_count, stats.total_evaluations)
             lines.append(f"  Vetoes: {stats.veto_count} ({veto_pct}%)")
 
-            if stats.confidences:
-                avg_conf = sum(stats.confidences) / len(stats.confidences)
-                min_conf = min(stats.confidences)
-                max_conf = max(stats.confidences)
+            if stats.total_evaluations:
+                conf = stats.confidence_summary()
                 lines.append(
-                    f"  Confidence: avg={avg_conf:.3f}, min={min_conf:.3f}, max={max_conf:.3f}"
+                    f"  Confidence: avg={conf['avg']:.3f}, min={conf['min']:.3f}, "
+                    f"max={conf['max']:.3f}, p50={conf['p50']:.3f}"
                 )
+            for reason, count in sorted(stats.veto_reasons.items()):
+                lines.append(f"    {reason}: {count}")
 
         lines.append("")
         lines.append("=" * 70)
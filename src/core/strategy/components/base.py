@@ -7,6 +7,10 @@ Defines the core interfaces and contracts for component-based strategy evaluatio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+import numpy as np
+
+from .batch import Columns, ComponentBatchResult, column_length, row_context
+
 
 @dataclass(frozen=True)
 class ComponentResult:
@@ -57,3 +61,27 @@ class StrategyComponent(ABC):
             ComponentResult with allowed/confidence/reason/metadata.
         """
         pass
+
+    def evaluate_batch(self, columns: Columns) -> ComponentBatchResult:
+        """
+        Evaluate every row of a column-wise decision stream.
+
+        The default implementation calls evaluate() once per row; stateless
+        components override it with a vectorized equivalent.
+
+        Args:
+            columns: Context key -> array, one row per bar (see batch module).
+
+        Returns:
+            ComponentBatchResult with one entry per row.
+        """
+        size = column_length(columns)
+        allowed = np.zeros(size, dtype=bool)
+        confidence = np.zeros(size, dtype=float)
+        reason = np.full(size, None, dtype=object)
+        for i in range(size):
+            result = self.evaluate(row_context(columns, i))
+            allowed[i] = result.allowed
+            confidence[i] = result.confidence
+            reason[i] = result.reason
+        return ComponentBatchResult(allowed=allowed, confidence=confidence, reason=reason)
@@ -0,0 +1,121 @@
+"""
+Batch (column-wise) evaluation support for strategy components.
+
+A decision stream is stored as columns: one array per context key, one row per
+bar, using the same keys ComponentContextBuilder produces. Missing values are
+``None`` (object columns) or ``NaN`` (numeric columns), which corresponds to
+the key being absent from the per-bar context dict.
+
+Components evaluate a whole stream at once via ``evaluate_batch`` and return a
+ComponentBatchResult with one entry per row.
+"""
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+Columns = Mapping[str, np.ndarray]
+
+
+@dataclass(frozen=True)
+class ComponentBatchResult:
+    """
+    Column-wise ComponentResult.
+
+    Attributes:
+        allowed: Boolean allow mask.
+        confidence: Component confidence per row.
+        reason: Veto reason code per row (None where allowed).
+    """
+
+    allowed: np.ndarray
+    confidence: np.ndarray
+    reason: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.allowed)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float | np.integer | np.floating) and not isinstance(
+        value, bool | np.bool_
+    )
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (isinstance(value, float | np.floating) and math.isnan(value))
+
+
+def contexts_to_columns(contexts: Sequence[Mapping[str, Any]]) -> dict[str, np.ndarray]:
+    """
+    Convert per-bar component contexts into columns.
+
+    Keys holding only numbers become float arrays (NaN where absent); all
+    other keys become object arrays (None where absent).
+    """
+    keys: dict[str, None] = {}
+    for context in contexts:
+        keys.update(dict.fromkeys(context))
+
+    columns: dict[str, np.ndarray] = {}
+    for key in keys:
+        values = [context.get(key) for context in contexts]
+        present = [value for value in values if value is not None]
+        if present and all(_is_number(value) for value in present):
+            columns[key] = np.array(
+                [np.nan if value is None else float(value) for value in values], dtype=float
+            )
+        else:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            columns[key] = column
+    return columns
+
+
+def as_columns(stream: Any) -> dict[str, np.ndarray]:
+    """Normalize a DataFrame, a mapping of sequences or a list of contexts to columns."""
+    if isinstance(stream, pd.DataFrame):
+        return {str(key): stream[key].to_numpy() for key in stream.columns}
+    if isinstance(stream, Mapping):
+        return {key: np.asarray(values) for key, values in stream.items()}
+    return contexts_to_columns(list(stream))
+
+
+def column_length(columns: Columns) -> int:
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns must have equal length, got {sorted(lengths)}")
+    return lengths.pop() if lengths else 0
+
+
+def row_context(columns: Columns, index: int) -> dict[str, Any]:
+    """Per-bar context dict for row ``index`` (missing values are omitted)."""
+    context = {}
+    for key, values in columns.items():
+        value = values[index]
+        if not _is_missing(value):
+            context[key] = value.item() if isinstance(value, np.generic) else value
+    return context
+
+
+def numeric_column(columns: Columns, key: str, size: int) -> np.ndarray:
+    """Float view of ``key`` (NaN where missing or non-numeric)."""
+    values = columns.get(key)
+    if values is None:
+        return np.full(size, np.nan)
+    if values.dtype.kind in "fiu":
+        return values.astype(float, copy=False)
+    return np.array([float(v) if _is_number(v) else np.nan for v in values], dtype=float)
+
+
+def factorize_column(columns: Columns, key: str, size: int) -> tuple[np.ndarray, list[Any]]:
+    """Integer codes and unique values of ``key`` (code -1 where missing)."""
+    values = columns.get(key)
+    if values is None:
+        return np.full(size, -1, dtype=np.intp), []
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    return codes, list(uniques)
@@ -30,7 +30,10 @@ overtrading and allow market conditions to develop.
 
 from typing import Any
 
+import numpy as np
+
 from .base import ComponentResult, StrategyComponent
+from .batch import Columns, ComponentBatchResult, column_length, numeric_column
 
 
 class CooldownComponent(StrategyComponent):
@@ -184,6 +187,57 @@ class CooldownComponent(StrategyComponent):
             },
         )
 
+    def evaluate_batch(
+        self, columns: Columns, *, entries: np.ndarray | None = None
+    ) -> ComponentBatchResult:
+        """Sequential cooldown scan over a decision stream.
+
+        Starts from a clean state and leaves the component state untouched.
+        A row that passes cooldown counts as a trade (like record_trade())
+        when ``entries`` is True for it; by default every LONG/SHORT action
+        row is an entry. ComposableStrategy.evaluate_batch passes the rows
+        where all other components also allow.
+
+        Args:
+            columns: Decision stream with 'bar_index', 'symbol' and 'action'.
+            entries: Optional boolean mask of rows that would open a trade.
+
+        Returns:
+            ComponentBatchResult (confidence 1.0 where allowed, else 0.0).
+        """
+        size = column_length(columns)
+        bar_index = numeric_column(columns, "bar_index", size)
+        symbols = columns.get("symbol")
+        if entries is None:
+            actions = columns.get("action")
+            entries = (
+                np.isin(actions, ("LONG", "SHORT"))
+                if actions is not None
+                else np.zeros(size, dtype=bool)
+            )
+
+        allowed = np.zeros(size, dtype=bool)
+        reason = np.full(size, None, dtype=object)
+        last_trade_bars: dict[str, float] = {}
+        for i in range(size):
+            symbol = symbols[i] if symbols is not None else None
+            if np.isnan(bar_index[i]):
+                reason[i] = "COOLDOWN_BAR_INDEX_MISSING"
+                continue
+            if symbol is None:
+                reason[i] = "COOLDOWN_SYMBOL_MISSING"
+                continue
+            last_trade_bar = last_trade_bars.get(symbol)
+            if last_trade_bar is not None and bar_index[i] - last_trade_bar < self._min_bars:
+                reason[i] = "COOLDOWN_ACTIVE"
+                continue
+            allowed[i] = True
+            if entries[i]:
+                last_trade_bars[symbol] = bar_index[i]
+        return ComponentBatchResult(
+            allowed=allowed, confidence=allowed.astype(float), reason=reason
+        )
+
     def record_trade(self, symbol: str, bar_index: int) -> None:
         """Record that a trade was taken (updates cooldown state).
 
@@ -199,6 +253,14 @@ class CooldownComponent(StrategyComponent):
         """
         self._last_trade_bars[symbol] = bar_index
 
+    def last_trade_bars(self) -> dict[str, int]:
+        """Return a copy of the last recorded trade bar per symbol.
+
+        Returns:
+            Mapping symbol -> bar_index for the most recent entry trade
+        """
+        return dict(self._last_trade_bars)
+
     def reset_state(self) -> None:
         """Reset component state (clears last_trade_bars).
 
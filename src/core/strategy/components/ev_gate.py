@@ -8,7 +8,15 @@ Phase 2 Component: Stateless, entry-only, binary veto.
 import math
 from typing import Any
 
+import numpy as np
+
 from core.strategy.components.base import ComponentResult, StrategyComponent
+from core.strategy.components.batch import (
+    Columns,
+    ComponentBatchResult,
+    column_length,
+    numeric_column,
+)
 
 
 class EVGateComponent(StrategyComponent):
@@ -129,3 +137,17 @@ class EVGateComponent(StrategyComponent):
                 "ev_value": ev_float,
             },
         )
+
+    def evaluate_batch(self, columns: Columns) -> ComponentBatchResult:
+        """Vectorized evaluate() over the 'expected_value' column."""
+        size = column_length(columns)
+        ev = numeric_column(columns, "expected_value", size)
+
+        missing = np.isnan(ev) | np.isposinf(ev)
+        allowed = ~missing & (ev >= self.min_ev)
+        reason = np.full(size, None, dtype=object)
+        reason[missing] = "EV_MISSING"
+        reason[~missing & ~allowed] = "EV_BELOW_THRESHOLD"
+        return ComponentBatchResult(
+            allowed=allowed, confidence=allowed.astype(float), reason=reason
+        )
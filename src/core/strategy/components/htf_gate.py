@@ -2,7 +2,10 @@
 HTF Gate Component - Filters trades based on higher timeframe regime.
 """
 
+import numpy as np
+
 from .base import ComponentResult, StrategyComponent
+from .batch import Columns, ComponentBatchResult, column_length, factorize_column
 
 
 class HTFGateComponent(StrategyComponent):
@@ -59,3 +62,26 @@ class HTFGateComponent(StrategyComponent):
             reason=None if allowed else f"HTF_REGIME_{htf_regime.upper()}",
             metadata={"htf_regime": htf_regime, "required": self.required_regimes},
         )
+
+    def evaluate_batch(self, columns: Columns) -> ComponentBatchResult:
+        """Vectorized evaluate() over the 'htf_regime' column (missing -> 'unknown')."""
+        size = column_length(columns)
+        codes, uniques = factorize_column(columns, "htf_regime", size)
+        # Reason per unique value; index -1 (missing) maps to the "unknown" default.
+        outcomes: list[str | None] = []
+        for regime in uniques:
+            if not isinstance(regime, str):
+                outcomes.append("HTF_REGIME_MISSING")
+            elif regime in self.required_regimes:
+                outcomes.append(None)
+            else:
+                outcomes.append(f"HTF_REGIME_{regime.upper()}")
+        outcomes.append(None if "unknown" in self.required_regimes else "HTF_REGIME_UNKNOWN")
+
+        lookup = np.empty(len(outcomes), dtype=object)
+        lookup[:] = outcomes
+        reason = lookup[codes]
+        allowed = np.array([outcome is None for outcome in outcomes], dtype=bool)[codes]
+        return ComponentBatchResult(
+            allowed=allowed, confidence=allowed.astype(float), reason=reason
+        )
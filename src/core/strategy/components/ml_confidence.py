@@ -2,7 +2,10 @@
 ML Confidence Component - Filters trades based on ML model confidence.
 """
 
+import numpy as np
+
 from .base import ComponentResult, StrategyComponent
+from .batch import Columns, ComponentBatchResult, column_length, numeric_column
 
 
 class MLConfidenceComponent(StrategyComponent):
@@ -71,3 +74,19 @@ class MLConfidenceComponent(StrategyComponent):
             reason=None if allowed else "ML_CONFIDENCE_LOW",
             metadata={"ml_confidence": confidence, "threshold": self.threshold},
         )
+
+    def evaluate_batch(self, columns: Columns) -> ComponentBatchResult:
+        """Vectorized evaluate(); rows without the direction-aware key use 'ml_confidence'."""
+        size = column_length(columns)
+        confidence = numeric_column(columns, "ml_confidence_for_action", size)
+        fallback = numeric_column(columns, "ml_confidence", size)
+        confidence = np.where(np.isnan(confidence), fallback, confidence)
+
+        missing = np.isnan(confidence)
+        allowed = ~missing & (confidence >= self.threshold)
+        reason = np.full(size, None, dtype=object)
+        reason[missing] = "ML_CONFIDENCE_MISSING"
+        reason[~missing & ~allowed] = "ML_CONFIDENCE_LOW"
+        return ComponentBatchResult(
+            allowed=allowed, confidence=np.where(missing, 0.0, confidence), reason=reason
+        )
@@ -7,7 +7,15 @@ Phase 2 Component: Stateless, entry-only.
 
 from typing import Any
 
+import numpy as np
+
 from core.strategy.components.base import ComponentResult, StrategyComponent
+from core.strategy.components.batch import (
+    Columns,
+    ComponentBatchResult,
+    column_length,
+    factorize_column,
+)
 
 
 class RegimeFilterComponent(StrategyComponent):
@@ -95,3 +103,20 @@ class RegimeFilterComponent(StrategyComponent):
                 "regime_found": regime,
             },
         )
+
+    def evaluate_batch(self, columns: Columns) -> ComponentBatchResult:
+        """Vectorized evaluate() over the 'regime' column."""
+        size = column_length(columns)
+        codes, uniques = factorize_column(columns, "regime", size)
+        allowed_codes = [
+            code for code, regime in enumerate(uniques) if regime in self.allowed_regimes
+        ]
+
+        missing = codes < 0
+        allowed = np.isin(codes, allowed_codes)
+        reason = np.full(size, None, dtype=object)
+        reason[missing] = "REGIME_MISSING"
+        reason[~missing & ~allowed] = "REGIME_NOT_ALLOWED"
+        return ComponentBatchResult(
+            allowed=allowed, confidence=allowed.astype(float), reason=reason
+        )
@@ -6,7 +6,10 @@ Evaluates components in sequence and applies veto/confidence aggregation logic.
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from .base import ComponentResult, StrategyComponent
+from .batch import ComponentBatchResult, as_columns, column_length
 
 
 @dataclass
@@ -29,6 +32,31 @@ class StrategyDecision:
     component_results: dict[str, ComponentResult] | None = None
 
 
+@dataclass
+class StrategyBatchDecision:
+    """
+    Column-wise StrategyDecision over a decision stream.
+
+    Attributes:
+        allowed: Boolean mask, True where every component allows.
+        confidence: min() of component confidences up to and including the
+            first veto (same as evaluate()).
+        veto_component: Name of the first vetoing component per row (None where allowed).
+        veto_reason: Reason code of that component per row.
+        component_results: Per-component batch results (all rows evaluated).
+    """
+
+    allowed: np.ndarray
+    confidence: np.ndarray
+    veto_component: np.ndarray
+    veto_reason: np.ndarray
+    component_results: dict[str, ComponentBatchResult]
+
+    @property
+    def allow_rate(self) -> float:
+        return float(self.allowed.mean()) if len(self.allowed) else 0.0
+
+
 class ComposableStrategy:
     """
     Combines multiple StrategyComponents into a single decision pipeline.
@@ -92,3 +120,67 @@ class ComposableStrategy:
             veto_reason=None,
             component_results=component_results,
         )
+
+    def evaluate_batch(self, stream) -> StrategyBatchDecision:
+        """
+        Evaluate all components over a stored decision stream at once.
+
+        Stateless components run vectorized; stateful ones with a sequential
+        batch scan (CooldownComponent) run last with ``entries`` set to the
+        LONG/SHORT rows every other component allows. This approximates the
+        engine, which may still reject an entry (e.g. position already open).
+        Component state used by evaluate() is not modified.
+
+        Args:
+            stream: DataFrame, mapping of columns, or list of per-bar contexts.
+
+        Returns:
+            StrategyBatchDecision with one entry per row.
+        """
+        columns = as_columns(stream)
+        size = column_length(columns)
+        names = [component.name() for component in self.components]
+
+        results: dict[str, ComponentBatchResult] = {}
+        sequential = []
+        for name, component in zip(names, self.components, strict=True):
+            if hasattr(component, "record_trade"):
+                sequential.append((name, component))
+            else:
+                results[name] = component.evaluate_batch(columns)
+
+        if sequential:
+            others_allow = np.ones(size, dtype=bool)
+            for result in results.values():
+                others_allow &= result.allowed
+            actions = columns.get("action")
+            entries = others_allow & (
+                np.isin(actions, ("LONG", "SHORT"))
+                if actions is not None
+                else np.zeros(size, dtype=bool)
+            )
+            for name, component in sequential:
+                result = component.evaluate_batch(columns, entries=entries)
+                results[name] = result
+                entries = entries & result.allowed
+
+        # Combine in component order: first veto wins, confidence = running min.
+        alive = np.ones(size, dtype=bool)
+        confidence = np.full(size, np.inf)
+        veto_component = np.full(size, None, dtype=object)
+        veto_reason = np.full(size, None, dtype=object)
+        for name in names:
+            result = results[name]
+            confidence = np.where(alive, np.minimum(confidence, result.confidence), confidence)
+            vetoed = alive & ~result.allowed
+            veto_component[vetoed] = name
+            veto_reason[vetoed] = result.reason[vetoed]
+            alive &= result.allowed
+
+        return StrategyBatchDecision(
+            allowed=alive,
+            confidence=confidence,
+            veto_component=veto_component,
+            veto_reason=veto_reason,
+            component_results={name: results[name] for name in names},
+        )
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
+from core.utils.compiled_config_cache import CompiledConfigCache
+
 
 def _clamp01(x: float) -> float:
     if x != x:  # NaN
@@ -66,156 +69,276 @@ def _soft_floor(base_01: float, *, floor: float, exponent: float = 1.0) -> float
     return float(_clamp(val, 0.0, 1.0) ** exponent)
 
 
-def _compute_quality_factor(
-    *,
-    atr_pct: float | None,
-    spread_bp: float | None,
-    volume_score: float | None,
-    data_quality: float | None,
-    config: dict[str, Any] | None,
-) -> tuple[float, dict[str, Any]]:
-    cfg = dict(config or {})
-    enabled = bool(cfg.get("enabled"))
-    if not enabled:
-        # v1 behavior: only honor data_quality if provided.
-        dq = _as_float(data_quality)
-        q = _clamp01(dq if dq is not None else 1.0)
-        return q, {
-            "version": "v1",
-            "enabled": False,
-            "quality_factor": q,
-            "components": {"data_quality": q},
-        }
-
-    # v2 behavior: multiply stable component factors into overall quality factors.
-    # We support per-component scopes:
-    # - gate: affects entry gating confidence
-    # - sizing: affects sizing confidence (position size scaling)
-    # - both (default): affects both
-    clamp_cfg = dict(cfg.get("clamp") or {})
-    min_quality = float(clamp_cfg.get("min_quality", 0.20))
-    min_quality = float(_clamp(min_quality, 0.0, 1.0))
-
-    components_cfg = dict(cfg.get("components") or {})
-
-    def _norm_scope(scope: Any) -> str:
-        s = str(scope or "both").strip().lower()
-        if s in {"gate", "gating", "entry"}:
-            return "gate"
-        if s in {"sizing", "size", "risk"}:
-            return "sizing"
-        if s in {"both", "all", "gate+sizing", "gating+sizing"}:
-            return "both"
+def _norm_scope(scope: Any) -> str:
+    s = str(scope or "both").strip().lower()
+    if s in {"gate", "gating", "entry"}:
+        return "gate"
+    if s in {"sizing", "size", "risk"}:
+        return "sizing"
+    if s in {"both", "all", "gate+sizing", "gating+sizing"}:
         return "both"
+    return "both"
+
 
-    reasons: list[str] = []
-    components_gate: dict[str, float] = {}
-    components_size: dict[str, float] = {}
-    component_scopes: dict[str, str] = {}
+def _norm_exponent(exponent: Any) -> float:
+    value = float(exponent) if exponent is not None else 1.0
+    return 1.0 if value <= 0 else value
 
-    q_gate = 1.0
-    q_size = 1.0
 
-    def _apply_component(name: str, factor: float, scope: str) -> None:
-        nonlocal q_gate, q_size
-        component_scopes[name] = scope
-        if scope in {"both", "gate"}:
-            components_gate[name] = float(factor)
-            q_gate *= float(factor)
-        if scope in {"both", "sizing"}:
-            components_size[name] = float(factor)
-            q_size *= float(factor)
+@dataclass(frozen=True, slots=True)
+class _QualityComponent:
+    """One v2 quality component with config-derived parameters pre-resolved."""
+
+    name: str
+    missing_reason: str
+    scope: str
+    soft_floor: bool  # True: _soft_floor(value); False: _linear_penalty(max(0, value))
+    floor: float
+    exponent: float
+    ref: float = 0.0
+    max_x: float = 0.0
+
+    def factor(self, value: float) -> float:
+        if self.soft_floor:
+            return _soft_floor(_clamp01(value), floor=self.floor, exponent=self.exponent)
+        factor = _linear_penalty(max(0.0, value), ref=self.ref, max_x=self.max_x, floor=self.floor)
+        return float(_clamp(factor, 0.0, 1.0) ** self.exponent)
+
+
+def _compile_components(components_cfg: dict[str, Any]) -> tuple[_QualityComponent, ...]:
+    components: list[_QualityComponent] = []
 
     # data_quality in [0,1]
     dq_cfg = dict(components_cfg.get("data_quality") or {})
     if dq_cfg.get("enabled", True):
-        scope = _norm_scope(dq_cfg.get("scope"))
-        dq = _as_float(data_quality)
-        if dq is None:
-            factor = 1.0
-            reasons.append("Q_DATA_QUALITY_MISSING")
-        else:
-            factor = _soft_floor(
-                _clamp01(dq),
+        components.append(
+            _QualityComponent(
+                name="data_quality",
+                missing_reason="Q_DATA_QUALITY_MISSING",
+                scope=_norm_scope(dq_cfg.get("scope")),
+                soft_floor=True,
                 floor=float(dq_cfg.get("floor", 0.50)),
                 exponent=float(dq_cfg.get("exponent", 1.0)),
             )
-        _apply_component("data_quality", float(factor), scope)
+        )
 
     # spread_bp in basis points
     spread_cfg = dict(components_cfg.get("spread") or {})
     if spread_cfg.get("enabled", True):
-        scope = _norm_scope(spread_cfg.get("scope"))
-        sp = _as_float(spread_bp)
-        if sp is None:
-            factor = 1.0
-            reasons.append("Q_SPREAD_MISSING")
-        else:
-            sp = max(0.0, sp)
-            factor = _linear_penalty(
-                sp,
+        components.append(
+            _QualityComponent(
+                name="spread",
+                missing_reason="Q_SPREAD_MISSING",
+                scope=_norm_scope(spread_cfg.get("scope")),
+                soft_floor=False,
                 ref=float(spread_cfg.get("ref_bp", 5.0)),
                 max_x=float(spread_cfg.get("max_bp", 50.0)),
                 floor=float(spread_cfg.get("floor", 0.25)),
+                exponent=_norm_exponent(spread_cfg.get("exponent", 1.0)),
             )
-            exponent = float(spread_cfg.get("exponent", 1.0))
-            exponent = 1.0 if exponent <= 0 else exponent
-            factor = float(_clamp(factor, 0.0, 1.0) ** exponent)
-        _apply_component("spread", float(factor), scope)
+        )
 
     # atr_pct in [0, inf)
     atr_cfg = dict(components_cfg.get("atr") or {})
     if atr_cfg.get("enabled", True):
-        scope = _norm_scope(atr_cfg.get("scope"))
-        ap = _as_float(atr_pct)
-        if ap is None:
-            factor = 1.0
-            reasons.append("Q_ATR_PCT_MISSING")
-        else:
-            ap = max(0.0, ap)
-            factor = _linear_penalty(
-                ap,
+        components.append(
+            _QualityComponent(
+                name="atr",
+                missing_reason="Q_ATR_PCT_MISSING",
+                scope=_norm_scope(atr_cfg.get("scope")),
+                soft_floor=False,
                 ref=float(atr_cfg.get("ref_pct", 0.008)),
                 max_x=float(atr_cfg.get("max_pct", 0.04)),
                 floor=float(atr_cfg.get("floor", 0.40)),
+                exponent=_norm_exponent(atr_cfg.get("exponent", 1.0)),
             )
-            exponent = float(atr_cfg.get("exponent", 1.0))
-            exponent = 1.0 if exponent <= 0 else exponent
-            factor = float(_clamp(factor, 0.0, 1.0) ** exponent)
-        _apply_component("atr", float(factor), scope)
+        )
 
     # volume_score in [0,1]
     vol_cfg = dict(components_cfg.get("volume") or {})
     if vol_cfg.get("enabled", True):
-        scope = _norm_scope(vol_cfg.get("scope"))
-        vs = _as_float(volume_score)
-        if vs is None:
-            factor = 1.0
-            reasons.append("Q_VOLUME_MISSING")
-        else:
-            factor = _soft_floor(
-                _clamp01(vs),
+        components.append(
+            _QualityComponent(
+                name="volume",
+                missing_reason="Q_VOLUME_MISSING",
+                scope=_norm_scope(vol_cfg.get("scope")),
+                soft_floor=True,
                 floor=float(vol_cfg.get("floor", 0.40)),
                 exponent=float(vol_cfg.get("exponent", 0.8)),
             )
-        _apply_component("volume", float(factor), scope)
-
-    q_gate = float(_clamp(q_gate, min_quality, 1.0))
-    q_size = float(_clamp(q_size, min_quality, 1.0))
-    return q_gate, {
-        "version": "v2",
-        "enabled": True,
-        # Backward compatible: quality_factor == gating factor.
-        "quality_factor": q_gate,
-        "quality_factor_gate": q_gate,
-        "quality_factor_size": q_size,
-        "min_quality": min_quality,
-        # Backward compatible: components == gate components.
-        "components": components_gate,
-        "components_size": components_size,
-        "component_scopes": component_scopes,
-        "reasons": reasons,
-    }
+        )
+
+    return tuple(components)
+
+
+@dataclass(frozen=True, slots=True)
+class ConfidenceEvaluator:
+    """compute_confidence() with the quality config resolved once.
+
+    Build it with compile_confidence() and reuse it across bars when the
+    quality config is frozen (backtests, live sessions).
+    """
+
+    enabled: bool
+    min_quality: float = 0.0
+    components: tuple[_QualityComponent, ...] = ()
+
+    def quality_factor(
+        self,
+        *,
+        atr_pct: float | None,
+        spread_bp: float | None,
+        volume_score: float | None,
+        data_quality: float | None,
+    ) -> tuple[float, dict[str, Any]]:
+        if not self.enabled:
+            # v1 behavior: only honor data_quality if provided.
+            dq = _as_float(data_quality)
+            q = _clamp01(dq if dq is not None else 1.0)
+            return q, {
+                "version": "v1",
+                "enabled": False,
+                "quality_factor": q,
+                "components": {"data_quality": q},
+            }
+
+        # v2 behavior: multiply stable component factors into overall quality factors.
+        # We support per-component scopes:
+        # - gate: affects entry gating confidence
+        # - sizing: affects sizing confidence (position size scaling)
+        # - both (default): affects both
+        inputs = {
+            "data_quality": data_quality,
+            "spread": spread_bp,
+            "atr": atr_pct,
+            "volume": volume_score,
+        }
+        reasons: list[str] = []
+        components_gate: dict[str, float] = {}
+        components_size: dict[str, float] = {}
+        component_scopes: dict[str, str] = {}
+
+        q_gate = 1.0
+        q_size = 1.0
+        for component in self.components:
+            value = _as_float(inputs[component.name])
+            if value is None:
+                factor = 1.0
+                reasons.append(component.missing_reason)
+            else:
+                factor = float(component.factor(value))
+            component_scopes[component.name] = component.scope
+            if component.scope in {"both", "gate"}:
+                components_gate[component.name] = factor
+                q_gate *= factor
+            if component.scope in {"both", "sizing"}:
+                components_size[component.name] = factor
+                q_size *= factor
+
+        q_gate = float(_clamp(q_gate, self.min_quality, 1.0))
+        q_size = float(_clamp(q_size, self.min_quality, 1.0))
+        return q_gate, {
+            "version": "v2",
+            "enabled": True,
+            # Backward compatible: quality_factor == gating factor.
+            "quality_factor": q_gate,
+            "quality_factor_gate": q_gate,
+            "quality_factor_size": q_size,
+            "min_quality": self.min_quality,
+            # Backward compatible: components == gate components.
+            "components": components_gate,
+            "components_size": components_size,
+            "component_scopes": component_scopes,
+            "reasons": reasons,
+        }
+
+    def compute(
+        self,
+        probas: dict[str, float],
+        *,
+        atr_pct: float | None = None,
+        spread_bp: float | None = None,
+        volume_score: float | None = None,
+        data_quality: float | None = None,
+    ) -> tuple[dict[str, float], dict[str, Any]]:
+        """Same contract as compute_confidence()."""
+        p_buy_raw = _as_float(probas.get("buy", 0.0)) if probas else None
+        p_sell_raw = _as_float(probas.get("sell", 0.0)) if probas else None
+        p_buy = float(p_buy_raw) if p_buy_raw is not None else 0.0
+        p_sell = float(p_sell_raw) if p_sell_raw is not None else 0.0
+
+        quality_gate, quality_meta = self.quality_factor(
+            atr_pct=atr_pct,
+            spread_bp=spread_bp,
+            volume_score=volume_score,
+            data_quality=data_quality,
+        )
+        quality_size = float(quality_meta.get("quality_factor_size", quality_gate))
+
+        # Bevara rangordning: multiplicera buy/sell med samma gate‑faktor.
+        c_buy = _clamp01(p_buy * quality_gate)
+        c_sell = _clamp01(p_sell * quality_gate)
+        c_overall = max(c_buy, c_sell)
+
+        confidences: dict[str, float] = {"buy": c_buy, "sell": c_sell, "overall": c_overall}
+
+        # If sizing-quality differs from gate-quality (e.g. component scopes), expose scaled confidences.
+        if abs(quality_size - quality_gate) > 1e-12:
+            c_buy_s = _clamp01(p_buy * quality_size)
+            c_sell_s = _clamp01(p_sell * quality_size)
+            confidences["buy_scaled"] = c_buy_s
+            confidences["sell_scaled"] = c_sell_s
+            confidences["overall_scaled"] = max(c_buy_s, c_sell_s)
+        meta: dict[str, Any] = {
+            "versions": {"confidence": str(quality_meta.get("version", "v1"))},
+            "reasons": list(quality_meta.get("reasons", [])),
+            "quality": quality_meta,
+        }
+        return confidences, meta
+
+
+_DISABLED_EVALUATOR = ConfidenceEvaluator(enabled=False)
+
+
+def _build_confidence_evaluator(config: Any) -> ConfidenceEvaluator:
+    cfg = dict(config or {})
+    if not bool(cfg.get("enabled")):
+        return _DISABLED_EVALUATOR
+    clamp_cfg = dict(cfg.get("clamp") or {})
+    min_quality = float(clamp_cfg.get("min_quality", 0.20))
+    return ConfidenceEvaluator(
+        enabled=True,
+        min_quality=float(_clamp(min_quality, 0.0, 1.0)),
+        components=_compile_components(dict(cfg.get("components") or {})),
+    )
+
+
+_CONFIDENCE_EVALUATOR_CACHE: CompiledConfigCache[ConfidenceEvaluator] = CompiledConfigCache(
+    _build_confidence_evaluator
+)
+
+
+def compile_confidence(config: dict[str, Any] | None = None) -> ConfidenceEvaluator:
+    """Resolve a quality config into a ConfidenceEvaluator (cached per config object)."""
+    if not config or not config.get("enabled"):
+        return _DISABLED_EVALUATOR
+    return _CONFIDENCE_EVALUATOR_CACHE.get(config)
+
+
+def _compute_quality_factor(
+    *,
+    atr_pct: float | None,
+    spread_bp: float | None,
+    volume_score: float | None,
+    data_quality: float | None,
+    config: dict[str, Any] | None,
+) -> tuple[float, dict[str, Any]]:
+    return compile_confidence(config).quality_factor(
+        atr_pct=atr_pct,
+        spread_bp=spread_bp,
+        volume_score=volume_score,
+        data_quality=data_quality,
+    )
 
 
 def compute_confidence(
@@ -233,43 +356,10 @@ def compute_confidence(
     - Clamp till [0, 1]
     - Returnera (confidences, meta) där meta innehåller versions och reasons
     """
-    p_buy_raw = _as_float(probas.get("buy", 0.0)) if probas else None
-    p_sell_raw = _as_float(probas.get("sell", 0.0)) if probas else None
-    p_buy = float(p_buy_raw) if p_buy_raw is not None else 0.0
-    p_sell = float(p_sell_raw) if p_sell_raw is not None else 0.0
-
-    quality, quality_meta = _compute_quality_factor(
+    return compile_confidence(config).compute(
+        probas,
         atr_pct=atr_pct,
         spread_bp=spread_bp,
         volume_score=volume_score,
         data_quality=data_quality,
-        config=config,
     )
-
-    quality_gate = float(quality)
-    quality_size = float(
-        quality_meta.get("quality_factor_size", quality_gate)
-        if isinstance(quality_meta, dict)
-        else quality_gate
-    )
-
-    # Bevara rangordning: multiplicera buy/sell med samma gate‑faktor.
-    c_buy = _clamp01(p_buy * quality_gate)
-    c_sell = _clamp01(p_sell * quality_gate)
-    c_overall = max(c_buy, c_sell)
-
-    confidences: dict[str, float] = {"buy": c_buy, "sell": c_sell, "overall": c_overall}
-
-    # If sizing-quality differs from gate-quality (e.g. component scopes), expose scaled confidences.
-    if abs(quality_size - quality_gate) > 1e-12:
-        c_buy_s = _clamp01(p_buy * quality_size)
-        c_sell_s = _clamp01(p_sell * quality_size)
-        confidences["buy_scaled"] = c_buy_s
-        confidences["sell_scaled"] = c_sell_s
-        confidences["overall_scaled"] = max(c_buy_s, c_sell_s)
-    meta: dict[str, Any] = {
-        "versions": {"confidence": str(quality_meta.get("version", "v1"))},
-        "reasons": list(quality_meta.get("reasons", [])) if isinstance(quality_meta, dict) else [],
-        "quality": quality_meta,
-    }
-    return confidences, meta
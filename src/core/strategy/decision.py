@@ -4,6 +4,7 @@ import copy
 import logging
 from typing import Any, Literal
 
+from core.strategy.decision_attribution import decide_with_shadow_branches, is_shadow_request
 from core.strategy.decision_fib_gating import apply_fib_gating
 from core.strategy.decision_gates import apply_post_fib_gates, safe_float, select_candidate
 from core.strategy.decision_sizing import apply_sizing
@@ -30,14 +31,13 @@ _FEATURE_ATTRIBUTION_HYSTERESIS_ROW = "Hysteresis gate seam"
 _FEATURE_ATTRIBUTION_COOLDOWN_ROW = "Cooldown gate seam"
 _FEATURE_ATTRIBUTION_HTF_BLOCK_ROW = "HTF block seam"
 _RESEARCH_BULL_HIGH_PERSISTENCE_REASON = "RESEARCH_BULL_HIGH_PERSISTENCE_OVERRIDE"
-_FEATURE_ATTRIBUTION_SUPPORTED_ROWS = frozenset(
-    {
-        _FEATURE_ATTRIBUTION_MIN_EDGE_ROW,
-        _FEATURE_ATTRIBUTION_HYSTERESIS_ROW,
-        _FEATURE_ATTRIBUTION_COOLDOWN_ROW,
-        _FEATURE_ATTRIBUTION_HTF_BLOCK_ROW,
-    }
+_FEATURE_ATTRIBUTION_SEAM_ROWS = (
+    _FEATURE_ATTRIBUTION_MIN_EDGE_ROW,
+    _FEATURE_ATTRIBUTION_HYSTERESIS_ROW,
+    _FEATURE_ATTRIBUTION_COOLDOWN_ROW,
+    _FEATURE_ATTRIBUTION_HTF_BLOCK_ROW,
 )
+_FEATURE_ATTRIBUTION_SUPPORTED_ROWS = frozenset(_FEATURE_ATTRIBUTION_SEAM_ROWS)
 _FEATURE_ATTRIBUTION_NEUTRALIZE_MODE = "neutralize"
 
 
@@ -150,7 +150,49 @@ def decide(
     risk_ctx: dict[str, Any] | None,
     cfg: dict[str, Any] | None,
 ) -> tuple[Action, dict[str, Any]]:
-    """Beslutsfunktion (pure) med strikt gate-ordning."""
+    """Beslutsfunktion (pure) med strikt gate-ordning.
+
+    A ``feature_attribution`` request with mode ``shadow_all`` additionally runs
+    one neutralized shadow branch per supported seam (see decision_attribution).
+    """
+    if is_shadow_request(policy.get(_FEATURE_ATTRIBUTION_REQUEST_KEY)):
+        return decide_with_shadow_branches(
+            policy,
+            request_key=_FEATURE_ATTRIBUTION_REQUEST_KEY,
+            seams=_FEATURE_ATTRIBUTION_SEAM_ROWS,
+            neutralize_mode=_FEATURE_ATTRIBUTION_NEUTRALIZE_MODE,
+            decide_branch=_decide_branch,
+            probas=probas,
+            confidence=confidence,
+            regime=regime,
+            htf_regime=htf_regime,
+            state=state,
+            risk_ctx=risk_ctx,
+            cfg=cfg,
+        )
+    return _decide_branch(
+        policy,
+        probas=probas,
+        confidence=confidence,
+        regime=regime,
+        htf_regime=htf_regime,
+        state=state,
+        risk_ctx=risk_ctx,
+        cfg=cfg,
+    )
+
+
+def _decide_branch(
+    policy: dict[str, Any],
+    *,
+    probas: dict[str, float] | None,
+    confidence: dict[str, float] | None,
+    regime: str | None,
+    htf_regime: str | None = None,
+    state: dict[str, Any] | None,
+    risk_ctx: dict[str, Any] | None,
+    cfg: dict[str, Any] | None,
+) -> tuple[Action, dict[str, Any]]:
     log_fib_flow(
         "[FIB-FLOW] decide() called with cfg keys: %s",
         list((cfg or {}).keys())[:15],
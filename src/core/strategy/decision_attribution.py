@@ -0,0 +1,257 @@
+"""Single-replay multi-seam feature attribution for decide().
+
+A ``feature_attribution`` request with ``mode == "shadow_all"`` keeps the live
+decision untouched and, on every bar, also evaluates one shadow branch per
+supported seam with that seam neutralized. Each branch carries its own decision
+state (cooldown, hysteresis, overrides, ...) and a simplified shadow position,
+while sharing the bar's probabilities, confidence and features.
+
+Branch bookkeeping lives in ``state_out[FEATURE_ATTRIBUTION_SHADOW_STATE_KEY]`` so
+it is threaded through the normal state round-trip of the backtest engine.
+
+Shadow positions are deliberately simple and identical for every branch
+(including the baseline branch): enter at ``last_close`` on LONG/SHORT when
+flat, exit on an opposite entry or after ``hold_bars`` bars. Attribution is read
+as the delta of a seam branch against the baseline branch, not as a substitute
+for a full backtest of the neutralized config.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from core.strategy.decision_gates import Action, safe_float
+
+FEATURE_ATTRIBUTION_SHADOW_MODE = "shadow_all"
+FEATURE_ATTRIBUTION_SHADOW_STATE_KEY = "feature_attribution_shadow"
+FEATURE_ATTRIBUTION_SHADOW_VERSION = "shadow_v1"
+
+_BASELINE_BRANCH = "baseline"
+_DEFAULT_HOLD_BARS = 24
+_SHADOW_REQUEST_KEYS = frozenset({"mode", "hold_bars"})
+
+# Keys injected fresh on every bar by evaluate_pipeline / BacktestEngine. Shadow
+# branches take these from the live state; all other keys are branch-owned.
+_SHARED_BAR_STATE_KEYS = (
+    "current_atr",
+    "atr_percentiles",
+    "htf_fib",
+    "ltf_fib",
+    "last_close",
+    "htf_regime",
+    "_peak_equity",
+    "equity_drawdown_pct",
+)
+
+DecideBranch = Callable[..., tuple[Action, dict[str, Any]]]
+
+
+def is_shadow_request(request: Any) -> bool:
+    return isinstance(request, dict) and request.get("mode") == FEATURE_ATTRIBUTION_SHADOW_MODE
+
+
+def _resolve_hold_bars(request: dict[str, Any]) -> int | None:
+    if not set(request) <= _SHADOW_REQUEST_KEYS:
+        return None
+    hold_bars = request.get("hold_bars", _DEFAULT_HOLD_BARS)
+    if isinstance(hold_bars, bool) or not isinstance(hold_bars, int) or hold_bars < 1:
+        return None
+    return hold_bars
+
+
+def _empty_stats() -> dict[str, Any]:
+    return {
+        "bars": 0,
+        "entries": 0,
+        "long_entries": 0,
+        "short_entries": 0,
+        "diverged_bars": 0,
+        "shadow_trades": 0,
+        "shadow_wins": 0,
+        "shadow_return": 0.0,
+    }
+
+
+def _advance_branch(
+    previous: dict[str, Any] | None,
+    *,
+    action: Action,
+    size: float,
+    baseline_action: Action,
+    price: float,
+    hold_bars: int,
+) -> dict[str, Any]:
+    """Return the next shadow position/stats for one branch after this bar."""
+    previous = previous or {}
+    stats = {**_empty_stats(), **(previous.get("stats") or {})}
+    position = previous.get("position")
+    position = dict(position) if isinstance(position, dict) else None
+
+    stats["bars"] += 1
+    if action != baseline_action:
+        stats["diverged_bars"] += 1
+
+    is_entry = action in ("LONG", "SHORT") and size > 0.0
+    if is_entry:
+        stats["entries"] += 1
+        stats["long_entries" if action == "LONG" else "short_entries"] += 1
+
+    if position is not None and price > 0.0:
+        position["bars_held"] = int(position.get("bars_held", 0)) + 1
+        flipped = is_entry and action != position["side"]
+        if flipped or position["bars_held"] >= hold_bars:
+            direction = 1.0 if position["side"] == "LONG" else -1.0
+            trade_return = direction * (price / float(position["entry_price"]) - 1.0)
+            stats["shadow_trades"] += 1
+            stats["shadow_return"] += trade_return
+            if trade_return > 0.0:
+                stats["shadow_wins"] += 1
+            position = None
+
+    if is_entry and position is None and price > 0.0:
+        position = {"side": action, "entry_price": price, "bars_held": 0}
+
+    return {"position": position, "stats": stats}
+
+
+def decide_with_shadow_branches(
+    policy: dict[str, Any],
+    *,
+    request_key: str,
+    seams: tuple[str, ...],
+    neutralize_mode: str,
+    decide_branch: DecideBranch,
+    probas: dict[str, float] | None,
+    confidence: dict[str, float] | None,
+    regime: str | None,
+    htf_regime: str | None,
+    state: dict[str, Any] | None,
+    risk_ctx: dict[str, Any] | None,
+    cfg: dict[str, Any] | None,
+) -> tuple[Action, dict[str, Any]]:
+    """Run the live decision plus one neutralized shadow branch per seam."""
+    request = policy.get(request_key)
+    hold_bars = _resolve_hold_bars(request)
+    if hold_bars is None:
+        # Malformed shadow request: fail closed through the regular validation.
+        return decide_branch(
+            policy,
+            probas=probas,
+            confidence=confidence,
+            regime=regime,
+            htf_regime=htf_regime,
+            state=state,
+            risk_ctx=risk_ctx,
+            cfg=cfg,
+        )
+
+    state_in = dict(state or {})
+    ledger = state_in.pop(FEATURE_ATTRIBUTION_SHADOW_STATE_KEY, None)
+    if not isinstance(ledger, dict) or ledger.get("version") != FEATURE_ATTRIBUTION_SHADOW_VERSION:
+        ledger = {}
+    previous_branches = dict(ledger.get("branches") or {})
+    base_policy = {key: value for key, value in policy.items() if key != request_key}
+
+    action, meta = decide_branch(
+        base_policy,
+        probas=probas,
+        confidence=confidence,
+        regime=regime,
+        htf_regime=htf_regime,
+        state=state_in,
+        risk_ctx=risk_ctx,
+        cfg=cfg,
+    )
+
+    price = safe_float(state_in.get("last_close"), 0.0)
+    bar_inputs = {key: state_in[key] for key in _SHARED_BAR_STATE_KEYS if key in state_in}
+    branches: dict[str, Any] = {
+        _BASELINE_BRANCH: _advance_branch(
+            previous_branches.get(_BASELINE_BRANCH),
+            action=action,
+            size=safe_float(meta.get("size"), 0.0),
+            baseline_action=action,
+            price=price,
+            hold_bars=hold_bars,
+        )
+    }
+    for seam in seams:
+        previous = previous_branches.get(seam)
+        if isinstance(previous, dict) and isinstance(previous.get("state"), dict):
+            seam_state = {**previous["state"], **bar_inputs}
+        else:
+            seam_state = dict(state_in)
+        seam_action, seam_meta = decide_branch(
+            {**base_policy, request_key: {"selected_row_label": seam, "mode": neutralize_mode}},
+            probas=probas,
+            confidence=confidence,
+            regime=regime,
+            htf_regime=htf_regime,
+            state=seam_state,
+            risk_ctx=risk_ctx,
+            cfg=cfg,
+        )
+        branch = _advance_branch(
+            previous,
+            action=seam_action,
+            size=safe_float(seam_meta.get("size"), 0.0),
+            baseline_action=action,
+            price=price,
+            hold_bars=hold_bars,
+        )
+        branch["state"] = seam_meta.get("state_out") or {}
+        branches[seam] = branch
+
+    state_out = meta.setdefault("state_out", {})
+    state_out[FEATURE_ATTRIBUTION_SHADOW_STATE_KEY] = {
+        "version": FEATURE_ATTRIBUTION_SHADOW_VERSION,
+        "hold_bars": hold_bars,
+        "branches": branches,
+    }
+    return action, meta
+
+
+def build_shadow_attribution_report(state: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Summarize shadow branches from a decision state (None when not tracked).
+
+    Only closed shadow trades count towards ``shadow_return``; a position still
+    open at the end of the replay is ignored for every branch alike.
+    """
+    ledger = (state or {}).get(FEATURE_ATTRIBUTION_SHADOW_STATE_KEY)
+    if not isinstance(ledger, dict) or ledger.get("version") != FEATURE_ATTRIBUTION_SHADOW_VERSION:
+        return None
+
+    branches = ledger.get("branches") or {}
+    baseline = {**_empty_stats(), **(branches.get(_BASELINE_BRANCH) or {}).get("stats", {})}
+
+    def _summary(stats: dict[str, Any]) -> dict[str, Any]:
+        trades = int(stats["shadow_trades"])
+        return {
+            "entries": int(stats["entries"]),
+            "long_entries": int(stats["long_entries"]),
+            "short_entries": int(stats["short_entries"]),
+            "shadow_trades": trades,
+            "shadow_win_rate": (stats["shadow_wins"] / trades) if trades else 0.0,
+            "shadow_return": float(stats["shadow_return"]),
+        }
+
+    seams: dict[str, Any] = {}
+    for label, branch in branches.items():
+        if label == _BASELINE_BRANCH:
+            continue
+        stats = {**_empty_stats(), **(branch or {}).get("stats", {})}
+        seams[label] = {
+            **_summary(stats),
+            "diverged_bars": int(stats["diverged_bars"]),
+            "delta_entries": int(stats["entries"] - baseline["entries"]),
+            "delta_shadow_return": float(stats["shadow_return"] - baseline["shadow_return"]),
+        }
+
+    return {
+        "version": ledger["version"],
+        "hold_bars": ledger.get("hold_bars"),
+        "bars": int(baseline["bars"]),
+        "baseline": _summary(baseline),
+        "seams": seams,
+    }
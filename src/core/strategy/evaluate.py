@@ -3,6 +3,8 @@ from __future__ import annotations
 import os
 from typing import Any
 
+import numpy as np
+
 from core.config.authority_mode_resolver import (
     AUTHORITY_MODE_REGIME_MODULE,
 )
@@ -10,6 +12,7 @@ from core.config.authority_mode_resolver import (
     resolve_authority_mode_with_source_permissive as _resolve_authority_mode_with_source,
 )
 from core.config.merge_policy import resolve_champion_merge_for_evaluate
+from core.indicators.volume import VOLUME_SCORE_CAP_RATIO, VOLUME_SCORE_WINDOW
 from core.intelligence.regime.authority import (
     detect_authoritative_regime_legacy as _detect_intelligence_authoritative_regime_legacy,
 )
@@ -92,8 +95,9 @@ def _volume_score_from_candles(
     if not recent:
         return 0.0
 
-    recent_sorted = sorted(recent)
-    median = recent_sorted[len(recent_sorted) // 2]
+    # Upper median via linear-time selection (same value as sorted(recent)[k // 2]).
+    mid = len(recent) // 2
+    median = float(np.partition(np.asarray(recent, dtype=float), mid)[mid])
     if median <= 0:
         return 0.0
 
@@ -114,6 +118,40 @@ def _volume_score_from_candles(
     return float(score)
 
 
+def _precomputed_volume_score(
+    candles: dict[str, Any],
+    configs: dict[str, Any],
+    *,
+    window: int,
+    cap_ratio: float,
+) -> tuple[bool, float | None]:
+    """Look up the precomputed per-bar volume score for the current backtest bar.
+
+    Returns ``(found, score)``. Only used when the pipeline parameters match the
+    ones the array was built with and the candle window covers the full median
+    window (or starts at the first bar), so the value equals the live computation.
+    """
+    if window != VOLUME_SCORE_WINDOW or max(1.0, cap_ratio) != VOLUME_SCORE_CAP_RATIO:
+        return False, None
+    pre = configs.get("precomputed_features")
+    scores = pre.get("volume_score") if isinstance(pre, dict) else None
+    if not isinstance(scores, list | tuple) or "_global_index" not in configs:
+        return False, None
+    try:
+        idx = int(configs["_global_index"])
+    except (TypeError, ValueError):
+        return False, None
+    vols = candles.get("volume") if isinstance(candles, dict) else None
+    if vols is None or not hasattr(vols, "__len__"):
+        return False, None
+    if not 0 <= idx < len(scores) or not (len(vols) >= window or len(vols) == idx + 1):
+        return False, None
+    value = _safe_float(scores[idx])
+    if value is None or value != value:  # NaN
+        return True, None
+    return True, value
+
+
 def _deep_merge(base: dict, override: dict) -> dict:
     """Deep merge override into base, recursively merging nested dicts."""
     return deep_merge_dicts(base, override)
@@ -318,16 +356,22 @@ def evaluate_pipeline(
     if current_atr is not None and last_close is not None and last_close > 0:
         atr_pct = float(current_atr / last_close)
 
-    quality_cfg = dict(configs.get("quality") or {})
+    # Read-only; keep the original object so compute_confidence can reuse its
+    # compiled evaluator across bars when the config is frozen.
+    quality_cfg = configs.get("quality") or {}
     pipeline_cfg = dict(quality_cfg.get("pipeline") or {})
 
     spread_bp = _safe_float(pipeline_cfg.get("spread_bp"))
 
-    volume_score = _volume_score_from_candles(
-        candles,
-        window=int(pipeline_cfg.get("volume_window", 50) or 50),
-        cap_ratio=float(pipeline_cfg.get("volume_cap_ratio", 3.0) or 3.0),
+    volume_window = int(pipeline_cfg.get("volume_window", 50) or 50)
+    volume_cap_ratio = float(pipeline_cfg.get("volume_cap_ratio", 3.0) or 3.0)
+    found_volume_score, volume_score = _precomputed_volume_score(
+        candles, configs, window=volume_window, cap_ratio=volume_cap_ratio
     )
+    if not found_volume_score:
+        volume_score = _volume_score_from_candles(
+            candles, window=volume_window, cap_ratio=volume_cap_ratio
+        )
 
     # data_quality in [0,1]; keep it conservative and deterministic
     data_quality = 1.0
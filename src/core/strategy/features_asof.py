@@ -94,6 +94,13 @@ from core.strategy.features_asof_parts.numeric_utils import (
 from core.strategy.features_asof_parts.precompute_utils import (
     remap_precomputed_features as _remap_precomputed_features_impl,
 )
+from core.strategy.features_asof_parts.result_cache_utils import (
+    IndexedFeatureResultCache,
+    feature_config_fingerprint,
+)
+from core.strategy.features_asof_parts.result_cache_utils import (
+    copy_cache_result as _copy_cache_result_impl,
+)
 from core.strategy.features_asof_parts.result_cache_utils import (
     feature_result_cache_lookup as _feature_result_cache_lookup_impl,
 )
@@ -135,6 +142,12 @@ try:
     _MAX_CACHE_SIZE = int(os.environ.get("GENESIS_FEATURE_CACHE_SIZE", "500"))
 except Exception:
     _MAX_CACHE_SIZE = 500
+# Keyed mode (backtests): results addressed by (dataset, feature config, bar index).
+try:
+    _MAX_INDEXED_CACHE_SIZE = int(os.environ.get("GENESIS_INDEXED_FEATURE_CACHE_SIZE", "20000"))
+except Exception:
+    _MAX_INDEXED_CACHE_SIZE = 20000
+_indexed_feature_cache = IndexedFeatureResultCache(max_entries=_MAX_INDEXED_CACHE_SIZE)
 _indicator_cache = IndicatorCache(max_size=2048)
 _INDICATOR_CACHE_ENABLED = not env_flag_enabled(
     os.getenv("GENESIS_DISABLE_INDICATOR_CACHE"), default=False
@@ -191,18 +204,44 @@ def _compute_candles_hash(candles: dict[str, list[float] | np.ndarray], asof_bar
     return _compute_candles_hash_impl(candles, asof_bar)
 
 
+def _keyed_cache_identity(cfg: dict[str, Any]) -> tuple[int, int] | None:
+    """Return (dataset_fingerprint, global_index) when the caller runs in keyed mode.
+
+    BacktestEngine injects ``_dataset_fingerprint`` once per run alongside the per-bar
+    ``_global_index``; together they identify the candle window without hashing it.
+    """
+    fingerprint = cfg.get("_dataset_fingerprint")
+    global_index = cfg.get("_global_index")
+    if type(fingerprint) is not int or type(global_index) is not int:
+        return None
+    return fingerprint, global_index
+
+
+def _feature_config_identity(cfg: Any) -> int:
+    """Fingerprint of the feature-affecting config (precomputed per run by BacktestEngine)."""
+    injected = cfg.get("_feature_config_fingerprint") if isinstance(cfg, dict) else None
+    if type(injected) is int:
+        return injected
+    return feature_config_fingerprint(cfg)
+
+
 def _compute_feature_cache_key(
     candles: dict[str, list[float] | np.ndarray],
     asof_bar: int,
     config: dict[str, Any] | None,
-) -> str:
+) -> str | tuple[int, int, int, int, int]:
     cfg = _as_config_dict(config)
-    candle_id = _compute_candles_hash(candles, asof_bar)
     use_precompute = os.environ.get("GENESIS_PRECOMPUTE_FEATURES") == "1" and bool(
         cfg.get("precomputed_features")
     )
+    config_id = _feature_config_identity(cfg if cfg or config is None else config)
+    keyed = _keyed_cache_identity(cfg)
+    if keyed is not None:
+        fingerprint, global_index = keyed
+        return (fingerprint, config_id, int(use_precompute), int(asof_bar), global_index)
+    candle_id = _compute_candles_hash(candles, asof_bar)
     mode = "precompute" if use_precompute else "runtime"
-    return f"{mode}:{int(asof_bar)}:{candle_id}"
+    return f"{mode}:{config_id:x}:{int(asof_bar)}:{candle_id}"
 
 
 def _clip(x: float, lo: float, hi: float) -> float:
@@ -347,14 +386,23 @@ def _build_fibonacci_updates_with_current_atr_period(
     )
 
 
-def _feature_cache_lookup(cache_key: str):
+def _feature_cache_lookup(cache_key: str | tuple[int, int, int, int, int]):
+    if isinstance(cache_key, tuple):
+        indexed = _indexed_feature_cache.lookup(cache_key)
+        return _copy_cache_result_impl(indexed) if indexed is not None else None
     cached_value = _feature_result_cache_lookup_impl(_feature_cache, cache_key)
     if cached_value is None:
         return None
     return copy.deepcopy(cached_value)
 
 
-def _feature_cache_store(cache_key: str, result: tuple[dict[str, float], dict[str, Any]]) -> None:
+def _feature_cache_store(
+    cache_key: str | tuple[int, int, int, int, int],
+    result: tuple[dict[str, float], dict[str, Any]],
+) -> None:
+    if isinstance(cache_key, tuple):
+        _indexed_feature_cache.store(cache_key, _copy_cache_result_impl(result))
+        return
     _feature_result_cache_store_impl(
         _feature_cache, cache_key, copy.deepcopy(result), _MAX_CACHE_SIZE
     )
@@ -6,6 +6,8 @@ from typing import Any
 
 import numpy as np
 
+from core.strategy.features_asof_parts.hash_utils import as_config_dict
+
 
 @dataclass(frozen=True)
 class ExtractionContext:
@@ -40,7 +42,7 @@ def prepare_extraction_context(
         len(closes) == asof_bar + 1
     ), f"Expected {asof_bar + 1} bars, got {len(closes)}"  # nosec B101
 
-    cfg = config or {}
+    cfg = as_config_dict(config)
     lookup_idx = cfg.get("_global_index", asof_bar)
     window_len = len(closes)
     window_start_idx = max(0, lookup_idx - (window_len - 1)) if window_len > 0 else 0
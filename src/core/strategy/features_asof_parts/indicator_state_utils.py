@@ -142,9 +142,16 @@ def build_indicator_state(
                 atr14_vals = atr14_full
             atr14_current = float(atr14_vals[-1]) if atr14_vals else None
 
+    # Precomputed volatility shift is ATR(period)/ATR50 keyed by period (the engine adds
+    # volatility_shift_{period} for the configured period); the unsuffixed precompute
+    # array is ATR14-based and only valid for the default period.
+    pre_vol_shift = pre.get(f"volatility_shift_{atr_period}")
+    if pre_vol_shift is None and atr_period == 14:
+        pre_vol_shift = pre.get("volatility_shift")
+
     pre_atr50_full = pre.get("atr_50")
     atr_long = None
-    if not pre.get("volatility_shift"):
+    if not pre_vol_shift:
         if isinstance(pre_atr50_full, list | tuple) and len(pre_atr50_full) > pre_idx:
             atr_long = list(pre_atr50_full[: pre_idx + 1])
         else:
@@ -161,7 +168,6 @@ def build_indicator_state(
                 indicator_cache_store_fn(key_atr50, atr_long_full)
                 atr_long = atr_long_full
 
-    pre_vol_shift = pre.get("volatility_shift")
     vol_shift_vals = None
     vol_shift_last_3: list[float] = []
     vol_shift_current = 1.0
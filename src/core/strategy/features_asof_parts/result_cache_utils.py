@@ -1,10 +1,46 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from collections import OrderedDict
 from typing import Any
 
 CacheResult = tuple[dict[str, float], dict[str, Any]]
 
+# Keyed (backtest) mode:
+# (dataset_fingerprint, feature_config_fingerprint, precompute_flag, asof_bar, global_index).
+IndexedCacheKey = tuple[int, int, int, int, int]
+
+# Config sections read by _extract_asof (ATR period, HTF/LTF fib and data source).
+_FEATURE_CONFIG_PATHS: tuple[tuple[str, ...], ...] = (
+    ("thresholds", "signal_adaptation"),
+    ("multi_timeframe",),
+    ("htf_fib",),
+    ("ltf_fib",),
+    ("data_source_policy",),
+)
+
+
+def feature_config_fingerprint(cfg: Any) -> int:
+    """Return a 63-bit digest of the config sections that change extracted features.
+
+    Accepts dicts as well as attribute-style configs (fib context reads
+    ``config.multi_timeframe`` directly).
+    """
+    material: dict[str, Any] = {}
+    for path in _FEATURE_CONFIG_PATHS:
+        node: Any = cfg
+        for key in path:
+            if isinstance(node, dict):
+                node = node.get(key)
+            else:
+                node = getattr(node, key, None)
+        if node is not None:
+            material[".".join(path)] = node
+    payload = json.dumps(material, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
 
 def feature_result_cache_lookup(cache: OrderedDict[str, CacheResult], cache_key: str):
     if cache_key not in cache:
@@ -31,3 +67,79 @@ def feature_result_cache_store(
     except Exception:
         if len(cache) > max_cache_size:
             cache.pop(next(iter(cache)))
+
+
+def _copy_structure(value: Any) -> Any:
+    # Cheaper than copy.deepcopy for the dict/list/scalar trees produced by _extract_asof.
+    if isinstance(value, dict):
+        return {k: _copy_structure(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_structure(v) for v in value]
+    return value
+
+
+def copy_cache_result(result: CacheResult) -> CacheResult:
+    """Return a copy of ``result`` that callers can mutate without touching the cache."""
+    features, meta = result
+    return dict(features), _copy_structure(meta)
+
+
+class IndexedFeatureResultCache:
+    """Feature results addressed by global bar index instead of hashed keys.
+
+    Every key element but the last (dataset, feature config, precompute flag,
+    asof_bar) names a namespace owning a flat slot list indexed by the last
+    element, ``global_index``. Only the ``max_namespaces`` most recently used
+    namespaces are retained, and at most ``max_entries`` results in total: older
+    namespaces are evicted first, then new results are simply not stored.
+    """
+
+    def __init__(self, max_namespaces: int = 4, max_entries: int = 20_000) -> None:
+        self.max_namespaces = max(1, int(max_namespaces))
+        self.max_entries = max(1, int(max_entries))
+        self._slots: OrderedDict[tuple[int, ...], list[CacheResult | None]] = OrderedDict()
+        self._counts: dict[tuple[int, ...], int] = {}
+
+    def lookup(self, key: IndexedCacheKey) -> CacheResult | None:
+        namespace, index = key[:-1], key[-1]
+        slots = self._slots.get(namespace)
+        if slots is None or index < 0 or index >= len(slots):
+            return None
+        return slots[index]
+
+    def _evict_oldest(self) -> None:
+        namespace, _slots = self._slots.popitem(last=False)
+        self._counts.pop(namespace, None)
+
+    def store(self, key: IndexedCacheKey, result: CacheResult) -> None:
+        namespace, index = key[:-1], key[-1]
+        if index < 0:
+            return
+        slots = self._slots.get(namespace)
+        if slots is None:
+            slots = []
+            self._slots[namespace] = slots
+            self._counts[namespace] = 0
+            while len(self._slots) > self.max_namespaces:
+                self._evict_oldest()
+        else:
+            self._slots.move_to_end(namespace)
+        if index < len(slots) and slots[index] is not None:
+            slots[index] = result
+            return
+        while len(self) >= self.max_entries and len(self._slots) > 1:
+            self._evict_oldest()
+        if len(self) >= self.max_entries:
+            return
+        if index >= len(slots):
+            # Grow geometrically so a forward bar replay stays amortised O(1).
+            slots.extend([None] * max(index + 1 - len(slots), len(slots)))
+        slots[index] = result
+        self._counts[namespace] += 1
+
+    def clear(self) -> None:
+        self._slots.clear()
+        self._counts.clear()
+
+    def __len__(self) -> int:
+        return sum(self._counts.values())
@@ -19,7 +19,7 @@ def finalize_feature_result(
     atr_vals: list[float] | np.ndarray | None,
     atr_period: int,
     atr_percentiles: dict[str, dict[str, float]],
-    cache_key: str,
+    cache_key: str | tuple[int, int, int, int, int],
     build_meta_fn,
     cache_store_fn,
 ) -> CacheResult:
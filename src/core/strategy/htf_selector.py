@@ -3,6 +3,12 @@ from __future__ import annotations
 from collections.abc import Mapping
 from typing import Any
 
+from core.indicators.htf_resample import (
+    can_derive_timeframe,
+    minutes_to_timeframe,
+    timeframe_to_minutes,
+)
+
 TIMEFRAME_TO_MINUTES: dict[str, int] = {
     "1m": 1,
     "5m": 5,
@@ -10,6 +16,7 @@ TIMEFRAME_TO_MINUTES: dict[str, int] = {
     "30m": 30,
     "1h": 60,
     "3h": 180,
+    "4h": 240,
     "6h": 360,
     "12h": 720,
     "1D": 1440,
@@ -44,14 +51,16 @@ def _apply_multiplier(base_timeframe: str, multiplier: Any) -> str | None:
         return None
     if mult <= 0:
         return None
-    base_minutes = TIMEFRAME_TO_MINUTES.get(base_timeframe)
+    base_minutes = TIMEFRAME_TO_MINUTES.get(base_timeframe) or timeframe_to_minutes(base_timeframe)
     if base_minutes is None:
         return None
     total_minutes = base_minutes * mult
     rounded = int(round(total_minutes))
-    if abs(total_minutes - rounded) > 1e-6:
+    if abs(total_minutes - rounded) > 1e-6 or rounded <= 0:
         return None
-    return MINUTES_TO_TIMEFRAME.get(rounded)
+    # Any exact multiple of the base timeframe can be resampled from base candles,
+    # so multipliers are no longer restricted to exchange-native timeframes.
+    return MINUTES_TO_TIMEFRAME.get(rounded) or minutes_to_timeframe(rounded)
 
 
 def _resolve_rule(rule: Any, ltf_timeframe: str, source: str) -> tuple[str | None, dict[str, Any]]:
@@ -117,6 +126,7 @@ def select_htf_timeframe(
     meta = {
         "mode": mode,
         "selected": selected,
+        "derivable": can_derive_timeframe(ltf_timeframe, selected),
         "decision_path": decision_path,
     }
     return selected, meta
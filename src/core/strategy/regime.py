@@ -10,8 +10,11 @@ Classifies market conditions into:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Literal
 
+from core.utils.compiled_config_cache import CompiledConfigCache
+
 # Regime types: bull/bear (trending), ranging (sideways), balanced (transition)
 Regime = Literal["bull", "bear", "ranging", "balanced"]
 
@@ -58,6 +61,116 @@ def _resolve_regime_definition_thresholds(config: dict[str, Any] | None) -> dict
     return thresholds
 
 
+@dataclass(frozen=True, slots=True)
+class RegimeClassifier:
+    """classify_regime() with thresholds and hysteresis resolved once from config.
+
+    Build it with compile_regime_classifier() and reuse it across bars when the
+    config is frozen (backtests, live sessions).
+    """
+
+    adx_trend_threshold: float
+    adx_range_threshold: float
+    slope_threshold: float
+    volatility_threshold: float
+    hysteresis_steps: int
+
+    def classify(
+        self,
+        htf_features: dict[str, float],
+        *,
+        prev_state: dict[str, Any] | None = None,
+    ) -> tuple[Regime, dict[str, Any]]:
+        """Classify one observation; see classify_regime() for the regime logic."""
+        # Extract features
+        adx = float(htf_features.get("adx", 0.0))
+        ema_slope = float(htf_features.get("ema_slope", 0.0))
+        price_vs_ema = float(htf_features.get("price_vs_ema", 0.0))
+        volatility = float(htf_features.get("volatility", 0.0))
+
+        # Determine candidate regime
+        candidate: Regime
+        adx_trending = adx > self.adx_trend_threshold
+
+        # Bull: Strong uptrend (require ADX + either price above EMA OR positive slope)
+        if adx_trending and (price_vs_ema > 0 or ema_slope > self.slope_threshold):
+            candidate = "bull"
+
+        # Bear: Strong downtrend (require ADX + either price below EMA OR negative slope)
+        elif adx_trending and (price_vs_ema < 0 or ema_slope < -self.slope_threshold):
+            candidate = "bear"
+
+        # Ranging: Low ADX and low volatility
+        elif adx < self.adx_range_threshold and volatility < self.volatility_threshold:
+            candidate = "ranging"
+
+        # Balanced: Transitional state
+        else:
+            candidate = "balanced"
+
+        # Hysteresis: Require N consecutive observations before regime change
+        ps = prev_state or {}
+        current = ps.get("regime", "balanced")
+        steps = int(ps.get("steps", 0))
+
+        if candidate == current:
+            # Same regime: reset counter
+            steps = 0
+            regime = current  # type: ignore[assignment]
+        else:
+            # Different regime: increment counter
+            steps += 1
+            if steps >= self.hysteresis_steps:
+                # Enough confirmation: change regime
+                regime = candidate
+                steps = 0
+            else:
+                # Not enough confirmation: hold current regime
+                regime = current  # type: ignore[assignment]
+
+        # Build state
+        state: dict[str, Any] = {
+            "regime": regime,
+            "steps": steps,
+            "candidate": candidate,
+            "features": {
+                "adx": adx,
+                "ema_slope": ema_slope,
+                "price_vs_ema": price_vs_ema,
+                "volatility": volatility,
+            },
+        }
+
+        return regime, state
+
+
+def _build_regime_classifier(mtf_cfg: Any, gates_cfg: Any) -> RegimeClassifier:
+    thresholds = _resolve_regime_definition_thresholds({"multi_timeframe": mtf_cfg})
+    return RegimeClassifier(
+        adx_trend_threshold=thresholds["adx_trend_threshold"],
+        adx_range_threshold=thresholds["adx_range_threshold"],
+        slope_threshold=thresholds["slope_threshold"],
+        volatility_threshold=thresholds["volatility_threshold"],
+        hysteresis_steps=int(dict(gates_cfg or {}).get("hysteresis_steps") or 2),
+    )
+
+
+_REGIME_CLASSIFIER_CACHE: CompiledConfigCache[RegimeClassifier] = CompiledConfigCache(
+    _build_regime_classifier
+)
+
+
+def compile_regime_classifier(config: dict[str, Any] | None = None) -> RegimeClassifier:
+    """
+    Resolve regime thresholds and hysteresis from config into a RegimeClassifier.
+
+    Results are cached per (multi_timeframe, gates) config objects, so calling
+    this on every bar with the same frozen config does not re-walk the dicts.
+    """
+    cfg = config or {}
+    return _REGIME_CLASSIFIER_CACHE.get(cfg.get("multi_timeframe"), cfg.get("gates"))
+
+
 def classify_regime(
     htf_features: dict[str, float],
     *,
@@ -85,76 +198,7 @@ def classify_regime(
         - Ranging: ADX < 20, low volatility
         - Balanced: Transitional state
     """
-    # Extract features
-    adx = float(htf_features.get("adx", 0.0))
-    ema_slope = float(htf_features.get("ema_slope", 0.0))
-    price_vs_ema = float(htf_features.get("price_vs_ema", 0.0))
-    volatility = float(htf_features.get("volatility", 0.0))
-
-    # Configuration
-    cfg = dict(config or {})
-    hysteresis_steps = int((cfg.get("gates") or {}).get("hysteresis_steps") or 2)
-
-    # Thresholds
-    thresholds = _resolve_regime_definition_thresholds(cfg)
-    adx_trend_threshold = thresholds["adx_trend_threshold"]
-    adx_range_threshold = thresholds["adx_range_threshold"]
-    slope_threshold = thresholds["slope_threshold"]
-    volatility_threshold = thresholds["volatility_threshold"]
-
-    # Determine candidate regime
-    candidate: Regime
-
-    # Bull: Strong uptrend (require ADX + either price above EMA OR positive slope)
-    if adx > adx_trend_threshold and (price_vs_ema > 0 or ema_slope > slope_threshold):
-        candidate = "bull"
-
-    # Bear: Strong downtrend (require ADX + either price below EMA OR negative slope)
-    elif adx > adx_trend_threshold and (price_vs_ema < 0 or ema_slope < -slope_threshold):
-        candidate = "bear"
-
-    # Ranging: Low ADX and low volatility
-    elif adx < adx_range_threshold and volatility < volatility_threshold:
-        candidate = "ranging"
-
-    # Balanced: Transitional state
-    else:
-        candidate = "balanced"
-
-    # Hysteresis: Require N consecutive observations before regime change
-    ps = dict(prev_state or {})
-    current = ps.get("regime", "balanced")
-    steps = int(ps.get("steps", 0))
-
-    if candidate == current:
-        # Same regime: reset counter
-        steps = 0
-        regime = current  # type: ignore[assignment]
-    else:
-        # Different regime: increment counter
-        steps += 1
-        if steps >= hysteresis_steps:
-            # Enough confirmation: change regime
-            regime = candidate
-            steps = 0
-        else:
-            # Not enough confirmation: hold current regime
-            regime = current  # type: ignore[assignment]
-
-    # Build state
-    state: dict[str, Any] = {
-        "regime": regime,
-        "steps": steps,
-        "candidate": candidate,
-        "features": {
-            "adx": adx,
-            "ema_slope": ema_slope,
-            "price_vs_ema": price_vs_ema,
-            "volatility": volatility,
-        },
-    }
-
-    return regime, state
+    return compile_regime_classifier(config).classify(htf_features, prev_state=prev_state)
 
 
 def detect_regime_from_candles(
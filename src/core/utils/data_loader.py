@@ -4,13 +4,36 @@ from pathlib import Path
 
 import pandas as pd
 
+from core.utils.feature_store import FeatureKey, default_feature_store, feature_spec_hash
+
 
 def load_features(symbol: str, timeframe: str, version: str | None = "v17") -> pd.DataFrame:
     """
     Load features with smart format selection.
 
     Tries curated (v18/v17) first, then archive, then legacy. Supports timestamped files.
+    The resolved file is read through the shared feature store (core.utils.feature_store),
+    so repeated loads in one process are served from memory and later processes
+    memory-map the stored columns instead of decoding feather/parquet again.
     """
+    path = _resolve_features_path(symbol, timeframe, version)
+    stat = path.stat()
+    key = FeatureKey(
+        symbol=symbol,
+        timeframe=timeframe,
+        spec_hash=feature_spec_hash({"source": "features_file", "name": path.name}),
+        # Source identity: a rewritten file gets a new entry instead of stale columns.
+        data_id=f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}",
+    )
+    if path.suffix == ".feather":
+        return default_feature_store().get_frame(key, load=lambda: pd.read_feather(path))
+    return default_feature_store().get_frame(
+        key, load=lambda: pd.read_parquet(path, engine="pyarrow")
+    )
+
+
+def _resolve_features_path(symbol: str, timeframe: str, version: str | None) -> Path:
+    """Return the first existing feature file for ``symbol``/``timeframe``/``version``."""
     if version:
         version = version.lower()
 
@@ -68,7 +91,7 @@ def load_features(symbol: str, timeframe: str, version: str | None = "v17") -> p
             )
             for path in feather_candidates:
                 if path.exists():
-                    return pd.read_feather(path)
+                    return path
 
             parquet_candidates = (
                 _curated_candidates(base, suffix, ".parquet")
@@ -77,7 +100,7 @@ def load_features(symbol: str, timeframe: str, version: str | None = "v17") -> p
             )
             for path in parquet_candidates:
                 if path.exists():
-                    return pd.read_parquet(path, engine="pyarrow")
+                    return path
 
     raise FileNotFoundError(
         f"Features not found for {symbol} {timeframe}. Tried versions {versions_to_try}"
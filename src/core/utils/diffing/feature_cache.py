@@ -40,6 +40,10 @@ class IndicatorCache:
             self._order.append(key)
         return value
 
+    def clear(self) -> None:
+        self._store.clear()
+        self._order.clear()
+
     def store(self, key: IndicatorFingerprint, value: Any) -> None:
         self._store[key] = value
         if key in self._order:
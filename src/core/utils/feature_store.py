@@ -0,0 +1,379 @@
+"""Shared feature store for ML training, backtests and analysis.
+
+Feature columns are addressed by ``FeatureKey(symbol, timeframe, spec_hash,
+data_id)`` and kept in two layers:
+
+- in process: a small FIFO of column arrays, so optimizer trials, training
+  folds and analysis code in one process compute/load a feature set once;
+- on disk (optional): one ``.npy`` file per column plus ``manifest.json`` under
+  ``cache/feature_store/<symbol>/<timeframe>/<entry>/``. Columns are read with
+  ``mmap_mode="r"``, so large matrices are paged in instead of decoded.
+
+Missing columns are computed lazily through a caller-supplied ``compute``
+callback and then stored. Arrays handed out are read-only because they are
+shared between callers; copy before mutating.
+
+The process-wide default store only reads existing entries from disk; set
+``GENESIS_FEATURE_STORE_WRITE=1`` to persist new ones and
+``GENESIS_FEATURE_STORE_DIR`` to move the on-disk root (default is the
+gitignored ``cache/feature_store``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from core.utils import timeframe_filename_suffix
+from core.utils.env_flags import env_flag_enabled
+
+# Bump when the on-disk layout or manifest semantics change.
+FEATURE_STORE_FORMAT_VERSION = 1
+
+_DEFAULT_ROOT = Path("cache/feature_store")
+_MANIFEST_FILENAME = "manifest.json"
+
+
+def feature_spec_hash(spec: Any) -> str:
+    """Return a short stable digest of a JSON-serialisable feature spec."""
+    canon = json.dumps(spec, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canon.encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class FeatureKey:
+    """Address of one feature set.
+
+    ``spec_hash`` identifies how the features are produced (see
+    feature_spec_hash); ``data_id`` identifies the input data (source path,
+    content fingerprint, cache key, ...). Both must change when the columns would.
+    """
+
+    symbol: str
+    timeframe: str
+    spec_hash: str
+    data_id: str = ""
+
+    def entry_name(self) -> str:
+        if not self.data_id:
+            return self.spec_hash
+        data_digest = hashlib.sha256(self.data_id.encode("utf-8")).hexdigest()[:12]
+        return f"{self.spec_hash}_{data_digest}"
+
+
+@dataclass
+class _Entry:
+    columns: dict[str, np.ndarray]
+    column_meta: dict[str, dict[str, Any]]
+    order: list[str]
+    frame: bool = False  # True once every column of a stored frame is present
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    if array.flags.writeable:
+        array = array.view()
+        array.flags.writeable = False
+    return array
+
+
+def _encode_series(series: pd.Series) -> tuple[np.ndarray, dict[str, Any]] | None:
+    """Return (array, meta) for a frame column, or None if it cannot be stored as .npy."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        values = series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy(copy=True)
+        return values, {"tz": str(dtype.tz)}
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufM":
+        # Copy: the caller keeps the frame and may mutate it in place.
+        return series.to_numpy(copy=True), {}
+    return None
+
+
+def _decode_column(array: np.ndarray, meta: Mapping[str, Any]) -> Any:
+    tz = meta.get("tz")
+    if tz:
+        return pd.Series(array).dt.tz_localize("UTC").dt.tz_convert(tz)
+    return array
+
+
+class FeatureStore:
+    """Versioned, columnar feature store (in process, optionally on disk)."""
+
+    def __init__(
+        self,
+        root: Path | str | None = _DEFAULT_ROOT,
+        *,
+        max_entries: int = 8,
+        mmap: bool = True,
+        write_enabled: bool = True,
+    ) -> None:
+        self.root = Path(root) if root is not None else None
+        self.mmap = mmap
+        self.write_enabled = write_enabled
+        self._max_entries = max(1, int(max_entries))
+        self._entries: dict[FeatureKey, _Entry] = {}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------ paths
+    def entry_dir(self, key: FeatureKey) -> Path | None:
+        if self.root is None:
+            return None
+        return self.root / key.symbol / timeframe_filename_suffix(key.timeframe) / key.entry_name()
+
+    # --------------------------------------------------------------- reading
+    def available(self, key: FeatureKey) -> tuple[str, ...]:
+        """Names of all columns stored for ``key`` (memory and disk)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            names = list(entry.order) if entry else []
+        manifest = self._read_manifest(key)
+        if manifest:
+            names.extend(n for n in manifest["order"] if n not in names)
+        return tuple(names)
+
+    def get(
+        self,
+        key: FeatureKey,
+        columns: Iterable[str] | None = None,
+        *,
+        compute: Callable[[tuple[str, ...]], Mapping[str, Any]] | None = None,
+        persist: bool | None = None,
+    ) -> dict[str, np.ndarray]:
+        """Return the requested columns for ``key`` as read-only arrays.
+
+        Columns are served from memory, then disk; any still missing are produced
+        by ``compute(missing)`` (which may return extra columns) and stored.
+        ``columns=None`` returns everything stored. Raises KeyError when columns
+        are missing and no ``compute`` is given or it does not provide them.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            wanted = tuple(columns) if columns is not None else None
+            if wanted is None:
+                names = self.available(key)
+            else:
+                names = wanted
+
+            missing = [n for n in names if entry is None or n not in entry.columns]
+            if missing:
+                loaded = self._load_from_disk(key, missing)
+                if loaded:
+                    entry = self._remember(key, *loaded)
+                    missing = [n for n in missing if n not in entry.columns]
+            if missing:
+                if compute is None:
+                    raise KeyError(f"Features {missing} not stored for {key}")
+                produced = compute(tuple(missing))
+                absent = [n for n in missing if n not in produced]
+                if absent:
+                    raise KeyError(f"compute() did not produce {absent} for {key}")
+                self.put(key, produced, persist=persist)
+                entry = self._entries[key]
+
+            if entry is None:
+                return {}
+            return {n: entry.columns[n] for n in names}
+
+    def get_frame(
+        self,
+        key: FeatureKey,
+        *,
+        load: Callable[[], pd.DataFrame],
+        persist: bool | None = None,
+    ) -> pd.DataFrame:
+        """Return a fresh DataFrame for ``key``, calling ``load()`` only on a miss.
+
+        Frames with a default RangeIndex and numeric/datetime columns are stored
+        column-wise; anything else is passed through and loaded on every call.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.frame:
+                loaded = self._load_from_disk(key, None)
+                entry = self._remember(key, *loaded) if loaded else None
+                if entry is not None:
+                    entry.frame = True
+            if entry is None:
+                df = load()
+                if self._put_frame(key, df, persist=persist):
+                    self._entries[key].frame = True
+                return df
+            return pd.DataFrame(
+                {n: _decode_column(entry.columns[n], entry.column_meta[n]) for n in entry.order},
+                copy=True,
+            )
+
+    # --------------------------------------------------------------- writing
+    def put(
+        self,
+        key: FeatureKey,
+        columns: Mapping[str, Any],
+        *,
+        column_meta: Mapping[str, Mapping[str, Any]] | None = None,
+        persist: bool | None = None,
+    ) -> None:
+        """Store columns for ``key`` (merged with columns already stored)."""
+        arrays = {name: _read_only(np.asarray(values)) for name, values in columns.items()}
+        meta = {name: dict((column_meta or {}).get(name) or {}) for name in arrays}
+        with self._lock:
+            self._remember(key, arrays, meta, list(arrays))
+            if self.write_enabled and (persist is None or persist):
+                self._write_to_disk(key, arrays, meta)
+
+    def _put_frame(self, key: FeatureKey, df: pd.DataFrame, *, persist: bool | None) -> bool:
+        arrays: dict[str, np.ndarray] = {}
+        meta: dict[str, dict[str, Any]] = {}
+        index = df.index
+        storable = (
+            isinstance(index, pd.RangeIndex)
+            and index.start == 0
+            and index.step == 1
+            and df.columns.is_unique
+            and all(isinstance(name, str) for name in df.columns)
+        )
+        for name in df.columns:
+            encoded = _encode_series(df[name]) if storable else None
+            if encoded is None:
+                storable = False
+                break
+            arrays[name], meta[name] = encoded
+        if storable:
+            self.put(key, arrays, column_meta=meta, persist=persist)
+        return storable
+
+    def clear(self) -> None:
+        """Drop the in-process layer (on-disk entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    # -------------------------------------------------------------- internals
+    def _remember(
+        self,
+        key: FeatureKey,
+        columns: dict[str, np.ndarray],
+        column_meta: dict[str, dict[str, Any]],
+        order: list[str],
+    ) -> _Entry:
+        entry = self._entries.get(key)
+        if entry is None:
+            if len(self._entries) >= self._max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            entry = _Entry({}, {}, [])
+            self._entries[key] = entry
+        for name in order:
+            if name not in entry.columns:
+                entry.order.append(name)
+            entry.columns[name] = columns[name]
+            entry.column_meta[name] = column_meta.get(name, {})
+        return entry
+
+    def _read_manifest(self, key: FeatureKey) -> dict[str, Any] | None:
+        entry_dir = self.entry_dir(key)
+        if entry_dir is None:
+            return None
+        try:
+            manifest = json.loads((entry_dir / _MANIFEST_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict):
+            return None
+        if manifest.get("format_version") != FEATURE_STORE_FORMAT_VERSION:
+            return None
+        if manifest.get("spec_hash") != key.spec_hash or manifest.get("data_id") != key.data_id:
+            return None
+        return manifest
+
+    def _load_from_disk(
+        self, key: FeatureKey, names: Iterable[str] | None
+    ) -> tuple[dict[str, np.ndarray], dict[str, dict[str, Any]], list[str]] | None:
+        manifest = self._read_manifest(key)
+        if not manifest:
+            return None
+        entry_dir = self.entry_dir(key)
+        assert entry_dir is not None
+        stored = manifest["columns"]
+        order = [n for n in (manifest["order"] if names is None else names) if n in stored]
+        columns: dict[str, np.ndarray] = {}
+        meta: dict[str, dict[str, Any]] = {}
+        for name in order:
+            info = stored[name]
+            try:
+                array = np.load(
+                    entry_dir / info["file"],
+                    mmap_mode="r" if self.mmap else None,
+                    allow_pickle=False,
+                )
+            except (OSError, ValueError):
+                return None
+            columns[name] = _read_only(array)
+            meta[name] = dict(info.get("meta") or {})
+        return columns, meta, order
+
+    def _write_to_disk(
+        self,
+        key: FeatureKey,
+        arrays: Mapping[str, np.ndarray],
+        meta: Mapping[str, Mapping[str, Any]],
+    ) -> None:
+        entry_dir = self.entry_dir(key)
+        if entry_dir is None:
+            return
+        try:
+            entry_dir.mkdir(parents=True, exist_ok=True)
+            manifest = self._read_manifest(key) or {
+                "format_version": FEATURE_STORE_FORMAT_VERSION,
+                "symbol": key.symbol,
+                "timeframe": key.timeframe,
+                "spec_hash": key.spec_hash,
+                "data_id": key.data_id,
+                "columns": {},
+                "order": [],
+            }
+            for name, array in arrays.items():
+                file_name = f"{hashlib.sha256(name.encode('utf-8')).hexdigest()[:16]}.npy"
+                tmp_path = entry_dir / f".{file_name}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as fh:
+                    np.save(fh, np.ascontiguousarray(array), allow_pickle=False)
+                os.replace(tmp_path, entry_dir / file_name)
+                if name not in manifest["columns"]:
+                    manifest["order"].append(name)
+                manifest["columns"][name] = {
+                    "file": file_name,
+                    "dtype": str(array.dtype),
+                    "shape": list(array.shape),
+                    "meta": dict(meta.get(name) or {}),
+                }
+            tmp_manifest = entry_dir / f".{_MANIFEST_FILENAME}.{os.getpid()}.tmp"
+            tmp_manifest.write_text(json.dumps(manifest, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_manifest, entry_dir / _MANIFEST_FILENAME)
+        except (OSError, ValueError):
+            # The store is a cache: a failed write only costs a recompute next process.
+            return
+
+
+_DEFAULT_STORE: FeatureStore | None = None
+_DEFAULT_STORE_LOCK = threading.Lock()
+
+
+def default_feature_store() -> FeatureStore:
+    """Return the process-wide store shared by load_features and backtest precompute."""
+    global _DEFAULT_STORE
+    if _DEFAULT_STORE is None:
+        with _DEFAULT_STORE_LOCK:
+            if _DEFAULT_STORE is None:
+                _DEFAULT_STORE = FeatureStore(
+                    os.getenv("GENESIS_FEATURE_STORE_DIR") or _DEFAULT_ROOT,
+                    # Opt-in: persisting is a second full copy of every feature file.
+                    write_enabled=env_flag_enabled(
+                        os.getenv("GENESIS_FEATURE_STORE_WRITE"), default=False
+                    ),
+                )
+    return _DEFAULT_STORE
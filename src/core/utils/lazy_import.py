@@ -0,0 +1,82 @@
+"""Deferred imports for heavy and optional third-party dependencies.
+
+Entry points (core.pipeline, core.server, optimizer workers, CLI scripts) should
+not pay for optuna, sklearn, numba, yaml or pandas unless the code path that
+needs them actually runs. ``lazy_import("optuna")`` returns a module proxy that
+imports the real module on first attribute access; ``module_available`` checks
+for an optional dependency without importing it.
+
+See scripts/audit/import_time_audit.py for the measured startup budget.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule(ModuleType):
+    """Module proxy that imports ``name`` on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a proxy for module ``name``; the import happens on first use.
+
+    A missing module raises ModuleNotFoundError at first use, not here.
+    """
+    return LazyModule(name)
+
+
+def module_available(name: str) -> bool:
+    """True if ``name`` can be imported (checked without importing it)."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def resolve_lazy_attribute(namespace: dict[str, Any], name: str, exports: dict[str, str]) -> Any:
+    """Return ``namespace[name]``, importing it from module ``exports[name]`` on first use.
+
+    Intended for a module-level ``__getattr__`` (PEP 562) plus call sites that
+    pass ``globals()``: the resolved object is cached in the namespace, so
+    monkeypatching the module attribute keeps working as a test seam.
+    """
+    try:
+        return namespace[name]
+    except KeyError:
+        pass
+    module_name = exports.get(name)
+    if module_name is None:
+        raise AttributeError(name)
+    value = getattr(importlib.import_module(module_name), name)
+    namespace[name] = value
+    return value
@@ -1,48 +1,175 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import struct
 import time
 from pathlib import Path
 from threading import Lock
 
-# Lagra nonces lokalt per API‑nyckel för strikt växande sekvens (mikrosekunder)
+try:  # POSIX only; Windows falls back to process-local counters
+    import fcntl
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None  # type: ignore[assignment]
+
+# Lagra nonces lokalt per API‑nyckel för strikt växande sekvens (mikrosekunder).
+#
+# Allokering sker i minnet. Till disk skrivs endast en reserverad high-water mark
+# (lease) per nyckel, NONCE_LEASE_MICRO före senast utdelade nonce, så en omstart
+# aldrig kan backa. Mellan processer delas räknaren via en liten fcntl-låst fil
+# (NONCE_FILE med suffix .counters) som läses/skrivs med pread/pwrite.
 NONCE_FILE = Path(__file__).parent / ".nonce_tracker.json"
+NONCE_LEASE_MICRO = 10_000_000
+
 _lock = Lock()
+# key_id -> [last_issued, reserved_high_water_mark]
+_state: dict[str, list[int]] = {}
+
+# Delad räknarfil: fasta slots med (key_digest, last_issued, reserved).
+_SLOT = struct.Struct("<8sqq")
+_SLOT_COUNT = 64
+# (path, pid, fd): flock-lås hör till den öppna filbeskrivningen, som delas efter fork().
+# En forkad process måste därför öppna filen på nytt för att låsen ska utesluta varandra.
+_shared_fd: tuple[str, int, int] | None = None
+
+
+def _now_micro() -> int:
+    return int(time.time() * 1_000_000)
+
+
+def _counters_path() -> Path:
+    return NONCE_FILE.with_suffix(".counters")
+
+
+def _read_leases() -> dict[str, int]:
+    try:
+        content = NONCE_FILE.read_text(encoding="utf-8").strip()
+        data = json.loads(content) if content else {}
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _persist_lease(key_id: str, reserved: int) -> None:
+    """Spara high-water mark för key_id (atomiskt, fsync) – endast vid ny lease."""
+    data = _read_leases()
+    try:
+        if int(data.get(key_id, 0) or 0) >= reserved:
+            return
+    except (TypeError, ValueError):
+        pass
+    data[key_id] = reserved
+    try:
+        NONCE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = NONCE_FILE.with_name(f"{NONCE_FILE.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data, indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, NONCE_FILE)
+    except OSError as io_err:
+        # Undvik hårt fail i hot path; in-memory-räknaren är fortfarande strikt växande.
+        print(f"nonce_manager: lease write failed: {io_err}")
+
+
+def _shared_counter_fd() -> int | None:
+    global _shared_fd
+    if fcntl is None:
+        return None
+    path = str(_counters_path())
+    pid = os.getpid()
+    if _shared_fd is not None:
+        cached_path, cached_pid, cached_fd = _shared_fd
+        if cached_path == path and cached_pid == pid:
+            return cached_fd
+        try:
+            # Stänger bara denna process kopia; föräldern behåller sin beskrivning.
+            os.close(cached_fd)
+        except OSError:
+            pass
+        _shared_fd = None
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_CLOEXEC", 0), 0o600)
+    except OSError:
+        return None
+    _shared_fd = (path, pid, fd)
+    return fd
+
+
+def _find_slot(fd: int, digest: bytes) -> tuple[int, int, int]:
+    """Return (offset, last_issued, reserved) for digest; claims an empty slot if needed."""
+    raw = os.pread(fd, _SLOT.size * _SLOT_COUNT, 0)
+    empty_offset: int | None = None
+    for i in range(_SLOT_COUNT):
+        offset = i * _SLOT.size
+        chunk = raw[offset : offset + _SLOT.size]
+        if len(chunk) < _SLOT.size:
+            chunk = b"\x00" * _SLOT.size
+        slot_digest, last, reserved = _SLOT.unpack(chunk)
+        if slot_digest == digest:
+            return offset, last, reserved
+        if empty_offset is None and slot_digest == b"\x00" * 8:
+            empty_offset = offset
+    if empty_offset is None:
+        # Tabellen full (osannolikt): återanvänd slot via digest, räknaren är monoton ändå.
+        empty_offset = (int.from_bytes(digest, "big") % _SLOT_COUNT) * _SLOT.size
+    return empty_offset, 0, 0
+
+
+def _allocate(key_id: str, advance) -> int:
+    """Allokera nästa nonce för key_id; ``advance(last, now)`` ger nytt värde.
+
+    Anropas med ``_lock`` hållet. Disk-I/O sker bara när en ny lease behövs.
+    """
+    now = _now_micro()
+    state = _state.get(key_id)
+    fd = _shared_counter_fd()
+    if fd is None:
+        if state is None:
+            hwm = int(_read_leases().get(key_id, 0) or 0)
+            state = [hwm, hwm]
+            _state[key_id] = state
+        nonce = advance(state[0], now)
+        if nonce > state[1]:
+            state[1] = nonce + NONCE_LEASE_MICRO
+            _persist_lease(key_id, state[1])
+        state[0] = nonce
+        return nonce
+
+    digest = hashlib.blake2b(key_id.encode("utf-8"), digest_size=8).digest()
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    try:
+        offset, shared_last, shared_reserved = _find_slot(fd, digest)
+        if shared_last == 0 and shared_reserved == 0:
+            # Ny/förlorad räknarfil: starta ovanför persisterad lease.
+            hwm = int(_read_leases().get(key_id, 0) or 0)
+            shared_last = shared_reserved = hwm
+        last = max(shared_last, state[0] if state else 0)
+        nonce = advance(last, now)
+        reserved = max(shared_reserved, state[1] if state else 0)
+        if nonce > reserved:
+            reserved = nonce + NONCE_LEASE_MICRO
+            _persist_lease(key_id, reserved)
+        os.pwrite(fd, _SLOT.pack(digest, nonce, reserved), offset)
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    _state[key_id] = [nonce, reserved]
+    return nonce
 
 
 def get_nonce(key_id: str) -> str:
     """Returnerar en strikt ökande nonce per API‑nyckel i mikrosekunder.
 
-    Persistens används för att undvika backstep efter omstart.
+    Persistens (lease high-water mark) används för att undvika backstep efter omstart.
     """
-    now = int(time.time() * 1_000_000)
     with _lock:
         try:
-            if NONCE_FILE.exists():
-                try:
-                    content = NONCE_FILE.read_text(encoding="utf-8").strip()
-                    data = json.loads(content) if content else {}
-                except Exception:
-                    data = {}
-            else:
-                data = {}
-
-            last_nonce = int(data.get(key_id, 0) or 0)
-            new_nonce = max(now, last_nonce + 1)
-            data[key_id] = new_nonce
-
-            NONCE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                NONCE_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
-            except (OSError, PermissionError, json.JSONDecodeError) as io_err:
-                # Fallback: logga lätt och returnera ändå nytt värde
-                # (undvik hårt fail i hot path)
-                print(f"nonce_manager: write failed: {io_err}")
-
-            return str(new_nonce)
+            return str(_allocate(key_id, lambda last, now: max(now, last + 1)))
         except Exception:
             # Fallback vid I/O-problem: returnera current time
-            return str(now)
+            return str(_now_micro())
 
 
 def bump_nonce(key_id: str, min_increment_micro: int = 1_000_000) -> str:
@@ -50,27 +177,9 @@ def bump_nonce(key_id: str, min_increment_micro: int = 1_000_000) -> str:
 
     Används vid t.ex. Bitfinex 10114 ("nonce too small").
     """
-    now = int(time.time() * 1_000_000)
+    inc = int(min_increment_micro)
     with _lock:
         try:
-            data = {}
-            if NONCE_FILE.exists():
-                try:
-                    content = NONCE_FILE.read_text(encoding="utf-8").strip()
-                    data = json.loads(content) if content else {}
-                except Exception:
-                    data = {}
-
-            last_nonce = int(data.get(key_id, 0) or 0)
-            target = max(last_nonce + int(min_increment_micro), now + int(min_increment_micro))
-            data[key_id] = target
-
-            NONCE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                NONCE_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
-            except (OSError, PermissionError, json.JSONDecodeError) as io_err:
-                print(f"nonce_manager: bump write failed: {io_err}")
-
-            return str(target)
+            return str(_allocate(key_id, lambda last, now: max(last + inc, now + inc)))
         except Exception:
-            return str(now + int(min_increment_micro))
+            return str(_now_micro() + inc)
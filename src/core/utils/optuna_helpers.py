@@ -57,11 +57,11 @@ from typing import Any
 
 import numpy as np
 
-try:
-    import optuna
-    from optuna.storages import RDBStorage
-except Exception as e:  # pragma: no cover
-    raise RuntimeError("optuna must be installed to use this module") from e
+from core.utils.lazy_import import lazy_import
+
+# Deferred: set_global_seeds() and the signature helpers do not need optuna, and
+# importing it costs several hundred milliseconds per process.
+optuna = lazy_import("optuna")
 
 LOGGER = logging.getLogger(__name__)
 
@@ -96,9 +96,13 @@ def set_global_seeds(seed: int = 42) -> None:
 # --- Storage ----------------------------------------------------------------
 
 
-def ensure_storage(url: str, heartbeat_interval: int = 60, grace_period: int = 120) -> RDBStorage:
+def ensure_storage(
+    url: str, heartbeat_interval: int = 60, grace_period: int = 120
+) -> optuna.storages.RDBStorage:
     """Create an Optuna RDBStorage with heartbeat (SQLite/Postgres/MySQL URLs)."""
-    return RDBStorage(url=url, heartbeat_interval=heartbeat_interval, grace_period=grace_period)
+    return optuna.storages.RDBStorage(
+        url=url, heartbeat_interval=heartbeat_interval, grace_period=grace_period
+    )
 
 
 # --- Samplers ---------------------------------------------------------------
@@ -8,11 +8,80 @@ att model training kan reproduceras exakt.
 import hashlib
 import json
 import sys
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+# Identifierar hashschemat i provenance records (saknas => legacy CSV-hash).
+DATA_HASH_SCHEME = "columnar_v1"
+DEFAULT_FINGERPRINT_CHUNK_ROWS = 1_000_000
+
+
+def _column_buffers(series: pd.Series, chunk_rows: int) -> Iterator[np.ndarray]:
+    """Yield contiguous byte-hashable chunks for one column.
+
+    Numeriska/bool/datetime-kolumner hashas direkt från NumPy-bufferten; övriga
+    dtypes (object, string, category, nullable) via pandas vektoriserade radhash.
+    """
+    dtype = series.dtype
+    n = len(series)
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        values: np.ndarray | None = series.to_numpy(dtype="datetime64[ns]")
+    elif isinstance(dtype, np.dtype) and dtype.kind in "biufcmM":
+        values = series.to_numpy(copy=False)
+    else:
+        values = None
+
+    for start in range(0, n, chunk_rows):
+        if values is not None:
+            chunk = values[start : start + chunk_rows]
+        else:
+            chunk = pd.util.hash_pandas_object(
+                series.iloc[start : start + chunk_rows], index=False
+            ).to_numpy()
+        yield np.ascontiguousarray(chunk)
+
+
+def fingerprint_dataframe(
+    df: pd.DataFrame,
+    *,
+    columns: Sequence[str] | None = None,
+    sort: bool = True,
+    chunk_rows: int | None = None,
+) -> str:
+    """
+    Kolumnär SHA-256-fingerprint av en DataFrame (64-char hex).
+
+    Hashar råa NumPy-buffertar per kolumn med inramning av form, kolumnnamn och
+    dtype, i stället för att serialisera hela frame:n till CSV. Hashningen sker i
+    chunks om ``chunk_rows`` rader så att minnesåtgången är begränsad.
+
+    Args:
+        df: DataFrame att hasha
+        columns: Delmängd kolumner (default: alla)
+        sort: Sortera kolumner på namn och rader på index (samma ordning som
+            legacy ``hash_dataframe``); False hashar i befintlig ordning
+        chunk_rows: Rader per chunk (default DEFAULT_FINGERPRINT_CHUNK_ROWS)
+    """
+    frame = df if columns is None else df.loc[:, list(columns)]
+    if sort:
+        frame = frame.sort_index(axis=1)
+        if not frame.index.is_monotonic_increasing:
+            frame = frame.sort_index(axis=0)
+    rows = max(1, int(chunk_rows or DEFAULT_FINGERPRINT_CHUNK_ROWS))
+
+    hasher = hashlib.sha256()
+    hasher.update(f"{DATA_HASH_SCHEME}|rows={len(frame)}|cols={frame.shape[1]}".encode())
+    for name in frame.columns:
+        series = frame[name]
+        hasher.update(f"|col={name!s}|dtype={series.dtype!s}|".encode())
+        for chunk in _column_buffers(series, rows):
+            hasher.update(chunk.view(np.uint8).data)
+    return hasher.hexdigest()
+
 
 def hash_dataframe(df: pd.DataFrame) -> str:
     """
@@ -22,15 +91,15 @@ def hash_dataframe(df: pd.DataFrame) -> str:
         df: DataFrame att hasha
 
     Returns:
-        16-char hex hash
+        16-char hex hash (kolumnär fingerprint, se ``fingerprint_dataframe``)
     """
-    # Sort för konsistens
-    df_sorted = df.sort_index(axis=1).sort_index(axis=0)
+    return fingerprint_dataframe(df)[:16]
 
-    # Convert till bytes
-    data_bytes = df_sorted.to_csv(index=False).encode("utf-8")
 
-    # SHA256 hash (trunc till 16 chars)
+def hash_dataframe_legacy_csv(df: pd.DataFrame) -> str:
+    """Legacy CSV-baserad hash; används bara för att verifiera äldre provenance records."""
+    df_sorted = df.sort_index(axis=1).sort_index(axis=0)
+    data_bytes = df_sorted.to_csv(index=False).encode("utf-8")
     return hashlib.sha256(data_bytes).hexdigest()[:16]
 
 
@@ -80,6 +149,7 @@ def create_provenance_record(
     return {
         "timestamp": datetime.now().isoformat(),
         "data_hash": hash_dataframe(features_df),
+        "data_hash_scheme": DATA_HASH_SCHEME,
         "labels_hash": hash_list([label if label is not None else -1 for label in labels]),
         "config_hash": hash_config(config),
         "model_path": str(model_path),
@@ -138,7 +208,10 @@ def verify_reproducibility(model_path: Path, current_features_df: pd.DataFrame)
     with open(provenance_path) as f:
         original_provenance = json.load(f)
 
-    current_hash = hash_dataframe(current_features_df)
+    if original_provenance.get("data_hash_scheme") == DATA_HASH_SCHEME:
+        current_hash = hash_dataframe(current_features_df)
+    else:
+        current_hash = hash_dataframe_legacy_csv(current_features_df)
 
     if current_hash != original_provenance["data_hash"]:
         print("⚠ WARNING: Data has changed since training!")
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable, MutableMapping
+from typing import Any, TypeVar
+
+from core.observability.metrics import metrics
+from core.utils.logging_redaction import get_logger
+
+_LOGGER = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesce concurrent async calls per key into one in-flight execution.
+
+    N callers awaiting ``do(key, fn)`` while a call for ``key`` is running share its
+    result (or exception); only the first caller invokes ``fn``.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def _live(self, key: Hashable) -> asyncio.Future[Any] | None:
+        fut = self._inflight.get(key)
+        if fut is None or fut.done():
+            return None
+        # Futures are loop-bound; ignore leftovers from another (e.g. closed test) loop.
+        try:
+            if fut.get_loop() is not asyncio.get_running_loop():
+                return None
+        except RuntimeError:
+            return None
+        return fut
+
+    def in_flight(self, key: Hashable) -> bool:
+        return self._live(key) is not None
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        fut = self._live(key)
+        if fut is not None:
+            metrics.inc("single_flight_coalesced")
+            return await asyncio.shield(fut)
+
+        fut = asyncio.ensure_future(fn())
+        self._inflight[key] = fut
+
+        def _forget(done: asyncio.Future[Any], _key: Hashable = key) -> None:
+            if self._inflight.get(_key) is done:
+                self._inflight.pop(_key, None)
+            # Mark exceptions as retrieved when every waiter was cancelled.
+            if not done.cancelled():
+                done.exception()
+
+        fut.add_done_callback(_forget)
+        return await asyncio.shield(fut)
+
+
+class StaleWhileRevalidateCache:
+    """Async TTL cache with single-flight loads and stale-while-revalidate refresh.
+
+    Entries are stored as ``{"ts": float, "data": Any}`` in ``store`` (so existing
+    module-level cache dicts keep their shape):
+
+    - age < ``ttl``: served as a hit.
+    - ``ttl`` <= age < ``stale_ttl``: stale value served immediately and one
+      background refresh is started.
+    - otherwise (or ``ts`` == 0): callers await a single coalesced load.
+
+    A failed background refresh keeps the stale entry; a failed foreground load
+    propagates to every coalesced caller and is not cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        stale_ttl: float,
+        name: str,
+        store: MutableMapping[Hashable, dict[str, Any]] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = float(ttl)
+        self.stale_ttl = max(float(stale_ttl), self.ttl)
+        self.name = name
+        self.store: MutableMapping[Hashable, dict[str, Any]] = store if store is not None else {}
+        self._clock = clock
+        self._flight = SingleFlight()
+        self._background: set[asyncio.Task[Any]] = set()
+        self.stats: dict[str, int] = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "refresh_errors": 0,
+        }
+
+    def _count(self, stat: str) -> None:
+        self.stats[stat] += 1
+        metrics.inc(f"{self.name}_{stat}")
+
+    def peek(self, key: Hashable) -> dict[str, Any] | None:
+        entry = self.store.get(key)
+        if not entry or not entry.get("ts"):
+            return None
+        return entry
+
+    def put(self, key: Hashable, data: Any) -> None:
+        self.store[key] = {"ts": self._clock(), "data": data}
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        data = await loader()
+        self.put(key, data)
+        return data
+
+    async def _refresh_in_background(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> None:
+        try:
+            await self._flight.do(key, lambda: self._load(key, loader))
+        except Exception as e:
+            self._count("refresh_errors")
+            _LOGGER.warning("%s background refresh failed for %s: %s", self.name, key, e)
+
+    async def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        *,
+        accept: Callable[[Any], bool] | None = None,
+    ) -> T:
+        """Return the cached value for ``key``, loading it via ``loader`` when needed.
+
+        ``accept`` lets callers reject a cached value that cannot serve this request
+        (e.g. too shallow); a rejected entry is treated as a miss.
+        """
+        entry = self.peek(key)
+        if entry is not None and accept is not None and not accept(entry["data"]):
+            entry = None
+        if entry is not None:
+            age = self._clock() - float(entry["ts"])
+            if age < self.ttl:
+                self._count("hits")
+                return entry["data"]
+            if age < self.stale_ttl:
+                self._count("stale_hits")
+                if not self._flight.in_flight(key):
+                    task = asyncio.ensure_future(self._refresh_in_background(key, loader))
+                    self._background.add(task)
+                    task.add_done_callback(self._background.discard)
+                return entry["data"]
+
+        if self._flight.in_flight(key):
+            self._count("coalesced")
+        else:
+            self._count("misses")
+        return await self._flight.do(key, lambda: self._load(key, loader))
+
+    async def wait_background(self) -> None:
+        """Wait for pending background refreshes (shutdown/tests)."""
+        if self._background:
+            await asyncio.gather(*list(self._background), return_exceptions=True)
+
+    def snapshot_stats(self) -> dict[str, Any]:
+        return {**self.stats, "entries": len(self.store), "ttl": self.ttl}
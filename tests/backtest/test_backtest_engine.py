@@ -398,6 +398,66 @@ def test_engine_load_data_applies_policy_to_htf(monkeypatch, sample_candles_data
     assert engine.htf_candles_source.endswith("tBTCUSD_1D.parquet")
 
 
+def test_engine_load_data_derives_missing_htf_from_base_candles(monkeypatch):
+    """A missing 1D file must not leave HTF inert: 1D bars are resampled from the base data."""
+
+    import core.backtest.engine as engine_mod
+
+    BacktestEngine._candles_cache.clear()
+    monkeypatch.delenv("GENESIS_HTF_DERIVE", raising=False)
+
+    dates = pd.date_range("2025-01-01", periods=4 * 96, freq="15min", tz="UTC")
+    ltf = pd.DataFrame(
+        {
+            "timestamp": dates,
+            "open": [100.0 + i for i in range(len(dates))],
+            "high": [101.0 + i for i in range(len(dates))],
+            "low": [99.0 + i for i in range(len(dates))],
+            "close": [100.5 + i for i in range(len(dates))],
+            "volume": [1.0] * len(dates),
+        }
+    )
+
+    original_exists = Path.exists
+
+    def _fake_exists(self: Path) -> bool:
+        if self.name == "tBTCUSD_15m_frozen.parquet":
+            return True
+        if self.name.startswith("tBTCUSD_1D"):
+            return False
+        return original_exists(self)
+
+    def _fake_read_parquet(path, columns=None, **_kwargs):
+        if not str(path).endswith("tBTCUSD_15m_frozen.parquet"):
+            raise AssertionError(f"Unexpected parquet read: {path}")
+        return ltf.copy() if columns is None else ltf[columns].copy()
+
+    real_resample = engine_mod.get_resampled_candles
+
+    def _resample_without_disk(df, **kwargs):
+        kwargs["cache_write_enabled"] = False
+        return real_resample(df, **kwargs)
+
+    monkeypatch.setattr(Path, "exists", _fake_exists)
+    monkeypatch.setattr(pd, "read_parquet", _fake_read_parquet)
+    monkeypatch.setattr(engine_mod, "get_resampled_candles", _resample_without_disk)
+
+    engine = BacktestEngine(symbol="tBTCUSD", timeframe="15m")
+    engine._use_new_exit_engine = True
+
+    assert engine.load_data() is True
+    assert engine.htf_candles_df is not None
+    assert len(engine.htf_candles_df) == 4
+    assert engine.htf_candles_source.startswith("derived:15m->1D:")
+    assert engine.htf_candles_df["high"].iloc[0] == pytest.approx(101.0 + 95)
+
+    monkeypatch.setenv("GENESIS_HTF_DERIVE", "0")
+    legacy_engine = BacktestEngine(symbol="tBTCUSD", timeframe="15m")
+    legacy_engine._use_new_exit_engine = True
+    assert legacy_engine.load_data() is True
+    assert legacy_engine.htf_candles_df is None
+
+
 def test_precompute_cache_key_includes_candle_source(sample_candles_data):
     """Precompute cache keys must differ across frozen vs curated sources."""
 
@@ -416,6 +476,60 @@ def test_precompute_cache_key_includes_candle_source(sample_candles_data):
     ) != curated_engine._precompute_cache_key(sample_candles_data)
 
 
+def test_precompute_cache_key_includes_candle_content(sample_candles_data):
+    """Same symbol/range/length but revised candle values must not share a cache key."""
+
+    engine = BacktestEngine(symbol="tBTCUSD", timeframe="15m")
+    revised = sample_candles_data.copy()
+    revised.loc[50, "close"] += 0.5
+
+    key = engine._precompute_cache_key(sample_candles_data)
+    assert key == engine._precompute_cache_key(sample_candles_data.copy())
+    assert key != engine._precompute_cache_key(revised)
+
+
+def test_engine_run_injects_dataset_fingerprint_for_keyed_feature_cache(
+    monkeypatch, sample_candles_data
+):
+    """run() passes a per-dataset fingerprint that keys the feature cache by bar index."""
+
+    engine = BacktestEngine(symbol="tBTCUSD", timeframe="15m", warmup_bars=10)
+    engine.candles_df = sample_candles_data.head(30)
+
+    captured: list[tuple[int, int]] = []
+
+    def _fake_evaluate_pipeline(*, candles, policy, configs, state):
+        captured.append((configs["_dataset_fingerprint"], configs["_global_index"]))
+        return (
+            {"action": "NONE", "confidence": 1.0, "regime": "NEUTRAL", "features": {}},
+            {"decision": {"size": 0.0, "state_out": {}}, "features": {}},
+        )
+
+    monkeypatch.setattr("core.backtest.engine.evaluate_pipeline", _fake_evaluate_pipeline)
+    caller_configs = {"meta": {"skip_champion_merge": True}}
+
+    results = engine.run(policy={}, configs=caller_configs, verbose=False)
+
+    assert "error" not in results
+    fingerprints = {fp for fp, _ in captured}
+    assert len(fingerprints) == 1
+    fingerprint = fingerprints.pop()
+    assert isinstance(fingerprint, int) and fingerprint >= 0
+    assert [idx for _, idx in captured] == list(range(10, 30))
+    assert "_dataset_fingerprint" not in caller_configs
+    # Volatile key must not leak into the effective config fingerprint.
+    assert engine._config_fingerprint(
+        {"_dataset_fingerprint": 1, "x": 1}
+    ) == engine._config_fingerprint({"x": 1})
+
+    other = BacktestEngine(symbol="tBTCUSD", timeframe="15m", warmup_bars=10)
+    shifted = sample_candles_data.head(30).copy()
+    shifted.loc[5, "close"] += 1.0
+    other.candles_df = shifted
+    other._prepare_numpy_arrays()
+    assert other._dataset_fingerprint() != fingerprint
+
+
 def test_build_candles_window(sample_candles_data):
     """Test building candles window for pipeline."""
     engine = BacktestEngine(symbol="tBTCUSD", timeframe="15m")
@@ -1788,3 +1902,16 @@ def test_engine_precompute_cache_hit_htf_mapping_does_not_require_local_fib_cfg(
     # HTF mapping should have been added to precomputed features.
     assert "htf_fib_05" in engine._precomputed_features
     assert len(engine._precomputed_features["htf_fib_05"]) == len(engine.candles_df)
+
+
+def test_engine_load_candles_dataframe_prepares_in_memory_dataset(sample_candles_data):
+    engine = BacktestEngine(symbol="tBTCUSD", timeframe="15m", warmup_bars=10)
+
+    assert engine.load_candles_dataframe(sample_candles_data) is True
+
+    assert engine.candles_source == "in_memory"
+    assert str(engine.candles_df["timestamp"].dt.tz) == "UTC"
+    assert engine._np_arrays is not None
+    assert len(engine._np_arrays["close"]) == len(sample_candles_data)
+    assert engine.load_candles_dataframe(sample_candles_data.head(0)) is False
+    assert engine.candles_df is None
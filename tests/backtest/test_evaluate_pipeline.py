@@ -5,7 +5,11 @@ from typing import Any
 
 import pytest
 
-from core.strategy.evaluate import _volume_score_from_candles, evaluate_pipeline
+from core.strategy.evaluate import (
+    _precomputed_volume_score,
+    _volume_score_from_candles,
+    evaluate_pipeline,
+)
 
 
 def test_evaluate_pipeline_returns_meta(
@@ -122,6 +126,24 @@ def test_volume_score_cap_ratio_below_one_does_not_penalize_normal_volume() -> N
     assert score == 1.0
 
 
+def test_precomputed_volume_score_is_read_by_global_index() -> None:
+    candles = {"volume": [100.0] * 200}
+    configs = {
+        "_global_index": 500,
+        "precomputed_features": {"volume_score": [0.25] * 500 + [0.75, float("nan")]},
+    }
+
+    assert _precomputed_volume_score(candles, configs, window=50, cap_ratio=3.0) == (True, 0.75)
+    configs["_global_index"] = 501
+    assert _precomputed_volume_score(candles, configs, window=50, cap_ratio=3.0) == (True, None)
+
+    # Non-default parameters or a window shorter than the median window fall back.
+    assert _precomputed_volume_score(candles, configs, window=20, cap_ratio=3.0)[0] is False
+    assert _precomputed_volume_score(candles, configs, window=50, cap_ratio=2.0)[0] is False
+    short = {"volume": [100.0] * 10}
+    assert _precomputed_volume_score(short, configs, window=50, cap_ratio=3.0)[0] is False
+
+
 def test_evaluate_pipeline_shadow_regime_observer_preserves_default_parity(
     monkeypatch,
     sample_policy: dict[str, Any],
@@ -51,7 +51,7 @@ def test_precompute_cache_key_legacy_shape_when_config_hash_unset_or_empty(monke
     material = re.escape(engine_mod._precompute_cache_key_material())
 
     assert "_cfg" not in key_unset
-    assert re.fullmatch(rf"tBTCUSD_1h_{material}_\d+_-?\d+_-?\d+", key_unset)
+    assert re.fullmatch(rf"tBTCUSD_1h_{material}_\d+_-?\d+_-?\d+_d[0-9a-f]{{16}}", key_unset)
 
     monkeypatch.setenv("GENESIS_PRECOMPUTE_CONFIG_HASH", "")
     key_empty = engine._precompute_cache_key(df)
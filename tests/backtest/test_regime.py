@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from core.strategy.regime import classify_regime, detect_regime_from_candles
+from core.strategy.regime import (
+    classify_regime,
+    compile_regime_classifier,
+    detect_regime_from_candles,
+)
 
 
 class TestClassifyRegime:
@@ -186,6 +190,48 @@ class TestClassifyRegime:
         assert tuned_state["candidate"] == "bull"
 
 
+class TestCompileRegimeClassifier:
+    """Test precompiled regime classification for frozen configs."""
+
+    def test_compiled_classifier_is_reused_for_the_same_config(self):
+        config = {
+            "gates": {"hysteresis_steps": 3},
+            "multi_timeframe": {
+                "regime_intelligence": {"regime_definition": {"adx_trend_threshold": 23.0}}
+            },
+        }
+
+        classifier = compile_regime_classifier(config)
+
+        assert compile_regime_classifier(config) is classifier
+        assert compile_regime_classifier(dict(config)) is classifier
+        assert classifier.adx_trend_threshold == 23.0
+        assert classifier.hysteresis_steps == 3
+
+    def test_in_place_mutation_recompiles(self):
+        config = {"gates": {"hysteresis_steps": 3}}
+        first = compile_regime_classifier(config)
+
+        config["gates"]["hysteresis_steps"] = 5
+
+        assert compile_regime_classifier(config).hysteresis_steps == 5
+        assert first.hysteresis_steps == 3
+
+    def test_compiled_classify_matches_classify_regime(self):
+        config = {"gates": {"hysteresis_steps": 2}}
+        classifier = compile_regime_classifier(config)
+        prev_state = {"regime": "balanced", "steps": 1}
+        for features in (
+            {"adx": 30.0, "price_vs_ema": 0.02, "ema_slope": 0.01, "volatility": 0.02},
+            {"adx": 30.0, "price_vs_ema": -0.02, "ema_slope": -0.01, "volatility": 0.02},
+            {"adx": 15.0, "price_vs_ema": 0.0, "ema_slope": 0.0, "volatility": 0.01},
+            {"adx": 22.0, "price_vs_ema": 0.0, "ema_slope": 0.0, "volatility": 0.10},
+        ):
+            assert classifier.classify(features, prev_state=prev_state) == classify_regime(
+                features, prev_state=prev_state, config=config
+            )
+
+
 class TestDetectRegimeFromCandles:
     """Test regime detection from candle data."""
 
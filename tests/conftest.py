@@ -4,6 +4,21 @@ from typing import Any
 
 import pytest
 
+from core.utils import feature_store
+
+
+@pytest.fixture(scope="session")
+def _feature_store_root(tmp_path_factory: pytest.TempPathFactory):
+    return tmp_path_factory.mktemp("feature_store")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_feature_store(monkeypatch: pytest.MonkeyPatch, _feature_store_root) -> None:
+    """Keep the shared feature store out of the working tree and fresh per test."""
+    monkeypatch.setenv("GENESIS_FEATURE_STORE_DIR", str(_feature_store_root))
+    monkeypatch.setenv("GENESIS_FEATURE_STORE_WRITE", "0")
+    monkeypatch.setattr(feature_store, "_DEFAULT_STORE", None)
+
 
 @pytest.fixture()
 def sample_policy() -> dict[str, Any]:
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import core.research_ledger.service as service_mod
+from core.research_ledger.enums import (
+    ArtifactKind,
+    ChampionStatus,
+    ExperimentStatus,
+    GovernanceDecisionKind,
+    LedgerEntityType,
+    PromotionTargetKind,
+)
+from core.research_ledger.models import (
+    ArtifactRecord,
+    ChampionRecord,
+    CodeVersionRef,
+    DatasetRef,
+    ExperimentRecord,
+    GovernanceDecisionRecord,
+    HypothesisRecord,
+    PromotionRecord,
+    ProposalRecord,
+)
+from core.research_ledger.service import ResearchLedgerService
+from core.research_ledger.storage import LedgerStorage
+
+
+def _service(tmp_path: Path) -> ResearchLedgerService:
+    return ResearchLedgerService(LedgerStorage(root=tmp_path / "artifacts" / "research_ledger"))
+
+
+def _chain(n: int, *, day: str = "2026-03-16", family: str = "ri") -> list:
+    hypothesis = HypothesisRecord(
+        entity_id=f"HYP-2026-{n:04d}",
+        entity_type=LedgerEntityType.HYPOTHESIS,
+        created_at=f"{day}T12:00:00+00:00",
+        title=f"Hypothesis {n}",
+        hypothesis="Incremental indexes match a rebuild.",
+        metadata={"strategy_family": family},
+    )
+    proposal = ProposalRecord(
+        entity_id=f"PROP-2026-{n:04d}",
+        entity_type=LedgerEntityType.PROPOSAL,
+        created_at=f"{day}T12:05:00+00:00",
+        hypothesis_id=hypothesis.entity_id,
+        title=f"Proposal {n}",
+        summary="Chain proposal.",
+        command_packet_path="docs/governance/templates/command_packet.md",
+    )
+    experiment = ExperimentRecord(
+        entity_id=f"EXP-2026-{n:04d}",
+        entity_type=LedgerEntityType.EXPERIMENT,
+        created_at=f"{day}T12:10:00+00:00",
+        hypothesis_id=hypothesis.entity_id,
+        proposal_id=proposal.entity_id,
+        title=f"Experiment {n}",
+        objective="Chain experiment.",
+        command_packet_path="docs/governance/templates/command_packet.md",
+        code_version=CodeVersionRef(commit_sha="abc123def456"),
+        config_paths=("config/optimizer/1h/tBTCUSD_1h_risk_optuna_smoke.yaml",),
+        dataset_refs=(DatasetRef(dataset_id="curated.tBTCUSD.1h", version="2026-03-16"),),
+        status=ExperimentStatus.COMPLETED if n % 2 else ExperimentStatus.PLANNED,
+        metadata={"strategy_family": family},
+    )
+    artifact = ArtifactRecord(
+        entity_id=f"ART-2026-{n:04d}",
+        entity_type=LedgerEntityType.ARTIFACT,
+        created_at=f"{day}T12:15:00+00:00",
+        experiment_id=experiment.entity_id,
+        artifact_kind=ArtifactKind.RESULT_SUMMARY,
+        path=f"results/run_{n}/best_trial.json",
+    )
+    governance = GovernanceDecisionRecord(
+        entity_id=f"GOV-2026-{n:04d}",
+        entity_type=LedgerEntityType.GOVERNANCE_DECISION,
+        created_at=f"{day}T12:20:00+00:00",
+        subject_type=LedgerEntityType.EXPERIMENT,
+        subject_id=experiment.entity_id,
+        decision=GovernanceDecisionKind.ACCEPTED,
+        rationale="Passes gates.",
+    )
+    promotion = PromotionRecord(
+        entity_id=f"PROMO-2026-{n:04d}",
+        entity_type=LedgerEntityType.PROMOTION_RECORD,
+        created_at=f"{day}T12:25:00+00:00",
+        subject_experiment_id=experiment.entity_id,
+        governance_decision_id=governance.entity_id,
+        target_kind=PromotionTargetKind.CHAMPION,
+        target_ref="config/strategy/champions/tBTCUSD_1h.json",
+    )
+    champion = ChampionRecord(
+        entity_id=f"CHAMP-2026-{n:04d}",
+        entity_type=LedgerEntityType.CHAMPION_RECORD,
+        created_at=f"{day}T12:30:00+00:00",
+        symbol="tBTCUSD" if n % 2 else "tETHUSD",
+        timeframe="1h",
+        promotion_record_id=promotion.entity_id,
+        status=ChampionStatus.ACTIVE,
+    )
+    return [hypothesis, proposal, experiment, artifact, governance, promotion, champion]
+
+
+def _disk_indexes(service: ResearchLedgerService) -> dict:
+    return {
+        name: service.storage.read_index(name)
+        for name in ("hypothesis", "experiment", "champion", "catalog")
+    }
+
+
+def test_incremental_indexes_match_full_rebuild(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    for record in _chain(1):
+        service.append_record(record)
+    service.append_records(_chain(2, day="2026-03-17", family="trend"))
+    for record in _chain(3):
+        service.append_record(record)
+
+    incremental = _disk_indexes(service)
+    service.refresh_indexes()
+
+    assert incremental == _disk_indexes(service)
+    assert incremental["hypothesis"]["items"][1]["experiment_ids"] == ["EXP-2026-0002"]
+    assert incremental["experiment"]["items"][2]["governance_ids"] == ["GOV-2026-0003"]
+
+
+def test_appends_delta_apply_without_rebuilding(tmp_path: Path, monkeypatch) -> None:
+    service = _service(tmp_path)
+    service.append_records(_chain(1))
+
+    def _no_scan(entity_type):
+        raise AssertionError(f"full scan of {entity_type}")
+
+    monkeypatch.setattr(service.storage, "list_records", _no_scan)
+    for record in _chain(2):
+        service.append_record(record)
+
+    experiments = service.queries.list_experiments(status=ExperimentStatus.PLANNED)
+    assert [record.entity_id for record in experiments] == ["EXP-2026-0002"]
+    champions = service.queries.list_champions(symbol="tETHUSD")
+    assert [record.entity_id for record in champions] == ["CHAMP-2026-0002"]
+    lineage = service.queries.get_hypothesis_lineage("HYP-2026-0002")
+    assert [item["entity_id"] for item in lineage["champion_records"]] == ["CHAMP-2026-0002"]
+    assert [item["entity_id"] for item in lineage["governance_decisions"]] == ["GOV-2026-0002"]
+
+
+def test_compaction_rebuilds_after_interval(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(service_mod, "INDEX_COMPACTION_INTERVAL", 3)
+    service = _service(tmp_path)
+    refreshes: list[int] = []
+    original_refresh = service.refresh_indexes
+    monkeypatch.setattr(
+        service, "refresh_indexes", lambda: refreshes.append(1) or original_refresh()
+    )
+
+    for record in _chain(1):
+        service.append_record(record)
+
+    # First append builds the missing indexes, then one compaction per 3 appends.
+    assert refreshes == [1, 1, 1]
+
+
+def test_indexes_recover_from_writes_by_another_service(tmp_path: Path) -> None:
+    first = _service(tmp_path)
+    second = _service(tmp_path)
+    first.append_records(_chain(1))
+    second.append_records(_chain(2))
+    first.append_records(_chain(3))
+
+    incremental = _disk_indexes(first)
+    first.refresh_indexes()
+    assert incremental == _disk_indexes(first)
+    assert incremental["catalog"]["record_counts"]["experiment"] == 3
+
+
+def test_find_ids_uses_secondary_indexes(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    service.append_records(_chain(1, family="ri"))
+    service.append_records(_chain(2, day="2026-03-18", family="trend"))
+
+    queries = service.queries
+    assert queries.find_ids(LedgerEntityType.EXPERIMENT, strategy_family="trend") == [
+        "EXP-2026-0002"
+    ]
+    assert queries.find_ids(LedgerEntityType.EXPERIMENT, status="completed") == ["EXP-2026-0001"]
+    assert queries.find_ids(created_from="2026-03-17") == sorted(
+        record.entity_id for record in _chain(2)
+    )
+    assert queries.find_ids(LedgerEntityType.CHAMPION_RECORD, created_to="2026-03-16") == [
+        "CHAMP-2026-0001"
+    ]
+
+
+@pytest.mark.parametrize("corruption", ["missing", "stale"])
+def test_queries_fall_back_to_scan_without_usable_catalog(tmp_path: Path, corruption) -> None:
+    service = _service(tmp_path)
+    service.append_records(_chain(1))
+    service.append_records(_chain(2, family="trend"))
+    catalog_path = service.storage.paths.index_path("catalog")
+    if corruption == "missing":
+        catalog_path.unlink()
+    else:
+        service.storage.write_record(
+            ExperimentRecord(
+                entity_id="EXP-2026-0099",
+                entity_type=LedgerEntityType.EXPERIMENT,
+                created_at="2026-03-19T00:00:00+00:00",
+                hypothesis_id="HYP-2026-0001",
+                proposal_id="PROP-2026-0001",
+                title="Written behind the service's back",
+                metadata={"strategy_family": "ri"},
+            )
+        )
+
+    experiments = service.queries.list_experiments(hypothesis_id="HYP-2026-0001")
+    expected = ["EXP-2026-0001"] + (["EXP-2026-0099"] if corruption == "stale" else [])
+    assert [record.entity_id for record in experiments] == expected
+    assert service.queries.find_ids(LedgerEntityType.EXPERIMENT, strategy_family="ri") == expected
@@ -451,3 +451,62 @@ def test_append_experiment_duplicate_id_wins_before_semantic_checks(tmp_path: Pa
 
     with pytest.raises(FileExistsError, match=valid_experiment.entity_id):
         service.append_experiment(semantically_invalid_duplicate)
+
+
+def test_append_records_validates_in_batch_references_and_refreshes_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = _service(tmp_path)
+    hypothesis = HypothesisRecord(
+        entity_id="HYP-2026-0001",
+        entity_type=LedgerEntityType.HYPOTHESIS,
+        created_at="2026-03-16T12:00:00+00:00",
+        title="Batch",
+        hypothesis="Batch appends resolve in-batch references.",
+    )
+    proposal = ProposalRecord(
+        entity_id="PROP-2026-0001",
+        entity_type=LedgerEntityType.PROPOSAL,
+        created_at="2026-03-16T12:05:00+00:00",
+        hypothesis_id=hypothesis.entity_id,
+        title="Batch proposal",
+        summary="Same batch as its hypothesis.",
+        command_packet_path="docs/governance/templates/command_packet.md",
+    )
+    refreshes: list[int] = []
+    original_refresh = service.refresh_indexes
+    monkeypatch.setattr(
+        service, "refresh_indexes", lambda: refreshes.append(1) or original_refresh()
+    )
+
+    persisted = service.append_records([hypothesis, proposal, _experiment_record()])
+
+    assert [record.entity_id for record in persisted] == [
+        "HYP-2026-0001",
+        "PROP-2026-0001",
+        "EXP-2026-0001",
+    ]
+    assert refreshes == [1]
+    assert service.storage.read_index("experiment")["items"][0]["entity_id"] == "EXP-2026-0001"
+
+
+def test_append_records_writes_nothing_when_any_record_is_invalid(tmp_path: Path) -> None:
+    service = _service(tmp_path)
+    hypothesis = HypothesisRecord(
+        entity_id="HYP-2026-0001",
+        entity_type=LedgerEntityType.HYPOTHESIS,
+        created_at="2026-03-16T12:00:00+00:00",
+        title="Batch",
+        hypothesis="All or nothing.",
+    )
+
+    with pytest.raises(LedgerValidationError, match="missing proposal"):
+        service.append_records([hypothesis, _experiment_record()])
+    with pytest.raises(FileExistsError, match="HYP-2026-0001"):
+        service.append_records([hypothesis, hypothesis])
+
+    assert service.storage.list_records(LedgerEntityType.HYPOTHESIS) == []
+    assert service.allocate_ids(LedgerEntityType.HYPOTHESIS, year=2026, count=2) == [
+        "HYP-2026-0001",
+        "HYP-2026-0002",
+    ]
@@ -0,0 +1,91 @@
+"""
+Tests for streaming component attribution statistics.
+"""
+
+import numpy as np
+import pytest
+
+from core.strategy.components.attribution import AttributionTracker, P2Quantile
+from core.strategy.components.base import ComponentResult
+from core.strategy.components.strategy import StrategyDecision
+
+
+def _decision(results: dict[str, ComponentResult]) -> StrategyDecision:
+    veto = next(((name, r) for name, r in results.items() if not r.allowed), None)
+    return StrategyDecision(
+        allowed=veto is None,
+        confidence=min(r.confidence for r in results.values()),
+        veto_component=veto[0] if veto else None,
+        veto_reason=veto[1].reason if veto else None,
+        component_results=results,
+    )
+
+
+class TestP2Quantile:
+    """P² estimates track exact quantiles without storing observations."""
+
+    @pytest.mark.parametrize("p", [0.1, 0.5, 0.9])
+    def test_estimate_close_to_exact_quantile(self, p):
+        values = np.random.default_rng(3).beta(2.0, 5.0, 5000)
+        estimator = P2Quantile(p)
+        for value in values:
+            estimator.add(float(value))
+
+        assert estimator.value() == pytest.approx(float(np.quantile(values, p)), abs=0.01)
+
+    def test_exact_for_small_samples(self):
+        estimator = P2Quantile(0.9)
+        assert estimator.value() == 0.0
+        for value in (0.4, 0.1, 0.3):
+            estimator.add(value)
+
+        assert estimator.value() == pytest.approx(float(np.quantile([0.4, 0.1, 0.3], 0.9)))
+
+
+class TestAttributionTracker:
+    """Report shape and streaming statistics."""
+
+    def test_report_matches_exact_statistics(self):
+        rng = np.random.default_rng(11)
+        confidences = rng.uniform(0.0, 1.0, 400)
+        tracker = AttributionTracker()
+        for conf in confidences:
+            allowed = conf >= 0.25
+            tracker.record(
+                _decision(
+                    {
+                        "ml": ComponentResult(
+                            allowed=allowed,
+                            confidence=float(conf),
+                            reason=None if allowed else "ML_CONFIDENCE_LOW",
+                        ),
+                    }
+                )
+            )
+
+        report = tracker.get_report_dict()
+        ml = report["components"]["ml"]
+        expected_vetoes = int((confidences < 0.25).sum())
+
+        assert report["total_decisions"] == 400
+        assert report["vetoed"] == expected_vetoes
+        assert report["veto_counts"] == {"ml": expected_vetoes}
+        assert ml["evaluations"] == 400
+        assert ml["veto_reasons"] == {"ML_CONFIDENCE_LOW": expected_vetoes}
+        assert ml["confidence"]["avg"] == pytest.approx(confidences.mean())
+        assert ml["confidence"]["std"] == pytest.approx(confidences.std(ddof=1))
+        assert ml["confidence"]["min"] == pytest.approx(confidences.min())
+        assert ml["confidence"]["max"] == pytest.approx(confidences.max())
+        assert ml["confidence"]["p50"] == pytest.approx(np.median(confidences), abs=0.03)
+        assert report["component_confidence"]["ml"] == ml["confidence"]
+
+    def test_memory_does_not_grow_with_evaluations(self):
+        tracker = AttributionTracker()
+        result = ComponentResult(allowed=True, confidence=0.5)
+        for _ in range(1000):
+            tracker.record(_decision({"gate": result}))
+
+        stats = tracker.stats["gate"]
+        assert not hasattr(stats, "confidences")
+        assert all(len(q._heights) == 5 for q in stats.quantiles.values())
+        assert "Confidence: avg=0.500" in tracker.get_report()
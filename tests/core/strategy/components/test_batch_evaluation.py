@@ -0,0 +1,153 @@
+"""
+Tests for column-wise (batch) component evaluation.
+
+Batch results must match evaluating each row's context with evaluate().
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.strategy.components.atr_filter import ATRFilterComponent
+from core.strategy.components.base import ComponentResult, StrategyComponent
+from core.strategy.components.batch import as_columns, contexts_to_columns, row_context
+from core.strategy.components.cooldown import CooldownComponent
+from core.strategy.components.ev_gate import EVGateComponent
+from core.strategy.components.htf_gate import HTFGateComponent
+from core.strategy.components.ml_confidence import MLConfidenceComponent
+from core.strategy.components.regime_filter import RegimeFilterComponent
+from core.strategy.components.strategy import ComposableStrategy
+
+REGIMES = ["trending", "bull", "bear", "ranging", "unknown"]
+
+
+def _maybe(rng, value, missing_rate=0.1):
+    return None if rng.random() < missing_rate else value
+
+
+def _contexts(size: int = 400, seed: int = 5) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    contexts = []
+    for bar in range(size):
+        context = {
+            "action": str(rng.choice(["LONG", "SHORT", "NONE"])),
+            "bar_index": bar,
+            "symbol": str(rng.choice(["tBTCUSD", "tETHUSD"])),
+            "ml_confidence": _maybe(rng, float(rng.uniform(0.0, 1.0))),
+            "ml_confidence_for_action": _maybe(rng, float(rng.uniform(0.0, 1.0)), 0.3),
+            "expected_value": _maybe(rng, float(rng.normal(0.0, 0.2))),
+            "regime": _maybe(rng, str(rng.choice(REGIMES))),
+            "htf_regime": _maybe(rng, str(rng.choice(REGIMES))),
+            "atr": _maybe(rng, float(rng.uniform(0.5, 2.0))),
+            "atr_ma": _maybe(rng, float(rng.choice([0.0, 1.0, 1.2]))),
+        }
+        contexts.append({key: value for key, value in context.items() if value is not None})
+    return contexts
+
+
+STATELESS = [
+    ATRFilterComponent(min_ratio=1.0),
+    MLConfidenceComponent(threshold=0.55),
+    EVGateComponent(min_ev=0.05),
+    RegimeFilterComponent(allowed_regimes=["trending", "bull"]),
+    HTFGateComponent(required_regimes=["trending", "bear"]),
+    HTFGateComponent(required_regimes=[]),
+]
+
+
+class TestColumns:
+    """Conversion between per-bar contexts and columns."""
+
+    def test_round_trip_preserves_present_keys(self):
+        contexts = _contexts(50)
+        columns = contexts_to_columns(contexts)
+
+        assert columns["atr"].dtype == float
+        assert columns["regime"].dtype == object
+        assert [row_context(columns, i) for i in range(50)] == contexts
+
+    def test_accepts_dataframe(self):
+        contexts = _contexts(20)
+        frame = pd.DataFrame(contexts)
+        columns = as_columns(frame)
+
+        assert set(columns) == set(contexts_to_columns(contexts))
+        assert len(columns["atr"]) == 20
+
+
+class TestComponentParity:
+    """Vectorized evaluate_batch() == per-row evaluate()."""
+
+    @pytest.mark.parametrize("component", STATELESS, ids=lambda c: c.name())
+    def test_stateless_components(self, component):
+        contexts = _contexts()
+        batch = component.evaluate_batch(contexts_to_columns(contexts))
+
+        for i, context in enumerate(contexts):
+            expected = component.evaluate(context)
+            assert batch.allowed[i] == expected.allowed, (i, context)
+            assert batch.confidence[i] == pytest.approx(expected.confidence), (i, context)
+            assert batch.reason[i] == expected.reason, (i, context)
+
+    def test_default_fallback_evaluates_per_row(self):
+        class OddBars(StrategyComponent):
+            def evaluate(self, context):
+                allowed = context["bar_index"] % 2 == 1
+                return ComponentResult(
+                    allowed=allowed, confidence=0.7, reason=None if allowed else "EVEN"
+                )
+
+            def name(self):
+                return "odd_bars"
+
+        batch = OddBars().evaluate_batch(contexts_to_columns(_contexts(10)))
+
+        assert batch.allowed.tolist() == [i % 2 == 1 for i in range(10)]
+        assert batch.reason.tolist() == [None if i % 2 else "EVEN" for i in range(10)]
+        assert batch.confidence.tolist() == [0.7] * 10
+
+    def test_cooldown_scan_matches_sequential_record_trade(self):
+        contexts = _contexts()
+        contexts[7].pop("bar_index")
+        contexts[9].pop("symbol")
+        reference = CooldownComponent({"min_bars_between_trades": 4})
+        component = CooldownComponent({"min_bars_between_trades": 4})
+
+        batch = component.evaluate_batch(contexts_to_columns(contexts))
+
+        for i, context in enumerate(contexts):
+            expected = reference.evaluate(context)
+            assert batch.allowed[i] == expected.allowed, i
+            assert batch.reason[i] == expected.reason, i
+            if expected.allowed and context["action"] in ("LONG", "SHORT"):
+                reference.record_trade(context["symbol"], context["bar_index"])
+        assert component.last_trade_bars() == {}
+
+
+class TestStrategyParity:
+    """ComposableStrategy.evaluate_batch() == per-row evaluate() with trade recording."""
+
+    def test_matches_per_row_decisions(self):
+        contexts = _contexts(600, seed=9)
+        components = [
+            MLConfidenceComponent(threshold=0.3),
+            CooldownComponent({"min_bars_between_trades": 3}),
+            RegimeFilterComponent(allowed_regimes=["trending", "bull", "ranging"]),
+            ATRFilterComponent(min_ratio=0.8),
+        ]
+        strategy = ComposableStrategy(components=components)
+        cooldown = components[1]
+
+        batch = strategy.evaluate_batch(contexts)
+
+        for i, context in enumerate(contexts):
+            expected = strategy.evaluate(context)
+            assert batch.allowed[i] == expected.allowed, i
+            assert batch.confidence[i] == pytest.approx(expected.confidence), i
+            assert batch.veto_component[i] == expected.veto_component, i
+            assert batch.veto_reason[i] == expected.veto_reason, i
+            if expected.allowed and context["action"] in ("LONG", "SHORT"):
+                cooldown.record_trade(context["symbol"], context["bar_index"])
+
+        assert 0.0 < batch.allow_rate < 1.0
+        assert list(batch.component_results) == [c.name() for c in components]
@@ -509,3 +509,57 @@ def test_authority_bootstraps_legacy_family_when_runtime_file_is_missing(tmp_pat
     assert version == 0
     assert cfg.strategy_family == "legacy"
     assert cfg.multi_timeframe.regime_intelligence.authority_mode == "legacy"
+
+
+def test_load_serves_cached_snapshot_until_file_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(authority_mod, "AUDIT_LOG", tmp_path / "config_audit.jsonl")
+    path = tmp_path / "runtime.json"
+    auth = ConfigAuthority(path)
+    auth.propose_update({"thresholds": {"entry_conf_overall": 0.5}}, actor="t", expected_version=0)
+
+    first = auth.load()
+    assert auth.load() is first
+    assert ConfigAuthority(path).load() is first
+    assert auth.version_info() == (first.version, first.hash)
+
+    # External edit (new inode via replace) is picked up on the next read.
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["version"] = 5
+    tmp = path.with_suffix(".edit")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    tmp.replace(path)
+
+    refreshed = auth.load()
+    assert refreshed is not first
+    assert refreshed.version == 5
+    assert refreshed.hash == first.hash
+
+
+def test_subscribe_pushes_updates_across_instances(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(authority_mod, "AUDIT_LOG", tmp_path / "config_audit.jsonl")
+    path = tmp_path / "runtime.json"
+    writer = ConfigAuthority(path)
+    reader = ConfigAuthority(path)
+    reader.load()
+
+    seen: list[tuple[int, str]] = []
+    unsubscribe = reader.subscribe(lambda snap: seen.append((snap.version, snap.hash)))
+
+    snap = writer.propose_update(
+        {"thresholds": {"entry_conf_overall": 0.5}}, actor="t", expected_version=0
+    )
+    assert seen == [(snap.version, snap.hash)]
+    # Unchanged reads do not re-notify.
+    reader.load()
+    assert len(seen) == 1
+
+    unsubscribe()
+    writer.propose_update(
+        {"thresholds": {"entry_conf_overall": 0.6}}, actor="t", expected_version=1
+    )
+    assert len(seen) == 1
+    assert reader.version_info()[0] == 2
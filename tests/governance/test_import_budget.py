@@ -0,0 +1,57 @@
+"""Cold-start import budget for entry points.
+
+Each check runs in a fresh interpreter because the test session itself has
+already imported pandas/optuna. Heavy dependencies must stay deferred until the
+code path that needs them runs (see core.utils.lazy_import).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+HEAVY = ("optuna", "sklearn", "numba", "yaml", "pandas", "tqdm")
+
+
+def _loaded_after_import(entry: str) -> set[str]:
+    code = (
+        "import json, sys\n"
+        f"import {entry}\n"
+        f"print(json.dumps(sorted(m for m in {HEAVY!r} if m in sys.modules)))\n"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (str(SRC), env.get("PYTHONPATH")) if p)
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    return set(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+
+@pytest.mark.parametrize(
+    ("entry", "forbidden"),
+    [
+        ("core.pipeline", {"optuna", "sklearn", "numba", "yaml", "pandas", "tqdm"}),
+        ("core.server", {"optuna", "sklearn", "numba", "yaml", "pandas"}),
+        ("core.optimizer.runner", {"optuna", "sklearn", "numba", "yaml"}),
+    ],
+)
+def test_entry_point_defers_heavy_imports(entry: str, forbidden: set[str]) -> None:
+    assert _loaded_after_import(entry) & forbidden == set()
+
+
+def test_lazy_optuna_attributes_resolve_on_use() -> None:
+    from core.optimizer import runner
+
+    if not runner.OPTUNA_AVAILABLE:
+        pytest.skip("optuna not installed")
+    from optuna.samplers import TPESampler
+
+    assert runner.TPESampler is TPESampler
+    assert runner._optuna_symbol("TPESampler") is TPESampler
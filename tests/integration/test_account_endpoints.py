@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import pytest
 from starlette.testclient import TestClient
 
 from core.server import app
@@ -99,3 +100,66 @@ def test_account_orders_filters_test(monkeypatch) -> None:
     data = r.json()
     items = data.get("items") or []
     assert len(items) == 1 and items[0]["symbol"].startswith("tTEST")
+
+
+@pytest.mark.asyncio
+async def test_account_snapshot_coalesces_concurrent_callers(monkeypatch) -> None:
+    import asyncio
+
+    import core.api.account as account_api
+    import core.io.bitfinex.read_helpers as rh
+
+    calls: dict[str, int] = {"wallets": 0, "positions": 0, "orders": 0}
+
+    def _fake(name: str, payload: Any):
+        async def _fetch() -> Any:
+            calls[name] += 1
+            await asyncio.sleep(0.01)
+            return payload
+
+        return _fetch
+
+    monkeypatch.setattr(rh, "get_wallets", _fake("wallets", [["exchange", "USD", 1.0, 0.0, 1.0]]))
+    monkeypatch.setattr(rh, "get_positions", _fake("positions", []))
+    monkeypatch.setattr(rh, "get_orders", _fake("orders", []))
+    for name in calls:
+        monkeypatch.setitem(account_api._ACCOUNT_CACHE, name, {"ts": 0.0, "data": {"items": []}})
+
+    snapshots = await asyncio.gather(*(account_api.account_snapshot() for _ in range(8)))
+
+    assert calls == {"wallets": 1, "positions": 1, "orders": 1}
+    for snap in snapshots:
+        assert snap["wallets"]["items"][0]["currency"] == "USD"
+        assert snap["positions"] == {"items": []}
+        assert snap["meta"]["stale"] is False
+
+    again = await account_api.account_snapshot()
+    assert set(again) == {"wallets", "positions", "orders", "meta"}
+    assert again["meta"]["cache"]["hits"] >= 3
+    assert calls == {"wallets": 1, "positions": 1, "orders": 1}
+
+
+@pytest.mark.asyncio
+async def test_account_snapshot_isolates_failing_resource(monkeypatch) -> None:
+
+    import core.api.account as account_api
+    import core.io.bitfinex.read_helpers as rh
+
+    async def _ok() -> Any:
+        return []
+
+    async def _boom() -> Any:
+        raise RuntimeError("SECRET_SHOULD_NOT_LEAK")
+
+    monkeypatch.setattr(rh, "get_wallets", _ok)
+    monkeypatch.setattr(rh, "get_positions", _boom)
+    monkeypatch.setattr(rh, "get_orders", _ok)
+    for name in ("wallets", "positions", "orders"):
+        monkeypatch.setitem(account_api._ACCOUNT_CACHE, name, {"ts": 0.0, "data": {"items": []}})
+
+    snap = await account_api.account_snapshot()
+
+    assert snap["wallets"] == {"items": []}
+    assert snap["positions"]["error"] == "internal_error"
+    assert "SECRET_SHOULD_NOT_LEAK" not in str(snap)
+    assert account_api._ACCOUNT_CACHE["positions"]["ts"] == 0.0
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import core.api.public as public_api
+
+
+class _Resp:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def json(self):
+        return self._rows
+
+
+class _FakeExchange:
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+
+    async def public_request(self, **kwargs):
+        self.calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        limit = int(kwargs["params"]["limit"])
+        return _Resp(
+            [[i, float(i), float(i) + 0.5, float(i) + 1, float(i) - 1, 1.0] for i in range(limit)]
+        )
+
+
+@pytest.fixture
+def exchange(monkeypatch):
+    fake = _FakeExchange()
+    monkeypatch.setattr(public_api, "_resolve_get_exchange_client", lambda: (lambda: fake))
+    monkeypatch.setattr(public_api, "_CANDLES_CACHE", public_api._BoundedCache(4))
+    monkeypatch.setattr(
+        public_api,
+        "_CANDLES_SWR",
+        public_api.StaleWhileRevalidateCache(
+            ttl=10.0, stale_ttl=60.0, name="test_candles", store=public_api._CANDLES_CACHE
+        ),
+    )
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_any_limit_within_ring_depth_is_served_from_one_fetch(exchange):
+    small = await public_api.public_candles(symbol="tBTCUSD", timeframe="1m", limit=10)
+    large = await public_api.public_candles(symbol="tBTCUSD", timeframe="1m", limit=200)
+
+    assert len(exchange.calls) == 1
+    assert exchange.calls[0]["params"] == {"limit": public_api._CANDLES_RING_DEPTH, "sort": 1}
+    assert len(small["close"]) == 10
+    assert len(large["close"]) == 200
+    assert small["close"] == large["close"][-10:]
+    assert public_api.candles_cache_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_deeper_limit_refetches_once_then_serves_from_ring(exchange):
+    await public_api.public_candles(symbol="tBTCUSD", timeframe="1m", limit=10)
+    deep = await public_api.public_candles(symbol="tBTCUSD", timeframe="1m", limit=600)
+    again = await public_api.public_candles(symbol="tBTCUSD", timeframe="1m", limit=300)
+
+    assert [c["params"]["limit"] for c in exchange.calls] == [public_api._CANDLES_RING_DEPTH, 600]
+    assert len(deep["open"]) == 600
+    assert len(again["open"]) == 300
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_upstream_request(exchange):
+    results = await asyncio.gather(
+        *(public_api.public_candles(symbol="tETHUSD", timeframe="5m", limit=50) for _ in range(12))
+    )
+
+    assert len(exchange.calls) == 1
+    assert all(r == results[0] for r in results)
+    assert public_api.candles_cache_stats()["coalesced"] == 11
+
+
+@pytest.mark.asyncio
+async def test_ring_cache_is_bounded(exchange):
+    for i in range(6):
+        await public_api.public_candles(symbol=f"tSYM{i}USD", timeframe="1m", limit=5)
+
+    assert list(public_api._CANDLES_CACHE) == [f"tSYM{i}USD:1m" for i in range(2, 6)]
+
+
+@pytest.mark.asyncio
+async def test_ring_cache_evicts_least_recently_read_key(exchange):
+    for i in range(4):
+        await public_api.public_candles(symbol=f"tSYM{i}USD", timeframe="1m", limit=5)
+    # A cache hit on the oldest key keeps it over keys stored after it.
+    await public_api.public_candles(symbol="tSYM0USD", timeframe="1m", limit=5)
+    await public_api.public_candles(symbol="tSYM4USD", timeframe="1m", limit=5)
+
+    assert len(exchange.calls) == 5
+    assert list(public_api._CANDLES_CACHE) == [
+        "tSYM2USD:1m",
+        "tSYM3USD:1m",
+        "tSYM0USD:1m",
+        "tSYM4USD:1m",
+    ]
@@ -322,7 +322,7 @@ def test_public_candles_endpoint_smoke():
         assert srv.public_router is public_api.router
         assert srv._CANDLES_CACHE is public_api._CANDLES_CACHE
         assert srv._CANDLES_TTL == public_api._CANDLES_TTL
-        assert "tBTCUSD:1m:1001" in srv._CANDLES_CACHE
+        assert "tBTCUSD:1m" in srv._CANDLES_CACHE
         assert len(calls) == 1
         assert calls[0]["params"] == {"limit": 1000, "sort": 1}
         candle_routes = [
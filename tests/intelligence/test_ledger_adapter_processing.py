@@ -205,3 +205,37 @@ def test_persist_events_preserves_invalid_strategy_family_errors(tmp_path: Path)
         adapter.persist_events(LedgerPersistenceRequest(events=(_validated_event(1),)))
 
     assert service.storage.list_records(LedgerEntityType.ARTIFACT) == []
+
+
+def test_persist_events_reserves_id_range_once_and_writes_single_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = _service(tmp_path)
+    adapter = DeterministicIntelligenceLedgerAdapter(
+        service=service,
+        strategy_config={"strategy_family": "legacy"},
+        strategy_family="legacy",
+    )
+    adapter.persist_events(LedgerPersistenceRequest(events=(_validated_event(1),)))
+
+    scans: list[int] = []
+    original_reserve = service.storage.reserve_entity_ids
+
+    def _counting_reserve(entity_type, year, count):
+        scans.append(count)
+        return original_reserve(entity_type, year, count)
+
+    monkeypatch.setattr(service.storage, "reserve_entity_ids", _counting_reserve)
+    monkeypatch.setattr(
+        service.storage,
+        "write_record",
+        lambda _record: pytest.fail("per-record write used for a batch"),
+    )
+
+    result = adapter.persist_events(
+        LedgerPersistenceRequest(events=tuple(_validated_event(i) for i in range(2, 6)))
+    )
+
+    assert scans == [4]
+    assert result.ledger_entity_ids == tuple(f"ART-2026-{i:04d}" for i in range(2, 6))
+    assert len(service.storage.list_records(LedgerEntityType.ARTIFACT)) == 5
@@ -463,3 +463,77 @@ def test_cross_family_override_wrapper_requires_explicit_override_and_signoff()
         explicit_override=True,
         governance_signoff=True,
     )
+
+
+def _ledger_snapshot(root) -> dict[str, bytes]:
+    return {
+        str(path.relative_to(root)): path.read_bytes()
+        for path in sorted(root.rglob("*.json"))
+        if path.is_file()
+    }
+
+
+def _family_sweep_tasks() -> tuple[FamilyResearchTask, ...]:
+    collection_request = CollectionRequest(source="news", asset="tBTCUSD", topic="macro")
+    return tuple(
+        FamilyResearchTask(
+            strategy_family=family,
+            task_id=f"{family}-task-{index:03d}",
+            collection_request=collection_request,
+            approved_parameter_sets=(
+                _parameter_set(f"ps-{family}-{index}", strategy_family=family),
+            ),
+        )
+        for index in range(1, 4)
+        for family in ("ri", "legacy")
+    )
+
+
+def test_run_family_research_tasks_parallel_matches_sequential_byte_for_byte(tmp_path) -> None:
+    runs = {}
+    for label, max_workers in (("sequential", 1), ("parallel", 3)):
+        service = build_service(tmp_path / label)
+        orchestrator = build_orchestrator(
+            service=service,
+            input_events=(build_event(1), build_event(2), build_event(3)),
+        )
+        results = run_family_research_tasks(
+            orchestrator, _family_sweep_tasks(), max_workers=max_workers
+        )
+        runs[label] = (results, _ledger_snapshot(service.storage.paths.root))
+
+    sequential_results, sequential_ledger = runs["sequential"]
+    parallel_results, parallel_ledger = runs["parallel"]
+    assert list(parallel_results) == list(sequential_results) == ["ri", "legacy"]
+    assert parallel_results == sequential_results
+    assert parallel_ledger == sequential_ledger
+    assert [result.task_id for result in parallel_results["legacy"]] == [
+        "legacy-task-001",
+        "legacy-task-002",
+        "legacy-task-003",
+    ]
+
+
+def test_run_family_research_tasks_parallel_persists_tasks_before_invalid_one(tmp_path) -> None:
+    collection_request = CollectionRequest(source="news", asset="tBTCUSD", topic="macro")
+    invalid = FamilyResearchTask(
+        strategy_family="ri",
+        task_id="ri-task-bad",
+        collection_request=collection_request,
+        approved_parameter_sets=(_parameter_set("ps-bad", strategy_family="legacy"),),
+    )
+    tasks = _family_sweep_tasks()[:2] + (invalid,) + _family_sweep_tasks()[2:]
+
+    snapshots = {}
+    for label, max_workers in (("sequential", 1), ("parallel", 2)):
+        service = build_service(tmp_path / label)
+        orchestrator = build_orchestrator(
+            service=service,
+            input_events=(build_event(1), build_event(2)),
+        )
+        with pytest.raises(StrategyFamilyValidationError):
+            run_family_research_tasks(orchestrator, tasks, max_workers=max_workers)
+        snapshots[label] = _ledger_snapshot(service.storage.paths.root)
+
+    assert snapshots["parallel"] == snapshots["sequential"]
+    assert snapshots["parallel"]
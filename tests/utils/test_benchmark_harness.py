@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from core.benchmark import (
+    DATASET_KINDS,
+    SyntheticDatasetSpec,
+    compare_reports,
+    dataset_digest,
+    generate_ohlcv,
+    load_report,
+    run_benchmarks,
+    write_report,
+)
+
+
+@pytest.mark.parametrize("kind", DATASET_KINDS)
+def test_synthetic_datasets_are_deterministic_and_valid(kind: str) -> None:
+    spec = SyntheticDatasetSpec(kind=kind, bars=500, timeframe="1h", seed=7)
+
+    first = generate_ohlcv(spec)
+    second = generate_ohlcv(spec)
+
+    assert dataset_digest(first) == dataset_digest(second)
+    assert dataset_digest(first) != dataset_digest(
+        generate_ohlcv(SyntheticDatasetSpec(kind=kind, bars=500, timeframe="1h", seed=8))
+    )
+    assert list(first.columns) == ["timestamp", "open", "high", "low", "close", "volume"]
+    assert len(first) == 500
+    assert (first["timestamp"].diff().dropna() == np.timedelta64(60, "m")).all()
+    assert (first["high"] >= first[["open", "close"]].max(axis=1)).all()
+    assert (first["low"] <= first[["open", "close"]].min(axis=1)).all()
+    assert (first["volume"] > 0).all()
+
+
+def test_dataset_spec_rejects_unknown_kind_and_timeframe() -> None:
+    with pytest.raises(ValueError, match="kind"):
+        SyntheticDatasetSpec(kind="sideways")
+    with pytest.raises(ValueError, match="timeframe"):
+        SyntheticDatasetSpec(timeframe="7m")
+
+
+def _report(digest: str, metrics: dict) -> dict:
+    return {
+        "schema_version": 1,
+        "dataset": {"digest": digest},
+        "scenarios": {"engine_run": {"metrics": metrics}},
+    }
+
+
+def test_compare_reports_flags_regressions_by_direction() -> None:
+    baseline = _report(
+        "abc",
+        {
+            "bars_per_sec": {"value": 100.0, "unit": "bars/s", "higher_is_better": True},
+            "seconds": {"value": 10.0, "unit": "s", "higher_is_better": False},
+            "peak_rss_mb": {"value": 100.0, "unit": "MiB", "higher_is_better": False},
+            "trades": {"value": 5.0, "unit": "trades", "higher_is_better": None},
+        },
+    )
+    current = _report(
+        "abc",
+        {
+            "bars_per_sec": {"value": 70.0, "unit": "bars/s", "higher_is_better": True},
+            "seconds": {"value": 11.0, "unit": "s", "higher_is_better": False},
+            "peak_rss_mb": {"value": 140.0, "unit": "MiB", "higher_is_better": False},
+            "trades": {"value": 50.0, "unit": "trades", "higher_is_better": None},
+        },
+    )
+
+    comparisons = compare_reports(
+        current, baseline, tolerance=0.2, metric_tolerances={"peak_rss_mb": 0.5}
+    )
+
+    by_metric = {item.metric: item for item in comparisons}
+    assert set(by_metric) == {"bars_per_sec", "seconds", "peak_rss_mb"}
+    assert by_metric["bars_per_sec"].regressed is True
+    assert by_metric["bars_per_sec"].relative_change == pytest.approx(-0.3)
+    assert by_metric["seconds"].regressed is False
+    assert by_metric["peak_rss_mb"].regressed is False
+
+
+def test_compare_reports_rejects_different_datasets() -> None:
+    with pytest.raises(ValueError, match="dataset"):
+        compare_reports(_report("abc", {}), _report("def", {}))
+
+
+def test_run_benchmarks_writes_comparable_report(tmp_path) -> None:
+    spec = SyntheticDatasetSpec(bars=300, timeframe="1h", seed=3)
+
+    report = run_benchmarks(["precompute", "results_build"], dataset=spec, repeats=1, isolate=False)
+    path = write_report(report, tmp_path / "bench.json")
+    loaded = load_report(path)
+
+    assert loaded == json.loads(json.dumps(report))
+    assert loaded["dataset"]["digest"] == dataset_digest(generate_ohlcv(spec))
+    assert set(loaded["scenarios"]) == {"precompute", "results_build"}
+    precompute = loaded["scenarios"]["precompute"]["metrics"]
+    assert precompute["compute_bars_per_sec"]["higher_is_better"] is True
+    assert precompute["compute_seconds"]["value"] > 0
+    assert loaded["scenarios"]["results_build"]["metrics"]["trades"]["value"] > 0
+    assert all(not item.regressed for item in compare_reports(loaded, loaded))
+
+
+def test_run_benchmarks_rejects_unknown_scenario() -> None:
+    with pytest.raises(ValueError, match="Unknown benchmark scenarios"):
+        run_benchmarks(["nope"], isolate=False)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from core.strategy.confidence import compute_confidence
+from core.strategy.confidence import compile_confidence, compute_confidence
 
 
 def test_compute_confidence_stub_shapes():
@@ -148,3 +148,45 @@ def test_compute_confidence_handles_non_numeric_string_probas() -> None:
 
     assert conf["buy"] == pytest.approx(0.0)
     assert conf["sell"] == pytest.approx(0.2)
+
+
+def test_compile_confidence_reuses_evaluator_for_frozen_config() -> None:
+    cfg = {
+        "enabled": True,
+        "clamp": {"min_quality": 0.10},
+        "components": {
+            "spread": {"scope": "sizing", "ref_bp": 2.0, "max_bp": 20.0},
+            "atr": {"scope": "gate", "exponent": 2.0},
+        },
+    }
+
+    evaluator = compile_confidence(cfg)
+
+    assert compile_confidence(cfg) is evaluator
+    assert [c.name for c in evaluator.components] == ["data_quality", "spread", "atr", "volume"]
+    assert evaluator.min_quality == pytest.approx(0.10)
+
+    cfg["components"]["atr"]["enabled"] = False
+    recompiled = compile_confidence(cfg)
+    assert recompiled is not evaluator
+    assert [c.name for c in recompiled.components] == ["data_quality", "spread", "volume"]
+
+
+def test_compiled_evaluator_matches_compute_confidence() -> None:
+    cfg = {
+        "enabled": True,
+        "components": {
+            "data_quality": {"scope": "gate"},
+            "spread": {"scope": "sizing"},
+            "volume": {"floor": 0.3, "exponent": 0.0},
+        },
+    }
+    evaluator = compile_confidence(cfg)
+    inputs = {"atr_pct": 0.02, "spread_bp": 12.0, "volume_score": 0.4, "data_quality": 0.7}
+
+    expected = compute_confidence({"buy": 0.7, "sell": 0.2}, config=cfg, **inputs)
+    conf, meta = evaluator.compute({"buy": 0.7, "sell": 0.2}, **inputs)
+
+    assert (conf, meta) == expected
+    assert "buy_scaled" in conf
+    assert compile_confidence({"enabled": False}) is compile_confidence(None)
@@ -0,0 +1,125 @@
+"""Tests for single-replay multi-seam (shadow_all) feature attribution in decide()."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+
+from core.strategy.decision import decide
+from core.strategy.decision_attribution import (
+    FEATURE_ATTRIBUTION_SHADOW_STATE_KEY,
+    build_shadow_attribution_report,
+)
+
+SEAMS = (
+    "Minimum-edge gate seam",
+    "Hysteresis gate seam",
+    "Cooldown gate seam",
+    "HTF block seam",
+)
+
+CFG = {
+    "thresholds": {"entry_conf_overall": 0.6, "min_edge": 0.10},
+    "gates": {"hysteresis_steps": 2, "cooldown_bars": 3},
+    "risk": {"risk_map": [[0.5, 0.01]]},
+}
+
+BARS = [
+    ({"buy": 0.70, "sell": 0.65}, {"buy": 0.80, "sell": 0.70}, 100.0),
+    ({"buy": 0.80, "sell": 0.40}, {"buy": 0.85, "sell": 0.40}, 101.0),
+    ({"buy": 0.82, "sell": 0.40}, {"buy": 0.85, "sell": 0.40}, 102.0),
+    ({"buy": 0.72, "sell": 0.66}, {"buy": 0.80, "sell": 0.70}, 101.5),
+    ({"buy": 0.85, "sell": 0.30}, {"buy": 0.90, "sell": 0.30}, 103.0),
+    ({"buy": 0.86, "sell": 0.30}, {"buy": 0.90, "sell": 0.30}, 104.0),
+    ({"buy": 0.70, "sell": 0.66}, {"buy": 0.80, "sell": 0.70}, 103.5),
+    ({"buy": 0.88, "sell": 0.20}, {"buy": 0.92, "sell": 0.20}, 105.0),
+]
+
+
+def _replay(policy: dict) -> tuple[list[str], dict]:
+    state: dict = {}
+    actions = []
+    for probas, confidence, close in BARS:
+        action, meta = decide(
+            policy,
+            probas=probas,
+            confidence=confidence,
+            regime="balanced",
+            state={**state, "last_close": close},
+            risk_ctx={},
+            cfg=CFG,
+        )
+        actions.append(action)
+        state = meta["state_out"]
+    return actions, state
+
+
+def test_shadow_mode_keeps_live_decisions_and_matches_per_seam_replays() -> None:
+    baseline_actions, _ = _replay({"symbol": "tTESTBTC:TESTUSD", "timeframe": "1h"})
+    policy = {
+        "symbol": "tTESTBTC:TESTUSD",
+        "timeframe": "1h",
+        "feature_attribution": {"mode": "shadow_all", "hold_bars": 2},
+    }
+    policy_before = deepcopy(policy)
+
+    shadow_actions, final_state = _replay(policy)
+
+    assert shadow_actions == baseline_actions
+    assert policy == policy_before
+
+    report = build_shadow_attribution_report(final_state)
+    assert report is not None
+    assert report["bars"] == len(BARS)
+    assert report["hold_bars"] == 2
+    assert report["baseline"]["entries"] == sum(a != "NONE" for a in baseline_actions)
+    assert list(report["seams"]) == list(SEAMS)
+
+    for seam in SEAMS:
+        seam_actions, _ = _replay(
+            {"feature_attribution": {"selected_row_label": seam, "mode": "neutralize"}}
+        )
+        seam_report = report["seams"][seam]
+        assert seam_report["entries"] == sum(a != "NONE" for a in seam_actions), seam
+        assert seam_report["diverged_bars"] == sum(
+            a != b for a, b in zip(seam_actions, baseline_actions, strict=True)
+        ), seam
+        assert seam_report["delta_entries"] == (
+            seam_report["entries"] - report["baseline"]["entries"]
+        )
+
+
+def test_shadow_mode_reports_seam_divergence() -> None:
+    _, final_state = _replay({"feature_attribution": {"mode": "shadow_all"}})
+    report = build_shadow_attribution_report(final_state)
+
+    assert report["seams"]["Minimum-edge gate seam"]["diverged_bars"] > 0
+    assert report["seams"]["Cooldown gate seam"]["delta_entries"] > 0
+
+
+def test_shadow_mode_closes_positions_after_hold_bars() -> None:
+    _, final_state = _replay({"feature_attribution": {"mode": "shadow_all", "hold_bars": 1}})
+    baseline = final_state[FEATURE_ATTRIBUTION_SHADOW_STATE_KEY]["branches"]["baseline"]
+
+    assert baseline["stats"]["shadow_trades"] >= 1
+    assert baseline["stats"]["shadow_return"] > 0.0
+
+
+def test_shadow_mode_invalid_request_fails_closed() -> None:
+    action, meta = decide(
+        {"feature_attribution": {"mode": "shadow_all", "hold_bars": 0}},
+        probas={"buy": 0.80, "sell": 0.40},
+        confidence={"buy": 0.85, "sell": 0.40},
+        regime="balanced",
+        state={},
+        risk_ctx={},
+        cfg=CFG,
+    )
+
+    assert action == "NONE"
+    assert "FEATURE_ATTRIBUTION_INVALID_REQUEST" in (meta.get("reasons") or [])
+    assert FEATURE_ATTRIBUTION_SHADOW_STATE_KEY not in meta["state_out"]
+
+
+def test_report_is_none_without_shadow_state() -> None:
+    assert build_shadow_attribution_report({}) is None
+    assert build_shadow_attribution_report(None) is None
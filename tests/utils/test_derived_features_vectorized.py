@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.backtest.engine_precompute import prepare_precomputed_features
+from core.indicators.derived_features import (
+    DERIVED_FEATURE_KEYS,
+    calculate_momentum_displacement_z,
+    calculate_price_reversion_potential,
+    calculate_price_stretch_z,
+    calculate_regime_persistence,
+    calculate_trend_confluence,
+    calculate_volatility_shift,
+    calculate_volume_anomaly_z,
+    compute_derived_feature_arrays,
+)
+from core.indicators.volume import volume_score
+
+
+def _series(length: int, seed: int) -> dict[str, list[float]]:
+    rng = np.random.default_rng(seed)
+    closes = 100.0 + np.cumsum(rng.normal(0.0, 1.0, length))
+    atr_14 = np.abs(rng.normal(1.0, 0.3, length))
+    atr_50 = np.abs(rng.normal(1.0, 0.1, length))
+    atr_50[rng.integers(0, length, 5)] = 0.0
+    ema_20 = pd.Series(closes).ewm(span=20, adjust=False).mean().to_numpy()
+    ema_50 = pd.Series(closes).ewm(span=50, adjust=False).mean().to_numpy()
+    # Flat stretches exercise the zero-slope branches.
+    ema_50[100:130] = ema_50[100]
+    volumes = rng.lognormal(3.0, 0.5, length)
+    return {
+        "closes": closes.tolist(),
+        "volumes": volumes.tolist(),
+        "atr_short": atr_14.tolist(),
+        "atr_long": atr_50.tolist(),
+        "ema_fast": ema_20.tolist(),
+        "ema_slow": ema_50.tolist(),
+    }
+
+
+def _asof(data: dict[str, list[float]], end: int) -> dict[str, float]:
+    """Last value of each as-of feature computed on the prefix ``[:end]``."""
+    closes = data["closes"][:end]
+    atr_short = data["atr_short"][:end]
+    ema_slow = data["ema_slow"][:end]
+    stretch = calculate_price_stretch_z(closes, ema_slow, atr_short)
+    return {
+        "momentum_displacement_z": calculate_momentum_displacement_z(closes, atr_short)[-1],
+        "price_stretch_z": stretch[-1],
+        "trend_confluence": calculate_trend_confluence(data["ema_fast"][:end], ema_slow)[-1],
+        "volatility_shift": calculate_volatility_shift(atr_short, data["atr_long"][:end])[-1],
+        "volume_anomaly_z": calculate_volume_anomaly_z(data["volumes"][:end])[-1],
+        "regime_persistence": calculate_regime_persistence(ema_slow)[-1],
+        "price_reversion_potential": calculate_price_reversion_potential(stretch)[-1],
+    }
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_vectorized_suite_matches_asof_values_on_random_bars(seed: int) -> None:
+    data = _series(600, seed)
+    suite = compute_derived_feature_arrays(**data)
+
+    assert tuple(suite) == DERIVED_FEATURE_KEYS
+    assert all(len(values) == 600 for values in suite.values())
+
+    rng = np.random.default_rng(seed + 100)
+    bars = sorted({0, 1, 3, 9, 20, 24, 25, 239, 599, *rng.integers(0, 600, 40).tolist()})
+    for bar in bars:
+        expected = _asof(data, bar + 1)
+        for key in DERIVED_FEATURE_KEYS:
+            assert suite[key][bar] == pytest.approx(expected[key], abs=1e-9), (key, bar)
+
+
+def test_vectorized_suite_has_no_lookahead() -> None:
+    data = _series(400, 7)
+    full = compute_derived_feature_arrays(**data)
+    truncated = compute_derived_feature_arrays(
+        **{key: values[:250] for key, values in data.items()}
+    )
+
+    for key in DERIVED_FEATURE_KEYS:
+        np.testing.assert_allclose(full[key][:250], truncated[key], rtol=0, atol=1e-9)
+
+
+def test_precompute_payload_only_carries_read_derived_features(tmp_path) -> None:
+    rng = np.random.default_rng(3)
+    closes = 100.0 + np.cumsum(rng.normal(0.0, 1.0, 300))
+    candles = pd.DataFrame(
+        {
+            "open": closes,
+            "high": closes + 1.0,
+            "low": closes - 1.0,
+            "close": closes,
+            "volume": rng.lognormal(3.0, 0.5, 300),
+        }
+    )
+
+    pre = prepare_precomputed_features(
+        candles_df=candles,
+        htf_candles_df=None,
+        cache_path=tmp_path / "pre.npz",
+        cache_write_enabled=False,
+        logger=logging.getLogger(__name__),
+        build_cache_metadata=lambda _n: {},
+        validate_cache=lambda _npz, _n: (False, "unused"),
+        load_cache_payload=lambda _npz: {},
+    )
+
+    assert pre is not None
+    # Only volatility_shift has a per-bar reader; the rest of the suite stays out of the payload.
+    assert [key for key in DERIVED_FEATURE_KEYS if key in pre] == ["volatility_shift"]
+    assert pre["volatility_shift"] == calculate_volatility_shift(pre["atr_14"], pre["atr_50"])
+    assert pre["volume_score"] == volume_score(candles["volume"].to_numpy()).tolist()
+
+
+@pytest.mark.parametrize("atr_period", [14, 28])
+def test_precomputed_volatility_shift_matches_runtime_for_atr_period(
+    tmp_path, monkeypatch, atr_period: int
+) -> None:
+    from core.strategy import features_asof
+
+    rng = np.random.default_rng(11)
+    closes = 100.0 + np.cumsum(rng.normal(0.0, 1.0, 320))
+    spread = np.abs(rng.normal(1.0, 0.4, 320))
+    candles_df = pd.DataFrame(
+        {
+            "open": closes,
+            "high": closes + spread,
+            "low": closes - spread[::-1],
+            "close": closes,
+            "volume": rng.lognormal(3.0, 0.5, 320),
+        }
+    )
+    pre = prepare_precomputed_features(
+        candles_df=candles_df,
+        htf_candles_df=None,
+        cache_path=tmp_path / "pre.npz",
+        cache_write_enabled=False,
+        logger=logging.getLogger(__name__),
+        build_cache_metadata=lambda _n: {},
+        validate_cache=lambda _npz, _n: (False, "unused"),
+        load_cache_payload=lambda _npz: {},
+        atr_periods=(atr_period,),
+    )
+    assert pre is not None
+    if atr_period != 14:
+        assert f"volatility_shift_{atr_period}" in pre
+    candles = {col: candles_df[col].tolist() for col in candles_df.columns}
+    asof_bar = len(closes) - 1
+    thresholds = {"signal_adaptation": {"atr_period": atr_period}}
+
+    monkeypatch.setattr(features_asof, "_feature_cache", features_asof.OrderedDict())
+    monkeypatch.setenv("GENESIS_PRECOMPUTE_FEATURES", "1")
+    runtime_shift = features_asof.calculate_volatility_shift
+    # The precomputed path must read the array by index, never recompute per bar.
+    monkeypatch.setattr(
+        features_asof,
+        "calculate_volatility_shift",
+        lambda *_a, **_k: pytest.fail("volatility shift recomputed per bar"),
+    )
+    precomputed, _ = features_asof._extract_asof(
+        candles,
+        asof_bar,
+        config={"thresholds": thresholds, "precomputed_features": pre, "_global_index": asof_bar},
+    )
+    monkeypatch.delenv("GENESIS_PRECOMPUTE_FEATURES")
+    monkeypatch.setattr(features_asof, "calculate_volatility_shift", runtime_shift)
+    monkeypatch.setattr(features_asof, "_feature_cache", features_asof.OrderedDict())
+    runtime, _ = features_asof._extract_asof(candles, asof_bar, config={"thresholds": thresholds})
+
+    for key in ("volatility_shift_ma3", "rsi_vol_interaction"):
+        assert precomputed[key] == pytest.approx(runtime[key], abs=1e-9)
+
+
+def test_ensure_atr_period_features_adds_period_columns_once() -> None:
+    from core.backtest.engine_precompute import ensure_atr_period_features
+    from core.indicators.atr import calculate_atr
+
+    rng = np.random.default_rng(5)
+    closes = 100.0 + np.cumsum(rng.normal(0.0, 1.0, 200))
+    candles_df = pd.DataFrame({"high": closes + 1.0, "low": closes - 1.0, "close": closes})
+    atr_50 = calculate_atr(
+        candles_df["high"].tolist(), candles_df["low"].tolist(), closes.tolist(), period=50
+    )
+    pre = {"atr_14": [1.0] * 200, "atr_50": list(atr_50)}
+
+    ensure_atr_period_features(pre, candles_df=candles_df, atr_period=14)
+    assert set(pre) == {"atr_14", "atr_50"}
+
+    ensure_atr_period_features(pre, candles_df=candles_df, atr_period=28)
+    atr_28 = calculate_atr(
+        candles_df["high"].tolist(), candles_df["low"].tolist(), closes.tolist(), period=28
+    )
+    assert pre["atr_28"] == pytest.approx(list(atr_28))
+    assert pre["volatility_shift_28"] == pytest.approx(
+        calculate_volatility_shift(list(atr_28), list(atr_50))
+    )
+
+    shift_28 = pre["volatility_shift_28"]
+    ensure_atr_period_features(pre, candles_df=candles_df, atr_period=28)
+    assert pre["volatility_shift_28"] is shift_28
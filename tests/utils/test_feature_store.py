@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import core.backtest.engine_precompute as engine_precompute
+from core.backtest.engine_precompute import PRECOMPUTE_BASE_COLUMNS, prepare_precomputed_features
+from core.utils.feature_store import FeatureKey, FeatureStore, feature_spec_hash
+
+KEY = FeatureKey("tTEST", "1h", spec_hash=feature_spec_hash({"spec": 1}), data_id="data-a")
+
+
+def test_spec_hash_is_order_independent() -> None:
+    assert feature_spec_hash({"a": 1, "b": [2]}) == feature_spec_hash({"b": [2], "a": 1})
+    assert feature_spec_hash({"a": 1}) != feature_spec_hash({"a": 2})
+
+
+def test_missing_columns_are_computed_once_and_shared(tmp_path) -> None:
+    store = FeatureStore(tmp_path)
+    calls: list[tuple[str, ...]] = []
+
+    def compute(missing: tuple[str, ...]) -> dict[str, np.ndarray]:
+        calls.append(missing)
+        return {name: np.arange(4, dtype=float) * (i + 1) for i, name in enumerate(missing)}
+
+    first = store.get(KEY, ["x", "y"], compute=compute)
+    second = store.get(KEY, ["y", "x"], compute=compute)
+    extended = store.get(KEY, ["x", "z"], compute=compute)
+
+    assert calls == [("x", "y"), ("z",)]
+    assert second["x"] is first["x"]
+    assert extended["z"].tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert not first["x"].flags.writeable
+    assert store.available(KEY) == ("x", "y", "z")
+
+
+def test_columns_persist_and_are_memory_mapped(tmp_path) -> None:
+    FeatureStore(tmp_path).put(KEY, {"x": [1.0, 2.0], "idx": np.array([3, 4])})
+
+    reopened = FeatureStore(tmp_path)
+    columns = reopened.get(KEY, ["x", "idx"])
+
+    assert isinstance(columns["x"], np.memmap)
+    assert columns["x"].tolist() == [1.0, 2.0]
+    assert columns["idx"].dtype.kind == "i"
+    other = FeatureKey(KEY.symbol, KEY.timeframe, KEY.spec_hash, data_id="data-b")
+    with pytest.raises(KeyError):
+        reopened.get(other, ["x"])
+
+
+def test_write_disabled_store_stays_in_memory(tmp_path) -> None:
+    store = FeatureStore(tmp_path, write_enabled=False)
+    store.put(KEY, {"x": [1.0]})
+
+    assert store.get(KEY, ["x"])["x"].tolist() == [1.0]
+    assert not any(tmp_path.iterdir())
+
+
+def test_get_frame_round_trips_and_returns_independent_copies(tmp_path) -> None:
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=3, freq="1h", tz="UTC"),
+            "rsi": [0.1, 0.2, 0.3],
+            "flag": [True, False, True],
+        }
+    )
+    loads: list[int] = []
+
+    def load() -> pd.DataFrame:
+        loads.append(1)
+        return df.copy()
+
+    first = FeatureStore(tmp_path).get_frame(KEY, load=load)
+    first.loc[0, "rsi"] = 99.0
+    from_disk = FeatureStore(tmp_path).get_frame(KEY, load=load)
+
+    assert len(loads) == 1
+    pd.testing.assert_frame_equal(from_disk, df)
+
+
+def test_get_frame_passes_through_unstorable_frames(tmp_path) -> None:
+    df = pd.DataFrame({"label": ["a", "b"]})
+    store = FeatureStore(tmp_path)
+
+    assert store.get_frame(KEY, load=lambda: df) is df
+    assert store.available(KEY) == ()
+
+
+def test_precompute_reuses_feature_store_between_engines(tmp_path, monkeypatch) -> None:
+    closes = 100.0 + np.cumsum(np.random.default_rng(5).normal(0.0, 1.0, 200))
+    candles = pd.DataFrame(
+        {"open": closes, "high": closes + 1.0, "low": closes - 1.0, "close": closes}
+    )
+    store = FeatureStore(None)
+    original = engine_precompute._load_or_compute_base_payload
+    calls: list[int] = []
+
+    def counting(**kwargs):
+        calls.append(1)
+        return original(**kwargs)
+
+    monkeypatch.setattr(engine_precompute, "_load_or_compute_base_payload", counting)
+
+    def run() -> dict[str, list[float]] | None:
+        return prepare_precomputed_features(
+            candles_df=candles,
+            htf_candles_df=None,
+            cache_path=tmp_path / "pre.npz",
+            cache_write_enabled=False,
+            logger=logging.getLogger(__name__),
+            build_cache_metadata=lambda _n: {},
+            validate_cache=lambda _npz, _n: (False, "unused"),
+            load_cache_payload=lambda _npz: {},
+            feature_store=store,
+            feature_key=KEY,
+        )
+
+    first = run()
+    second = run()
+
+    assert calls == [1]
+    assert first is not None and second is not None
+    assert set(PRECOMPUTE_BASE_COLUMNS) <= set(first)
+    assert first.keys() == second.keys()
+    for name in first:
+        np.testing.assert_array_equal(first[name], second[name])
+    assert all(isinstance(i, int) for i in second["fib_high_idx"])
+
+
+def test_default_store_persists_only_when_opted_in(tmp_path, monkeypatch) -> None:
+    from core.utils import feature_store
+
+    monkeypatch.setenv("GENESIS_FEATURE_STORE_DIR", str(tmp_path))
+    monkeypatch.delenv("GENESIS_FEATURE_STORE_WRITE")
+    feature_store.default_feature_store().put(KEY, {"x": [1.0]})
+    assert not any(tmp_path.iterdir())
+
+    monkeypatch.setattr(feature_store, "_DEFAULT_STORE", None)
+    monkeypatch.setenv("GENESIS_FEATURE_STORE_WRITE", "1")
+    feature_store.default_feature_store().put(KEY, {"x": [1.0]})
+    assert (tmp_path / KEY.symbol).is_dir()
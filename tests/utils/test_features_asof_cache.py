@@ -241,3 +241,113 @@ def test_feature_result_cache_store_enforces_size_and_overwrite_semantics() -> N
     assert list(cache.keys()) == ["k2", "k3"]
     assert "k1" not in cache
     assert cache["k3"] is third
+
+
+def test_indexed_feature_result_cache_addresses_slots_by_global_index() -> None:
+    from core.strategy.features_asof_parts.result_cache_utils import IndexedFeatureResultCache
+
+    cache = IndexedFeatureResultCache(max_namespaces=2)
+    result = ({"f": 1.0}, {"m": 1})
+
+    cache.store((7, 0, 199, 350), result)
+
+    assert cache.lookup((7, 0, 199, 350)) is result
+    assert cache.lookup((7, 0, 199, 351)) is None
+    assert cache.lookup((7, 1, 199, 350)) is None
+    assert cache.lookup((8, 0, 199, 350)) is None
+    assert len(cache) == 1
+
+    cache.store((8, 0, 199, 0), result)
+    cache.store((9, 0, 199, 0), result)
+    # Oldest namespace (dataset 7) is evicted.
+    assert cache.lookup((7, 0, 199, 350)) is None
+    assert cache.lookup((9, 0, 199, 0)) is result
+
+
+def test_keyed_mode_uses_index_cache_without_hashing_candles(monkeypatch) -> None:
+    from core.strategy import features_asof
+
+    def _no_hash(*_args, **_kwargs):  # pragma: no cover - must not be called
+        raise AssertionError("candle hashing used in keyed mode")
+
+    monkeypatch.setattr(features_asof, "_compute_candles_hash", _no_hash)
+    monkeypatch.setattr(
+        features_asof, "_indexed_feature_cache", features_asof.IndexedFeatureResultCache()
+    )
+
+    n = 120
+    closes = [100.0 + math.sin(i / 5.0) for i in range(n)]
+    candles = {
+        "open": closes,
+        "high": [c + 1.0 for c in closes],
+        "low": [c - 1.0 for c in closes],
+        "close": closes,
+        "volume": [10.0] * n,
+    }
+    config = {"_dataset_fingerprint": 12345, "_global_index": 500}
+
+    key = features_asof._compute_feature_cache_key(candles, n - 1, config)
+    assert key == (12345, features_asof.feature_config_fingerprint(config), 0, n - 1, 500)
+
+    feats, meta = features_asof._extract_asof(candles, n - 1, config=config)
+    assert len(features_asof._indexed_feature_cache) == 1
+
+    feats["rsi_inv_lag1"] = 999.0
+    meta["reasons"].append("mutated")
+    cached_feats, cached_meta = features_asof._extract_asof(candles, n - 1, config=config)
+
+    assert cached_feats["rsi_inv_lag1"] != 999.0
+    assert "mutated" not in cached_meta["reasons"]
+
+
+def test_keyed_cache_separates_feature_configs_on_same_dataset(monkeypatch) -> None:
+    from core.strategy import features_asof
+
+    monkeypatch.setattr(
+        features_asof, "_indexed_feature_cache", features_asof.IndexedFeatureResultCache()
+    )
+    n = 200
+    closes = [100.0 + 5.0 * math.sin(i / 7.0) + 0.05 * i for i in range(n)]
+    candles = {
+        "open": closes,
+        "high": [c + 1.0 + (i % 5) * 0.3 for i, c in enumerate(closes)],
+        "low": [c - 1.0 - (i % 3) * 0.4 for i, c in enumerate(closes)],
+        "close": closes,
+        "volume": [10.0] * n,
+    }
+
+    def _config(atr_period: int) -> dict:
+        return {
+            "_dataset_fingerprint": 777,
+            "_global_index": n - 1,
+            "thresholds": {"signal_adaptation": {"atr_period": atr_period}},
+        }
+
+    feats_14, _ = features_asof._extract_asof(candles, n - 1, config=_config(14))
+    feats_28, _ = features_asof._extract_asof(candles, n - 1, config=_config(28))
+    features_asof._indexed_feature_cache.clear()
+    uncached_28, _ = features_asof._extract_asof(candles, n - 1, config=_config(28))
+
+    assert feats_28 == uncached_28
+    assert feats_14["volatility_shift_ma3"] != feats_28["volatility_shift_ma3"]
+
+
+def test_indexed_feature_result_cache_is_bounded() -> None:
+    from core.strategy.features_asof_parts.result_cache_utils import IndexedFeatureResultCache
+
+    cache = IndexedFeatureResultCache(max_namespaces=4, max_entries=3)
+    result = ({"f": 1.0}, {"m": 1})
+
+    cache.store((1, 0, 0, 99, 0), result)
+    cache.store((1, 0, 0, 99, 1), result)
+    cache.store((2, 0, 0, 99, 0), result)
+    cache.store((2, 0, 0, 99, 1), result)
+
+    # Older namespace evicted to make room for the active one.
+    assert cache.lookup((1, 0, 0, 99, 0)) is None
+    assert len(cache) == 2
+
+    for index in range(2, 6):
+        cache.store((2, 0, 0, 99, index), result)
+    assert len(cache) == 3
+    assert cache.lookup((2, 0, 0, 99, 5)) is None
@@ -66,7 +66,8 @@ def test_build_indicator_state_keeps_true_atr14_when_period_differs() -> None:
         "bb_position_20_2": [float(i) / 100.0 for i in range(120)],
         "atr_21": [float(i) / 10.0 for i in range(120)],
         "atr_14": [float(i) / 20.0 for i in range(120)],
-        "volatility_shift": [1.0 + (i / 100.0) for i in range(120)],
+        # Unsuffixed volatility_shift is ATR14-based; other periods need their own key.
+        "volatility_shift_21": [1.0 + (i / 100.0) for i in range(120)],
     }
 
     state = build_indicator_state(
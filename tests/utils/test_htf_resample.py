@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import core.indicators.htf_resample as htf_resample
+from core.indicators.htf_resample import (
+    can_derive_timeframe,
+    get_resampled_candles,
+    minutes_to_timeframe,
+    resample_candles,
+    timeframe_to_minutes,
+)
+
+
+def _hourly(start: str, periods: int) -> pd.DataFrame:
+    ts = pd.date_range(start, periods=periods, freq="1h", tz="UTC")
+    base = np.arange(periods, dtype=float)
+    return pd.DataFrame(
+        {
+            "timestamp": ts,
+            "open": 100.0 + base,
+            "high": 101.0 + base,
+            "low": 99.0 + base,
+            "close": 100.5 + base,
+            "volume": np.ones(periods),
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    ("tf", "minutes"),
+    [
+        ("15m", 15),
+        ("4h", 240),
+        ("1D", 1440),
+        ("1d", 1440),
+        ("1W", 10080),
+        ("1M", None),
+        ("x", None),
+    ],
+)
+def test_timeframe_to_minutes(tf, minutes):
+    assert timeframe_to_minutes(tf) == minutes
+
+
+def test_minutes_to_timeframe_prefers_largest_unit():
+    assert minutes_to_timeframe(240) == "4h"
+    assert minutes_to_timeframe(1440) == "1D"
+    assert minutes_to_timeframe(20160) == "2W"
+    assert minutes_to_timeframe(45) == "45m"
+
+
+def test_can_derive_timeframe_requires_exact_multiple():
+    assert can_derive_timeframe("1h", "1D")
+    assert can_derive_timeframe("15m", "4h")
+    assert not can_derive_timeframe("3h", "4h")
+    assert not can_derive_timeframe("1D", "1h")
+    assert not can_derive_timeframe("1h", "1h")
+
+
+def test_resample_daily_aggregates_ohlcv_with_open_time_labels():
+    df = _hourly("2024-01-01", 48)
+    out = resample_candles(df, "1h", "1D")
+
+    assert list(out["timestamp"]) == list(
+        pd.date_range("2024-01-01", periods=2, freq="1D", tz="UTC")
+    )
+    first = out.iloc[0]
+    assert first["open"] == pytest.approx(100.0)
+    assert first["high"] == pytest.approx(101.0 + 23)
+    assert first["low"] == pytest.approx(99.0)
+    assert first["close"] == pytest.approx(100.5 + 23)
+    assert first["volume"] == pytest.approx(24.0)
+
+
+def test_resample_drops_partial_leading_and_unclosed_trailing_buckets():
+    # Starts at 05:00 on day 1 and ends at 10:00 on day 3 -> only day 2 is a closed bar.
+    df = _hourly("2024-01-01 05:00", 24 * 2 + 1)
+    out = resample_candles(df, "1h", "1D")
+
+    assert list(out["timestamp"]) == [pd.Timestamp("2024-01-02", tz="UTC")]
+
+
+def test_resample_weekly_buckets_anchor_on_monday():
+    df = _hourly("2024-01-01", 24 * 14)  # 2024-01-01 is a Monday
+    out = resample_candles(df, "1h", "1W")
+
+    assert len(out) == 2
+    assert all(ts.dayofweek == 0 for ts in out["timestamp"])
+
+
+def test_resample_rejects_non_multiple_timeframes():
+    with pytest.raises(ValueError):
+        resample_candles(_hourly("2024-01-01", 10), "3h", "4h")
+
+
+def test_get_resampled_candles_uses_disk_cache_keyed_by_checksum(tmp_path, monkeypatch):
+    df = _hourly("2024-01-01", 96)
+    htf_resample._resampled_cache.clear()
+
+    first = get_resampled_candles(
+        df, symbol="tTEST", source_timeframe="1h", target_timeframe="1D", cache_dir=tmp_path
+    )
+    files = list(tmp_path.glob("*.parquet"))
+    assert len(files) == 1
+
+    htf_resample._resampled_cache.clear()
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("cache hit must not resample")
+
+    monkeypatch.setattr(htf_resample, "resample_candles", _fail)
+    second = get_resampled_candles(
+        df, symbol="tTEST", source_timeframe="1h", target_timeframe="1D", cache_dir=tmp_path
+    )
+    pd.testing.assert_frame_equal(first, second, check_dtype=False)
+
+    changed = df.copy()
+    changed.loc[5, "close"] += 1.0
+    monkeypatch.undo()
+    get_resampled_candles(
+        changed, symbol="tTEST", source_timeframe="1h", target_timeframe="1D", cache_dir=tmp_path
+    )
+    assert len(list(tmp_path.glob("*.parquet"))) == 2
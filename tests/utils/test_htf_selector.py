@@ -29,3 +29,17 @@ def test_select_htf_timeframe_defaults_to_static_map():
     timeframe, meta = select_htf_timeframe("1h", None)
     assert timeframe == "6h"
     assert meta["selected"] == "6h"
+
+
+def test_select_htf_timeframe_multiplier_allows_derived_timeframes():
+    selector = {"mode": "fixed", "per_timeframe": {"1h": {"multiplier": 8}}}
+    timeframe, meta = select_htf_timeframe("1h", selector)
+    assert timeframe == "8h"
+    assert meta["derivable"] is True
+
+
+def test_select_htf_timeframe_reports_non_derivable_selection():
+    selector = {"mode": "fixed", "per_timeframe": {"3h": {"timeframe": "4h"}}}
+    timeframe, meta = select_htf_timeframe("3h", selector)
+    assert timeframe == "4h"
+    assert meta["derivable"] is False
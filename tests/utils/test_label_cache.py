@@ -0,0 +1,147 @@
+"""Tests for the indexed label cache and batched triple-barrier labeling."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import core.ml.label_cache as label_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(label_cache, "_CACHE_DIR", tmp_path / "labels")
+    return tmp_path / "labels"
+
+
+def _ohlc(n: int = 400, seed: int = 7) -> tuple[list[float], list[float], list[float]]:
+    rng = np.random.default_rng(seed)
+    closes = 100.0 + np.cumsum(rng.normal(0.0, 1.0, n))
+    highs = closes + rng.random(n)
+    lows = closes - rng.random(n)
+    return closes.tolist(), highs.tolist(), lows.tolist()
+
+
+def test_save_and_load_roundtrip_uses_single_store(cache_dir):
+    labels = [1, 0, None, 1]
+    label_cache.save_labels_to_cache(labels, "tBTCUSD", "1h", 1.5, 1.0, 12)
+
+    assert label_cache.load_cached_labels("tBTCUSD", "1h", 1.5, 1.0, 12) == labels
+    assert label_cache.load_cached_labels("tBTCUSD", "1h", 2.0, 1.0, 12) is None
+    assert [p.name for p in cache_dir.iterdir() if p.suffix != ".lock"] == ["label_store.npz"]
+
+
+def test_cache_info_is_backed_by_index(cache_dir):
+    label_cache.save_label_batch(
+        {"tBTCUSD_1h_a": [1, None], "tETHUSD_1h_b": [0, 0, 1]},
+        {"tBTCUSD_1h_a": {"symbol": "tBTCUSD"}, "tETHUSD_1h_b": {"symbol": "tETHUSD"}},
+    )
+
+    info = label_cache.get_cache_info()
+
+    assert info["exists"] is True
+    assert info["total_entries"] == 2
+    assert info["total_labels"] == 5
+    assert info["symbols"] == ["tBTCUSD", "tETHUSD"]
+
+
+def test_cache_info_counts_legacy_only_entries(cache_dir):
+    cache_dir.mkdir(parents=True)
+    legacy_key = label_cache.get_label_cache_key("tSOLUSD", "1h", 1.0, 1.0, 5)
+    pd.DataFrame({"label": [1.0]}).to_parquet(cache_dir / f"{legacy_key}.parquet", index=False)
+
+    info = label_cache.get_cache_info()
+    assert info["exists"] is True
+    assert info["total_entries"] == info["legacy_entries"] == 1
+    assert info["symbols"] == ["tSOLUSD"]
+
+    label_cache.save_label_batch({"tBTCUSD_1h_a": [1]}, {"tBTCUSD_1h_a": {"symbol": "tBTCUSD"}})
+    info = label_cache.get_cache_info()
+    assert info["total_files"] == 2
+    assert info["total_entries"] == 2
+    assert info["symbols"] == ["tBTCUSD", "tSOLUSD"]
+
+
+def _save_many(cache_dir, worker: int, count: int) -> None:
+    label_cache._CACHE_DIR = cache_dir
+    for i in range(count):
+        label_cache.save_labels_to_cache([worker, i], "tBTCUSD", "1h", float(worker), 1.0, i)
+
+
+@pytest.mark.skipif(label_cache.fcntl is None, reason="requires fcntl")
+def test_concurrent_saves_keep_every_entry(cache_dir):
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_save_many, args=(cache_dir, w, 8)) for w in range(4)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join(timeout=60)
+
+    assert all(proc.exitcode == 0 for proc in procs)
+    assert label_cache.get_cache_info()["total_entries"] == 32
+    for worker in range(4):
+        for i in range(8):
+            cached = label_cache.load_cached_labels("tBTCUSD", "1h", float(worker), 1.0, i)
+            assert cached == [worker, i]
+
+
+def test_clear_label_cache_filters_store_and_legacy_files(cache_dir):
+    label_cache.save_labels_to_cache([1], "tBTCUSD", "1h", 1.0, 1.0, 5)
+    label_cache.save_labels_to_cache([0], "tETHUSD", "1h", 1.0, 1.0, 5)
+    legacy_key = label_cache.get_label_cache_key("tBTCUSD", "1h", 9.0, 9.0, 9)
+    pd.DataFrame({"label": [1.0]}).to_parquet(cache_dir / f"{legacy_key}.parquet", index=False)
+
+    assert label_cache.load_cached_labels("tBTCUSD", "1h", 9.0, 9.0, 9) == [1]
+    assert label_cache.clear_label_cache(symbol="tBTCUSD") == 2
+    assert label_cache.load_cached_labels("tBTCUSD", "1h", 1.0, 1.0, 5) is None
+    assert label_cache.load_cached_labels("tETHUSD", "1h", 1.0, 1.0, 5) == [0]
+
+
+def test_label_grid_matches_single_config_labeling(cache_dir):
+    pytest.importorskip("numba")
+    from core.ml.labeling_fast import (
+        generate_adaptive_triple_barrier_label_grid,
+        generate_adaptive_triple_barrier_labels_fast,
+    )
+
+    closes, highs, lows = _ohlc()
+    configs = [(p, s, h) for p in (1.0, 1.5) for s in (0.6, 1.0) for h in (3, 12, 36)]
+
+    grid = generate_adaptive_triple_barrier_label_grid(closes, highs, lows, configs)
+
+    assert list(grid) == configs
+    for profit, stop, holding in configs:
+        expected = generate_adaptive_triple_barrier_labels_fast(
+            closes, highs, lows, profit, stop, holding
+        )
+        assert grid[(profit, stop, holding)] == expected
+
+
+def test_get_or_compute_label_grid_only_computes_misses(cache_dir, monkeypatch):
+    pytest.importorskip("numba")
+    import core.ml.labeling_fast as labeling_fast
+
+    closes, highs, lows = _ohlc(200)
+    first = label_cache.get_or_compute_label_grid(
+        closes, highs, lows, "tBTCUSD", "1h", [(1.0, 1.0, 5), (2.0, 1.0, 5)]
+    )
+    assert label_cache.get_cache_info()["total_entries"] == 2
+
+    seen: list[list[tuple[float, float, int]]] = []
+    real = labeling_fast.generate_adaptive_triple_barrier_label_grid
+
+    def _spy(c, h, lo, configs, atr_period=14):
+        seen.append(list(configs))
+        return real(c, h, lo, configs, atr_period=atr_period)
+
+    monkeypatch.setattr(labeling_fast, "generate_adaptive_triple_barrier_label_grid", _spy)
+    second = label_cache.get_or_compute_label_grid(
+        closes, highs, lows, "tBTCUSD", "1h", [(1.0, 1.0, 5), (1.0, 0.5, 5)]
+    )
+
+    assert seen == [[(1.0, 0.5, 5)]]
+    assert second[(1.0, 1.0, 5)] == first[(1.0, 1.0, 5)]
+    assert label_cache.get_cache_info()["total_entries"] == 3
@@ -0,0 +1,129 @@
+"""
+Tests for the MCP in-memory code search index
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from mcp_server.code_index import CodeSearchIndex, SearchHit
+from mcp_server.config import load_config
+from mcp_server.tools import get_project_structure, search_code
+
+
+def _write(path, text: str, *, mtime_ns: int | None = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_search_returns_path_and_line_hits_in_path_order(tmp_path):
+    _write(tmp_path / "pkg" / "b.py", "import os\ndef load_config():\n    pass\n")
+    _write(tmp_path / "pkg" / "load_config.py", "x = 1\n")
+    _write(tmp_path / "pkg" / "notes.md", "def load_config in docs\n")
+    _write(tmp_path / "data" / "ignored.py", "def load_config():\n")
+
+    index = CodeSearchIndex(tmp_path)
+    hits, truncated = index.search("LOAD_CONFIG")
+
+    assert truncated is False
+    assert hits == [
+        SearchHit("pkg/b.py", 2, "def load_config():"),
+        SearchHit("pkg/load_config.py", 0, "[path match]"),
+    ]
+    md_hits, _ = index.search("load_config", file_pattern="*.md")
+    assert md_hits == [SearchHit("pkg/notes.md", 1, "def load_config in docs")]
+
+
+def test_trigram_prefilter_skips_files_without_query(tmp_path):
+    _write(tmp_path / "a.py", "alpha = 1\n")
+    _write(tmp_path / "b.py", "beta = 2\n")
+
+    index = CodeSearchIndex(tmp_path)
+    index.refresh(force=True)
+
+    assert index._content_candidates("alpha") == {"a.py"}
+    assert index._content_candidates("gamma") == set()
+    assert index.search("al")[0] == [SearchHit("a.py", 1, "alpha = 1")]
+
+
+def test_refresh_reindexes_only_changed_and_removed_files(tmp_path):
+    _write(tmp_path / "a.py", "old_name = 1\n", mtime_ns=1_000_000_000)
+    _write(tmp_path / "b.py", "keep = 1\n", mtime_ns=1_000_000_000)
+
+    index = CodeSearchIndex(tmp_path)
+    assert index.refresh(force=True) == 2
+    assert index.refresh(force=True) == 0
+
+    _write(tmp_path / "a.py", "new_name = 1\n", mtime_ns=2_000_000_000)
+    (tmp_path / "b.py").unlink()
+    generation = index.generation
+
+    assert index.refresh(force=True) == 2
+    assert index.generation == generation + 1
+    assert index.search("old_name")[0] == []
+    assert index.search("new_name")[0] == [SearchHit("a.py", 1, "new_name = 1")]
+    assert index.search("keep")[0] == []
+
+
+def test_search_truncates_at_max_matches(tmp_path):
+    _write(tmp_path / "a.py", "hit\n" * 10)
+
+    hits, truncated = CodeSearchIndex(tmp_path).search("hit", max_matches=3)
+
+    assert truncated is True
+    assert len(hits) == 3
+
+
+@pytest.mark.asyncio
+async def test_project_structure_is_cached(monkeypatch):
+    import mcp_server.tools as tools
+
+    calls: list[int] = []
+    original = tools._build_project_structure
+
+    def _counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(tools, "_build_project_structure", _counting)
+    monkeypatch.setattr(tools, "_STRUCTURE_CACHE", {})
+    config = load_config()
+
+    first = await get_project_structure(config)
+    second = await get_project_structure(config)
+
+    assert first == second
+    assert first["success"] is True
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_search_code_respects_blocked_patterns():
+    config = load_config()
+    config.security.blocked_patterns = [*config.security.blocked_patterns, "config.py"]
+
+    result = await search_code("def load_config", "*.py", config)
+
+    assert result["success"] is True
+    assert not any(match["file"] == "mcp_server/config.py" for match in result["matches"])
+
+
+def test_update_path_makes_writes_searchable_before_next_refresh(tmp_path, monkeypatch):
+    monkeypatch.setenv("GENESIS_MCP_INDEX_REFRESH_SECONDS", "3600")
+    _write(tmp_path / "a.py", "first = 1\n")
+    index = CodeSearchIndex(tmp_path)
+    index.refresh(force=True)
+
+    _write(tmp_path / "sub" / "b.py", "fresh_symbol = 2\n")
+    assert index.search("fresh_symbol")[0] == []
+
+    index.update_path(tmp_path / "sub" / "b.py")
+    assert index.search("fresh_symbol")[0] == [SearchHit("sub/b.py", 1, "fresh_symbol = 2")]
+
+    (tmp_path / "sub" / "b.py").unlink()
+    index.update_path(tmp_path / "sub" / "b.py")
+    assert index.search("fresh_symbol")[0] == []
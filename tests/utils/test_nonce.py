@@ -1,3 +1,8 @@
+import multiprocessing
+
+import pytest
+
+from core.utils import nonce_manager
 from core.utils.nonce_manager import bump_nonce, get_nonce
 
 
@@ -14,3 +19,114 @@ def test_nonce_bump_increases_enough():
     assert bumped - before >= 1_000_000
     after = int(get_nonce(key))
     assert int(after) >= bumped
+
+
+@pytest.fixture
+def isolated_nonce_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(nonce_manager, "NONCE_FILE", tmp_path / ".nonce_tracker.json")
+    monkeypatch.setattr(nonce_manager, "_state", {})
+    monkeypatch.setattr(nonce_manager, "_shared_fd", None)
+    return tmp_path
+
+
+def test_nonce_persists_lease_once_per_block(isolated_nonce_files, monkeypatch):
+    writes: list[int] = []
+    original = nonce_manager._persist_lease
+
+    def _counting(key_id, reserved):
+        writes.append(reserved)
+        original(key_id, reserved)
+
+    monkeypatch.setattr(nonce_manager, "_persist_lease", _counting)
+
+    vals = [int(get_nonce("lease_key")) for _ in range(200)]
+
+    assert vals == sorted(set(vals))
+    assert len(writes) == 1
+    assert writes[0] >= vals[-1]
+
+
+@pytest.mark.parametrize("shared", [True, False])
+def test_nonce_never_steps_back_after_restart(isolated_nonce_files, monkeypatch, shared):
+    if not shared:
+        monkeypatch.setattr(nonce_manager, "fcntl", None)
+    bumped = int(bump_nonce("restart_key", min_increment_micro=60_000_000))
+
+    # Simulate a fresh process after a crash that also lost the shared counter file.
+    monkeypatch.setattr(nonce_manager, "_state", {})
+    monkeypatch.setattr(nonce_manager, "_shared_fd", None)
+    nonce_manager._counters_path().unlink(missing_ok=True)
+
+    assert int(get_nonce("restart_key")) > bumped
+
+
+def _issue_nonces(nonce_file, count, queue):
+    nonce_manager.NONCE_FILE = nonce_file
+    queue.put([int(get_nonce("shared_key")) for _ in range(count)])
+
+
+@pytest.mark.skipif(nonce_manager.fcntl is None, reason="requires fcntl")
+def test_nonce_unique_across_processes(isolated_nonce_files):
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    nonce_file = nonce_manager.NONCE_FILE
+    procs = [ctx.Process(target=_issue_nonces, args=(nonce_file, 300, queue)) for _ in range(3)]
+    for proc in procs:
+        proc.start()
+    results = [queue.get(timeout=30) for _ in procs]
+    for proc in procs:
+        proc.join(timeout=30)
+
+    for seq in results:
+        assert seq == sorted(seq)
+    combined = [v for seq in results for v in seq]
+    assert len(set(combined)) == len(combined)
+    assert int(get_nonce("shared_key")) > max(combined)
+
+
+def _try_counter_lock(queue):
+    fd = nonce_manager._shared_counter_fd()
+    try:
+        nonce_manager.fcntl.flock(fd, nonce_manager.fcntl.LOCK_EX | nonce_manager.fcntl.LOCK_NB)
+    except BlockingIOError:
+        queue.put("blocked")
+    else:
+        queue.put("acquired")
+
+
+@pytest.mark.skipif(nonce_manager.fcntl is None, reason="requires fcntl")
+def test_forked_child_does_not_share_counter_lock(isolated_nonce_files):
+    get_nonce("parent_key")
+    parent_fd = nonce_manager._shared_counter_fd()
+    fcntl = nonce_manager.fcntl
+    fcntl.flock(parent_fd, fcntl.LOCK_EX)
+    try:
+        ctx = multiprocessing.get_context("fork")
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_try_counter_lock, args=(queue,))
+        proc.start()
+        outcome = queue.get(timeout=30)
+        proc.join(timeout=30)
+    finally:
+        fcntl.flock(parent_fd, fcntl.LOCK_UN)
+
+    # An inherited descriptor would share the parent's flock and acquire it at once.
+    assert outcome == "blocked"
+    assert nonce_manager._shared_counter_fd() == parent_fd
+
+
+@pytest.mark.skipif(nonce_manager.fcntl is None, reason="requires fcntl")
+def test_nonce_unique_across_processes_forked_after_open(isolated_nonce_files):
+    get_nonce("shared_key")
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    nonce_file = nonce_manager.NONCE_FILE
+    procs = [ctx.Process(target=_issue_nonces, args=(nonce_file, 300, queue)) for _ in range(4)]
+    for proc in procs:
+        proc.start()
+    results = [queue.get(timeout=30) for _ in procs]
+    for proc in procs:
+        proc.join(timeout=30)
+
+    combined = [v for seq in results for v in seq]
+    assert len(set(combined)) == len(combined)
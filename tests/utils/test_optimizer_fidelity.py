@@ -0,0 +1,179 @@
+"""Tests for multi-fidelity screening of Optuna trials."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from core.optimizer.runner import _run_optuna
+from core.optimizer.runner_fidelity import (
+    FidelityLadder,
+    FidelityLevel,
+    fidelity_dir,
+    fidelity_window,
+    parse_fidelity_schedule,
+)
+from core.optimizer.runner_trial_results import (
+    _candidate_from_result,
+    _select_best_candidate_from_results,
+)
+
+pytest.importorskip("optuna")
+
+
+def test_parse_fidelity_schedule_validates_levels() -> None:
+    assert parse_fidelity_schedule(None) is None
+    assert parse_fidelity_schedule({"enabled": False, "levels": [0.5]}) is None
+
+    schedule = parse_fidelity_schedule({"levels": [0.25, 0.5], "keep_fraction": 0.5})
+    assert schedule is not None
+    assert [level.fraction for level in schedule.levels] == [0.25, 0.5]
+    assert [level.rung for level in schedule.levels] == [0, 1]
+    assert schedule.keep_fraction == 0.5
+    assert schedule.anchor == "end"
+
+    with pytest.raises(ValueError, match="stigande"):
+        parse_fidelity_schedule({"levels": [0.5, 0.25]})
+    with pytest.raises(ValueError, match="intervallet"):
+        parse_fidelity_schedule({"levels": [0.5, 1.0]})
+    with pytest.raises(ValueError, match="anchor"):
+        parse_fidelity_schedule({"levels": [0.5], "anchor": "middle"})
+
+
+def test_fidelity_window_anchors_inside_sample_range() -> None:
+    assert fidelity_window("2024-01-01", "2024-12-31", 0.25) == ("2024-10-01", "2024-12-31")
+    assert fidelity_window("2024-01-01", "2024-12-31", 0.25, anchor="start") == (
+        "2024-01-01",
+        "2024-04-01",
+    )
+    assert fidelity_window("2024-01-01", "2024-01-02", 0.1) == ("2024-01-01", "2024-01-02")
+
+
+def test_ladder_promotes_top_fraction_and_seeds_from_run_dir(tmp_path: Path) -> None:
+    schedule = parse_fidelity_schedule({"levels": [0.5], "keep_fraction": 0.5, "min_trials": 2})
+    assert schedule is not None
+    ladder = FidelityLadder(schedule=schedule)
+
+    assert ladder.record(0, 1.0) is True  # below min_trials: always promoted
+    assert ladder.record(0, 0.5) is False
+    assert ladder.record(0, 3.0) is True
+    assert ladder.record(0, 2.0) is True  # second best of [1, 0.5, 3, 2]
+
+    level_dir = fidelity_dir(tmp_path, schedule.levels[0])
+    level_dir.mkdir(parents=True)
+    for idx, payload in enumerate(
+        [{"score": {"score": 4.0}}, {"score": {"score": 1.0}}, {"error": "boom"}], start=1
+    ):
+        (level_dir / f"trial_{idx:03d}.json").write_text(json.dumps(payload), encoding="utf-8")
+
+    resumed = FidelityLadder.from_run_dir(schedule, tmp_path)
+    assert resumed.scores == {0: [4.0, 1.0]}
+    assert resumed.record(0, 0.5) is False
+
+
+def test_run_optuna_screens_trials_before_full_range(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    calls: list[tuple[int, str]] = []
+
+    def make_trial(idx: int, params: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        level: FidelityLevel | None = kwargs.get("fidelity")
+        calls.append((idx, level.name if level else "full"))
+        payload = {
+            "trial_id": f"trial_{idx:03d}",
+            "parameters": params,
+            "score": {"score": float(params["x"]), "metrics": {"num_trades": 5}},
+            "constraints": {"ok": True, "reasons": []},
+        }
+        if level is not None:
+            payload["fidelity_window"] = {"start_date": "2024-07-01", "end_date": "2024-12-31"}
+        return payload
+
+    results = _run_optuna(
+        study_config={
+            "storage": None,
+            "study_name": "fidelity_test",
+            "sampler": {"name": "random", "kwargs": {"seed": 7}},
+            "pruner": {"name": "none"},
+            "dedup_guard_enabled": False,
+            "fidelity": {"levels": [0.5], "keep_fraction": 0.25, "min_trials": 2},
+        },
+        parameters_spec={"x": {"type": "float", "low": 0.0, "high": 10.0}},
+        make_trial=make_trial,
+        run_dir=run_dir,
+        run_id="fidelity_test",
+        existing_trials={},
+        max_trials=12,
+        concurrency=1,
+        allow_resume=False,
+    )
+
+    screening_calls = [idx for idx, name in calls if name != "full"]
+    full_calls = [idx for idx, name in calls if name == "full"]
+    assert len(screening_calls) == 12
+    assert 2 <= len(full_calls) < 12
+    assert set(full_calls) <= set(screening_calls)
+
+    pruned = [r for r in results if r.get("fidelity_pruned")]
+    promoted = [r for r in results if not r.get("fidelity_pruned")]
+    assert len(pruned) == 12 - len(full_calls)
+    assert pruned[0]["fidelity"][-1]["status"] == "screened_out"
+    assert promoted[0]["fidelity"][0]["status"] == "promoted"
+    assert promoted[0]["fidelity"][0]["start_date"] == "2024-07-01"
+    assert promoted[0]["fidelity"][-1]["name"] == "full"
+
+    run_meta = json.loads((run_dir / "run_meta.json").read_text(encoding="utf-8"))
+    assert run_meta["optuna"]["fidelity"]["levels"][0]["fraction"] == 0.5
+    assert run_meta["optuna"]["diagnostics"]["fidelity_pruned_count"] == len(pruned)
+
+
+def test_screened_out_short_window_scores_never_become_champion(tmp_path: Path) -> None:
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+
+    def make_trial(idx: int, params: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        level: FidelityLevel | None = kwargs.get("fidelity")
+        x = float(params["x"])
+        # Short windows reward low x; every full-range score is far below them.
+        score = 100.0 - x if level is not None else x
+        window = "fidelity/" if level is not None else ""
+        return {
+            "trial_id": f"trial_{idx:03d}",
+            "parameters": params,
+            "score": {"score": score, "metrics": {"num_trades": 5}, "hard_failures": []},
+            "constraints": {"ok": True, "reasons": []},
+            "results_path": f"{window}trial_{idx:03d}.json",
+        }
+
+    results = _run_optuna(
+        study_config={
+            "storage": None,
+            "study_name": "fidelity_champion_test",
+            "sampler": {"name": "random", "kwargs": {"seed": 3}},
+            "pruner": {"name": "none"},
+            "dedup_guard_enabled": False,
+            "fidelity": {"levels": [0.5], "keep_fraction": 0.25, "min_trials": 2},
+        },
+        parameters_spec={"x": {"type": "float", "low": 0.0, "high": 10.0}},
+        make_trial=make_trial,
+        run_dir=run_dir,
+        run_id="fidelity_champion_test",
+        existing_trials={},
+        max_trials=10,
+        concurrency=1,
+        allow_resume=False,
+    )
+
+    pruned = [r for r in results if r.get("fidelity_pruned")]
+    assert pruned and all(r["skipped"] and r["score"]["score"] > 90.0 for r in pruned)
+
+    best, best_result = _select_best_candidate_from_results(
+        results, candidate_from_result=_candidate_from_result
+    )
+    assert best is not None and best_result is not None
+    assert not best_result.get("fidelity_pruned")
+    assert best.score <= 10.0
+    assert not best.results_path.startswith("fidelity/")
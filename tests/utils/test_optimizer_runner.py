@@ -18,6 +18,7 @@ except ImportError:
     optuna = None
 
 import core.optimizer.runner as runner
+import core.optimizer.runner_config as runner_config_lib
 from core.optimizer.runner import run_optimizer
 
 TEST_SYMBOL = "tTEST"
@@ -338,6 +339,62 @@ def test_expand_parameters_nested_grid_and_fixed_parity() -> None:
     ]
 
 
+def test_grid_space_nth_matches_iteration_order() -> None:
+    spec = {
+        "thresholds": {
+            "entry_conf_overall": {"type": "grid", "values": [0.4, 0.5, 0.6]},
+            "exit_conf": {"type": "fixed", "value": 0.3},
+        },
+        "risk": {"multiplier": {"type": "grid", "values": [1.0, 2.0]}},
+        "htf": {"type": "grid", "values": [True, False]},
+    }
+
+    space = runner.expand_parameters(spec)
+    expanded = list(space)
+
+    assert len(space) == len(expanded) == 12
+    assert [space.nth(i) for i in range(len(space))] == expanded
+    assert space.nth(-1) == expanded[-1]
+    with pytest.raises(IndexError):
+        space.nth(12)
+
+
+def test_grid_shards_partition_space_with_global_indices() -> None:
+    spec = {
+        "a": {"type": "grid", "values": [1, 2, 3]},
+        "b": {"type": "grid", "values": [10, 20, 30, 40]},
+    }
+    space = runner.expand_parameters(spec)
+
+    shards = [
+        list(runner_config_lib.iter_grid_trials(space, shard_index=i, shard_count=3))
+        for i in range(3)
+    ]
+
+    assert sorted(idx for shard in shards for idx, _ in shard) == list(range(len(space)))
+    assert all(params == space.nth(idx) for shard in shards for idx, params in shard)
+    assert runner_config_lib.parse_grid_shard("2/3") == (2, 3)
+    with pytest.raises(ValueError):
+        runner_config_lib.parse_grid_shard("3/3")
+
+
+def test_grid_dedup_uses_transformed_params_and_keeps_shards_disjoint() -> None:
+    spec = {
+        "thresholds": {"entry_conf_overall": {"type": "grid", "values": [0.3, 0.1 + 0.2, 0.4]}},
+        "risk": {"multiplier": {"type": "grid", "values": [1.0, 2.0]}},
+    }
+    space = runner.expand_parameters(spec)
+
+    unique = list(runner_config_lib.iter_grid_trials(space, dedup=True))
+    sharded = [
+        runner_config_lib.iter_grid_trials(space, shard_index=i, shard_count=2, dedup=True)
+        for i in range(2)
+    ]
+
+    assert [idx for idx, _ in unique] == [0, 1, 4, 5]
+    assert sorted(idx for shard in sharded for idx, _ in shard) == [0, 1, 4, 5]
+
+
 def test_get_default_runtime_version_reads_runner_facade_state(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1110,6 +1167,67 @@ def test_load_existing_trials_warns_on_corrupt_artifact(tmp_path: Path, caplog)
     assert "trial_001.json" in caplog.text
 
 
+def test_grid_worker_loads_context_once_and_dedups_across_processes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name in ("_WORKER_CTX", "_WORKER_EXISTING_TRIALS", "_WORKER_BASELINE_RESULTS"):
+        monkeypatch.setattr(runner, name, getattr(runner, name))
+    monkeypatch.setattr(runner, "_WORKER_SEEN_KEYS", None)
+
+    resumed = _entry_conf_params(0.4)
+    claimed_elsewhere = _entry_conf_params(0.5)
+    resume_index = tmp_path / "resume_index.json"
+    runner._write_resume_index(
+        resume_index,
+        {
+            runner._trial_key(resumed): {
+                "trial_id": "trial_007",
+                "results_path": "r7.json",
+                "score": {"score": 1.0, "metrics": {"num_trades": 10}},
+            }
+        },
+    )
+    assert (
+        "score"
+        not in json.loads(resume_index.read_text(encoding="utf-8"))[runner._trial_key(resumed)]
+    )
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps({"summary": {"num_trades": 3}}), encoding="utf-8")
+    seen_keys_path = tmp_path / "seen.db"
+    # Another worker process already claimed this parameter set.
+    runner.NoDupeGuard(sqlite_path=str(seen_keys_path)).add(runner._trial_key(claimed_elsewhere))
+
+    ctx = runner.TrialContext(
+        snapshot_id=TEST_SNAPSHOT_ID,
+        symbol=TEST_SYMBOL,
+        timeframe=TEST_TIMEFRAME,
+        warmup_bars=1,
+        start_date=TEST_START_DATE,
+        end_date=TEST_END_DATE,
+        run_id=TEST_RUN_ID,
+        run_dir=tmp_path,
+        allow_resume=True,
+        max_attempts=1,
+        constraints_cfg=None,
+        baseline_results_path=baseline_path,
+        baseline_label="baseline.json",
+        optuna_context=None,
+        resume_index_path=resume_index,
+        seen_keys_path=seen_keys_path,
+    )
+    runner._init_trial_worker(ctx)
+
+    assert runner._WORKER_BASELINE_RESULTS == {"summary": {"num_trades": 3}}
+    resumed_payload = runner._execute_trial_task(1, resumed)
+    duplicate_payload = runner._execute_trial_task(2, claimed_elsewhere)
+
+    assert resumed_payload["reason"] == "already_completed"
+    assert resumed_payload["trial_id"] == "trial_007"
+    assert resumed_payload["results_path"] == "r7.json"
+    assert duplicate_payload["skipped"] is True
+    assert duplicate_payload["reason"] == "duplicate_within_run"
+
+
 def test_run_trial_abort_payload_is_strict_json_and_includes_score_version(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -1286,6 +1404,44 @@ def test_run_optimizer_optuna_strategy(tmp_path: Path) -> None:
     create_study.assert_called_once()
 
 
+@_OPTUNA_SKIP
+def test_run_optimizer_optuna_fidelity_screens_on_sub_range_first(tmp_path: Path) -> None:
+    config = _make_optuna_test_config(max_trials=1, resume=False, storage=None)
+    config["meta"]["runs"]["optuna"]["fidelity"] = {"levels": [0.5], "min_trials": 10}
+    config["meta"]["runs"]["optuna"]["dedup_guard_enabled"] = False
+    config_path = tmp_path / "optuna.yaml"
+    _write_yaml(config_path, config)
+
+    payload = {
+        "trial_id": "trial_001",
+        "parameters": _entry_conf_params(0.4),
+        "results_path": "dummy.json",
+        "score": {"score": 1.0, "metrics": {"num_trades": 3}, "hard_failures": []},
+        "constraints": _ok_constraints(),
+    }
+
+    with (
+        _results_dir_patch(tmp_path / "results"),
+        patch("core.optimizer.runner._ensure_run_metadata") as ensure_meta,
+        patch("core.optimizer.runner.run_trial", side_effect=lambda *a, **k: dict(payload)) as rt,
+    ):
+        ensure_meta.side_effect = lambda run_dir, *_: _write_run_meta(
+            run_dir, _base_run_meta_payload()
+        )
+        results = runner.run_optimizer(config_path, run_id="run_fidelity")
+
+    assert rt.call_count == 2
+    screen_call, full_call = rt.call_args_list
+    screen_trial = screen_call.args[0]
+    assert (screen_trial.start_date, screen_trial.end_date) == ("2024-01-16", "2024-02-01")
+    assert screen_call.kwargs["run_dir"].parts[-2:] == ("fidelity", "r0_050pct")
+    assert screen_call.kwargs["allow_resume"] is False
+    assert full_call.args[0].start_date is None
+    assert full_call.kwargs["run_dir"].name == "run_fidelity"
+
+    assert [entry["status"] for entry in results[0]["fidelity"]] == ["promoted", "full_range"]
+
+
 @_OPTUNA_SKIP
 def test_run_optimizer_optuna_strategy_uses_runner_run_optuna_patch_surface(tmp_path: Path) -> None:
     config = _make_optuna_test_config(max_trials=2, resume=False, storage=None)
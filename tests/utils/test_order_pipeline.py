@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from core.io.bitfinex.exchange_client import ExchangeClient
+from core.io.bitfinex.order_pipeline import OrderQueueFull, OrderSubmitPipeline
+from core.observability.metrics import metrics
+from core.utils import nonce_manager
+from core.utils.crypto import build_hmac_signature
+
+API_KEY = "mock-key"  # pragma: allowlist secret
+API_SECRET = "mock-secret"  # pragma: allowlist secret
+
+
+class _Settings:
+    BITFINEX_API_KEY = API_KEY
+    BITFINEX_API_SECRET = API_SECRET
+    symbol_mode = "realistic"
+
+
+def _mock_exchange(*, delay: float = 0.02) -> tuple[FastAPI, dict]:
+    """Local Bitfinex stand-in: checks signatures and rejects non-increasing nonces."""
+    app = FastAPI()
+    seen: dict = {"nonces": [], "orders": [], "in_flight": 0, "peak_in_flight": 0, "rejected": 0}
+
+    @app.post("/v2/auth/w/order/submit")
+    async def submit(request: Request):
+        nonce = request.headers["bfx-nonce"]
+        raw = (await request.body()).decode("utf-8")
+        expected = build_hmac_signature(API_SECRET, f"/api/v2/auth/w/order/submit{nonce}{raw}")
+        if request.headers["bfx-signature"] != expected:
+            return JSONResponse(["error", 10100, "apikey: invalid"], status_code=401)
+        if seen["nonces"] and int(nonce) <= seen["nonces"][-1]:
+            seen["rejected"] += 1
+            return JSONResponse(["error", 10114, "nonce: small"], status_code=500)
+        seen["nonces"].append(int(nonce))
+        seen["orders"].append(json.loads(raw)["amount"])
+        seen["in_flight"] += 1
+        seen["peak_in_flight"] = max(seen["peak_in_flight"], seen["in_flight"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            seen["in_flight"] -= 1
+        order = json.loads(raw)
+        return [0, "on-req", None, None, [[1, None, None, order["symbol"], order["amount"]]]]
+
+    return app, seen
+
+
+@pytest.fixture()
+def isolated_nonces(tmp_path, monkeypatch):
+    monkeypatch.setattr(nonce_manager, "NONCE_FILE", tmp_path / ".nonce_tracker.json")
+    monkeypatch.setattr(nonce_manager, "_state", {})
+    monkeypatch.setattr(nonce_manager, "_shared_fd", None)
+    monkeypatch.setattr("core.io.bitfinex.exchange_client.get_settings", lambda: _Settings())
+
+
+class _WireTransport(httpx.AsyncBaseTransport):
+    """ASGI transport that, like httpcore, reports the request write via the trace extension.
+
+    ``connect_delays`` stall successive requests before the write (a slow pool acquire
+    or connection open), so without ordering a later request reaches the app first.
+    """
+
+    def __init__(self, app: FastAPI, connect_delays: tuple[float, ...] = ()) -> None:
+        self._inner = httpx.ASGITransport(app=app)
+        self._delays = iter(connect_delays)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        delay = next(self._delays, 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        trace = request.extensions.get("trace")
+        if trace is not None:
+            await trace("http11.send_request_body.complete", {})
+        return await self._inner.handle_async_request(request)
+
+
+def _client(
+    app: FastAPI, connect_delays: tuple[float, ...] = ()
+) -> tuple[ExchangeClient, httpx.AsyncClient]:
+    http = httpx.AsyncClient(transport=_WireTransport(app, connect_delays))
+    return ExchangeClient(base_url="http://mock-exchange", http_client=http), http
+
+
+def _order(i: int) -> dict:
+    return {"type": "EXCHANGE MARKET", "symbol": "tTESTBTC:TESTUSD", "amount": str(0.001 * i)}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_share_client_with_increasing_nonces(isolated_nonces) -> None:
+    app, seen = _mock_exchange()
+    ec, http = _client(app)
+    pipeline = OrderSubmitPipeline(max_in_flight=4, max_pending=16)
+    try:
+        results = await asyncio.gather(*(pipeline.submit(ec, _order(i)) for i in range(1, 9)))
+    finally:
+        await http.aclose()
+
+    assert all(r.response.status_code == 200 for r in results)
+    assert len(seen["nonces"]) == 8
+    assert seen["nonces"] == sorted(set(seen["nonces"]))
+    assert seen["rejected"] == 0
+    assert 1 < seen["peak_in_flight"] <= 4
+
+    summary = pipeline.latency_summary()
+    assert summary["count"] == 8
+    assert summary["total_ms"]["max"] >= summary["exchange_ms"]["max"] >= 20.0
+    # Eight 20 ms round trips four at a time: the last ack waits for one batch ahead.
+    assert summary["queued_ms"]["max"] >= 15.0
+    assert metrics.gauges["order_submit_last_total_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_slow_connections_cannot_reorder_nonces(isolated_nonces) -> None:
+    # The first submit waits longest for its connection; later ones would overtake it.
+    app, seen = _mock_exchange(delay=0.0)
+    ec, http = _client(app, connect_delays=(0.04, 0.03, 0.02, 0.01))
+    pipeline = OrderSubmitPipeline(max_in_flight=4, max_pending=16)
+    try:
+        results = await asyncio.gather(*(pipeline.submit(ec, _order(i)) for i in range(1, 5)))
+    finally:
+        await http.aclose()
+
+    assert all(r.response.status_code == 200 for r in results)
+    assert seen["rejected"] == 0
+    assert seen["nonces"] == sorted(set(seen["nonces"]))
+    assert sorted(seen["orders"]) == sorted(_order(i)["amount"] for i in range(1, 5))
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_instead_of_waiting(isolated_nonces) -> None:
+    app, seen = _mock_exchange(delay=0.05)
+    ec, http = _client(app)
+    pipeline = OrderSubmitPipeline(max_in_flight=1, max_pending=1)
+    try:
+        outcomes = await asyncio.gather(
+            *(pipeline.submit(ec, _order(i)) for i in range(1, 4)), return_exceptions=True
+        )
+    finally:
+        await http.aclose()
+
+    assert [type(o).__name__ for o in outcomes].count("OrderSubmitResult") == 2
+    assert sum(isinstance(o, OrderQueueFull) for o in outcomes) == 1
+    assert len(seen["nonces"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_exchange_errors_propagate_and_free_the_slot(isolated_nonces) -> None:
+    app, _seen = _mock_exchange()
+    ec, http = _client(app)
+    pipeline = OrderSubmitPipeline(max_in_flight=1, max_pending=0)
+    bad = ExchangeClient(base_url="http://mock-exchange", http_client=http)
+    bad._settings = type("S", (_Settings,), {"BITFINEX_API_SECRET": "wrong"})()
+    try:
+        with pytest.raises(httpx.HTTPStatusError):
+            await pipeline.submit(bad, _order(1))
+        result = await pipeline.submit(ec, _order(2))
+    finally:
+        await http.aclose()
+
+    assert result.response.status_code == 200
+    assert pipeline.latency_summary()["count"] == 1
+
+
+def test_invalid_limits_raise() -> None:
+    with pytest.raises(ValueError):
+        OrderSubmitPipeline(max_in_flight=0)
+
+
+@pytest.mark.asyncio
+async def test_paper_submit_reaches_mock_exchange(isolated_nonces, monkeypatch) -> None:
+    import core.server as srv
+
+    app, seen = _mock_exchange(delay=0.0)
+    ec, http = _client(app)
+    monkeypatch.setattr(srv, "get_exchange_client", lambda: ec)
+    try:
+        outs = await asyncio.gather(
+            *(
+                srv.paper_submit(
+                    {"symbol": "tTESTBTC:TESTUSD", "side": side, "size": 1.0, "type": "MARKET"}
+                )
+                for side in ("LONG", "SHORT", "LONG")
+            )
+        )
+    finally:
+        await http.aclose()
+
+    assert [out["ok"] for out in outs] == [True, True, True]
+    assert [out["request"]["amount"] for out in outs] == ["1.0", "-1.0", "1.0"]
+    assert len(seen["nonces"]) == 3 and seen["rejected"] == 0
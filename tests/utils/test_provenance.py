@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from core.utils.provenance import (
+    DATA_HASH_SCHEME,
+    fingerprint_dataframe,
+    hash_dataframe,
+    hash_dataframe_legacy_csv,
+    verify_reproducibility,
+)
+
+
+def _frame(n: int = 50) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2025-01-01", periods=n, freq="h", tz="UTC"),
+            "close": rng.normal(100.0, 1.0, n),
+            "volume": rng.integers(0, 1000, n),
+            "regime": pd.Categorical(rng.choice(["bull", "bear"], n)),
+            "note": [f"row{i}" for i in range(n)],
+        }
+    )
+
+
+def test_fingerprint_is_order_independent_when_sorted() -> None:
+    df = _frame()
+    shuffled = df.sample(frac=1.0, random_state=1)[list(reversed(df.columns))]
+
+    assert fingerprint_dataframe(shuffled) == fingerprint_dataframe(df)
+    assert fingerprint_dataframe(shuffled, sort=False) != fingerprint_dataframe(df, sort=False)
+
+
+def test_fingerprint_frames_dtype_and_names() -> None:
+    df = _frame()
+
+    changed_value = df.copy()
+    changed_value.loc[10, "close"] += 1e-9
+    as_float = df.assign(volume=df["volume"].astype("float64"))
+    renamed = df.rename(columns={"close": "close_px"})
+
+    base = fingerprint_dataframe(df)
+    assert fingerprint_dataframe(changed_value) != base
+    assert fingerprint_dataframe(as_float) != base
+    assert fingerprint_dataframe(renamed) != base
+
+
+def test_fingerprint_is_independent_of_chunk_size() -> None:
+    df = _frame(101)
+
+    assert fingerprint_dataframe(df, chunk_rows=7) == fingerprint_dataframe(df)
+    assert fingerprint_dataframe(df, columns=["close"]) != fingerprint_dataframe(df)
+    assert len(hash_dataframe(df)) == 16
+
+
+def test_verify_reproducibility_supports_columnar_and_legacy_records(tmp_path) -> None:
+    df = _frame()
+    model_path = tmp_path / "model.json"
+    provenance_path = tmp_path / "model_provenance.json"
+
+    provenance_path.write_text(
+        json.dumps({"data_hash": hash_dataframe(df), "data_hash_scheme": DATA_HASH_SCHEME})
+    )
+    assert verify_reproducibility(model_path, df)
+    assert not verify_reproducibility(model_path, df.iloc[:-1])
+
+    provenance_path.write_text(json.dumps({"data_hash": hash_dataframe_legacy_csv(df)}))
+    assert verify_reproducibility(model_path, df)
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+
+from core.utils.single_flight import SingleFlight, StaleWhileRevalidateCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_callers():
+    calls = 0
+    release = asyncio.Event()
+
+    async def _fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "value"
+
+    flight = SingleFlight()
+    waiters = [asyncio.ensure_future(flight.do("k", _fetch)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["value"] * 10
+    assert calls == 1
+    assert flight.in_flight("k") is False
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_and_allows_retry():
+    attempts = 0
+
+    async def _boom():
+        nonlocal attempts
+        attempts += 1
+        raise RuntimeError("down")
+
+    flight = SingleFlight()
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await flight.do("k", _boom)
+    assert attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_swr_cache_serves_stale_and_refreshes_in_background():
+    clock = _Clock()
+    cache = StaleWhileRevalidateCache(ttl=5.0, stale_ttl=30.0, name="t_swr", clock=clock)
+    values = iter(["v1", "v2"])
+
+    async def _load():
+        return next(values)
+
+    assert await cache.get("k", _load) == "v1"
+    assert await cache.get("k", _load) == "v1"
+
+    clock.now += 10.0
+    assert await cache.get("k", _load) == "v1"  # stale, refresh scheduled
+    await cache.wait_background()
+    assert await cache.get("k", _load) == "v2"
+    assert cache.stats == {
+        "hits": 2,
+        "stale_hits": 1,
+        "misses": 1,
+        "coalesced": 0,
+        "refresh_errors": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_swr_cache_keeps_stale_entry_when_refresh_fails():
+    clock = _Clock()
+    cache = StaleWhileRevalidateCache(ttl=1.0, stale_ttl=10.0, name="t_swr_err", clock=clock)
+    cache.put("k", "old")
+    clock.now += 2.0
+
+    async def _fail():
+        raise RuntimeError("exchange down")
+
+    assert await cache.get("k", _fail) == "old"
+    await cache.wait_background()
+    assert cache.stats["refresh_errors"] == 1
+    assert cache.peek("k")["data"] == "old"
+
+    clock.now += 20.0
+    with pytest.raises(RuntimeError):
+        await cache.get("k", _fail)
@@ -4,17 +4,22 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pytest
 
 from core.indicators.volume import (
+    RollingMedian,
     calculate_volume_ema,
     calculate_volume_sma,
     obv,
+    rolling_upper_median,
     volume_change,
     volume_price_divergence,
+    volume_score,
     volume_spike,
     volume_trend,
 )
+from core.strategy.evaluate import _volume_score_from_candles
 
 
 @pytest.mark.parametrize(
@@ -357,6 +362,51 @@ class TestVolumeSMA:
         assert sma[3] == 3000.0
 
 
+class TestVolumeScore:
+    """Test rolling-median volume score kernels."""
+
+    @staticmethod
+    def _volumes(length: int = 400) -> np.ndarray:
+        rng = np.random.default_rng(11)
+        volume = rng.lognormal(3.0, 0.6, length)
+        volume[rng.integers(0, length, 30)] = 0.0
+        volume[rng.integers(0, length, 5)] = np.nan
+        volume[200:260] = 0.0  # longer than the window: no positive volume at all
+        return volume
+
+    def test_rolling_median_matches_sorted_window(self):
+        volume = self._volumes()
+        rm = RollingMedian(7)
+        for i, value in enumerate(volume):
+            recent = sorted(v for v in volume[max(0, i - 6) : i + 1] if v > 0)
+            expected = recent[len(recent) // 2] if recent else None
+            assert rm.push(value) == expected
+
+    def test_vectorized_median_matches_streaming(self):
+        volume = self._volumes()
+        rm = RollingMedian(50)
+        streamed = [rm.push(v) for v in volume]
+        vectorized = rolling_upper_median(volume, 50, chunk_size=64)
+        assert [None if math.isnan(v) else v for v in vectorized] == streamed
+
+    @pytest.mark.parametrize("cap_ratio", [0.5, 1.5, 3.0])
+    def test_volume_score_matches_per_bar_computation(self, cap_ratio):
+        volume = self._volumes()
+        scores = volume_score(volume, 50, cap_ratio)
+        for i in range(len(volume)):
+            expected = _volume_score_from_candles(
+                {"volume": volume[: i + 1]}, window=50, cap_ratio=cap_ratio
+            )
+            if expected is None:
+                assert math.isnan(scores[i])
+            else:
+                assert scores[i] == expected
+
+    def test_rolling_median_rejects_invalid_window(self):
+        with pytest.raises(ValueError):
+            RollingMedian(0)
+
+
 class TestVolumeIntegration:
     """Integration tests for volume indicators."""
 